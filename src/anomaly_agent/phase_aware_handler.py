@@ -13,7 +13,8 @@ depending on the current mission phase.
 """
 
 import logging
-from typing import Dict, Any, Optional, Tuple
+from collections import deque
+from typing import Deque, Dict, Any, Optional, Tuple
 from dataclasses import asdict
 from datetime import datetime, timedelta
 import json
@@ -34,6 +35,39 @@ from anomaly.report_generator import get_report_generator
 
 logger = logging.getLogger(__name__)
 
+# Sliding windows reported by get_recurrence_stats()
+DEFAULT_RECURRENCE_WINDOWS = {
+    '1m': timedelta(minutes=1),
+    '5m': timedelta(minutes=5),
+    '1h': timedelta(hours=1),
+}
+HISTORY_RETENTION = timedelta(hours=24)  # anomaly_history keeps this much
+
+
+class _TypeRecurrence:
+    """Recurrence state for one anomaly type."""
+
+    __slots__ = ('count', 'last', 'windows')
+
+    def __init__(self, window_names):
+        self.count = 0  # occurrences ever recorded
+        self.last: Optional[datetime] = None
+        # Window name -> timestamps inside that window, oldest first
+        self.windows: Dict[Any, Deque[datetime]] = {name: deque() for name in window_names}
+
+    def record(self, now: datetime) -> None:
+        self.count += 1
+        self.last = now
+        for timestamps in self.windows.values():
+            timestamps.append(now)
+
+    def expire(self, now: datetime, window_lengths: Dict[Any, timedelta]) -> None:
+        # Each timestamp is appended and popped once per window: amortized O(1)
+        for name, timestamps in self.windows.items():
+            start = now - window_lengths[name]
+            while timestamps and timestamps[0] < start:
+                timestamps.popleft()
+
 
 class PhaseAwareAnomalyHandler:
     """
@@ -53,7 +87,8 @@ class PhaseAwareAnomalyHandler:
         self,
         state_machine: StateMachine,
         policy_loader: Optional[MissionPhasePolicyLoader] = None,
-        enable_recurrence_tracking: bool = True
+        enable_recurrence_tracking: bool = True,
+        recurrence_windows: Optional[Dict[str, timedelta]] = None
     ):
         """
         Initialize the phase-aware anomaly handler.
@@ -63,6 +98,8 @@ class PhaseAwareAnomalyHandler:
             policy_loader: MissionPhasePolicyLoader instance
                           If None, creates a new one with defaults
             enable_recurrence_tracking: Track anomaly recurrence patterns
+            recurrence_windows: Named sliding windows for
+                get_recurrence_stats() (default 1m/5m/1h)
         """
         self.state_machine = state_machine
         self.policy_loader = policy_loader or MissionPhasePolicyLoader()
@@ -70,8 +107,10 @@ class PhaseAwareAnomalyHandler:
         
         # Recurrence tracking
         self.enable_recurrence_tracking = enable_recurrence_tracking
-        self.anomaly_history = []  # List of (anomaly_type, timestamp) tuples
+        self.anomaly_history: Deque[Tuple[str, datetime]] = deque()  # (anomaly_type, timestamp), last 24h
         self.recurrence_window = timedelta(seconds=3600)  # 1 hour default
+        self.recurrence_windows = dict(recurrence_windows or DEFAULT_RECURRENCE_WINDOWS)
+        self._recurrence: Dict[str, _TypeRecurrence] = {}
         
         logger.info("Phase-aware anomaly handler initialized")
     
@@ -191,7 +230,10 @@ class PhaseAwareAnomalyHandler:
     def _update_recurrence_tracking(self, anomaly_type: str) -> Dict[str, Any]:
         """
         Track recurrence of anomalies within a time window.
-        
+
+        Per-type counters and time-ordered deques make this O(1) amortized,
+        independent of how much history has accumulated.
+
         Returns:
             Dict with:
             {
@@ -202,50 +244,63 @@ class PhaseAwareAnomalyHandler:
             }
         """
         now = datetime.now()
-        
+        stats = self._recurrence.get(anomaly_type)
+
         # Add current occurrence
         if self.enable_recurrence_tracking:
+            if stats is None:
+                stats = self._recurrence[anomaly_type] = _TypeRecurrence(self._window_lengths())
+            last_occurrence = stats.last
+            stats.record(now)
             self.anomaly_history.append((anomaly_type, now))
-        
-        # Count total occurrences of this type
-        total_count = sum(1 for a_type, _ in self.anomaly_history if a_type == anomaly_type)
-        
-        # Find occurrences within time window
-        window_start = now - self.recurrence_window
-        recent_occurrences = [
-            (a_type, timestamp) for a_type, timestamp in self.anomaly_history
-            if a_type == anomaly_type and timestamp >= window_start
-        ]
-        
-        # Find last occurrence
-        same_type_history = [
-            (a_type, timestamp) for a_type, timestamp in self.anomaly_history
-            if a_type == anomaly_type
-        ]
-        
-        if len(same_type_history) > 1:
-            # Get second-to-last (last one is the current)
-            last_occurrence = same_type_history[-2][1]
-            time_since_last = (now - last_occurrence).total_seconds()
         else:
-            last_occurrence = None
-            time_since_last = None
-        
-        # Clean up old entries (keep last 1000 or entries within 24 hours)
-        if len(self.anomaly_history) > 1000:
-            cutoff = now - timedelta(hours=24)
-            self.anomaly_history = [
-                (a_type, ts) for a_type, ts in self.anomaly_history
-                if ts >= cutoff
-            ]
-        
+            last_occurrence = stats.last if stats else None
+
+        # Expire old entries
+        cutoff = now - HISTORY_RETENTION
+        while self.anomaly_history and self.anomaly_history[0][1] < cutoff:
+            self.anomaly_history.popleft()
+        if stats is not None:
+            stats.expire(now, self._window_lengths())
+
         return {
-            'count': total_count,
-            'total_in_window': len(recent_occurrences),
+            'count': stats.count if stats else 0,
+            'total_in_window': len(stats.windows[None]) if stats else 0,
             'last_occurrence': last_occurrence.isoformat() if last_occurrence else None,
-            'time_since_last_seconds': time_since_last
+            'time_since_last_seconds': (now - last_occurrence).total_seconds() if last_occurrence else None
         }
-    
+
+    def _window_lengths(self) -> Dict[Any, timedelta]:
+        # None is the recurrence_window used for 'total_in_window'
+        return {**self.recurrence_windows, None: self.recurrence_window}
+
+    def get_recurrence_stats(self, anomaly_type: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Per-type occurrence counts over each configured recurrence window.
+
+        Args:
+            anomaly_type: Only this type, or None for every tracked type
+
+        Returns:
+            {anomaly_type: {'count': int, 'last_occurrence': str or None,
+                            'windows': {window_name: int}}}
+        """
+        now = datetime.now()
+        lengths = self._window_lengths()
+        types = [anomaly_type] if anomaly_type is not None else list(self._recurrence)
+        result = {}
+        for a_type in types:
+            stats = self._recurrence.get(a_type)
+            if stats is None:
+                continue
+            stats.expire(now, lengths)
+            result[a_type] = {
+                'count': stats.count,
+                'last_occurrence': stats.last.isoformat() if stats.last else None,
+                'windows': {name: len(stats.windows[name]) for name in self.recurrence_windows},
+            }
+        return result
+
     def _execute_escalation(self, decision: Dict[str, Any]):
         """
         Execute escalation to SAFE_MODE.
@@ -369,7 +424,7 @@ class PhaseAwareAnomalyHandler:
             List of (anomaly_type, timestamp) tuples
         """
         if anomaly_type is None:
-            return self.anomaly_history.copy()
+            return list(self.anomaly_history)
         else:
             return [
                 (a_type, ts) for a_type, ts in self.anomaly_history
@@ -379,6 +434,7 @@ class PhaseAwareAnomalyHandler:
     def clear_anomaly_history(self):
         """Clear the anomaly history (e.g., for testing or reset)."""
         self.anomaly_history.clear()
+        self._recurrence.clear()
         logger.info("Anomaly history cleared")
     
     def reload_policies(self, new_config_path: Optional[str] = None):
@@ -389,9 +445,8 @@ class PhaseAwareAnomalyHandler:
         """
         try:
             self.policy_loader.reload(new_config_path)
-            self.policy_engine = MissionPhasePolicyEngine(
-                self.policy_loader.get_policy()
-            )
+            # Compiles the new decision table, then swaps it in atomically
+            self.policy_engine.reload(self.policy_loader.get_policy())
             logger.info("Policies reloaded successfully")
         except Exception as e:
             logger.error(f"Failed to reload policies: {e}", exc_info=True)
@@ -0,0 +1,194 @@
+"""
+Time-Indexed Anomaly History
+
+Bounded ring buffer of AnomalyResponse objects with parallel NumPy
+timestamp and severity arrays, so dashboard queries do not copy or scan
+the whole history:
+
+- Time ranges are found by bisection while entries arrive in time order
+  (the normal case); out-of-order inserts fall back to a vectorized mask
+- Severity filtering is a vectorized mask over the candidate range
+- Every entry gets a monotonically increasing sequence number, used as a
+  pagination cursor so clients can fetch only entries added since their
+  last poll
+
+The class keeps the deque operations the service relies on (append,
+extend, clear, len, iteration, maxlen).
+"""
+
+import threading
+from collections import deque
+from datetime import datetime
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+
+class AnomalyHistory:
+    """Bounded, time-indexed anomaly history with cursor pagination."""
+
+    def __init__(self, maxlen: int):
+        """
+        Initialize the history.
+
+        Args:
+            maxlen: Maximum number of anomalies kept; the oldest are evicted first
+
+        Raises:
+            ValueError: If maxlen is not positive
+        """
+        if maxlen <= 0:
+            raise ValueError("maxlen must be positive")
+        self.maxlen = maxlen
+        self._items: List[Any] = [None] * maxlen
+        self._timestamps = np.zeros(maxlen, dtype=np.float64)
+        self._severity = np.zeros(maxlen, dtype=np.float64)
+        self._size = 0
+        self._next_seq = 0  # Sequence number (cursor) of the next appended entry
+        self._breaks: deque = deque()  # Sequences whose timestamp is earlier than their predecessor's
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Any]:
+        """Iterate over a snapshot of the entries, oldest first."""
+        with self._lock:
+            slots = self._slots(np.arange(self._size))
+            snapshot = [self._items[s] for s in slots.tolist()]
+        return iter(snapshot)
+
+    @property
+    def next_cursor(self) -> int:
+        """Cursor that returns only entries appended after this call."""
+        return self._next_seq
+
+    def append(self, anomaly: Any) -> None:
+        """Add an anomaly, evicting the oldest one when full."""
+        with self._lock:
+            self._append(anomaly)
+
+    def extend(self, anomalies: Iterable[Any]) -> None:
+        """Add several anomalies in order under one lock acquisition."""
+        with self._lock:
+            for anomaly in anomalies:
+                self._append(anomaly)
+
+    def clear(self) -> None:
+        """Remove all entries. Cursors keep increasing across clears."""
+        with self._lock:
+            self._items = [None] * self.maxlen
+            self._size = 0
+            self._breaks.clear()
+
+    def query(
+        self,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        severity_min: Optional[float] = None,
+        limit: Optional[int] = None,
+        since: Optional[int] = None,
+    ) -> Tuple[List[Any], int]:
+        """
+        Return anomalies matching the filters.
+
+        Without a cursor the most recent `limit` matches are returned. With
+        `since`, matches appended at or after that cursor are returned
+        oldest first, up to `limit`, so clients can page forward.
+
+        Args:
+            start_time: Inclusive lower bound on anomaly timestamp
+            end_time: Inclusive upper bound on anomaly timestamp
+            severity_min: Minimum severity_score
+            limit: Maximum number of results (None or <= 0 for no limit)
+            since: Cursor from a previous query's next_cursor
+
+        Returns:
+            Tuple of (anomalies in insertion order, next_cursor)
+        """
+        with self._lock:
+            oldest = self._next_seq - self._size
+            lo = 0 if since is None else min(max(since - oldest, 0), self._size)
+            hi = self._size
+
+            if self._in_time_order():
+                if start_time is not None:
+                    lo = max(lo, self._bisect(_to_epoch(start_time), "left"))
+                if end_time is not None:
+                    hi = min(hi, self._bisect(_to_epoch(end_time), "right"))
+                if severity_min is None and limit is not None and limit > 0 and hi > lo:
+                    # Only the requested page needs to be materialized
+                    if since is None:
+                        lo = max(lo, hi - limit)
+                    else:
+                        hi = min(hi, lo + limit + 1)
+                indices = np.arange(lo, max(lo, hi))
+                slots = self._slots(indices)
+            else:
+                indices = np.arange(lo, hi)
+                slots = self._slots(indices)
+                timestamps = self._timestamps[slots]
+                mask = np.ones(len(indices), dtype=bool)
+                if start_time is not None:
+                    mask &= timestamps >= _to_epoch(start_time)
+                if end_time is not None:
+                    mask &= timestamps <= _to_epoch(end_time)
+                indices, slots = indices[mask], slots[mask]
+
+            if severity_min is not None:
+                mask = self._severity[slots] >= severity_min
+                indices, slots = indices[mask], slots[mask]
+
+            next_cursor = self._next_seq
+            if limit is not None and limit > 0 and len(slots) > limit:
+                if since is None:
+                    slots = slots[-limit:]
+                else:
+                    slots = slots[:limit]
+                    next_cursor = oldest + int(indices[limit - 1]) + 1
+
+            return [self._items[s] for s in slots.tolist()], next_cursor
+
+    # Private helper methods
+
+    def _append(self, anomaly: Any) -> None:
+        seq = self._next_seq
+        slot = seq % self.maxlen
+        timestamp = _to_epoch(anomaly.timestamp)
+        if self._size and timestamp < self._timestamps[(seq - 1) % self.maxlen]:
+            self._breaks.append(seq)
+
+        self._items[slot] = anomaly
+        self._timestamps[slot] = timestamp
+        self._severity[slot] = anomaly.severity_score
+        self._next_seq = seq + 1
+        self._size = min(self._size + 1, self.maxlen)
+
+    def _slots(self, indices: np.ndarray) -> np.ndarray:
+        """Map logical indices (0 = oldest) to buffer slots."""
+        oldest = self._next_seq - self._size
+        return (oldest + indices) % self.maxlen
+
+    def _in_time_order(self) -> bool:
+        """True when no live entry is older than the entry before it."""
+        oldest = self._next_seq - self._size
+        # A break only matters while its predecessor is still in the buffer
+        while self._breaks and self._breaks[0] <= oldest:
+            self._breaks.popleft()
+        return not self._breaks
+
+    def _bisect(self, timestamp: float, side: str) -> int:
+        """Logical insertion index of timestamp in the (time-ordered) buffer."""
+        start = (self._next_seq - self._size) % self.maxlen
+        first_len = min(self._size, self.maxlen - start)
+        first = self._timestamps[start:start + first_len]
+        index = int(np.searchsorted(first, timestamp, side=side))
+        if index < first_len:
+            return index
+        second = self._timestamps[:self._size - first_len]
+        return first_len + int(np.searchsorted(second, timestamp, side=side))
+
+
+def _to_epoch(value: datetime) -> float:
+    """Convert a timestamp to POSIX seconds (naive values are local time)."""
+    return value.timestamp()
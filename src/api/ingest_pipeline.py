@@ -0,0 +1,324 @@
+"""
+Staged Telemetry Ingest Pipeline
+
+Moves the single-point telemetry pipeline off the request coroutine. The
+request path only enqueues onto a bounded queue; worker stages do the rest:
+
+1. detect      - micro-batches queued points, scores them with
+                 detect_anomaly_batch(), classifies, runs the phase-aware
+                 decision and resolves the waiting request (sync mode)
+2. predictive  - feeds predictive maintenance (train + predict + actions)
+3. persist     - writes anomalies to the history buffer and memory store
+
+Stages 2 and 3 run concurrently with each other and with detection of the
+next micro-batch. Detection is a single worker because the policy handler
+tracks recurrence and mission phase in arrival order.
+
+Every queue is bounded: a full downstream queue stalls the detect stage,
+which fills the ingest queue, and submit() then raises
+IngestBackpressureError (HTTP 429 at the API). Sync submitters still
+waiting when the pipeline stops get IngestStoppedError (HTTP 503).
+"""
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from api.batch_processor import (
+    classify_features,
+    decide_batch,
+    pack_telemetry,
+    persist_anomalies,
+    run_predictive_maintenance,
+)
+from api.models import AnomalyResponse, TelemetryInput
+from anomaly.anomaly_detector import detect_anomaly_batch
+from core.metrics import INGEST_QUEUE_DEPTH, INGEST_REJECTED_TOTAL, INGEST_STAGE_LATENCY
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("detect", "predictive", "persist")
+
+
+class IngestBackpressureError(Exception):
+    """Raised by submit() when the ingest queue is full."""
+
+    def __init__(self, queue_depth: int, retry_after: float = 1.0):
+        self.queue_depth = queue_depth
+        self.retry_after = retry_after
+        super().__init__(f"Ingest queue full ({queue_depth} pending)")
+
+
+class IngestStoppedError(RuntimeError):
+    """Raised by submit() when the pipeline is not running or stops before answering."""
+
+
+class _IngestJob:
+    """One queued telemetry point."""
+
+    __slots__ = ("telemetry", "timestamp", "enqueued_at", "future")
+
+    def __init__(self, telemetry: TelemetryInput, future: Optional[asyncio.Future]):
+        self.telemetry = telemetry
+        self.timestamp = telemetry.timestamp or datetime.now()
+        self.enqueued_at = time.perf_counter()
+        self.future = future
+
+
+class TelemetryIngestPipeline:
+    """
+    Bounded, staged telemetry ingest.
+
+    Usage:
+        pipeline = TelemetryIngestPipeline(state_machine, handler, memory_store,
+                                           predictive_engine, history)
+        await pipeline.start()
+        response = await pipeline.submit(telemetry)           # sync mode
+        await pipeline.submit(telemetry, wait=False)          # fire and forget
+        await pipeline.stop()
+    """
+
+    def __init__(
+        self,
+        state_machine: Any,
+        phase_aware_handler: Any,
+        memory_store: Any = None,
+        predictive_engine: Any = None,
+        history: Optional[Any] = None,
+        queue_size: int = 1000,
+        stage_queue_size: int = 100,
+        max_batch_size: int = 64,
+    ):
+        """
+        Args:
+            state_machine: StateMachine used for the current mission phase
+            phase_aware_handler: PhaseAwareAnomalyHandler for anomalous points
+            memory_store: Optional AdaptiveMemoryStore receiving anomaly embeddings
+            predictive_engine: Optional PredictiveMaintenanceEngine
+            history: Optional anomaly history (needs extend())
+            queue_size: Capacity of the ingest queue, in telemetry points
+            stage_queue_size: Capacity of the predictive/persist queues,
+                in micro-batches
+            max_batch_size: Most points scored together by the detect stage
+        """
+        if queue_size < 1 or stage_queue_size < 1 or max_batch_size < 1:
+            raise ValueError("queue sizes and max_batch_size must be >= 1")
+
+        self.state_machine = state_machine
+        self.phase_aware_handler = phase_aware_handler
+        self.memory_store = memory_store
+        self.predictive_engine = predictive_engine
+        self.history = history
+        self.queue_size = queue_size
+        self.stage_queue_size = stage_queue_size
+        self.max_batch_size = max_batch_size
+
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._workers: List[asyncio.Task] = []
+        self._stats: Dict[str, Any] = {
+            "submitted": 0,
+            "processed": 0,
+            "rejected": 0,
+            "failed": 0,
+            "batches": 0,
+        }
+        self._latency: Dict[str, List[float]] = {}  # stage -> [count, total, max]
+
+    @property
+    def running(self) -> bool:
+        return bool(self._workers)
+
+    async def start(self) -> None:
+        """Create the queues and start one worker per stage."""
+        if self.running:
+            return
+        self._queues = {
+            "detect": asyncio.Queue(maxsize=self.queue_size),
+            "predictive": asyncio.Queue(maxsize=self.stage_queue_size),
+            "persist": asyncio.Queue(maxsize=self.stage_queue_size),
+        }
+        self._workers = [
+            asyncio.create_task(self._detect_worker(), name="ingest-detect"),
+            asyncio.create_task(self._stage_worker("predictive", self._run_predictive), name="ingest-predictive"),
+            asyncio.create_task(self._stage_worker("persist", self._run_persist), name="ingest-persist"),
+        ]
+        logger.info(
+            f"Ingest pipeline started (queue={self.queue_size}, "
+            f"batch={self.max_batch_size})"
+        )
+
+    async def stop(self, drain: bool = True) -> None:
+        """
+        Stop the workers.
+
+        Args:
+            drain: Finish everything already queued first (default True);
+                otherwise pending sync submitters get an IngestStoppedError
+        """
+        if not self.running:
+            return
+        if drain:
+            for stage in STAGES:
+                await self._queues[stage].join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+        queue = self._queues["detect"]
+        _fail_pending([queue.get_nowait() for _ in range(queue.qsize())])
+        logger.info("Ingest pipeline stopped")
+
+    async def submit(
+        self, telemetry: TelemetryInput, wait: bool = True
+    ) -> Optional[AnomalyResponse]:
+        """
+        Enqueue a telemetry point.
+
+        Args:
+            telemetry: Validated telemetry point
+            wait: Wait for the detect stage and return its response
+                (default); otherwise return None as soon as it is queued
+
+        Returns:
+            AnomalyResponse in sync mode, None otherwise
+
+        Raises:
+            IngestBackpressureError: If the ingest queue is full
+            IngestStoppedError: If the pipeline is not running, or stops
+                without draining before this point is processed
+        """
+        if not self.running:
+            raise IngestStoppedError("Ingest pipeline is not running")
+
+        future = asyncio.get_running_loop().create_future() if wait else None
+        queue = self._queues["detect"]
+        try:
+            queue.put_nowait(_IngestJob(telemetry, future))
+        except asyncio.QueueFull:
+            self._stats["rejected"] += 1
+            INGEST_REJECTED_TOTAL.inc()
+            raise IngestBackpressureError(queue.qsize()) from None
+        self._stats["submitted"] += 1
+        INGEST_QUEUE_DEPTH.labels(stage="detect").set(queue.qsize())
+
+        if future is None:
+            return None
+        return await future
+
+    def queue_depths(self) -> Dict[str, int]:
+        return {stage: queue.qsize() for stage, queue in self._queues.items()}
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Counters, queue depths and per-stage latency (ms) for monitoring."""
+        latency = {
+            stage: {
+                "count": int(count),
+                "avg_ms": round(total / count * 1000, 3) if count else 0.0,
+                "max_ms": round(peak * 1000, 3),
+            }
+            for stage, (count, total, peak) in self._latency.items()
+        }
+        return {
+            **self._stats,
+            "running": self.running,
+            "queue_depth": self.queue_depths(),
+            "queue_capacity": self.queue_size,
+            "latency": latency,
+        }
+
+    # Private helper methods
+
+    def _observe(self, stage: str, seconds: float) -> None:
+        INGEST_STAGE_LATENCY.labels(stage=stage).observe(seconds)
+        entry = self._latency.setdefault(stage, [0, 0.0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+        entry[2] = max(entry[2], seconds)
+
+    async def _detect_worker(self) -> None:
+        queue = self._queues["detect"]
+        while True:
+            jobs = [await queue.get()]
+            while len(jobs) < self.max_batch_size and not queue.empty():
+                jobs.append(queue.get_nowait())
+            INGEST_QUEUE_DEPTH.labels(stage="detect").set(queue.qsize())
+            try:
+                await self._detect(jobs)
+            except asyncio.CancelledError:
+                _fail_pending(jobs)
+                raise
+            except Exception as e:
+                logger.error(f"Ingest detect stage failed: {e}")
+                self._stats["failed"] += len(jobs)
+                for job in jobs:
+                    if job.future is not None and not job.future.done():
+                        job.future.set_exception(e)
+            finally:
+                for _ in jobs:
+                    queue.task_done()
+
+    async def _detect(self, jobs: List[_IngestJob]) -> None:
+        start = time.perf_counter()
+        self._observe("queue_wait", start - jobs[0].enqueued_at)
+
+        telemetry = [job.telemetry for job in jobs]
+        timestamps = [job.timestamp for job in jobs]
+        features = pack_telemetry(telemetry)
+        is_anomaly, scores = await detect_anomaly_batch(features)
+        fault_types = classify_features(features)
+        decision = decide_batch(
+            features, is_anomaly, scores, fault_types, timestamps,
+            self.state_machine, self.phase_aware_handler,
+        )
+
+        for job, response in zip(jobs, decision.responses):
+            if job.future is not None and not job.future.done():
+                job.future.set_result(response)
+        self._stats["processed"] += len(jobs)
+        self._stats["batches"] += 1
+        self._observe("detect", time.perf_counter() - start)
+
+        # Blocks while a downstream stage is full, which backs up the ingest queue
+        if self.predictive_engine is not None:
+            await self._queues["predictive"].put((telemetry, is_anomaly, timestamps))
+        if decision.anomaly_indices.size:
+            await self._queues["persist"].put((features, decision, timestamps))
+
+    async def _stage_worker(self, stage: str, handler) -> None:
+        queue = self._queues[stage]
+        while True:
+            item = await queue.get()
+            INGEST_QUEUE_DEPTH.labels(stage=stage).set(queue.qsize())
+            start = time.perf_counter()
+            try:
+                await handler(*item)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Ingest {stage} stage failed: {e}")
+            finally:
+                self._observe(stage, time.perf_counter() - start)
+                queue.task_done()
+
+    async def _run_predictive(
+        self, telemetry: List[TelemetryInput], is_anomaly: np.ndarray, timestamps: List[datetime]
+    ) -> None:
+        await run_predictive_maintenance(self.predictive_engine, telemetry, is_anomaly, timestamps)
+
+    async def _run_persist(self, features: np.ndarray, decision, timestamps: List[datetime]) -> None:
+        # History and memory store are lock-protected; keep their I/O off the loop
+        await asyncio.to_thread(
+            persist_anomalies, features, decision, timestamps, self.history, self.memory_store
+        )
+
+
+def _fail_pending(jobs: List[_IngestJob]) -> None:
+    """Answer sync submitters whose points will not be processed."""
+    for job in jobs:
+        if job.future is not None and not job.future.done():
+            job.future.set_exception(IngestStoppedError("Ingest pipeline stopped"))
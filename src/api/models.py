@@ -122,6 +122,7 @@ class AnomalyHistoryQuery(BaseModel):
     end_time: Optional[datetime] = None
     limit: int = Field(100, ge=1, le=1000)
     severity_min: Optional[float] = Field(None, ge=0, le=1)
+    since: Optional[int] = Field(None, ge=0, description="Cursor from a previous next_cursor")
 
 
 class AnomalyHistoryResponse(BaseModel):
@@ -130,6 +131,7 @@ class AnomalyHistoryResponse(BaseModel):
     anomalies: List[AnomalyResponse]
     start_time: Optional[datetime]
     end_time: Optional[datetime]
+    next_cursor: Optional[int] = Field(None, description="Pass as `since` to fetch only newer anomalies")
 
 
 class HealthCheckResponse(BaseModel):
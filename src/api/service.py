@@ -7,8 +7,7 @@ FastAPI-based REST API for telemetry ingestion and anomaly detection.
 import os
 import time
 from datetime import datetime, timedelta
-from typing import List
-from collections import deque
+from typing import List, Optional
 from fastapi import FastAPI, HTTPException, status, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import HTTPBasic, HTTPBasicCredentials
@@ -55,6 +54,9 @@ from state_machine.state_engine import StateMachine, MissionPhase
 from config.mission_phase_policy_loader import MissionPhasePolicyLoader
 from anomaly_agent.phase_aware_handler import PhaseAwareAnomalyHandler
 from anomaly.anomaly_detector import detect_anomaly, load_model
+from api.anomaly_history import AnomalyHistory
+from api.batch_processor import process_telemetry_batch
+from api.ingest_pipeline import TelemetryIngestPipeline, IngestBackpressureError, IngestStoppedError
 from classifier.fault_classifier import classify
 from core.component_health import get_health_monitor
 from memory_engine.memory_store import AdaptiveMemoryStore
@@ -63,7 +65,8 @@ from security_engine.predictive_maintenance import (
     TimeSeriesData,
     PredictionResult
 )
-from fastapi.responses import Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response, JSONResponse
 from core.metrics import get_metrics_text, get_metrics_content_type
 from core.rate_limiter import RateLimiter, RateLimitMiddleware, get_rate_limit_config
 from backend.redis_client import RedisClient
@@ -100,8 +103,9 @@ phase_aware_handler = None
 memory_store = None
 predictive_engine = None
 latest_telemetry_data = None # Store latest telemetry for dashboard
-anomaly_history = deque(maxlen=MAX_ANOMALY_HISTORY_SIZE)  # Bounded deque prevents memory exhaustion
+anomaly_history = AnomalyHistory(maxlen=MAX_ANOMALY_HISTORY_SIZE)  # Bounded ring buffer prevents memory exhaustion
 active_faults = {} # Stores active chaos experiments: {fault_type: expiration_timestamp}
+ingest_pipeline = None  # Staged ingest (opt-in via INGEST_PIPELINE_ENABLED)
 start_time = time.time()
 
 # Rate limiting
@@ -208,7 +212,7 @@ def _check_credential_security():
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
-    global redis_client, telemetry_limiter, api_limiter
+    global redis_client, telemetry_limiter, api_limiter, ingest_pipeline
 
     # Security: Check credentials at startup
     _check_credential_security()
@@ -219,6 +223,27 @@ async def lifespan(app: FastAPI):
     # Pre-load anomaly detection model async
     await load_model()
 
+    # Staged ingest pipeline (request path only enqueues)
+    if (get_secret("ingest_pipeline_enabled") or "false").lower() in ("1", "true", "yes"):
+        ingest_pipeline = TelemetryIngestPipeline(
+            state_machine,
+            phase_aware_handler,
+            memory_store=memory_store,
+            predictive_engine=predictive_engine,
+            history=anomaly_history,
+            queue_size=int(get_secret("ingest_queue_size", "1000")),
+            max_batch_size=int(get_secret("ingest_max_batch_size", "64")),
+        )
+        await ingest_pipeline.start()
+
+    # Background retraining of predictive models (periodic or on drift)
+    training_interval = get_secret("predictive_training_interval_s")
+    if predictive_engine and training_interval:
+        predictive_engine.start_training_scheduler(
+            interval_s=float(training_interval),
+            drift_threshold=float(get_secret("predictive_drift_threshold", "3.0")),
+        )
+
     # Initialize rate limiting
     try:
         redis_url = get_secret("redis_url")
@@ -266,6 +291,11 @@ async def lifespan(app: FastAPI):
     yield
 
     # Cleanup
+    if ingest_pipeline:
+        await ingest_pipeline.stop()
+        ingest_pipeline = None
+    if predictive_engine:
+        await predictive_engine.close()
     if memory_store:
         memory_store.save()
     if redis_client:
@@ -404,38 +434,6 @@ def create_response(status: str, data: dict = None, **kwargs) -> dict:
     return response
 
 
-def process_telemetry_batch(telemetry_list: list) -> dict:
-    """Process a batch of telemetry data and return aggregated results."""
-    processed_count = 0
-    anomalies_detected = 0
-
-    for telemetry in telemetry_list:
-        try:
-            # Process individual telemetry (extracted from submit_telemetry logic)
-            processed_count += 1
-
-            # Check for anomalies
-            anomaly_score = anomaly_detector.detect_anomaly(telemetry)
-            if anomaly_score > 0.7:
-                anomalies_detected += 1
-
-                # Store anomaly
-                anomaly = AnomalyEvent(
-                    timestamp=datetime.now(),
-                    metric=telemetry.get('metric', 'unknown'),
-                    value=telemetry.get('value', 0.0),
-                    severity_score=anomaly_score,
-                    context=telemetry
-                )
-                anomaly_history.append(anomaly)
-
-        except Exception as e:
-            logger.error(f"Failed to process telemetry: {e}")
-            continue
-    return {
-        "processed": processed_count,
-        "anomalies_detected": anomalies_detected
-    }
 # ============================================================================
 # API Endpoints
 # ============================================================================
@@ -528,12 +526,20 @@ async def metrics(username: str = Depends(get_current_username)):
 
 
 @app.post("/api/v1/telemetry", response_model=AnomalyResponse, status_code=status.HTTP_200_OK)
-async def submit_telemetry(telemetry: TelemetryInput, current_user: User = Depends(require_operator)):
+async def submit_telemetry(
+    telemetry: TelemetryInput,
+    sync: bool = True,
+    current_user: User = Depends(require_operator),
+):
     """
     Submit single telemetry point for anomaly detection.
 
     Requires API key authentication with 'write' permission.
 
+    When the ingest pipeline is enabled the point is queued; with sync=false
+    the request returns 202 as soon as it is queued, and a full queue
+    returns 429.
+
     Returns:
         AnomalyResponse with detection results and recommended actions
     """
@@ -551,6 +557,9 @@ async def submit_telemetry(telemetry: TelemetryInput, current_user: User = Depen
             detail="Chaos Injection: Model Loader Failed"
         )
     
+    if ingest_pipeline is not None:
+        return await _enqueue_telemetry(telemetry, sync)
+
     try:
         if OBSERVABILITY_ENABLED:
             with track_request("anomaly_detection"):
@@ -583,6 +592,53 @@ async def submit_telemetry(telemetry: TelemetryInput, current_user: User = Depen
         ) from e
 
 
+async def _enqueue_telemetry(telemetry: TelemetryInput, sync: bool):
+    """Hand a telemetry point to the ingest pipeline."""
+    global latest_telemetry_data
+    latest_telemetry_data = {
+        "data": {
+            "voltage": telemetry.voltage,
+            "temperature": telemetry.temperature,
+            "gyro": telemetry.gyro,
+            "current": telemetry.current or 0.0,
+            "wheel_speed": telemetry.wheel_speed or 0.0,
+        },
+        "timestamp": datetime.now()
+    }
+
+    try:
+        response = await ingest_pipeline.submit(telemetry, wait=sync)
+    except IngestBackpressureError as e:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=str(e),
+            headers={"Retry-After": str(int(e.retry_after))},
+        ) from e
+    except IngestStoppedError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+        ) from e
+    except Exception as e:
+        if OBSERVABILITY_ENABLED:
+            log_error(get_logger(__name__), e, {"endpoint": "/api/v1/telemetry"})
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Anomaly detection failed: {str(e)}"
+        ) from e
+
+    if response is None:
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content=jsonable_encoder(
+                create_response("accepted", {"queue_depth": ingest_pipeline.queue_depths()})
+            ),
+        )
+    if OBSERVABILITY_ENABLED and response.is_anomaly:
+        ANOMALY_DETECTIONS.labels(severity=response.severity_level.lower()).inc()
+    return response
+
+
 async def _process_telemetry(telemetry: TelemetryInput, request_start: float) -> AnomalyResponse:
     """Internal telemetry processing logic."""
     # Convert telemetry to dict
@@ -730,24 +786,76 @@ async def get_latest_telemetry(api_key: APIKey = Depends(get_api_key)):
     return create_response("success", latest_telemetry_data)
 
 
+@app.get("/api/v1/telemetry/pipeline")
+async def get_ingest_pipeline_stats(api_key: APIKey = Depends(get_api_key)):
+    """Get ingest pipeline queue depths, counters and per-stage latency."""
+    if ingest_pipeline is None:
+        return create_response("disabled", {"running": False})
+    return create_response("success", ingest_pipeline.get_stats())
+
+
 @app.post("/api/v1/telemetry/batch", response_model=BatchAnomalyResponse)
 async def submit_telemetry_batch(batch: TelemetryBatch, current_user: User = Depends(require_operator)):
     """
     Submit batch of telemetry points for anomaly detection.
 
+    The batch is scored in one vectorized pass (see api.batch_processor)
+    rather than running the single-point pipeline once per sample.
+
     Requires API key authentication with 'write' permission.
 
     Returns:
         BatchAnomalyResponse with aggregated results
     """
-    results = []
-    anomalies_detected = 0
+    request_start = time.time()
+
+    # CHAOS INJECTION HOOK (applied once per batch)
+    if check_chaos_injection("network_latency"):
+        time.sleep(2.0)  # Simulate 2s latency
+
+    if check_chaos_injection("model_loader"):
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Chaos Injection: Model Loader Failed"
+        )
+
+    global latest_telemetry_data
+    last = batch.telemetry[-1]
+    latest_telemetry_data = {
+        "data": {
+            "voltage": last.voltage,
+            "temperature": last.temperature,
+            "gyro": last.gyro,
+            "current": last.current or 0.0,
+            "wheel_speed": last.wheel_speed or 0.0,
+        },
+        "timestamp": datetime.now()
+    }
 
-    for telemetry in batch.telemetry:
-        result = await submit_telemetry(telemetry)
-        results.append(result)
-        if result.is_anomaly:
-            anomalies_detected += 1
+    try:
+        results = await process_telemetry_batch(
+            batch.telemetry,
+            state_machine=state_machine,
+            phase_aware_handler=phase_aware_handler,
+            memory_store=memory_store,
+            predictive_engine=predictive_engine,
+            history=anomaly_history,
+        )
+    except Exception as e:
+        if OBSERVABILITY_ENABLED:
+            log_error(get_logger(__name__), e, {"endpoint": "/api/v1/telemetry/batch"})
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Batch anomaly detection failed: {str(e)}"
+        ) from e
+
+    anomalies_detected = sum(1 for r in results if r.is_anomaly)
+
+    if OBSERVABILITY_ENABLED:
+        for result in results:
+            if result.is_anomaly:
+                ANOMALY_DETECTIONS.labels(severity=result.severity_level.lower()).inc()
+        DETECTION_LATENCY.observe(time.time() - request_start)
 
     return BatchAnomalyResponse(
         total_processed=len(results),
@@ -855,30 +963,29 @@ async def get_anomaly_history(
     start_time: datetime = None,
     end_time: datetime = None,
     limit: int = 100,
-    severity_min: float = None
+    severity_min: float = None,
+    since: Optional[int] = None
 ):
-    """Retrieve anomaly history with optional filtering."""
-    # Convert deque to list for filtering operations
-    filtered = list(anomaly_history)
-
-    # Filter by time range
-    if start_time:
-        filtered = [a for a in filtered if a.timestamp >= start_time]
-    if end_time:
-        filtered = [a for a in filtered if a.timestamp <= end_time]
+    """Retrieve anomaly history with optional filtering.
 
-    # Filter by severity
-    if severity_min is not None:
-        filtered = [a for a in filtered if a.severity_score >= severity_min]
-
-    # Apply limit (get last N items)
-    filtered = filtered[-limit:] if len(filtered) > limit else filtered
+    Without `since` the latest `limit` matches are returned. Pass the
+    previous response's `next_cursor` as `since` to fetch only anomalies
+    recorded after that poll.
+    """
+    filtered, next_cursor = anomaly_history.query(
+        start_time=start_time,
+        end_time=end_time,
+        severity_min=severity_min,
+        limit=limit,
+        since=since,
+    )
 
     return AnomalyHistoryResponse(
         count=len(filtered),
         anomalies=filtered,
         start_time=start_time,
-        end_time=end_time
+        end_time=end_time,
+        next_cursor=next_cursor
     )
 
 
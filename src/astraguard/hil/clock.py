@@ -0,0 +1,83 @@
+"""Injectable clocks for HIL simulation.
+
+Simulators, fault models and metric collectors read time through a Clock
+instead of calling datetime.now()/time.time() directly. WallClock (the
+default) keeps the existing real-time behaviour; VirtualClock only moves
+when the scenario executor advances it, so scenarios run as fast as the
+physics allows and produce the same timestamps on every run.
+"""
+
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta
+from typing import Optional
+
+# Fixed start of simulated time, so virtual runs are reproducible
+DEFAULT_EPOCH = datetime(2026, 1, 1)
+
+
+class Clock(ABC):
+    """Source of the current time for HIL components."""
+
+    @abstractmethod
+    def now(self) -> datetime:
+        """Current time as a naive datetime (like datetime.now())."""
+
+    @abstractmethod
+    def time(self) -> float:
+        """Current time as a Unix timestamp (like time.time())."""
+
+
+class WallClock(Clock):
+    """Real time."""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def time(self) -> float:
+        return time.time()
+
+
+class VirtualClock(Clock):
+    """
+    Simulated time that only advances when told to.
+
+    Example:
+        clock = VirtualClock()
+        clock.advance(60.0)
+        clock.elapsed_s  # 60.0
+    """
+
+    def __init__(self, epoch: Optional[datetime] = None):
+        """
+        Initialize virtual clock.
+
+        Args:
+            epoch: Simulated start time (default: DEFAULT_EPOCH)
+        """
+        self.epoch = epoch or DEFAULT_EPOCH
+        self._epoch_ts = self.epoch.timestamp()
+        self.elapsed_s = 0.0
+
+    def now(self) -> datetime:
+        return self.epoch + timedelta(seconds=self.elapsed_s)
+
+    def time(self) -> float:
+        return self._epoch_ts + self.elapsed_s
+
+    def advance(self, seconds: float) -> None:
+        """Move simulated time forward.
+
+        Raises:
+            ValueError: If seconds is negative
+        """
+        if seconds < 0:
+            raise ValueError(f"Cannot move a clock backwards ({seconds}s)")
+        self.elapsed_s += seconds
+
+    def advance_to(self, elapsed_s: float) -> None:
+        """Move simulated time to elapsed_s seconds after the epoch."""
+        self.advance(elapsed_s - self.elapsed_s)
+
+
+WALL_CLOCK = WallClock()
@@ -1,11 +1,13 @@
 """HIL metrics collection and analysis."""
 
 from astraguard.hil.metrics.latency import LatencyCollector, LatencyMeasurement
+from astraguard.hil.metrics.sketch import QuantileSketch
 from astraguard.hil.metrics.accuracy import AccuracyCollector, GroundTruthEvent, AgentClassification
 
 __all__ = [
     "LatencyCollector",
     "LatencyMeasurement",
+    "QuantileSketch",
     "AccuracyCollector",
     "GroundTruthEvent",
     "AgentClassification",
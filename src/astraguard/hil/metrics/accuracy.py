@@ -1,11 +1,13 @@
 """Ground-truth accuracy metrics for agent classification validation."""
 
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Sequence, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 import numpy as np
 from collections import defaultdict
 
+from astraguard.hil.metrics.columns import ColumnBuffer
+
 
 class FaultState(str, Enum):
     """Fault states for ground truth."""
@@ -34,13 +36,102 @@ class AgentClassification:
     is_correct: bool
 
 
+# Classifications match ground truth on the same satellite within this window
+MATCH_TOLERANCE_S = 1.0
+
+_GROUND_TRUTH_DTYPES = {
+    "timestamp_s": np.float64,
+    "satellite_code": np.int32,
+    "fault_code": np.int16,  # -1 = nominal
+    "confidence": np.float64,
+}
+_CLASSIFICATION_DTYPES = {
+    "timestamp_s": np.float64,
+    "satellite_code": np.int32,
+    "fault_code": np.int16,  # -1 = nominal prediction
+    "confidence": np.float64,
+    "is_correct": np.bool_,
+}
+
+
 class AccuracyCollector:
-    """Validates agent classification accuracy against scenario ground truth."""
+    """
+    Validates agent classification accuracy against scenario ground truth.
+
+    Ground truth and classifications are stored as columns with interned
+    satellite and fault-type codes. Ground truth is indexed per satellite
+    as sorted timestamp arrays, so matching a classification is a binary
+    search within MATCH_TOLERANCE_S instead of a scan of every event.
+    """
 
     def __init__(self):
         """Initialize accuracy collector."""
-        self.ground_truth_events: List[GroundTruthEvent] = []
-        self.agent_classifications: List[AgentClassification] = []
+        self._satellite_codes: Dict[str, int] = {}
+        self._fault_codes: Dict[str, int] = {}
+        self._ground_truth = ColumnBuffer(_GROUND_TRUTH_DTYPES)
+        self._classifications = ColumnBuffer(_CLASSIFICATION_DTYPES)
+        self._match_cache: Optional[Tuple[Tuple[int, int], Any]] = None
+        self._batch_codes: Optional[Tuple[Tuple[str, ...], np.ndarray]] = None
+
+    @staticmethod
+    def _code(codes: Dict[str, int], key: str) -> int:
+        code = codes.get(key)
+        if code is None:
+            code = codes[key] = len(codes)
+        return code
+
+    def _fault_code(self, fault_type: Optional[str]) -> int:
+        return self._code(self._fault_codes, fault_type) if fault_type else -1
+
+    def _satellite_code_array(self, sat_ids: Sequence[str]) -> np.ndarray:
+        """Satellite codes for a batch (reused while the satellite list is unchanged)."""
+        key = tuple(sat_ids)
+        if self._batch_codes is None or self._batch_codes[0] != key:
+            codes = self._satellite_codes
+            self._batch_codes = (
+                key, np.fromiter((self._code(codes, s) for s in key), np.int32, len(key))
+            )
+        return self._batch_codes[1]
+
+    @property
+    def ground_truth_events(self) -> List[GroundTruthEvent]:
+        """Recorded ground truth, in recording order."""
+        sat_ids = list(self._satellite_codes)
+        faults = list(self._fault_codes)
+        cols = self._ground_truth.columns()
+        return [
+            GroundTruthEvent(
+                timestamp_s=t,
+                satellite_id=sat_ids[s],
+                expected_fault_type=faults[f] if f >= 0 else None,
+                confidence=conf,
+            )
+            for t, s, f, conf in zip(
+                cols["timestamp_s"].tolist(), cols["satellite_code"].tolist(),
+                cols["fault_code"].tolist(), cols["confidence"].tolist(),
+            )
+        ]
+
+    @property
+    def agent_classifications(self) -> List[AgentClassification]:
+        """Recorded agent classifications, in recording order."""
+        sat_ids = list(self._satellite_codes)
+        faults = list(self._fault_codes)
+        cols = self._classifications.columns()
+        return [
+            AgentClassification(
+                timestamp_s=t,
+                satellite_id=sat_ids[s],
+                predicted_fault=faults[f] if f >= 0 else None,
+                confidence=conf,
+                is_correct=ok,
+            )
+            for t, s, f, conf, ok in zip(
+                cols["timestamp_s"].tolist(), cols["satellite_code"].tolist(),
+                cols["fault_code"].tolist(), cols["confidence"].tolist(),
+                cols["is_correct"].tolist(),
+            )
+        ]
 
     def record_ground_truth(
         self,
@@ -58,13 +149,12 @@ class AccuracyCollector:
             fault_type: Expected fault type (None = nominal)
             confidence: Ground truth confidence (always 1.0)
         """
-        event = GroundTruthEvent(
+        self._ground_truth.append(
             timestamp_s=scenario_time_s,
-            satellite_id=sat_id,
-            expected_fault_type=fault_type,
+            satellite_code=self._code(self._satellite_codes, sat_id),
+            fault_code=self._fault_code(fault_type),
             confidence=confidence,
         )
-        self.ground_truth_events.append(event)
 
     def record_agent_classification(
         self,
@@ -84,14 +174,131 @@ class AccuracyCollector:
             confidence: Agent's confidence in prediction
             is_correct: Whether prediction matches ground truth
         """
-        classification = AgentClassification(
+        self._classifications.append(
             timestamp_s=scenario_time_s,
-            satellite_id=sat_id,
-            predicted_fault=predicted_fault,
+            satellite_code=self._code(self._satellite_codes, sat_id),
+            fault_code=self._fault_code(predicted_fault),
             confidence=confidence,
             is_correct=is_correct,
         )
-        self.agent_classifications.append(classification)
+
+    def record_classification_batch(
+        self,
+        sat_ids: Sequence[str],
+        scenario_time_s: float,
+        predicted_faults: Sequence[Optional[str]],
+        confidences: Sequence[float],
+        is_correct: Sequence[bool],
+    ) -> None:
+        """
+        Record one classification per satellite for the same instant.
+
+        Equivalent to calling record_agent_classification() for each
+        satellite, without per-classification overhead.
+
+        Args:
+            sat_ids: Satellite identifiers
+            scenario_time_s: Simulation time
+            predicted_faults: Predicted fault types (None = nominal), aligned with sat_ids
+            confidences: Agent confidences, aligned with sat_ids
+            is_correct: Whether each prediction matches ground truth
+        """
+        n = len(sat_ids)
+        if not (len(predicted_faults) == len(confidences) == len(is_correct) == n):
+            raise ValueError(f"Got {n} satellites but misaligned classification columns")
+        if not n:
+            return
+        predicted = np.asarray(predicted_faults, dtype=object)
+        fault_codes = np.full(n, -1, dtype=np.int16)
+        faulty = np.flatnonzero(predicted != None)  # noqa: E711 (elementwise)
+        if len(faulty):
+            names, inverse = np.unique(predicted[faulty].astype(str), return_inverse=True)
+            lookup = np.array([self._fault_code(name) for name in names.tolist()], dtype=np.int16)
+            fault_codes[faulty] = lookup[inverse]
+        self._classifications.extend(
+            timestamp_s=scenario_time_s,
+            satellite_code=self._satellite_code_array(sat_ids),
+            fault_code=fault_codes,
+            confidence=np.asarray(confidences, dtype=np.float64),
+            is_correct=np.asarray(is_correct, dtype=bool),
+        )
+
+    def _ground_truth_index(self) -> Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """
+        Index ground truth per satellite.
+
+        Returns:
+            Satellite code -> (sorted timestamps, fault codes, recording
+            order), all aligned
+        """
+        if not len(self._ground_truth):
+            return {}
+        cols = self._ground_truth.columns()
+        sats = cols["satellite_code"]
+        # Stable sort: ties keep recording order
+        order = np.lexsort((cols["timestamp_s"], sats))
+        sats_sorted = sats[order]
+        starts = np.flatnonzero(np.r_[True, sats_sorted[1:] != sats_sorted[:-1]])
+        ends = np.r_[starts[1:], len(order)]
+        return {
+            int(sats_sorted[start]): (
+                cols["timestamp_s"][order[start:end]],
+                cols["fault_code"][order[start:end]],
+                order[start:end],
+            )
+            for start, end in zip(starts.tolist(), ends.tolist())
+        }
+
+    def _match_ground_truth(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Join every classification to the ground truth around it.
+
+        A classification matches events on the same satellite with
+        |event time - classification time| < MATCH_TOLERANCE_S.
+
+        Returns:
+            (actual, in_window): actual[i] is the fault code of the earliest
+            recorded matching event for classification i (-1 if none or
+            nominal); in_window[i, f] is True if any matching event has
+            fault code f
+        """
+        key = (len(self._classifications), len(self._ground_truth))
+        if self._match_cache is not None and self._match_cache[0] == key:
+            return self._match_cache[1]
+
+        cols = self._classifications.columns()
+        times = cols["timestamp_s"]
+        sats = cols["satellite_code"]
+        actual = np.full(len(times), -1, dtype=np.int16)
+        in_window = np.zeros((len(times), len(self._fault_codes)), dtype=bool)
+
+        index = self._ground_truth_index()
+        for sat, (event_times, event_faults, event_order) in index.items():
+            rows = np.flatnonzero(sats == sat)
+            if not len(rows):
+                continue
+            t = times[rows]
+            # Bisect a slightly wider window, then apply the exact test
+            slack = 1e-9 * np.maximum(1.0, np.abs(t))
+            lo = np.searchsorted(event_times, t - MATCH_TOLERANCE_S - slack, side="left")
+            hi = np.searchsorted(event_times, t + MATCH_TOLERANCE_S + slack, side="right")
+            first = np.full(len(rows), len(self._ground_truth), dtype=np.int64)
+            first_fault = np.full(len(rows), -1, dtype=np.int16)
+            for offset in range(int((hi - lo).max(initial=0))):
+                candidate = lo + offset
+                valid = candidate < hi
+                candidate = np.where(valid, candidate, 0)
+                match = valid & (np.abs(event_times[candidate] - t) < MATCH_TOLERANCE_S)
+                faults = event_faults[candidate]
+                earlier = match & (event_order[candidate] < first)
+                first = np.where(earlier, event_order[candidate], first)
+                first_fault = np.where(earlier, faults, first_fault)
+                faulted = match & (faults >= 0)
+                in_window[rows[faulted], faults[faulted]] = True
+            actual[rows] = first_fault
+
+        self._match_cache = (key, (actual, in_window))
+        return actual, in_window
 
     def get_accuracy_stats(self) -> Dict[str, Any]:
         """
@@ -100,7 +307,7 @@ class AccuracyCollector:
         Returns:
             Dict with overall accuracy, per-fault-type precision/recall, confidence
         """
-        if not self.agent_classifications:
+        if not len(self._classifications):
             return {
                 "total_classifications": 0,
                 "correct_classifications": 0,
@@ -110,16 +317,16 @@ class AccuracyCollector:
                 "confidence_std": 0.0,
             }
 
-        total = len(self.agent_classifications)
-        correct = sum(1 for c in self.agent_classifications if c.is_correct)
+        cols = self._classifications.columns()
+        total = len(self._classifications)
+        correct = int(np.count_nonzero(cols["is_correct"]))
 
         # Per-fault-type breakdown
         by_fault = self._calculate_per_fault_stats()
 
         # Confidence statistics
-        confidences = [c.confidence for c in self.agent_classifications]
-        confidence_mean = float(np.mean(confidences))
-        confidence_std = float(np.std(confidences))
+        confidence_mean = float(np.mean(cols["confidence"]))
+        confidence_std = float(np.std(cols["confidence"]))
 
         return {
             "total_classifications": total,
@@ -134,74 +341,63 @@ class AccuracyCollector:
         """
         Calculate precision, recall, F1 per fault type.
 
+        All fault types are counted in one pass with bincount over the
+        classification columns and the ground-truth join.
+
         Returns:
             Dict mapping fault types to metrics
         """
-        # Collect all possible fault types
-        fault_types = set()
-        for c in self.agent_classifications:
-            if c.predicted_fault:
-                fault_types.add(c.predicted_fault)
-        for e in self.ground_truth_events:
-            if e.expected_fault_type:
-                fault_types.add(e.expected_fault_type)
-
-        stats = {}
-
-        for fault_type in sorted(fault_types):
-            # True positives: correctly identified
-            tp = sum(
-                1
-                for c in self.agent_classifications
-                if c.predicted_fault == fault_type and c.is_correct
-            )
+        n_faults = len(self._fault_codes)
+        cols = self._classifications.columns()
+        predicted = cols["fault_code"].astype(np.int64)
+        is_correct = cols["is_correct"]
+        has_prediction = predicted >= 0
+        faulted = predicted[has_prediction]
+
+        # True positives: correctly identified
+        tp = np.bincount(faulted[is_correct[has_prediction]], minlength=n_faults)
+        # False positives: incorrectly identified
+        fp = np.bincount(faulted[~is_correct[has_prediction]], minlength=n_faults)
+        confidence_sum = np.bincount(
+            faulted, weights=cols["confidence"][has_prediction], minlength=n_faults
+        )
 
-            # False positives: incorrectly identified
-            fp = sum(
-                1
-                for c in self.agent_classifications
-                if c.predicted_fault == fault_type and not c.is_correct
-            )
+        # False negatives: wrong classifications with that fault in the
+        # ground-truth window, unless that fault is what was predicted
+        _, in_window = self._match_ground_truth()
+        missed = in_window & ~is_correct[:, None]
+        rows = np.flatnonzero(has_prediction)
+        missed[rows, predicted[rows]] = False
+        fn = missed.sum(axis=0)
 
-            # False negatives: should have detected but didn't
-            fn = sum(
-                1
-                for c in self.agent_classifications
-                if c.predicted_fault != fault_type
-                and c.is_correct is False
-                and any(
-                    e.expected_fault_type == fault_type
-                    for e in self.ground_truth_events
-                    if e.satellite_id == c.satellite_id
-                    and abs(e.timestamp_s - c.timestamp_s) < 1.0
-                )
-            )
+        stats = {}
+        fault_names = list(self._fault_codes)
+        for fault_type in sorted(fault_names):
+            code = self._fault_codes[fault_type]
+            tp_f, fp_f, fn_f = int(tp[code]), int(fp[code]), int(fn[code])
 
             # Calculate metrics
-            precision = tp / (tp + fp) if (tp + fp) > 0 else 0.0
-            recall = tp / (tp + fn) if (tp + fn) > 0 else 0.0
+            precision = tp_f / (tp_f + fp_f) if (tp_f + fp_f) > 0 else 0.0
+            recall = tp_f / (tp_f + fn_f) if (tp_f + fn_f) > 0 else 0.0
             f1 = (
                 2 * (precision * recall) / (precision + recall)
                 if (precision + recall) > 0
                 else 0.0
             )
-
-            predictions = [
-                c for c in self.agent_classifications if c.predicted_fault == fault_type
-            ]
+            total_predictions = tp_f + fp_f
 
             stats[fault_type] = {
                 "precision": precision,
                 "recall": recall,
                 "f1": f1,
-                "true_positives": tp,
-                "false_positives": fp,
-                "false_negatives": fn,
-                "total_predictions": len(predictions),
-                "correct_predictions": tp,
+                "true_positives": tp_f,
+                "false_positives": fp_f,
+                "false_negatives": fn_f,
+                "total_predictions": total_predictions,
+                "correct_predictions": tp_f,
                 "avg_confidence": (
-                    float(np.mean([c.confidence for c in predictions]))
-                    if predictions
+                    float(confidence_sum[code]) / total_predictions
+                    if total_predictions
                     else 0.0
                 ),
             }
@@ -215,25 +411,25 @@ class AccuracyCollector:
         Returns:
             Dict mapping satellite ID to accuracy stats
         """
-        by_satellite = defaultdict(list)
+        cols = self._classifications.columns()
+        sats = cols["satellite_code"]
+        n_sats = len(self._satellite_codes)
+        totals = np.bincount(sats, minlength=n_sats)
+        corrects = np.bincount(sats[cols["is_correct"]], minlength=n_sats)
+        confidence_sums = np.bincount(sats, weights=cols["confidence"], minlength=n_sats)
 
-        for c in self.agent_classifications:
-            by_satellite[c.satellite_id].append(c)
+        # Satellites in order of their first classification
+        _, first_seen = np.unique(sats, return_index=True)
+        sat_ids = list(self._satellite_codes)
 
         stats = {}
-        for sat_id, classifications in by_satellite.items():
-            total = len(classifications)
-            correct = sum(1 for c in classifications if c.is_correct)
-
-            stats[sat_id] = {
+        for sat in sats[np.sort(first_seen)].tolist():
+            total, correct = int(totals[sat]), int(corrects[sat])
+            stats[sat_ids[sat]] = {
                 "total_classifications": total,
                 "correct_classifications": correct,
                 "accuracy": correct / total if total > 0 else 0.0,
-                "avg_confidence": (
-                    float(np.mean([c.confidence for c in classifications]))
-                    if classifications
-                    else 0.0
-                ),
+                "avg_confidence": float(confidence_sums[sat]) / total if total else 0.0,
             }
 
         return stats
@@ -242,29 +438,26 @@ class AccuracyCollector:
         """
         Build confusion matrix of predicted vs actual fault types.
 
+        The actual type of a classification is the earliest recorded ground
+        truth on its satellite within MATCH_TOLERANCE_S (nominal if none).
+
         Returns:
             Nested dict: predicted[actual] = count
         """
-        confusion = defaultdict(lambda: defaultdict(int))
+        actual, _ = self._match_ground_truth()
+        predicted = self._classifications.columns()["fault_code"]
 
-        # Map classifications to ground truth
-        for c in self.agent_classifications:
-            # Find matching ground truth
-            actual_fault = None
-            for e in self.ground_truth_events:
-                if (
-                    e.satellite_id == c.satellite_id
-                    and abs(e.timestamp_s - c.timestamp_s) < 1.0
-                ):
-                    actual_fault = e.expected_fault_type
-                    break
+        # Row/column 0 is nominal, code c is at c + 1
+        size = len(self._fault_codes) + 1
+        counts = np.zeros((size, size), dtype=np.int64)
+        np.add.at(counts, (predicted.astype(np.int64) + 1, actual.astype(np.int64) + 1), 1)
 
-            predicted = c.predicted_fault or "nominal"
-            actual = actual_fault or "nominal"
-
-            confusion[predicted][actual] += 1
+        labels = ["nominal"] + list(self._fault_codes)
+        confusion = defaultdict(lambda: defaultdict(int))
+        for p, a in zip(*np.nonzero(counts)):
+            confusion[labels[p]][labels[a]] += int(counts[p, a])
 
-        return dict(confusion)
+        return {predicted: dict(row) for predicted, row in confusion.items()}
 
     def export_csv(self, filename: str) -> None:
         """
@@ -286,19 +479,20 @@ class AccuracyCollector:
                 "confidence",
                 "is_correct",
             ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for c in self.agent_classifications:
-                writer.writerow(
-                    {
-                        "timestamp_s": c.timestamp_s,
-                        "satellite_id": c.satellite_id,
-                        "predicted_fault": c.predicted_fault or "nominal",
-                        "confidence": c.confidence,
-                        "is_correct": c.is_correct,
-                    }
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+
+            sat_ids = list(self._satellite_codes)
+            faults = list(self._fault_codes)
+            cols = self._classifications.columns()
+            writer.writerows(
+                (t, sat_ids[s], faults[p] if p >= 0 else "nominal", conf, ok)
+                for t, s, p, conf, ok in zip(
+                    cols["timestamp_s"].tolist(), cols["satellite_code"].tolist(),
+                    cols["fault_code"].tolist(), cols["confidence"].tolist(),
+                    cols["is_correct"].tolist(),
                 )
+            )
 
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -308,8 +502,8 @@ class AccuracyCollector:
             Complete summary dict
         """
         return {
-            "total_events": len(self.ground_truth_events),
-            "total_classifications": len(self.agent_classifications),
+            "total_events": len(self._ground_truth),
+            "total_classifications": len(self._classifications),
             "stats": self.get_accuracy_stats(),
             "stats_by_satellite": self.get_stats_by_satellite(),
             "confusion_matrix": self.get_confusion_matrix(),
@@ -317,9 +511,13 @@ class AccuracyCollector:
 
     def reset(self) -> None:
         """Clear all data."""
-        self.ground_truth_events.clear()
-        self.agent_classifications.clear()
+        self._ground_truth.clear()
+        self._classifications.clear()
+        self._satellite_codes.clear()
+        self._fault_codes.clear()
+        self._match_cache = None
+        self._batch_codes = None
 
     def __len__(self) -> int:
         """Return number of classifications."""
-        return len(self.agent_classifications)
+        return len(self._classifications)
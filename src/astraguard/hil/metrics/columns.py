@@ -0,0 +1,73 @@
+"""Growable column storage for high-volume HIL metrics."""
+
+from typing import Dict, Any
+
+import numpy as np
+
+
+class ColumnBuffer:
+    """
+    Struct-of-arrays buffer that grows by doubling.
+
+    Replaces a list of per-record dataclasses: each field lives in one
+    NumPy array, so storage is a few bytes per field and aggregations run
+    on whole columns.
+
+    Example:
+        buffer = ColumnBuffer({"t": np.float64, "sat": np.int32})
+        buffer.append(t=1.0, sat=0)
+        buffer.columns()["t"]  # array([1.])
+    """
+
+    def __init__(self, dtypes: Dict[str, Any], capacity: int = 1024):
+        """
+        Initialize empty buffer.
+
+        Args:
+            dtypes: Column name -> NumPy dtype
+            capacity: Initial number of rows allocated
+        """
+        self._dtypes = dict(dtypes)
+        self._size = 0
+        self._data = {name: np.empty(capacity, dtype=dtype) for name, dtype in self._dtypes.items()}
+
+    def _reserve(self, extra: int) -> None:
+        needed = self._size + extra
+        capacity = len(next(iter(self._data.values())))
+        if needed <= capacity:
+            return
+        capacity = max(capacity, 1)
+        while capacity < needed:
+            capacity *= 2
+        for name, values in self._data.items():
+            grown = np.empty(capacity, dtype=values.dtype)
+            grown[: self._size] = values[: self._size]
+            self._data[name] = grown
+
+    def append(self, **row: Any) -> None:
+        """Append one row (every column must be given)."""
+        self._reserve(1)
+        i = self._size
+        for name, values in self._data.items():
+            values[i] = row[name]
+        self._size += 1
+
+    def extend(self, **columns: Any) -> None:
+        """Append equal-length columns; scalars are broadcast to every row."""
+        n = max((np.size(v) for v in columns.values() if np.ndim(v)), default=1)
+        self._reserve(n)
+        for name, values in self._data.items():
+            values[self._size: self._size + n] = columns[name]
+        self._size += n
+
+    def columns(self) -> Dict[str, np.ndarray]:
+        """Views of the filled part of every column."""
+        return {name: values[: self._size] for name, values in self._data.items()}
+
+    def clear(self) -> None:
+        """Drop all rows (keeps the allocation)."""
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return number of rows."""
+        return self._size
@@ -1,13 +1,21 @@
 """High-resolution latency tracking for HIL validation."""
 
-import time
 import csv
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, asdict
-from datetime import datetime
+from typing import Dict, List, Any, Optional, Sequence, Tuple
+from dataclasses import dataclass
 from collections import defaultdict
 from pathlib import Path
 
+import numpy as np
+
+from astraguard.hil.clock import Clock, WALL_CLOCK
+from astraguard.hil.metrics.columns import ColumnBuffer
+from astraguard.hil.metrics.sketch import QuantileSketch
+
+# (stat name, quantile) reported per metric type and per satellite
+_TYPE_PERCENTILES = (("p50_ms", 0.5), ("p95_ms", 0.95), ("p99_ms", 0.99))
+_SATELLITE_PERCENTILES = (("p50_ms", 0.5), ("p95_ms", 0.95))
+
 
 @dataclass
 class LatencyMeasurement:
@@ -20,14 +28,125 @@ class LatencyMeasurement:
     scenario_time_s: float  # Simulation time when measured
 
 
+# Raw measurement columns; metric types and satellites are interned codes
+_MEASUREMENT_DTYPES = {
+    "timestamp": np.float64,
+    "scenario_time_s": np.float64,
+    "duration_ms": np.float64,
+    "metric_code": np.int16,
+    "satellite_code": np.int32,
+}
+
+
+def _sorted_stats(
+    latencies: np.ndarray, percentiles: Sequence[Tuple[str, float]], with_min: bool
+) -> Dict[str, Any]:
+    """Exact statistics for an ascending array of latencies."""
+    count = len(latencies)
+    stats = {"count": count, "mean_ms": float(latencies.sum()) / count}
+    for name, q in percentiles:
+        stats[name] = float(latencies[int(count * q)])
+    stats["max_ms"] = float(latencies[-1])
+    if with_min:
+        stats["min_ms"] = float(latencies[0])
+    return stats
+
+
+def _sketch_stats(
+    sketch: QuantileSketch, percentiles: Sequence[Tuple[str, float]], with_min: bool
+) -> Dict[str, Any]:
+    """Statistics from a sketch: count/mean/min/max exact, quantiles approximate."""
+    stats = {"count": sketch.count, "mean_ms": sketch.mean}
+    for name, q in percentiles:
+        stats[name] = sketch.quantile(q)
+    stats["max_ms"] = sketch.max
+    if with_min:
+        stats["min_ms"] = sketch.min
+    return stats
+
+
 class LatencyCollector:
-    """Captures high-resolution timing data across swarm (10Hz cadence)."""
+    """
+    Captures high-resolution timing data across swarm (10Hz cadence).
+
+    By default every measurement is kept in compact column arrays, so stats
+    are exact and export_csv() writes the raw data. With streaming=True only
+    mergeable quantile sketches per metric type and per satellite are kept:
+    memory stays bounded however long the run, count/mean/min/max remain
+    exact and percentiles are within relative_accuracy.
+    """
+
+    def __init__(
+        self,
+        clock: Optional[Clock] = None,
+        streaming: bool = False,
+        relative_accuracy: float = 0.01,
+    ):
+        """
+        Initialize collector with empty measurements.
 
-    def __init__(self):
-        """Initialize collector with empty measurements."""
-        self.measurements: List[LatencyMeasurement] = []
-        self._start_time = time.time()
+        Args:
+            clock: Time source for measurement timestamps (default: wall clock)
+            streaming: Keep quantile sketches instead of raw measurements
+            relative_accuracy: Sketch percentile error bound (streaming mode
+                and export_sketches())
+        """
+        self._clock = clock or WALL_CLOCK
+        self.streaming = streaming
+        self.relative_accuracy = relative_accuracy
+        self._start_time = self._clock.time()
         self._measurement_log: Dict[str, int] = defaultdict(int)
+        self._count = 0
+        # Raw mode: interned ids + column arrays
+        self._metric_codes: Dict[str, int] = {}
+        self._satellite_codes: Dict[str, int] = {}
+        self._batch_codes: Optional[Tuple[Tuple[str, ...], np.ndarray]] = None
+        self._columns = ColumnBuffer(_MEASUREMENT_DTYPES)
+        # Streaming mode: sketches
+        self._sketches: Dict[str, QuantileSketch] = {}
+        self._satellite_sketches: Dict[str, Dict[str, QuantileSketch]] = {}
+
+    @staticmethod
+    def _code(codes: Dict[str, int], key: str) -> int:
+        code = codes.get(key)
+        if code is None:
+            code = codes[key] = len(codes)
+        return code
+
+    def _satellite_code_array(self, sat_ids: Sequence[str]) -> np.ndarray:
+        """Satellite codes for a batch (reused while the satellite list is unchanged)."""
+        key = tuple(sat_ids)
+        if self._batch_codes is None or self._batch_codes[0] != key:
+            codes = self._satellite_codes
+            self._batch_codes = (
+                key, np.fromiter((self._code(codes, s) for s in key), np.int32, len(key))
+            )
+        return self._batch_codes[1]
+
+    def _sketch(self, metric_type: str, sat_id: Optional[str] = None) -> QuantileSketch:
+        sketches = self._sketches if sat_id is None else \
+            self._satellite_sketches.setdefault(sat_id, {})
+        sketch = sketches.get(metric_type)
+        if sketch is None:
+            sketch = sketches[metric_type] = QuantileSketch(self.relative_accuracy)
+        return sketch
+
+    def _record(
+        self, metric_type: str, sat_id: str, scenario_time_s: float, duration_ms: float
+    ) -> None:
+        if self.streaming:
+            self._sketch(metric_type).add(duration_ms)
+            self._sketch(metric_type, sat_id).add(duration_ms)
+        else:
+            self._columns.append(
+                timestamp=self._clock.time(),
+                scenario_time_s=scenario_time_s,
+                duration_ms=duration_ms,
+                metric_code=self._code(self._metric_codes, metric_type),
+                satellite_code=self._code(self._satellite_codes, sat_id),
+            )
+        self._count += 1
+        self._measurement_log[metric_type] += 1
 
     def record_fault_detection(
         self, sat_id: str, scenario_time_s: float, detection_delay_ms: float
@@ -40,15 +159,7 @@ class LatencyCollector:
             scenario_time_s: Simulation time when detected
             detection_delay_ms: Time from fault injection to detection
         """
-        measurement = LatencyMeasurement(
-            timestamp=time.time(),
-            metric_type="fault_detection",
-            satellite_id=sat_id,
-            duration_ms=detection_delay_ms,
-            scenario_time_s=scenario_time_s,
-        )
-        self.measurements.append(measurement)
-        self._measurement_log["fault_detection"] += 1
+        self._record("fault_detection", sat_id, scenario_time_s, detection_delay_ms)
 
     def record_agent_decision(
         self, sat_id: str, scenario_time_s: float, decision_time_ms: float
@@ -61,15 +172,7 @@ class LatencyCollector:
             scenario_time_s: Simulation time of decision
             decision_time_ms: Time for agent to process and decide
         """
-        measurement = LatencyMeasurement(
-            timestamp=time.time(),
-            metric_type="agent_decision",
-            satellite_id=sat_id,
-            duration_ms=decision_time_ms,
-            scenario_time_s=scenario_time_s,
-        )
-        self.measurements.append(measurement)
-        self._measurement_log["agent_decision"] += 1
+        self._record("agent_decision", sat_id, scenario_time_s, decision_time_ms)
 
     def record_recovery_action(
         self, sat_id: str, scenario_time_s: float, action_time_ms: float
@@ -82,15 +185,90 @@ class LatencyCollector:
             scenario_time_s: Simulation time of action
             action_time_ms: Time to execute recovery action
         """
-        measurement = LatencyMeasurement(
-            timestamp=time.time(),
-            metric_type="recovery_action",
-            satellite_id=sat_id,
-            duration_ms=action_time_ms,
-            scenario_time_s=scenario_time_s,
+        self._record("recovery_action", sat_id, scenario_time_s, action_time_ms)
+
+    def record_batch(
+        self,
+        metric_type: str,
+        sat_ids: Sequence[str],
+        scenario_time_s: float,
+        durations_ms: Sequence[float],
+    ) -> None:
+        """
+        Record one measurement per satellite for the same instant.
+
+        Equivalent to calling the matching record_* method for each
+        (sat_id, duration) pair, without per-measurement overhead.
+
+        Args:
+            metric_type: fault_detection, agent_decision or recovery_action
+            sat_ids: Satellite identifiers
+            scenario_time_s: Simulation time of the measurements
+            durations_ms: Latencies, aligned with sat_ids
+        """
+        if len(sat_ids) != len(durations_ms):
+            raise ValueError(
+                f"Got {len(sat_ids)} satellites but {len(durations_ms)} durations"
+            )
+        if not len(sat_ids):
+            return
+        durations = np.asarray(durations_ms, dtype=np.float64)
+        if self.streaming:
+            self._sketch(metric_type).add_many(durations)
+            for sat_id, duration in zip(sat_ids, durations.tolist()):
+                self._sketch(metric_type, sat_id).add(duration)
+        else:
+            self._columns.extend(
+                timestamp=self._clock.time(),
+                scenario_time_s=scenario_time_s,
+                duration_ms=durations,
+                metric_code=self._code(self._metric_codes, metric_type),
+                satellite_code=self._satellite_code_array(sat_ids),
+            )
+        self._count += len(durations)
+        self._measurement_log[metric_type] += len(durations)
+
+    @property
+    def measurements(self) -> List[LatencyMeasurement]:
+        """Raw measurements in recording order (empty in streaming mode)."""
+        metric_types = list(self._metric_codes)
+        sat_ids = list(self._satellite_codes)
+        cols = self._columns.columns()
+        return [
+            LatencyMeasurement(
+                timestamp=ts,
+                metric_type=metric_types[m],
+                satellite_id=sat_ids[s],
+                duration_ms=d,
+                scenario_time_s=st,
+            )
+            for ts, m, s, d, st in zip(
+                cols["timestamp"].tolist(), cols["metric_code"].tolist(),
+                cols["satellite_code"].tolist(), cols["duration_ms"].tolist(),
+                cols["scenario_time_s"].tolist(),
+            )
+        ]
+
+    def _grouped(self, by_satellite: bool):
+        """
+        Yield (satellite_code, metric_code, sorted latencies) per group.
+
+        One lexsort over the raw columns replaces a sort per group.
+        """
+        if not len(self._columns):
+            return
+        cols = self._columns.columns()
+        durations = cols["duration_ms"]
+        metrics = cols["metric_code"]
+        sats = cols["satellite_code"] if by_satellite else np.zeros_like(metrics)
+        order = np.lexsort((durations, metrics, sats))
+        durations, metrics, sats = durations[order], metrics[order], sats[order]
+        starts = np.flatnonzero(
+            np.r_[True, (metrics[1:] != metrics[:-1]) | (sats[1:] != sats[:-1])]
         )
-        self.measurements.append(measurement)
-        self._measurement_log["recovery_action"] += 1
+        ends = np.r_[starts[1:], len(durations)]
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            yield int(sats[start]), int(metrics[start]), durations[start:end]
 
     def get_stats(self) -> Dict[str, Any]:
         """
@@ -99,29 +277,20 @@ class LatencyCollector:
         Returns:
             Dict with per-metric-type statistics (count, mean, p50, p95, max)
         """
-        if not self.measurements:
+        if not self._count:
             return {}
 
-        by_type = defaultdict(list)
-        for m in self.measurements:
-            by_type[m.metric_type].append(m.duration_ms)
-
-        stats = {}
-        for metric_type, latencies in by_type.items():
-            sorted_latencies = sorted(latencies)
-            count = len(sorted_latencies)
-
-            stats[metric_type] = {
-                "count": count,
-                "mean_ms": sum(latencies) / count if count > 0 else 0,
-                "p50_ms": sorted_latencies[count // 2],
-                "p95_ms": sorted_latencies[int(count * 0.95)] if count > 0 else 0,
-                "p99_ms": sorted_latencies[int(count * 0.99)] if count > 0 else 0,
-                "max_ms": max(latencies),
-                "min_ms": min(latencies),
+        if self.streaming:
+            return {
+                metric_type: _sketch_stats(sketch, _TYPE_PERCENTILES, with_min=True)
+                for metric_type, sketch in self._sketches.items()
             }
 
-        return stats
+        metric_types = list(self._metric_codes)
+        return {
+            metric_types[metric]: _sorted_stats(latencies, _TYPE_PERCENTILES, with_min=True)
+            for _, metric, latencies in self._grouped(by_satellite=False)
+        }
 
     def get_stats_by_satellite(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -130,27 +299,124 @@ class LatencyCollector:
         Returns:
             Dict mapping satellite ID to stats
         """
-        by_satellite = defaultdict(lambda: defaultdict(list))
+        if self.streaming:
+            return {
+                sat_id: {
+                    metric_type: _sketch_stats(sketch, _SATELLITE_PERCENTILES, with_min=False)
+                    for metric_type, sketch in sketches.items()
+                }
+                for sat_id, sketches in self._satellite_sketches.items()
+            }
 
-        for m in self.measurements:
-            by_satellite[m.satellite_id][m.metric_type].append(m.duration_ms)
+        metric_types = list(self._metric_codes)
+        sat_ids = list(self._satellite_codes)
+        stats: Dict[str, Dict[str, Any]] = {}
+        for sat, metric, latencies in self._grouped(by_satellite=True):
+            stats.setdefault(sat_ids[sat], {})[metric_types[metric]] = _sorted_stats(
+                latencies, _SATELLITE_PERCENTILES, with_min=False
+            )
+        return stats
 
-        stats = {}
-        for sat_id, metrics in by_satellite.items():
-            stats[sat_id] = {}
-            for metric_type, latencies in metrics.items():
-                sorted_latencies = sorted(latencies)
-                count = len(sorted_latencies)
+    def export_sketches(self) -> Dict[str, Any]:
+        """
+        Export per-type and per-satellite sketches as a JSON-safe dict.
 
-                stats[sat_id][metric_type] = {
-                    "count": count,
-                    "mean_ms": sum(latencies) / count if count > 0 else 0,
-                    "p50_ms": sorted_latencies[count // 2],
-                    "p95_ms": sorted_latencies[int(count * 0.95)] if count > 0 else 0,
-                    "max_ms": max(latencies) if latencies else 0,
-                }
+        Raw collectors build the sketches from their measurements. Pass the
+        result to from_sketches() in another process and merge() it into a
+        campaign-wide collector.
+        """
+        if self.streaming:
+            sketches = self._sketches
+            satellite_sketches = self._satellite_sketches
+        else:
+            metric_types = list(self._metric_codes)
+            sat_ids = list(self._satellite_codes)
+            sketches = {}
+            satellite_sketches = {}
+            for sat, metric, latencies in self._grouped(by_satellite=True):
+                metric_type = metric_types[metric]
+                sketch = QuantileSketch(self.relative_accuracy)
+                sketch.add_many(latencies)
+                satellite_sketches.setdefault(sat_ids[sat], {})[metric_type] = sketch
+                if metric_type not in sketches:
+                    sketches[metric_type] = QuantileSketch(self.relative_accuracy)
+                sketches[metric_type].merge(sketch)
 
-        return stats
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "measurement_types": dict(self._measurement_log),
+            "by_type": {t: s.to_dict() for t, s in sketches.items()},
+            "by_satellite": {
+                sat_id: {t: s.to_dict() for t, s in per_type.items()}
+                for sat_id, per_type in satellite_sketches.items()
+            },
+        }
+
+    @classmethod
+    def from_sketches(
+        cls, data: Dict[str, Any], clock: Optional[Clock] = None
+    ) -> "LatencyCollector":
+        """
+        Rebuild a streaming collector from export_sketches() output.
+
+        Args:
+            data: Dict produced by export_sketches()
+            clock: Time source for further measurements
+
+        Returns:
+            Streaming LatencyCollector
+        """
+        collector = cls(
+            clock=clock, streaming=True, relative_accuracy=data["relative_accuracy"]
+        )
+        collector._sketches = {
+            t: QuantileSketch.from_dict(s) for t, s in data["by_type"].items()
+        }
+        collector._satellite_sketches = {
+            sat_id: {t: QuantileSketch.from_dict(s) for t, s in per_type.items()}
+            for sat_id, per_type in data["by_satellite"].items()
+        }
+        collector._measurement_log.update(data["measurement_types"])
+        collector._count = sum(data["measurement_types"].values())
+        return collector
+
+    def merge(self, other: "LatencyCollector") -> None:
+        """
+        Fold another collector's measurements into this one.
+
+        A streaming collector accepts any collector (raw ones are sketched
+        first); a raw collector only accepts raw collectors, since sketches
+        cannot be turned back into measurements.
+
+        Raises:
+            ValueError: If merging a streaming collector into a raw one, or
+                sketches use different relative accuracies
+        """
+        if self.streaming:
+            if not other.streaming:
+                other = LatencyCollector.from_sketches(other.export_sketches())
+            for metric_type, sketch in other._sketches.items():
+                self._sketch(metric_type).merge(sketch)
+            for sat_id, per_type in other._satellite_sketches.items():
+                for metric_type, sketch in per_type.items():
+                    self._sketch(metric_type, sat_id).merge(sketch)
+        else:
+            if other.streaming:
+                raise ValueError("Cannot merge a streaming collector into a raw collector")
+            metric_map = np.array(
+                [self._code(self._metric_codes, t) for t in other._metric_codes] or [0]
+            )
+            sat_map = np.array(
+                [self._code(self._satellite_codes, s) for s in other._satellite_codes] or [0]
+            )
+            cols = other._columns.columns()
+            cols["metric_code"] = metric_map[cols["metric_code"]]
+            cols["satellite_code"] = sat_map[cols["satellite_code"]]
+            self._columns.extend(**cols)
+
+        self._count += other._count
+        for metric_type, n in other._measurement_log.items():
+            self._measurement_log[metric_type] += n
 
     def export_csv(self, filename: str) -> None:
         """
@@ -158,7 +424,13 @@ class LatencyCollector:
 
         Args:
             filename: Path to output CSV file
+
+        Raises:
+            ValueError: In streaming mode, where raw measurements are not kept
         """
+        if self.streaming:
+            raise ValueError("Streaming collector keeps no raw measurements to export")
+
         Path(filename).parent.mkdir(parents=True, exist_ok=True)
 
         with open(filename, "w", newline="") as f:
@@ -169,11 +441,20 @@ class LatencyCollector:
                 "duration_ms",
                 "scenario_time_s",
             ]
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-
-            for m in self.measurements:
-                writer.writerow(asdict(m))
+            writer = csv.writer(f)
+            writer.writerow(fieldnames)
+
+            metric_types = list(self._metric_codes)
+            sat_ids = list(self._satellite_codes)
+            cols = self._columns.columns()
+            writer.writerows(
+                (ts, metric_types[m], sat_ids[s], d, st)
+                for ts, m, s, d, st in zip(
+                    cols["timestamp"].tolist(), cols["metric_code"].tolist(),
+                    cols["satellite_code"].tolist(), cols["duration_ms"].tolist(),
+                    cols["scenario_time_s"].tolist(),
+                )
+            )
 
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -182,11 +463,11 @@ class LatencyCollector:
         Returns:
             Dict with high-level metrics summary
         """
-        if not self.measurements:
+        if not self._count:
             return {"total_measurements": 0, "metrics": {}}
 
         return {
-            "total_measurements": len(self.measurements),
+            "total_measurements": self._count,
             "measurement_types": dict(self._measurement_log),
             "stats": self.get_stats(),
             "stats_by_satellite": self.get_stats_by_satellite(),
@@ -194,9 +475,15 @@ class LatencyCollector:
 
     def reset(self) -> None:
         """Clear all measurements."""
-        self.measurements.clear()
+        self._columns.clear()
+        self._metric_codes.clear()
+        self._satellite_codes.clear()
+        self._batch_codes = None
+        self._sketches.clear()
+        self._satellite_sketches.clear()
         self._measurement_log.clear()
+        self._count = 0
 
     def __len__(self) -> int:
         """Return number of measurements."""
-        return len(self.measurements)
+        return self._count
@@ -0,0 +1,161 @@
+"""Mergeable quantile sketch for streaming latency statistics."""
+
+import math
+from typing import Dict, Any, Iterable
+
+import numpy as np
+
+
+class QuantileSketch:
+    """
+    DDSketch-style quantile sketch with bounded relative error.
+
+    Positive values fall into logarithmic buckets of ratio gamma, so any
+    quantile is returned within relative_accuracy of the exact value (of
+    the same rank) while memory grows with the log of the value range, not
+    the number of values. Counts, sum, min and max are exact. Two sketches
+    with the same relative_accuracy merge by adding bucket counts, so
+    partial sketches from different processes or scenarios combine
+    losslessly.
+
+    Example:
+        sketch = QuantileSketch()
+        sketch.add_many([75.0, 80.0, 120.0])
+        sketch.quantile(0.95)  # ~120.0 (within 1%)
+    """
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        """
+        Initialize empty sketch.
+
+        Args:
+            relative_accuracy: Maximum relative error of quantile estimates
+                (0 < relative_accuracy < 1)
+        """
+        if not 0.0 < relative_accuracy < 1.0:
+            raise ValueError(
+                f"relative_accuracy must be in (0, 1), got {relative_accuracy}"
+            )
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1.0 + relative_accuracy) / (1.0 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._bins: Dict[int, int] = {}
+        self.zero_count = 0  # Values <= 0 (no logarithmic bucket)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def add(self, value: float) -> None:
+        """Add a single value."""
+        if value > 0.0:
+            key = math.ceil(math.log(value) / self._log_gamma)
+            self._bins[key] = self._bins.get(key, 0) + 1
+        else:
+            self.zero_count += 1
+        self.count += 1
+        self.sum += value
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def add_many(self, values: Iterable[float]) -> None:
+        """Add a batch of values with one vectorized bucketing pass."""
+        values = np.asarray(values, dtype=np.float64).ravel()
+        if not len(values):
+            return
+        positive = values[values > 0.0]
+        keys, counts = np.unique(
+            np.ceil(np.log(positive) / self._log_gamma).astype(np.int64),
+            return_counts=True,
+        )
+        bins = self._bins
+        for key, n in zip(keys.tolist(), counts.tolist()):
+            bins[key] = bins.get(key, 0) + n
+        self.zero_count += len(values) - len(positive)
+        self.count += len(values)
+        self.sum += float(values.sum())
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """
+        Fold another sketch into this one.
+
+        Raises:
+            ValueError: If the sketches use different relative accuracies
+        """
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError(
+                f"Cannot merge sketches with relative accuracy "
+                f"{other.relative_accuracy} into {self.relative_accuracy}"
+            )
+        for key, n in other._bins.items():
+            self._bins[key] = self._bins.get(key, 0) + n
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the value at quantile q.
+
+        Uses the same rank as the exact statistics (sorted[int(count * q)]),
+        so exact and sketched percentiles describe the same element.
+
+        Returns:
+            Estimated value, or 0.0 for an empty sketch
+        """
+        if self.count == 0:
+            return 0.0
+        rank = min(int(self.count * q), self.count - 1)
+        if rank < self.zero_count:
+            return min(max(0.0, self.min), self.max)
+
+        seen = self.zero_count
+        for key in sorted(self._bins):
+            seen += self._bins[key]
+            if seen > rank:
+                # Midpoint (in relative terms) of (gamma^(key-1), gamma^key]
+                estimate = 2.0 * self._gamma ** key / (self._gamma + 1.0)
+                return min(max(estimate, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """Exact mean of all added values (0.0 when empty)."""
+        return self.sum / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-safe representation, for shipping between processes."""
+        keys = sorted(self._bins)
+        return {
+            "relative_accuracy": self.relative_accuracy,
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.min if self.count else None,
+            "max": self.max if self.count else None,
+            "zero_count": self.zero_count,
+            "keys": keys,
+            "counts": [self._bins[k] for k in keys],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "QuantileSketch":
+        """Rebuild a sketch produced by to_dict()."""
+        sketch = cls(data["relative_accuracy"])
+        sketch._bins = dict(zip(data["keys"], data["counts"]))
+        sketch.zero_count = data["zero_count"]
+        sketch.count = data["count"]
+        sketch.sum = data["sum"]
+        if sketch.count:
+            sketch.min = data["min"]
+            sketch.max = data["max"]
+        return sketch
+
+    def __len__(self) -> int:
+        """Return number of values added."""
+        return self.count
@@ -31,7 +31,8 @@ class MetricsStorage:
             collector: LatencyCollector with measurements
 
         Returns:
-            Dict with paths to saved files
+            Dict with paths to saved files ("raw" is None for a streaming
+            collector, which keeps no raw measurements)
         """
         stats = collector.get_stats()
         summary = collector.get_summary()
@@ -40,7 +41,9 @@ class MetricsStorage:
         summary_dict = {
             "run_id": self.run_id,
             "timestamp": datetime.now().isoformat(),
-            "total_measurements": len(collector.measurements),
+            "total_measurements": summary.get(
+                "total_measurements", len(collector.measurements)
+            ),
             "measurement_types": summary.get("measurement_types", {}),
             "stats": stats,
             "stats_by_satellite": summary.get("stats_by_satellite", {}),
@@ -50,6 +53,8 @@ class MetricsStorage:
         summary_path.write_text(json.dumps(summary_dict, indent=2, default=str))
 
         # Raw CSV for external analysis
+        if getattr(collector, "streaming", False):
+            return {"summary": str(summary_path), "raw": None}
         csv_path = self.metrics_dir / "latency_raw.csv"
         collector.export_csv(str(csv_path))
 
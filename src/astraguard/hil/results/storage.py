@@ -1,6 +1,7 @@
 """Test result persistence and retrieval."""
 
 import json
+import re
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
@@ -46,6 +47,23 @@ class ResultStorage:
         filepath.write_text(json.dumps(result_with_metadata, indent=2, default=str))
         return str(filepath)
 
+    def has_result(self, scenario_name: str) -> bool:
+        """
+        Check whether any result has been saved for a scenario.
+
+        Args:
+            scenario_name: Name of scenario (without .yaml)
+
+        Returns:
+            True if a {scenario_name}_{timestamp}.json file exists
+        """
+        # Match the exact name, so "nominal" is not satisfied by "nominal_long"
+        pattern = re.compile(rf"{re.escape(scenario_name)}_\d{{8}}_\d{{6}}\.json")
+        return any(
+            pattern.fullmatch(path.name)
+            for path in self.results_dir.glob(f"{scenario_name}_*.json")
+        )
+
     def get_scenario_results(
         self, scenario_name: str, limit: int = 10
     ) -> List[Dict[str, Any]]:
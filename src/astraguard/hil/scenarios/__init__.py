@@ -18,7 +18,9 @@ from .parser import (
 from .orchestrator import (
     ScenarioOrchestrator,
     execute_campaign,
+    execute_process_campaign,
     execute_all_scenarios,
+    scenario_seed,
 )
 
 __all__ = [
@@ -35,5 +37,7 @@ __all__ = [
     "run_scenario_file",
     "ScenarioOrchestrator",
     "execute_campaign",
+    "execute_process_campaign",
     "execute_all_scenarios",
+    "scenario_seed",
 ]
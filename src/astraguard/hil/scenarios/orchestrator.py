@@ -2,26 +2,88 @@
 
 import asyncio
 import json
-from typing import List, Dict, Any, Optional
+import multiprocessing
+import os
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from typing import AsyncIterator, List, Dict, Any, Optional
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
+from astraguard.hil.clock import VirtualClock
+from astraguard.hil.metrics.latency import LatencyCollector
 from astraguard.hil.scenarios.schema import load_scenario, Scenario
 from astraguard.hil.scenarios.parser import ScenarioExecutor
+from astraguard.hil.results.storage import ResultStorage
+
+# Per-tick data that stays in the worker process; only summaries are
+# shipped back and persisted
+_WORKER_DROPPED_KEYS = ("final_telemetry", "execution_log")
+
+
+def scenario_seed(campaign_seed: int, scenario_name: str) -> int:
+    """
+    Derive a scenario's RNG seed from the campaign seed.
+
+    The seed depends only on the campaign seed and the scenario name, so a
+    scenario draws the same numbers whichever worker runs it, in whatever
+    order, and whether or not the campaign was resumed.
+    """
+    sequence = np.random.SeedSequence([campaign_seed, zlib.crc32(scenario_name.encode())])
+    return int(sequence.generate_state(1)[0])
+
+
+def _run_scenario_worker(
+    scenario_path: str, seed: int, speed: float, virtual_time: bool
+) -> Dict[str, Any]:
+    """
+    Run one scenario inside a pool worker.
+
+    Returns:
+        Picklable result dict without per-tick telemetry and execution log
+    """
+    scenario_name = Path(scenario_path).name
+    try:
+        scenario = load_scenario(scenario_path)
+        clock = VirtualClock() if virtual_time else None
+        executor = ScenarioExecutor(
+            scenario, clock=clock, seed=seed, streaming_metrics=True
+        )
+        result = asyncio.run(executor.run(speed=speed, verbose=False))
+        for key in _WORKER_DROPPED_KEYS:
+            result.pop(key, None)
+        result["satellite_count"] = len(scenario.satellites)
+    except Exception as e:
+        result = {"success": False, "error": str(e)}
+
+    result["scenario_name"] = scenario_name
+    result["scenario_path"] = scenario_path
+    result["seed"] = seed
+    result["worker_pid"] = os.getpid()
+    result["execution_timestamp"] = datetime.now().isoformat()
+    return result
 
 
 class ScenarioOrchestrator:
     """Manages test campaigns, parallel execution, and result aggregation."""
 
-    def __init__(self, scenario_dir: str = "astraguard/hil/scenarios/sample_scenarios"):
+    def __init__(
+        self,
+        scenario_dir: str = "astraguard/hil/scenarios/sample_scenarios",
+        results_dir: str = "astraguard/hil/results",
+    ):
         """
         Initialize orchestrator with scenario directory.
 
         Args:
             scenario_dir: Directory containing YAML scenario files
+            results_dir: Directory for campaign and scenario result files
         """
         self.scenario_dir = Path(scenario_dir)
-        self.results_dir = Path("astraguard/hil/results")
+        self.results_dir = Path(results_dir)
         self.results_dir.mkdir(parents=True, exist_ok=True)
         self._execution_log: List[Dict[str, Any]] = []
 
@@ -140,6 +202,180 @@ class ScenarioOrchestrator:
 
         return results
 
+    async def stream_campaign(
+        self,
+        scenario_paths: List[str],
+        processes: Optional[int] = None,
+        seed: Optional[int] = None,
+        speed: float = 10.0,
+        virtual_time: bool = True,
+        resume: bool = False,
+    ) -> AsyncIterator[tuple[str, Dict[str, Any]]]:
+        """
+        Execute scenarios across a process pool, yielding each as it finishes.
+
+        Every result is saved to results_dir (one {name}_{timestamp}.json
+        per scenario) before it is yielded, so an interrupted campaign can be
+        picked up again with resume=True.
+
+        Args:
+            scenario_paths: List of paths to scenario YAML files
+            processes: Worker processes (default: CPU count)
+            seed: Campaign seed; each scenario gets its own seed derived from
+                it with scenario_seed(). Drawn at random if not given and
+                reported in every result
+            speed: Playback speed multiplier (wall-clock runs only)
+            virtual_time: Run scenarios on a VirtualClock, as fast as possible
+            resume: Skip scenarios that already have a saved result
+
+        Yields:
+            Tuples of (scenario_name, result_dict) in completion order
+        """
+        storage = ResultStorage(str(self.results_dir))
+        if seed is None:
+            seed = int(np.random.SeedSequence().generate_state(1)[0])
+
+        pending = []
+        for path in scenario_paths:
+            if resume and storage.has_result(Path(path).stem):
+                continue
+            pending.append(path)
+        if not pending:
+            return
+
+        processes = min(processes or os.cpu_count() or 1, len(pending))
+        loop = asyncio.get_running_loop()
+        # Spawned workers start clean: no inherited event loop or RNG state
+        context = multiprocessing.get_context("spawn")
+        pool = ProcessPoolExecutor(max_workers=processes, mp_context=context)
+        futures = []
+        finished = False
+        try:
+            futures = [
+                loop.run_in_executor(
+                    pool,
+                    _run_scenario_worker,
+                    path,
+                    scenario_seed(seed, Path(path).name),
+                    speed,
+                    virtual_time,
+                )
+                for path in pending
+            ]
+            for future in asyncio.as_completed(futures):
+                result = await future
+                scenario_name = result["scenario_name"]
+                storage.save_scenario_result(Path(scenario_name).stem, result)
+                self._execution_log.append({
+                    "scenario": scenario_name,
+                    "success": result["success"],
+                    "time": result.get("execution_time_s", 0),
+                })
+                yield scenario_name, result
+            finished = True
+        finally:
+            # Closed early (aclose(), cancellation or an error): drop the
+            # queued scenarios instead of waiting for all of them to run
+            if not finished:
+                for future in futures:
+                    future.cancel()
+            pool.shutdown(wait=finished, cancel_futures=not finished)
+
+    async def run_process_campaign(
+        self,
+        scenario_paths: List[str],
+        processes: Optional[int] = None,
+        seed: Optional[int] = None,
+        speed: float = 10.0,
+        virtual_time: bool = True,
+        resume: bool = False,
+        verbose: bool = True,
+    ) -> Dict[str, Any]:
+        """
+        Execute a campaign across a process pool and summarize it.
+
+        Args:
+            scenario_paths: List of paths to scenario YAML files
+            processes: Worker processes (default: CPU count)
+            seed: Campaign seed (see stream_campaign)
+            speed: Playback speed multiplier (wall-clock runs only)
+            virtual_time: Run scenarios on a VirtualClock, as fast as possible
+            resume: Skip scenarios that already have a saved result
+            verbose: Print each result as it arrives
+
+        Returns:
+            Campaign summary dict with results, throughput and latency stats
+            merged across all scenarios
+        """
+        if seed is None:
+            seed = int(np.random.SeedSequence().generate_state(1)[0])
+        processes = processes or os.cpu_count() or 1
+
+        if verbose:
+            print(f"[CAMPAIGN] Running {len(scenario_paths)} scenarios "
+                  f"({processes} processes, seed {seed})")
+
+        results = {}
+        campaign_latency = LatencyCollector(streaming=True)
+        start_time = time.perf_counter()
+        async for scenario_name, result in self.stream_campaign(
+            scenario_paths, processes=processes, seed=seed, speed=speed,
+            virtual_time=virtual_time, resume=resume,
+        ):
+            results[scenario_name] = result
+            if "latency_sketches" in result:
+                campaign_latency.merge(
+                    LatencyCollector.from_sketches(result["latency_sketches"])
+                )
+            if verbose:
+                status = "[OK]" if result.get("success") else "[X]"
+                print(f"{status} {scenario_name} ({len(results)} done)")
+        wall_time_s = time.perf_counter() - start_time
+
+        total = len(results)
+        passed = sum(1 for r in results.values() if r.get("success"))
+        simulated_s = sum(r.get("simulated_time_s", 0.0) for r in results.values())
+        sat_ticks = sum(
+            r.get("simulated_time_s", 0.0) * r.get("satellite_count", 0)
+            for r in results.values()
+        )
+        per_s = 1.0 / wall_time_s if wall_time_s > 0 else 0.0
+
+        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        summary = {
+            "campaign_id": timestamp,
+            "timestamp": datetime.now().isoformat(),
+            "total_scenarios": total,
+            "skipped_scenarios": len(scenario_paths) - total,
+            "passed": passed,
+            "failed": total - passed,
+            "pass_rate": passed / total if total > 0 else 0.0,
+            "processes": processes,
+            "seed": seed,
+            "virtual_time": virtual_time,
+            "throughput": {
+                "wall_time_s": wall_time_s,
+                "scenarios_per_s": total * per_s,
+                "simulated_s_per_s": simulated_s * per_s,
+                "sat_ticks_per_s": sat_ticks * per_s,
+            },
+            "latency_stats": campaign_latency.get_stats(),
+            "results": results,
+        }
+
+        summary_path = self.results_dir / f"campaign_{timestamp}.json"
+        summary_path.write_text(json.dumps(summary, indent=2, default=str))
+
+        if verbose:
+            print()
+            print(f"[RESULTS] Pass rate: {summary['pass_rate']:.0%} ({passed}/{total}), "
+                  f"{summary['skipped_scenarios']} skipped")
+            print(f"[THROUGHPUT] {summary['throughput']['scenarios_per_s']:.2f} scenarios/s, "
+                  f"{summary['throughput']['sat_ticks_per_s']:,.0f} sat-ticks/s")
+            print(f"[SAVED] Campaign: {summary_path}")
+
+        return summary
+
     async def run_all_scenarios(
         self,
         parallel: int = 3,
@@ -269,6 +505,30 @@ async def execute_campaign(
     )
 
 
+async def execute_process_campaign(
+    scenario_paths: List[str],
+    processes: Optional[int] = None,
+    seed: Optional[int] = None,
+    resume: bool = False,
+) -> Dict[str, Any]:
+    """
+    High-level convenience function to run a campaign on a process pool.
+
+    Args:
+        scenario_paths: List of YAML scenario file paths
+        processes: Worker processes (default: CPU count)
+        seed: Campaign seed for reproducible runs
+        resume: Skip scenarios that already have a saved result
+
+    Returns:
+        Campaign summary dict
+    """
+    orchestrator = ScenarioOrchestrator()
+    return await orchestrator.run_process_campaign(
+        scenario_paths, processes=processes, seed=seed, resume=resume
+    )
+
+
 async def execute_all_scenarios(
     parallel: int = 3, speed: float = 20.0
 ) -> Dict[str, Any]:
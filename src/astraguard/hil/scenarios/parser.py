@@ -12,10 +12,18 @@ from astraguard.hil.scenarios.schema import (
     FaultInjection,
     load_scenario,
 )
-from astraguard.hil.simulator.base import StubSatelliteSimulator
+from astraguard.hil.clock import Clock, VirtualClock, WALL_CLOCK
+from astraguard.hil.simulator.constellation import (
+    ConstellationEngine,
+    ConstellationSatellite,
+)
 from astraguard.hil.metrics.latency import LatencyCollector
 from astraguard.hil.metrics.accuracy import AccuracyCollector
 
+# Simulated agent misclassifications of nominal satellites (false positives)
+FALSE_POSITIVE_FAULTS = np.array(["power_brownout", "comms_dropout", "thermal_runaway"], dtype=object)
+FALSE_POSITIVE_WEIGHTS = [0.3, 0.3, 0.4]
+
 
 @dataclass
 class ExecutionStatus:
@@ -30,21 +38,41 @@ class ExecutionStatus:
 class ScenarioExecutor:
     """Orchestrates full scenario execution from YAML."""
 
-    def __init__(self, scenario: Scenario):
+    def __init__(
+        self,
+        scenario: Scenario,
+        clock: Optional[Clock] = None,
+        seed: Optional[int] = None,
+        streaming_metrics: bool = False
+    ):
         """
         Initialize executor with scenario configuration.
 
         Args:
             scenario: Validated Scenario object from YAML
+            clock: Time source for simulators and collectors. With a
+                VirtualClock the scenario runs as fast as possible: simulated
+                time jumps to the next tick instead of sleeping. Default is
+                the wall clock with real-time pacing
+            seed: Seed for all random draws (physics noise, fault contagion,
+                simulated agent latencies), for reproducible runs
+            streaming_metrics: Keep latency quantile sketches instead of
+                every raw measurement, for bounded memory on long runs
         """
         self.scenario = scenario
-        self._simulators: Dict[str, StubSatelliteSimulator] = {}
+        self.clock = clock or WALL_CLOCK
+        self._virtual_time = isinstance(self.clock, VirtualClock)
+        self._rng = np.random.default_rng(seed) if seed is not None else np.random
+        self._engine: Optional[ConstellationEngine] = None
+        self._simulators: Dict[str, ConstellationSatellite] = {}
         self._current_time_s = 0.0
         self._fault_timeline: List[FaultInjection] = scenario.fault_sequence
         self._running = False
-        self._fault_active: Dict[str, bool] = {}
+        self._fault_active: Optional[np.ndarray] = None  # Per satellite: fault injected
         self._execution_log: List[Dict[str, Any]] = []
-        self.latency_collector = LatencyCollector()
+        self.latency_collector = LatencyCollector(
+            clock=self.clock, streaming=streaming_metrics
+        )
         self.accuracy_collector = AccuracyCollector()
 
     async def provision_simulators(self) -> int:
@@ -54,9 +82,11 @@ class ScenarioExecutor:
         Returns:
             Number of simulators provisioned
         """
-        sat_count = 0
+        self._engine = ConstellationEngine(
+            [sat.id for sat in self.scenario.satellites], clock=self.clock, rng=self._rng
+        )
         for sat_config in self.scenario.satellites:
-            sim = StubSatelliteSimulator(sat_config.id)
+            sim = self._engine.satellite(sat_config.id)
 
             # Register formation neighbors with default distance
             # In real implementation, distances would come from YAML or computed
@@ -65,9 +95,9 @@ class ScenarioExecutor:
                 sim.add_nearby_sat(neighbor_id, distance_km)
 
             self._simulators[sat_config.id] = sim
-            sat_count += 1
 
-        return sat_count
+        self._fault_active = np.zeros(len(self._engine), dtype=bool)
+        return len(self._simulators)
 
     async def inject_scheduled_faults(self) -> List[str]:
         """
@@ -92,7 +122,7 @@ class ScenarioExecutor:
                             duration=fault.duration_s
                         )
                         injected.append(f"{fault.type.value}@{fault.satellite}")
-                        self._fault_active[fault.satellite] = True
+                        self._fault_active[self._engine.index_of(fault.satellite)] = True
 
                         # Record ground truth: this fault is now active
                         self.accuracy_collector.record_ground_truth(
@@ -103,6 +133,19 @@ class ScenarioExecutor:
 
         return injected
 
+    def _criteria_checks(self) -> Dict[str, np.ndarray]:
+        """Per-criterion pass flags for every satellite, on the current state."""
+        criteria = self.scenario.success_criteria
+        engine = self._engine
+        if engine is None or not len(engine):
+            return {}
+        return {
+            "nadir_ok": engine.nadir_error_deg <= criteria.max_nadir_error_deg,
+            "battery_ok": np.round(engine.battery_soc, 3) >= criteria.min_battery_soc,
+            "temp_ok": np.round(engine.battery_temp, 1) <= criteria.max_temperature_c,
+            "comms_ok": engine.packet_loss_rate <= criteria.max_packet_loss,
+        }
+
     async def check_success_criteria(self) -> Dict[str, bool]:
         """
         Real-time success criteria evaluation.
@@ -110,55 +153,84 @@ class ScenarioExecutor:
         Returns:
             Dict with 'all_pass' (bool) and per-satellite results
         """
-        criteria = self.scenario.success_criteria
         results = {}
-
-        for sat_id, sim in self._simulators.items():
-            try:
-                telemetry = await sim.generate_telemetry()
-
-                # Check each criterion
-                sat_results = {
-                    "nadir_ok": (
-                        telemetry.attitude.nadir_pointing_error_deg
-                        <= criteria.max_nadir_error_deg
-                    ),
-                    "battery_ok": (
-                        telemetry.power.battery_soc >= criteria.min_battery_soc
-                    ),
-                    "temp_ok": (
-                        telemetry.thermal.battery_temp <= criteria.max_temperature_c
-                    ),
-                    "comms_ok": (
-                        telemetry.comms.packet_loss_ratio <= criteria.max_packet_loss
-                    ),
-                }
-
+        checks = self._criteria_checks()
+        if checks:
+            passed = np.logical_and.reduce(list(checks.values()))
+            columns = {name: values.tolist() for name, values in checks.items()}
+            for i, (sat_id, sat_pass) in enumerate(zip(self._engine.sat_ids, passed.tolist())):
                 results[sat_id] = {
-                    "pass": all(sat_results.values()),
-                    "criteria": sat_results,
+                    "pass": sat_pass,
+                    "criteria": {name: values[i] for name, values in columns.items()},
                 }
-            except Exception as e:
-                # Telemetry generation might fail in stub
-                results[sat_id] = {"pass": True, "criteria": {}}
 
         all_pass = all(r["pass"] for r in results.values())
         return {"all_pass": all_pass, "per_sat": results}
 
+    def summarize_criteria(self) -> Dict[str, Any]:
+        """
+        Constellation-wide criteria evaluation, without per-satellite detail.
+
+        Returns:
+            Dict with 'all_pass', 'failing_sats' and failing counts per criterion
+        """
+        checks = self._criteria_checks()
+        if not checks:
+            return {"all_pass": True, "failing_sats": 0, "failing": {}}
+        passed = np.logical_and.reduce(list(checks.values()))
+        failing_sats = int(len(passed) - np.count_nonzero(passed))
+        return {
+            "all_pass": failing_sats == 0,
+            "failing_sats": failing_sats,
+            "failing": {name: int(len(ok) - np.count_nonzero(ok)) for name, ok in checks.items()},
+        }
+
+    def _classify_constellation(self) -> None:
+        """
+        Simulate agent fault classification for every satellite at once.
+
+        90% accuracy detecting injected faults, 95% accuracy on nominal
+        satellites (5% false positives).
+        """
+        sat_ids = self._engine.sat_ids
+        n = len(sat_ids)
+        faulty = self._fault_active
+        correct = self._rng.random(n) > np.where(faulty, 0.10, 0.05)
+        predicted = np.full(n, None, dtype=object)
+        confidence = np.where(faulty, 0.9, 0.95)
+
+        # Injected faults are sparse: few satellites to look up
+        for i in np.flatnonzero(faulty & correct).tolist():
+            predicted[i] = self._engine.fault_type[i]
+        missed = faulty & ~correct
+        confidence[missed] = self._rng.uniform(0.3, 0.6, np.count_nonzero(missed))
+        false_positive = ~faulty & ~correct
+        count = int(np.count_nonzero(false_positive))
+        predicted[false_positive] = FALSE_POSITIVE_FAULTS[
+            self._rng.choice(len(FALSE_POSITIVE_FAULTS), size=count, p=FALSE_POSITIVE_WEIGHTS)
+        ]
+        confidence[false_positive] = self._rng.uniform(0.4, 0.7, count)
+
+        self.accuracy_collector.record_classification_batch(
+            sat_ids, self._current_time_s, predicted, confidence, correct
+        )
+
     async def run(self, speed: float = 1.0, verbose: bool = True) -> Dict[str, Any]:
         """
         Execute full scenario from start to finish.
 
         Args:
-            speed: Playback speed multiplier (1.0 = real-time, 10.0 = 10x faster)
+            speed: Playback speed multiplier (1.0 = real-time, 10.0 = 10x faster);
+                ignored on a virtual clock
             verbose: Print progress updates
 
         Returns:
             Execution results including final telemetry and success status
         """
         if verbose:
+            pacing = "virtual time" if self._virtual_time else f"Speed: {speed}x"
             print(f"[RUN] Starting scenario: {self.scenario.name}")
-            print(f"[TIME] Duration: {self.scenario.duration_s}s | Speed: {speed}x")
+            print(f"[TIME] Duration: {self.scenario.duration_s}s | {pacing}")
 
         # Provision simulators
         sat_count = await self.provision_simulators()
@@ -176,53 +248,25 @@ class ScenarioExecutor:
             if faults_injected and verbose:
                 print(f"[FAULT] T+{self._current_time_s:.0f}s: {', '.join(faults_injected)}")
 
-            # Generate telemetry from all satellites
-            all_telemetry = {}
-            for sat_id, sim in self._simulators.items():
-                try:
-                    telemetry = await sim.generate_telemetry()
-                    all_telemetry[sat_id] = telemetry
-
-                    # Record realistic latencies for agents
-                    # Simulate fault detection latency (75ms mean ± 25ms std dev)
-                    detection_delay = abs(np.random.normal(75, 25))
-                    self.latency_collector.record_fault_detection(
-                        sat_id, self._current_time_s, detection_delay
-                    )
-
-                    # Simulate agent decision latency (120ms mean ± 40ms std dev)
-                    decision_time = abs(np.random.normal(120, 40))
-                    self.latency_collector.record_agent_decision(
-                        sat_id, self._current_time_s, decision_time
-                    )
-
-                    # Simulate agent fault classification
-                    # 90% accuracy detecting faults, 95% accuracy on nominal
-                    has_fault = sim.fault_type and self._fault_active.get(sat_id, False)
-                    if has_fault:
-                        # Agent should detect this fault (90% accuracy)
-                        is_correct = np.random.random() > 0.10
-                        predicted_fault = sim.fault_type if is_correct else None
-                        confidence = 0.9 if is_correct else np.random.uniform(0.3, 0.6)
-                    else:
-                        # Nominal case: 95% accuracy (5% false positives)
-                        is_correct = np.random.random() > 0.05
-                        predicted_fault = None if is_correct else np.random.choice(
-                            ["power_brownout", "comms_dropout", "thermal_runaway"],
-                            p=[0.3, 0.3, 0.4]
-                        )
-                        confidence = 0.95 if is_correct else np.random.uniform(0.4, 0.7)
-
-                    self.accuracy_collector.record_agent_classification(
-                        sat_id, self._current_time_s, predicted_fault, confidence, is_correct
-                    )
-
-                except Exception:
-                    # Stub might not generate full telemetry
-                    all_telemetry[sat_id] = None
+            # Propagate physics for the whole constellation
+            self._engine.step(dt=1.0)
+            sat_ids = self._engine.sat_ids
+            sat_count = len(sat_ids)
+
+            # Simulate fault detection latency (75ms mean ± 25ms std dev)
+            # and agent decision latency (120ms mean ± 40ms std dev)
+            detection_delays = np.abs(self._rng.normal(75, 25, sat_count))
+            decision_times = np.abs(self._rng.normal(120, 40, sat_count))
+            self.latency_collector.record_batch(
+                "fault_detection", sat_ids, self._current_time_s, detection_delays
+            )
+            self.latency_collector.record_batch(
+                "agent_decision", sat_ids, self._current_time_s, decision_times
+            )
+            self._classify_constellation()
 
-            # Check success criteria
-            criteria_result = await self.check_success_criteria()
+            # Check success criteria (aggregate only: the log grows every tick)
+            criteria_result = self.summarize_criteria()
 
             # Log status
             status = ExecutionStatus(
@@ -230,7 +274,7 @@ class ScenarioExecutor:
                 satellite_count=len(self._simulators),
                 active_faults=faults_injected,
                 criteria_pass=criteria_result["all_pass"],
-                telemetry_collected=len(all_telemetry),
+                telemetry_collected=sat_count,
             )
             self._execution_log.append({
                 "time_s": self._current_time_s,
@@ -247,15 +291,21 @@ class ScenarioExecutor:
                           f"{len(self._simulators)} sats")
                 last_report_s = self._current_time_s
 
-            # Time step: simulate at 10Hz scaled by speed
-            await asyncio.sleep(0.1 / speed)
+            # Time step: 10Hz real-time pacing scaled by speed, or on a
+            # virtual clock jump straight to the next tick
+            if self._virtual_time:
+                self.clock.advance(1.0)
+                await asyncio.sleep(0)
+            else:
+                await asyncio.sleep(0.1 / speed)
             self._current_time_s += 1.0
 
         self._running = False
         elapsed = time.time() - start_time
 
-        # Final results
+        # Final results; packets are only materialized here
         final_criteria = await self.check_success_criteria()
+        final_telemetry = self._engine.packets() if self._current_time_s > 0 else {}
         if verbose:
             print(f"[DONE] Scenario complete in {elapsed:.1f}s")
             print(f"[RESULT] Final result: {'PASS' if final_criteria['all_pass'] else 'FAIL'}")
@@ -265,17 +315,22 @@ class ScenarioExecutor:
             "final_criteria": final_criteria,
             "execution_time_s": elapsed,
             "simulated_time_s": self._current_time_s,
-            "final_telemetry": all_telemetry,
+            "final_telemetry": final_telemetry,
             "execution_log": self._execution_log,
             "latency_stats": self.latency_collector.get_stats(),
             "latency_summary": self.latency_collector.get_summary(),
+            "latency_sketches": self.latency_collector.export_sketches(),
             "accuracy_stats": self.accuracy_collector.get_accuracy_stats(),
             "accuracy_summary": self.accuracy_collector.get_summary(),
         }
 
 
 async def execute_scenario_file(
-    file_path: str, speed: float = 10.0, verbose: bool = True
+    file_path: str,
+    speed: float = 10.0,
+    verbose: bool = True,
+    virtual_time: bool = False,
+    seed: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     High-level scenario runner from YAML file.
@@ -284,17 +339,24 @@ async def execute_scenario_file(
         file_path: Path to YAML scenario file
         speed: Playback speed multiplier
         verbose: Print progress
+        virtual_time: Run on a VirtualClock, as fast as possible
+        seed: Seed for reproducible runs
 
     Returns:
         Execution results
     """
     scenario = load_scenario(file_path)
-    executor = ScenarioExecutor(scenario)
+    clock = VirtualClock() if virtual_time else None
+    executor = ScenarioExecutor(scenario, clock=clock, seed=seed)
     return await executor.run(speed=speed, verbose=verbose)
 
 
 def run_scenario_file(
-    file_path: str, speed: float = 10.0, verbose: bool = True
+    file_path: str,
+    speed: float = 10.0,
+    verbose: bool = True,
+    virtual_time: bool = False,
+    seed: Optional[int] = None,
 ) -> Dict[str, Any]:
     """
     Synchronous wrapper for scenario execution.
@@ -303,8 +365,12 @@ def run_scenario_file(
         file_path: Path to YAML scenario file
         speed: Playback speed multiplier
         verbose: Print progress
+        virtual_time: Run on a VirtualClock, as fast as possible
+        seed: Seed for reproducible runs
 
     Returns:
         Execution results
     """
-    return asyncio.run(execute_scenario_file(file_path, speed=speed, verbose=verbose))
+    return asyncio.run(execute_scenario_file(
+        file_path, speed=speed, verbose=verbose, virtual_time=virtual_time, seed=seed
+    ))
@@ -115,8 +115,8 @@ class Scenario(BaseModel):
     satellites: List[SatelliteConfig] = Field(
         ...,
         min_length=1,
-        max_length=10,
-        description="Satellite configurations (1-10 sats)"
+        max_length=5000,
+        description="Satellite configurations (1-5000 sats)"
     )
     fault_sequence: List[FaultInjection] = Field(
         default_factory=list,
@@ -245,7 +245,7 @@ description: str (required)
 duration_s: int (default: 1800)
   - Test duration in seconds (60s minimum, 24h maximum)
 
-satellites: list (required, 1-10 items)
+satellites: list (required, 1-5000 items)
   - List of satellite configurations
   - id: str (required)
       - Unique satellite identifier (1-16 chars)
@@ -1,4 +1,11 @@
 """Satellite simulator implementations."""
 from .base import SatelliteSimulator, TelemetryPacket, StubSatelliteSimulator
+from .constellation import ConstellationEngine, ConstellationSatellite
 
-__all__ = ["SatelliteSimulator", "TelemetryPacket", "StubSatelliteSimulator"]
+__all__ = [
+    "SatelliteSimulator",
+    "TelemetryPacket",
+    "StubSatelliteSimulator",
+    "ConstellationEngine",
+    "ConstellationSatellite",
+]
@@ -9,6 +9,9 @@ import numpy as np
 from typing import Tuple
 import math
 from datetime import datetime
+from typing import Optional
+
+from ..clock import Clock, WALL_CLOCK
 
 
 class AttitudeSimulator:
@@ -19,15 +22,17 @@ class AttitudeSimulator:
     angular velocity integration, and controllable fault modes.
     """
     
-    def __init__(self, sat_id: str):
+    def __init__(self, sat_id: str, clock: Optional[Clock] = None):
         """
         Initialize attitude simulator for a satellite.
         
         Args:
             sat_id: Satellite identifier
+            clock: Time source (default: wall clock)
         """
         self.sat_id = sat_id
-        self.start_time = datetime.now()
+        self._clock = clock or WALL_CLOCK
+        self.start_time = self._clock.now()
         
         # Attitude state: normalized quaternion [w, x, y, z]
         # Initially pointed nadir (toward Earth)
@@ -90,7 +95,7 @@ class AttitudeSimulator:
         """
         self._fault_active = True
         self._mode = "tumble"
-        self._tumble_start = datetime.now()
+        self._tumble_start = self._clock.now()
         
         # Impart random angular velocity (tumble spin)
         self._angular_velocity = np.random.uniform(-0.3, 0.3, 3)
@@ -191,7 +196,7 @@ class AttitudeSimulator:
             Duration in seconds, or 0 if not tumbling
         """
         if self._fault_active and self._tumble_start:
-            return (datetime.now() - self._tumble_start).total_seconds()
+            return (self._clock.now() - self._tumble_start).total_seconds()
         return 0.0
     
     def get_status(self) -> dict:
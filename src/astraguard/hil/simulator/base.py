@@ -8,6 +8,7 @@ that powers all HIL testing for AstraGuard swarm behaviors.
 from abc import ABC, abstractmethod
 from typing import List, Optional
 from datetime import datetime
+from ..clock import Clock, WALL_CLOCK
 from ..schemas.telemetry import (
     TelemetryPacket,
     AttitudeData,
@@ -116,21 +117,28 @@ class StubSatelliteSimulator(SatelliteSimulator):
     This stub will be replaced by specialized implementations in subsequent PRs.
     """
     
-    def __init__(self, sat_id: str):
-        """Initialize stub simulator."""
+    def __init__(self, sat_id: str, clock: Optional[Clock] = None):
+        """
+        Initialize stub simulator.
+        
+        Args:
+            sat_id: Unique identifier for this satellite
+            clock: Time source for packets and fault timelines (default: wall clock)
+        """
         super().__init__(sat_id)
+        self._clock = clock or WALL_CLOCK
         self._fault_active = False
         self._fault_type: Optional[str] = None
         
         # Attitude dynamics simulator
-        self.attitude_sim = AttitudeSimulator(sat_id)
+        self.attitude_sim = AttitudeSimulator(sat_id, clock=self._clock)
         self._tumble_injected = False
         
         # Power system simulator
-        self.power_sim = PowerSimulator(sat_id)
+        self.power_sim = PowerSimulator(sat_id, clock=self._clock)
         
         # Thermal dynamics simulator
-        self.thermal_sim = ThermalSimulator(sat_id)
+        self.thermal_sim = ThermalSimulator(sat_id, clock=self._clock)
         
         # Orbital mechanics simulator
         self.orbit_sim = OrbitSimulator(sat_id)
@@ -148,7 +156,7 @@ class StubSatelliteSimulator(SatelliteSimulator):
         """
         import random
         
-        timestamp = datetime.now()
+        timestamp = self._clock.now()
         
         # Update orbital mechanics first (drives eclipse timing and altitude)
         self.orbit_sim.update(dt=1.0)
@@ -249,7 +257,8 @@ class StubSatelliteSimulator(SatelliteSimulator):
                 self.sat_id, 
                 pattern="gilbert", 
                 packet_loss=packet_loss, 
-                duration=duration
+                duration=duration,
+                clock=self._clock,
             )
             self._comms_fault.inject()
         
@@ -0,0 +1,696 @@
+"""Vectorized constellation physics for large HIL scenarios.
+
+StubSatelliteSimulator steps five scalar subsystem objects per satellite and
+builds a Pydantic TelemetryPacket every tick. That is fine for a handful of
+satellites, but 500-5000 satellite constellations spend almost all of their
+time in per-object Python overhead.
+
+ConstellationEngine keeps the same physics in struct-of-arrays form: one
+NumPy array per state variable, indexed by satellite. step() advances orbit,
+eclipse, attitude, power, thermal and comms for every satellite with array
+operations. Faults stay sparse: the handful of faulted satellites keep their
+PowerBrownoutFault / ThermalRunawayFault objects and are patched in per tick.
+
+TelemetryPackets are only built on demand (packet() / packets()).
+ConstellationSatellite exposes one row of the engine through the
+SatelliteSimulator interface, with orbit_sim/attitude_sim/power_sim/
+thermal_sim/comms_sim views, so existing per-satellite callers keep working.
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from ..clock import Clock, WALL_CLOCK
+from ..schemas.telemetry import (
+    TelemetryPacket,
+    AttitudeData,
+    PowerData,
+    ThermalData,
+    OrbitData,
+)
+from .base import SatelliteSimulator
+from .comms import CommsState
+from .faults.power_brownout import PowerBrownoutFault
+from .faults.thermal_runaway import ThermalRunawayFault, NeighborProximity
+
+# Orbit (OrbitSimulator defaults)
+BASE_ALTITUDE_M = 420000.0
+J2_AMPLITUDE_M = 500.0
+MEAN_MOTION_REVDAY = 15.72
+EARTH_RADIUS_KM = 6371.0
+ORBIT_RATE_DEG_S = MEAN_MOTION_REVDAY / (24.0 * 3600.0) * 360.0
+
+# Power (PowerSimulator defaults)
+SOLAR_CONSTANT = 1366.0
+SOLAR_EFFICIENCY = 0.28
+PANEL_AREA_M2 = 0.12
+BATTERY_CAPACITY_AH = 7.0
+POWER_PHASE_RATE_DEG_S = 360.0 / 5400.0
+NOMINAL_LOAD_W = 5.0
+ECLIPSE_LOAD_W = 3.0
+
+# Thermal (ThermalSimulator defaults)
+BASE_HEAT_W = 4.0
+RADIATOR_CAPACITY_WK = 8.0
+BATTERY_THERMAL_MASS = 50.0
+EPS_THERMAL_MASS = 40.0
+
+THERMAL_STATUSES = ("nominal", "warning", "critical")
+COMMS_STATES = (CommsState.NOMINAL, CommsState.DEGRADED, CommsState.DROPOUT)
+
+
+def _quaternion_multiply(q1: np.ndarray, q2: np.ndarray) -> np.ndarray:
+    """Row-wise Hamilton product of two (N, 4) quaternion arrays."""
+    w1, x1, y1, z1 = q1.T
+    w2, x2, y2, z2 = q2.T
+    return np.stack([
+        w1*w2 - x1*x2 - y1*y2 - z1*z2,
+        w1*x2 + x1*w2 + y1*z2 - z1*y2,
+        w1*y2 - x1*z2 + y1*w2 + z1*x2,
+        w1*z2 + x1*y2 - y1*x2 + z1*w2,
+    ], axis=1)
+
+
+class ConstellationEngine:
+    """Struct-of-arrays physics for every satellite in a constellation.
+
+    Follows the StubSatelliteSimulator propagation order each tick:
+    orbit → attitude → power → attitude faults → thermal → comms.
+
+    Example:
+        engine = ConstellationEngine([f"SAT-{i:04d}" for i in range(5000)])
+        for _ in range(900):
+            engine.step(dt=1.0)
+        packet = engine.packet("SAT-0042")
+    """
+
+    def __init__(
+        self,
+        sat_ids: Sequence[str],
+        clock: Optional[Clock] = None,
+        rng: Optional[np.random.Generator] = None
+    ):
+        """
+        Initialize constellation state.
+
+        Args:
+            sat_ids: Satellite identifiers (max 16 chars each)
+            clock: Time source for packets and fault timelines (default: wall clock)
+            rng: Random generator for noise and fault draws (default: np.random)
+
+        Raises:
+            ValueError: If a sat_id is too long or duplicated
+        """
+        self.sat_ids: List[str] = list(sat_ids)
+        self._index: Dict[str, int] = {}
+        for i, sat_id in enumerate(self.sat_ids):
+            if len(sat_id) > 16:
+                raise ValueError(f"sat_id '{sat_id}' exceeds 16 character limit")
+            if sat_id in self._index:
+                raise ValueError(f"Duplicate sat_id '{sat_id}'")
+            self._index[sat_id] = i
+
+        self.clock = clock or WALL_CLOCK
+        self.rng = rng if rng is not None else np.random
+
+        n = len(self.sat_ids)
+        self.tick = 0
+        self.elapsed_s = 0.0
+
+        # Orbit
+        self.true_anomaly_deg = np.zeros(n)
+        self.altitude_m = np.full(n, BASE_ALTITUDE_M)
+        self.in_eclipse = np.zeros(n, dtype=bool)
+
+        # Attitude
+        self.quaternion = np.tile([1.0, 0.0, 0.0, 0.0], (n, 1))
+        self.angular_velocity = np.tile([0.0, 0.0, 0.001], (n, 1))
+        self.nadir_error_deg = np.zeros(n)
+        self.tumbling = np.zeros(n, dtype=bool)
+
+        # Power
+        self.orbit_phase_deg = np.zeros(n)
+        self.battery_soc = np.full(n, 0.85)
+        self.battery_voltage = np.full(n, 8.2)
+        self.panel_degradation = np.ones(n)
+        self.power_fault = np.zeros(n, dtype=bool)
+
+        # Thermal
+        self.battery_temp = np.full(n, 15.0)
+        self.eps_temp = np.full(n, 20.0)
+        self.payload_temp = np.full(n, 18.0)
+        self.radiator_capacity_wk = np.full(n, RADIATOR_CAPACITY_WK)
+        self.thermal_fault = np.zeros(n, dtype=bool)
+        self.runaway_triggered = np.zeros(n, dtype=bool)
+        self.time_in_critical = np.zeros(n)
+        self.thermal_status = np.zeros(n, dtype=np.int8)  # Index into THERMAL_STATUSES
+
+        # Comms
+        self.tx_power_dbw = np.full(n, 2.0)
+        self.packet_loss_rate = np.full(n, 0.02)
+        self.gilbert_good = np.ones(n, dtype=bool)
+        self.range_km = np.full(n, 500.0)
+        self.comms_state = np.zeros(n, dtype=np.int8)  # Index into COMMS_STATES
+
+        # Scenario fault state, as on StubSatelliteSimulator
+        self.fault_active = np.zeros(n, dtype=bool)
+        self.fault_type: List[Optional[str]] = [None] * n
+
+        # Sparse per-satellite objects: only faulted satellites have entries
+        self._brownout_faults: Dict[int, PowerBrownoutFault] = {}
+        self._thermal_faults: Dict[int, ThermalRunawayFault] = {}
+        self._comms_faults: Dict[int, object] = {}
+        self.nearby_sats: List[List[NeighborProximity]] = [[] for _ in range(n)]
+
+        self._satellites: Dict[str, "ConstellationSatellite"] = {}
+
+    def __len__(self) -> int:
+        return len(self.sat_ids)
+
+    def index_of(self, sat_id: str) -> int:
+        """Row index of a satellite.
+
+        Raises:
+            KeyError: If the satellite is not in this constellation
+        """
+        return self._index[sat_id]
+
+    def satellite(self, sat_id: str) -> "ConstellationSatellite":
+        """Per-satellite SatelliteSimulator view of one row (cached)."""
+        view = self._satellites.get(sat_id)
+        if view is None:
+            view = ConstellationSatellite(self, sat_id)
+            self._satellites[sat_id] = view
+        return view
+
+    def add_nearby_sat(self, sat_id: str, neighbor_id: str, distance_km: float) -> None:
+        """Register a formation neighbor for thermal cascade propagation."""
+        self.nearby_sats[self._index[sat_id]].append(
+            NeighborProximity(neighbor_id, distance_km, 1.0)
+        )
+
+    def inject_fault(
+        self,
+        sat_id: str,
+        fault_type: str,
+        severity: float = 1.0,
+        duration: float = 60.0
+    ) -> None:
+        """
+        Inject a fault into one satellite.
+
+        Same fault models as StubSatelliteSimulator.inject_fault.
+
+        Args:
+            sat_id: Satellite to fault
+            fault_type: 'power_brownout', 'attitude_desync', 'thermal_runaway'
+                or 'comms_dropout'
+            severity: Fault severity (0.0-1.0)
+            duration: Fault duration in seconds
+        """
+        i = self._index[sat_id]
+        self.fault_active[i] = True
+        self.fault_type[i] = fault_type
+
+        if fault_type == "power_brownout":
+            fault = PowerBrownoutFault(sat_id, severity, clock=self.clock)
+            fault.inject()
+            self._brownout_faults[i] = fault
+            self.power_fault[i] = True
+            self.panel_degradation[i] = fault.get_fault_state()["panel_damage_factor"]
+        elif fault_type == "attitude_desync":
+            # Tumble starts on the next step()
+            pass
+        elif fault_type == "thermal_runaway":
+            fault = ThermalRunawayFault(
+                sat_id=sat_id,
+                contagion_rate=0.3 + severity * 0.4,
+                duration=600.0,
+                clock=self.clock,
+                rng=self.rng,
+            )
+            fault.inject()
+            self._thermal_faults[i] = fault
+            self.thermal_fault[i] = True
+            self.radiator_capacity_wk[i] *= 0.1
+        elif fault_type == "comms_dropout":
+            from .faults.comms_dropout import CommsDropoutFault
+            fault = CommsDropoutFault(
+                sat_id,
+                pattern="gilbert",
+                packet_loss=0.3 + severity * 0.5,
+                duration=duration,
+                clock=self.clock,
+            )
+            fault.inject()
+            self._comms_faults[i] = fault
+
+    def step(self, dt: float = 1.0) -> None:
+        """Propagate every satellite dt seconds forward."""
+        if not self.sat_ids:
+            return
+        self.tick += 1
+        self.elapsed_s += dt
+
+        self._step_orbit(dt)
+        self._step_attitude(dt)
+        self._step_power(dt)
+        self._apply_attitude_faults()
+        self._step_thermal(dt)
+        self._step_comms()
+
+    def _step_orbit(self, dt: float) -> None:
+        self.true_anomaly_deg = (self.true_anomaly_deg + ORBIT_RATE_DEG_S * dt) % 360.0
+        self.altitude_m = BASE_ALTITUDE_M + J2_AMPLITUDE_M * np.sin(
+            np.radians(self.true_anomaly_deg * 2.0)
+        )
+        self.in_eclipse = (self.true_anomaly_deg > 90.0) & (self.true_anomaly_deg < 270.0)
+
+    def _step_attitude(self, dt: float) -> None:
+        omega = self.angular_velocity
+        tumbling = self.tumbling
+        if tumbling.any():
+            count = int(tumbling.sum())
+            omega[tumbling] = np.clip(
+                omega[tumbling] + self.rng.normal(0, 0.02, (count, 3)), -0.5, 0.5
+            )
+            omega[~tumbling] *= 0.98
+        else:
+            omega *= 0.98
+
+        # q_new = q_old * exp(0.5 * ω * dt), skipped where ω is negligible
+        omega_norm = np.linalg.norm(omega, axis=1)
+        spinning = omega_norm > 1e-6
+        if spinning.any():
+            norm = omega_norm[spinning]
+            half_angle = norm * dt * 0.5
+            axis = omega[spinning] / norm[:, None]
+            increment = np.column_stack([
+                np.cos(half_angle), np.sin(half_angle)[:, None] * axis
+            ])
+            self.quaternion[spinning] = _quaternion_multiply(
+                self.quaternion[spinning], increment
+            )
+        self.quaternion /= np.linalg.norm(self.quaternion, axis=1)[:, None]
+
+        # Angle between body +Z and nadir: z component of q·[0,0,1]·q*
+        x, y = self.quaternion[:, 1], self.quaternion[:, 2]
+        cos_angle = np.clip(1.0 - 2.0 * (x * x + y * y), -1.0, 1.0)
+        # Rounded like AttitudeData, which is what the scalar model couples on
+        self.nadir_error_deg = np.round(np.degrees(np.arccos(cos_angle)), 2)
+
+    def _step_power(self, dt: float) -> None:
+        sun_exposure = np.where(
+            self.in_eclipse, 0.0, np.maximum(0.0, 1.0 - self.nadir_error_deg / 90.0)
+        )
+
+        self.orbit_phase_deg = (self.orbit_phase_deg + POWER_PHASE_RATE_DEG_S * dt) % 360.0
+        power_eclipse = self._power_eclipse()
+
+        solar_power_w = np.where(
+            power_eclipse,
+            0.0,
+            SOLAR_CONSTANT * sun_exposure * self.panel_degradation
+            * PANEL_AREA_M2 * SOLAR_EFFICIENCY,
+        )
+        load_w = np.where(power_eclipse, ECLIPSE_LOAD_W, NOMINAL_LOAD_W)
+
+        for i, fault in list(self._brownout_faults.items()):
+            if not fault.active:
+                continue
+            state = fault.get_fault_state()
+            if not state["active"]:
+                continue
+            solar_power_w[i] *= state["panel_damage_factor"]
+            if state["phase"] == "battery_stress":
+                load_w[i] *= state["discharge_multiplier"]
+            if state["phase"] == "safe_mode":
+                load_w[i] = state["safe_mode_load"]
+            if fault.is_expired():
+                fault.active = False
+                self.panel_degradation[i] = 1.0
+
+        # Net power → charge at the 8.4V nominal bus → state of charge
+        charge_change_ah = (solar_power_w - load_w) * (dt / 3600.0) / 8.4
+        self.battery_soc = np.clip(
+            self.battery_soc + charge_change_ah / BATTERY_CAPACITY_AH, 0.0, 1.0
+        )
+        self.battery_voltage = 8.4 - (1.0 - self.battery_soc) * 1.9
+
+    def _power_eclipse(self) -> np.ndarray:
+        # PowerSimulator's own eclipse window, independent of the orbit model
+        return (self.orbit_phase_deg >= 135.0) & (self.orbit_phase_deg <= 225.0)
+
+    def _apply_attitude_faults(self) -> None:
+        # Reaction wheel failure on satellites with a pending attitude_desync
+        pending = [
+            i for i in np.flatnonzero(self.fault_active & ~self.tumbling)
+            if self.fault_type[i] == "attitude_desync"
+        ]
+        if pending:
+            self.angular_velocity[pending] = self.rng.uniform(-0.3, 0.3, (len(pending), 3))
+            self.tumbling[pending] = True
+
+        recover = self.tumbling & ~self.fault_active
+        if recover.any():
+            self.angular_velocity[recover] *= 0.05
+            self.tumbling &= ~recover
+
+    def _step_thermal(self, dt: float) -> None:
+        solar_flux = np.where(self.in_eclipse, 0.0, SOLAR_CONSTANT)
+        attitude_multiplier = 1.0 + self.nadir_error_deg / 90.0
+        total_heat_w = BASE_HEAT_W + solar_flux * 0.54 * 0.15 * attitude_multiplier
+
+        faulted = self.thermal_fault.copy()
+        for i, fault in self._thermal_faults.items():
+            if not fault.active:
+                continue
+            faulted[i] = True
+            # Each infected neighbor adds ambient heat, then the cascade spreads
+            total_heat_w[i] += len(fault.infected_neighbors) * 2.0
+            for neighbor in self.nearby_sats[i]:
+                if neighbor.sat_id not in fault.infected_neighbors:
+                    if fault.infect_neighbor(neighbor):
+                        fault.infected_neighbors.append(neighbor.sat_id)
+
+        radiator_capacity = np.where(
+            faulted, self.radiator_capacity_wk * 0.1, self.radiator_capacity_wk
+        )
+        total_heat_w = np.where(faulted, total_heat_w * 1.8, total_heat_w)
+
+        battery_cooling_w = radiator_capacity * np.maximum(0.1, self.battery_temp / 20.0) * 0.3
+        eps_cooling_w = radiator_capacity * np.maximum(0.1, self.eps_temp / 20.0) * 0.6
+        battery_temp = self.battery_temp + (
+            (total_heat_w * 0.4 - battery_cooling_w) / BATTERY_THERMAL_MASS * dt
+        )
+        eps_temp = self.eps_temp + (total_heat_w * 0.6 - eps_cooling_w) / EPS_THERMAL_MASS * dt
+
+        critical = battery_temp > 60
+        self.thermal_status = np.where(critical, 2, np.where(battery_temp > 45, 1, 0)).astype(np.int8)
+        self.runaway_triggered |= critical
+        self.time_in_critical = np.where(critical, self.time_in_critical + dt, 0.0)
+
+        self.battery_temp = np.clip(battery_temp, -40, 80)
+        self.eps_temp = np.clip(eps_temp, -40, 85)
+        self.payload_temp = np.clip(self.payload_temp, -40, 75)
+
+    def _step_comms(self) -> None:
+        voltage = np.round(self.battery_voltage, 2)
+        self.range_km = np.maximum(500.0, self.altitude_m / 1000.0)
+        deep_brownout = voltage < 6.5
+        brownout = ~deep_brownout & (voltage < 7.2)
+
+        # TX power derating and brownout packet loss
+        self.tx_power_dbw = np.select(
+            [deep_brownout, brownout],
+            [
+                -3.0 + 10.0 * np.log10(np.maximum(0.01, (voltage - 6.0) / 1.4)),
+                2.0 * np.log10(np.maximum(0.01, (voltage - 6.5) / 0.7)),
+            ],
+            2.0,
+        )
+        loss = np.select(
+            [deep_brownout, brownout],
+            [
+                np.minimum(0.85, 0.80 - (voltage - 6.0) / 0.5 * 0.5),
+                0.30 - (voltage - 6.5) / 0.7 * 0.28,
+            ],
+            0.02,
+        )
+
+        range_loss = np.select(
+            [self.range_km > 900, self.range_km > 800, self.range_km > 700],
+            [0.90, 0.50, 0.05],
+            0.02,
+        )
+        loss = np.minimum(0.95, loss + range_loss)
+
+        # Gilbert-Elliot bursty fading: one draw per satellite
+        draw = self.rng.random(len(self.sat_ids))
+        to_bad = self.gilbert_good & (draw > 0.95)
+        to_good = ~self.gilbert_good & (draw < 0.10)
+        loss = np.where(to_bad, np.minimum(0.90, loss + 0.35), loss)
+        loss = np.where(to_good, np.maximum(0.02, loss - 0.25), loss)
+        self.gilbert_good = (self.gilbert_good & ~to_bad) | to_good
+        self.packet_loss_rate = loss
+
+        self.comms_state = np.where(loss > 0.30, 2, np.where(loss > 0.02, 1, 0)).astype(np.int8)
+
+    def packet(self, sat_id: str, timestamp: Optional[datetime] = None) -> TelemetryPacket:
+        """
+        Materialize one satellite's current state as a TelemetryPacket.
+
+        Args:
+            sat_id: Satellite identifier
+            timestamp: Packet timestamp (default: the engine clock's now)
+
+        Returns:
+            Validated TelemetryPacket
+        """
+        view = self.satellite(sat_id)
+        return TelemetryPacket(
+            timestamp=timestamp or self.clock.now(),
+            satellite_id=sat_id,
+            attitude=view.attitude_sim.get_attitude_data(),
+            power=view.power_sim.get_power_data(),
+            thermal=view.thermal_sim.get_thermal_data(),
+            orbit=view.orbit_sim.get_orbit_data(),
+            mission_mode="nominal",
+            ground_contact=bool(self.rng.random() < 0.5),
+        )
+
+    def packets(
+        self,
+        sat_ids: Optional[Iterable[str]] = None,
+        timestamp: Optional[datetime] = None
+    ) -> Dict[str, TelemetryPacket]:
+        """
+        Materialize TelemetryPackets for several satellites.
+
+        Args:
+            sat_ids: Satellites to materialize (default: all)
+            timestamp: Shared packet timestamp (default: the engine clock's now)
+
+        Returns:
+            Dict of sat_id → TelemetryPacket
+        """
+        timestamp = timestamp or self.clock.now()
+        return {
+            sat_id: self.packet(sat_id, timestamp)
+            for sat_id in (self.sat_ids if sat_ids is None else sat_ids)
+        }
+
+
+class _RowView:
+    """One satellite's row of a ConstellationEngine."""
+
+    __slots__ = ("_engine", "_i", "sat_id")
+
+    def __init__(self, engine: ConstellationEngine, index: int):
+        self._engine = engine
+        self._i = index
+        self.sat_id = engine.sat_ids[index]
+
+
+class OrbitView(_RowView):
+    """OrbitSimulator-compatible view of one satellite's orbit."""
+
+    __slots__ = ()
+
+    @property
+    def altitude_m(self) -> float:
+        return float(self._engine.altitude_m[self._i])
+
+    @property
+    def true_anomaly_deg(self) -> float:
+        return float(self._engine.true_anomaly_deg[self._i])
+
+    def is_in_eclipse(self) -> bool:
+        return bool(self._engine.in_eclipse[self._i])
+
+    def get_position_eci(self):
+        """Simplified equatorial ECI position (km), as OrbitSimulator."""
+        r_km = EARTH_RADIUS_KM + self.altitude_m / 1000.0
+        theta = np.radians(self.true_anomaly_deg)
+        return (r_km * np.cos(theta), r_km * np.sin(theta), 0.0)
+
+    def get_orbit_data(self) -> OrbitData:
+        return OrbitData(
+            altitude_m=int(self.altitude_m),
+            ground_speed_ms=int(7660 + self._engine.rng.normal(0, 10)),
+            true_anomaly_deg=round(self.true_anomaly_deg, 1),
+        )
+
+
+class AttitudeView(_RowView):
+    """AttitudeSimulator-compatible view of one satellite's attitude."""
+
+    __slots__ = ()
+
+    def get_attitude_data(self) -> AttitudeData:
+        return AttitudeData(
+            quaternion=self._engine.quaternion[self._i].tolist(),
+            angular_velocity=self._engine.angular_velocity[self._i].tolist(),
+            nadir_pointing_error_deg=float(self._engine.nadir_error_deg[self._i]),
+        )
+
+    def get_status(self) -> dict:
+        engine, i = self._engine, self._i
+        return {
+            "mode": "tumble" if engine.tumbling[i] else "nadir_pointing",
+            "fault_active": bool(engine.tumbling[i]),
+            "quaternion_norm": float(np.linalg.norm(engine.quaternion[i])),
+            "angular_velocity_magnitude": float(np.linalg.norm(engine.angular_velocity[i])),
+        }
+
+
+class PowerView(_RowView):
+    """PowerSimulator-compatible view of one satellite's EPS."""
+
+    __slots__ = ()
+
+    @property
+    def battery_soc(self) -> float:
+        return float(self._engine.battery_soc[self._i])
+
+    @property
+    def battery_voltage(self) -> float:
+        return float(self._engine.battery_voltage[self._i])
+
+    def get_power_data(self) -> PowerData:
+        engine, i = self._engine, self._i
+        if 135.0 <= engine.orbit_phase_deg[i] <= 225.0:
+            solar_power_w, load_w = 0.0, ECLIPSE_LOAD_W
+        else:
+            solar_power_w = (
+                SOLAR_CONSTANT * engine.panel_degradation[i] * PANEL_AREA_M2 * SOLAR_EFFICIENCY
+            )
+            load_w = NOMINAL_LOAD_W
+        if engine.power_fault[i]:
+            solar_power_w *= 0.5
+            load_w *= 1.3
+
+        voltage = max(self.battery_voltage, 1.0)
+        return PowerData(
+            battery_voltage=round(self.battery_voltage, 2),
+            battery_soc=round(self.battery_soc, 3),
+            solar_current=round(solar_power_w / voltage, 3),
+            load_current=round(load_w / voltage, 3),
+        )
+
+
+class ThermalView(_RowView):
+    """ThermalSimulator-compatible view of one satellite's thermal state."""
+
+    __slots__ = ()
+
+    @property
+    def battery_temp(self) -> float:
+        return float(self._engine.battery_temp[self._i])
+
+    @property
+    def eps_temp(self) -> float:
+        return float(self._engine.eps_temp[self._i])
+
+    @property
+    def status(self) -> str:
+        return THERMAL_STATUSES[self._engine.thermal_status[self._i]]
+
+    @property
+    def nearby_sats(self) -> List[NeighborProximity]:
+        return self._engine.nearby_sats[self._i]
+
+    def get_thermal_data(self) -> ThermalData:
+        return ThermalData(
+            battery_temp=round(self.battery_temp, 1),
+            eps_temp=round(self.eps_temp, 1),
+            status=self.status,
+        )
+
+
+class CommsView(_RowView):
+    """CommsSimulator-compatible view of one satellite's link."""
+
+    __slots__ = ()
+
+    @property
+    def state(self) -> CommsState:
+        return COMMS_STATES[self._engine.comms_state[self._i]]
+
+    @property
+    def packet_loss_rate(self) -> float:
+        return float(self._engine.packet_loss_rate[self._i])
+
+    def get_comms_stats(self) -> dict:
+        engine, i = self._engine, self._i
+        return {
+            "state": self.state.value,
+            "packet_loss_rate": round(self.packet_loss_rate, 3),
+            "tx_power_dbw": round(float(engine.tx_power_dbw[i]), 1),
+            "gilbert_state": "good" if engine.gilbert_good[i] else "bad",
+            "range_km": round(float(engine.range_km[i]), 1),
+        }
+
+
+class ConstellationSatellite(SatelliteSimulator):
+    """
+    SatelliteSimulator view of one ConstellationEngine row.
+
+    Physics advances with ConstellationEngine.step() for the whole
+    constellation; generate_telemetry() materializes the current state.
+    """
+
+    def __init__(self, engine: ConstellationEngine, sat_id: str):
+        """
+        Bind a view to a satellite in the engine.
+
+        Args:
+            engine: Owning constellation engine
+            sat_id: Satellite identifier
+        """
+        super().__init__(sat_id)
+        self._engine = engine
+        self._index = index = engine.index_of(sat_id)
+        self.orbit_sim = OrbitView(engine, index)
+        self.attitude_sim = AttitudeView(engine, index)
+        self.power_sim = PowerView(engine, index)
+        self.thermal_sim = ThermalView(engine, index)
+        self.comms_sim = CommsView(engine, index)
+
+    @property
+    def fault_type(self) -> Optional[str]:
+        """Most recently injected fault type, or None."""
+        return self._engine.fault_type[self._index]
+
+    async def generate_telemetry(self) -> TelemetryPacket:
+        """
+        Materialize this satellite's current state.
+
+        Returns:
+            TelemetryPacket (also recorded in telemetry history)
+        """
+        packet = self._engine.packet(self.sat_id)
+        self.record_telemetry(packet)
+        return packet
+
+    async def inject_fault(
+        self,
+        fault_type: str,
+        severity: float = 1.0,
+        duration: float = 60.0
+    ) -> None:
+        """
+        Inject fault into this satellite's row of the engine.
+
+        Args:
+            fault_type: Type of fault (e.g., 'power_brownout', 'attitude_desync')
+            severity: Fault severity (0.0-1.0)
+            duration: Fault duration in seconds
+        """
+        self._engine.inject_fault(self.sat_id, fault_type, severity, duration)
+        print(
+            f"Sat {self.sat_id}: Injected {fault_type} fault "
+            f"(severity={severity}, duration={duration}s)"
+        )
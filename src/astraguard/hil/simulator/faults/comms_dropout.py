@@ -10,12 +10,14 @@ Supports:
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 
+from ...clock import Clock, WALL_CLOCK
+
 
 class CommsDropoutFault:
     """Simulated dropout fault with auto-recovery and pattern control."""
     
     def __init__(self, sat_id: str, pattern: str = "gilbert", packet_loss: float = 0.3, 
-                 duration: float = 300.0):
+                 duration: float = 300.0, clock: Optional[Clock] = None):
         """
         Initialize comms dropout fault.
         
@@ -24,6 +26,7 @@ class CommsDropoutFault:
             pattern: "gilbert" (bursty) or "constant" (steady high loss)
             packet_loss: Target packet loss rate (0.05-0.95)
             duration: Fault duration in seconds before auto-recovery
+            clock: Time source for the fault timeline (default: wall clock)
         
         Raises:
             ValueError: If sat_id exceeds 16 characters
@@ -32,6 +35,7 @@ class CommsDropoutFault:
             raise ValueError(f"sat_id '{sat_id}' exceeds 16 character limit")
         
         self.sat_id = sat_id
+        self._clock = clock or WALL_CLOCK
         self.pattern = pattern
         self.packet_loss = min(max(packet_loss, 0.05), 0.95)  # Clamp to valid range
         self.duration = duration
@@ -48,7 +52,7 @@ class CommsDropoutFault:
     
     def inject(self):
         """Activate fault - start the dropout sequence."""
-        self.start_time = datetime.now()
+        self.start_time = self._clock.now()
         self.active = True
     
     def is_expired(self) -> bool:
@@ -61,7 +65,7 @@ class CommsDropoutFault:
         if not self.active or self.start_time is None:
             return True
         
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+        elapsed = (self._clock.now() - self.start_time).total_seconds()
         return elapsed > self.duration
     
     def get_fault_state(self) -> Dict[str, Any]:
@@ -74,7 +78,7 @@ class CommsDropoutFault:
         if not self.active or self.start_time is None:
             return {"active": False}
         
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+        elapsed = (self._clock.now() - self.start_time).total_seconds()
         
         return {
             "active": True,
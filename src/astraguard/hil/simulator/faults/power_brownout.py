@@ -20,6 +20,8 @@ Auto-recovery:
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 
+from ...clock import Clock, WALL_CLOCK
+
 
 class PowerBrownoutFault:
     """Multi-phase brownout: panel damage → battery stress → safe mode.
@@ -35,13 +37,20 @@ class PowerBrownoutFault:
         safe_mode_load_w: High-power load during recovery phase (8W)
     """
     
-    def __init__(self, sat_id: str, severity: float = 1.0, duration: float = 300.0):
+    def __init__(
+        self,
+        sat_id: str,
+        severity: float = 1.0,
+        duration: float = 300.0,
+        clock: Optional[Clock] = None,
+    ):
         """Initialize brownout fault.
         
         Args:
             sat_id: Satellite identifier (max 16 chars)
             severity: Fault severity (0.1-1.0), affects degradation intensity
             duration: How long fault lasts before auto-recovery (seconds)
+            clock: Time source for fault phases (default: wall clock)
         
         Raises:
             ValueError: If sat_id exceeds 16 characters
@@ -50,6 +59,7 @@ class PowerBrownoutFault:
             raise ValueError(f"sat_id '{sat_id}' exceeds 16 character limit")
         
         self.sat_id = sat_id
+        self._clock = clock or WALL_CLOCK
         
         # Clamp severity to valid range
         self.severity = min(max(severity, 0.1), 1.0)
@@ -88,7 +98,7 @@ class PowerBrownoutFault:
         Sets start_time to now and activates fault.
         Fault will propagate through 3 phases over duration seconds.
         """
-        self.start_time = datetime.now()
+        self.start_time = self._clock.now()
         self.active = True
     
     def is_expired(self) -> bool:
@@ -100,7 +110,7 @@ class PowerBrownoutFault:
         if not self.active or self.start_time is None:
             return True
         
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+        elapsed = (self._clock.now() - self.start_time).total_seconds()
         return elapsed > self.duration
     
     def get_fault_state(self) -> Dict[str, Any]:
@@ -118,7 +128,7 @@ class PowerBrownoutFault:
         if not self.active or self.start_time is None:
             return {"active": False}
         
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+        elapsed = (self._clock.now() - self.start_time).total_seconds()
         
         # Determine current phase
         if elapsed < 60:
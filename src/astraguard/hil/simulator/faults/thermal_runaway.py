@@ -10,6 +10,8 @@ from datetime import datetime
 from dataclasses import dataclass
 import numpy as np
 
+from ...clock import Clock, WALL_CLOCK
+
 
 @dataclass
 class NeighborProximity:
@@ -37,7 +39,9 @@ class ThermalRunawayFault:
         self, 
         sat_id: str, 
         contagion_rate: float = 0.2, 
-        duration: float = 600.0
+        duration: float = 600.0,
+        clock: Optional[Clock] = None,
+        rng: Optional[np.random.Generator] = None,
     ):
         """
         Initialize thermal runaway fault.
@@ -46,8 +50,12 @@ class ThermalRunawayFault:
             sat_id: Satellite identifier
             contagion_rate: Base infection probability (0.05-0.8, clamped)
             duration: Fault duration in seconds (300-1800)
+            clock: Time source for the fault timeline (default: wall clock)
+            rng: Random generator for contagion draws (default: np.random)
         """
         self.sat_id = sat_id
+        self._clock = clock or WALL_CLOCK
+        self._rng = rng if rng is not None else np.random
         self.contagion_rate = np.clip(contagion_rate, 0.05, 0.8)
         self.duration = np.clip(duration, 0.1, 1800.0)
         self.start_time: Optional[datetime] = None
@@ -60,7 +68,7 @@ class ThermalRunawayFault:
         
         Triggers radiator failure and starts countdown to recovery.
         """
-        self.start_time = datetime.now()
+        self.start_time = self._clock.now()
         self.active = True
         
     def infect_neighbor(self, neighbor: NeighborProximity) -> bool:
@@ -93,7 +101,7 @@ class ThermalRunawayFault:
         distance_factor = 1.0 - (neighbor.distance_km / 5.0)
         infection_prob = self.contagion_rate * distance_factor * neighbor.contagion_risk
         
-        return np.random.random() < infection_prob
+        return self._rng.random() < infection_prob
     
     def is_expired(self) -> bool:
         """
@@ -105,7 +113,7 @@ class ThermalRunawayFault:
         if not self.active or not self.start_time:
             return True
         
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+        elapsed = (self._clock.now() - self.start_time).total_seconds()
         return elapsed > self.duration
     
     def get_fault_state(self) -> Dict[str, Any]:
@@ -125,7 +133,7 @@ class ThermalRunawayFault:
             time_remaining = 0.0
             time_elapsed = 0.0
         else:
-            time_elapsed = (datetime.now() - self.start_time).total_seconds()
+            time_elapsed = (self._clock.now() - self.start_time).total_seconds()
             time_remaining = max(0.0, self.duration - time_elapsed)
         
         return {
@@ -8,6 +8,7 @@ battery charging/discharging, and orbital eclipse cycles typical of LEO operatio
 import numpy as np
 from typing import Optional
 from datetime import datetime
+from ..clock import Clock, WALL_CLOCK
 from .faults.power_brownout import PowerBrownoutFault
 
 
@@ -22,15 +23,17 @@ class PowerSimulator:
     - Realistic load profile (ADCS, comms, payload)
     """
     
-    def __init__(self, sat_id: str):
+    def __init__(self, sat_id: str, clock: Optional[Clock] = None):
         """
         Initialize power system.
         
         Args:
             sat_id: Satellite identifier
+            clock: Time source for fault timelines (default: wall clock)
         """
         self.sat_id = sat_id
-        self.start_time = datetime.now()
+        self._clock = clock or WALL_CLOCK
+        self.start_time = self._clock.now()
         self.elapsed_time = 0.0
         
         # Battery: 2x 18650 LiIon cells in series
@@ -243,7 +246,9 @@ class PowerSimulator:
                 - 0.9: Severe (90% panel loss)
             duration: Total fault duration in seconds (default 300s = 5min)
         """
-        self._brownout_fault = PowerBrownoutFault(self.sat_id, severity, duration)
+        self._brownout_fault = PowerBrownoutFault(
+            self.sat_id, severity, duration, clock=self._clock
+        )
         self._brownout_fault.inject()
         self._fault_active = True
         self._fault_type = "power_brownout"
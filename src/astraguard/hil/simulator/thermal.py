@@ -18,6 +18,7 @@ Physics Model:
 import numpy as np
 from pydantic import BaseModel, Field
 from typing import Dict, List, Optional
+from ..clock import Clock
 from ..schemas.telemetry import ThermalData
 
 
@@ -35,11 +36,12 @@ class ThermalSimulator:
         status: Thermal status (nominal/warning/critical)
     """
     
-    def __init__(self, sat_id: str):
+    def __init__(self, sat_id: str, clock: Optional[Clock] = None):
         """Initialize thermal simulator.
         
         Args:
             sat_id: Satellite identifier string (max 16 chars)
+            clock: Time source for fault timelines (default: wall clock)
         
         Raises:
             ValueError: If sat_id exceeds 16 characters
@@ -48,6 +50,7 @@ class ThermalSimulator:
             raise ValueError(f"sat_id '{sat_id}' exceeds 16 character limit")
         
         self.sat_id = sat_id
+        self._clock = clock
         
         # Initial temperatures (°C) - starting at nominal Earth orbit conditions
         self.battery_temp = 15.0  # Colder initially
@@ -188,7 +191,8 @@ class ThermalSimulator:
         self._thermal_fault = ThermalRunawayFault(
             sat_id=self.sat_id,
             contagion_rate=contagion_rate,
-            duration=600.0  # 10 minute cascade
+            duration=600.0,  # 10 minute cascade
+            clock=self._clock,
         )
         
         # Activate primary infection
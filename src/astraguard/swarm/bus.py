@@ -7,17 +7,40 @@ Issue #398: Message bus abstraction for distributed satellite constellation
 - ISL bandwidth constraints (10KB/s)
 - Latency simulation (50-200ms)
 - Deduplication and ordering (Issue #403 prep)
+
+Matching subscribers are resolved through a topic trie (O(topic depth)).
+Delivery is sequential by default; concurrent_delivery runs callbacks with
+asyncio.gather, and subscriber_queue_size > 0 gives each subscription a
+bounded queue drained by its own task, so a slow callback only delays its
+own messages.
+
+With batch_window_ms > 0, QoS 0/1 publishes issued within the window are
+coalesced into one frame per (sender, receiver) pair (split every
+MAX_FRAME_MESSAGES) and the whole batch pays a single latency sleep.
+publish_many() sends a batch immediately. Messages are still delivered
+in-process; frames are only accounted for, from this layout (little-endian):
+
+    header  sender uuid (16) | receiver uuid or zeros (16) | count (uint16)
+    entry   message id (16) | timestamp us (int64) | sequence (uint32) |
+            qos (uint8) | topic length (uint16) | payload length (uint16) |
+            topic | payload
+
+Sent on its own, every message carries the sender and receiver itself
+(MESSAGE_HEADER); metrics["bytes_saved"] is the difference between that and
+the frames actually charged to the ISL (metrics["isl_bytes"]).
 """
 
 import asyncio
 import logging
-from typing import Dict, List, Callable, Optional, Any, Set
+import struct
+from typing import Dict, List, Callable, Optional, Any, Set, Iterable, Tuple
 from collections import defaultdict
 from datetime import datetime
 import json
 
 from astraguard.swarm.models import SwarmConfig, AgentID, HealthSummary
 from astraguard.swarm.serializer import SwarmSerializer
+from astraguard.swarm.topic_index import TopicTrie
 from astraguard.swarm.types import (
     SwarmMessage,
     SwarmTopic,
@@ -29,6 +52,27 @@ from astraguard.swarm.types import (
 
 logger = logging.getLogger(__name__)
 
+# Wire accounting for coalesced publishing (see module docstring)
+MESSAGE_HEADER = struct.Struct("<16s16s16sqIBHH")  # standalone message
+FRAME_HEADER = struct.Struct("<16s16sH")
+FRAME_ENTRY = struct.Struct("<16sqIBHH")
+MAX_FRAME_MESSAGES = 0xFFFF  # uint16 count in FRAME_HEADER
+
+
+def _empty_metrics() -> Dict[str, int]:
+    return {
+        "published": 0,
+        "delivered": 0,
+        "failed": 0,
+        "acked": 0,
+        "lost": 0,
+        "dropped": 0,
+        "batches": 0,
+        "batched_messages": 0,
+        "isl_bytes": 0,
+        "bytes_saved": 0,
+    }
+
 
 class SwarmMessageBus:
     """High-performance pub/sub message bus for satellite constellations.
@@ -48,6 +92,9 @@ class SwarmMessageBus:
         serializer: SwarmSerializer,
         isl_bandwidth_kbps: int = 10,
         latency_ms: int = 100,
+        concurrent_delivery: bool = False,
+        subscriber_queue_size: int = 0,
+        batch_window_ms: float = 0,
     ):
         """Initialize message bus.
         
@@ -56,16 +103,37 @@ class SwarmMessageBus:
             serializer: SwarmSerializer for message encoding
             isl_bandwidth_kbps: ISL bandwidth limit (default 10 KB/s)
             latency_ms: ISL latency in milliseconds (default 100ms)
+            concurrent_delivery: Await matching callbacks concurrently
+                (asyncio.gather) instead of one at a time
+            subscriber_queue_size: If > 0, queue messages per subscription
+                (bounded; the oldest queued message is dropped when full)
+                and run callbacks in per-subscription tasks
+            batch_window_ms: If > 0, coalesce QoS 0/1 publishes issued within
+                this window into one frame per receiver
         """
+        if subscriber_queue_size < 0:
+            raise ValueError("subscriber_queue_size must be >= 0")
+        if batch_window_ms < 0:
+            raise ValueError("batch_window_ms must be >= 0")
         self.config = config
         self.serializer = serializer
         self.isl_bandwidth_kbps = isl_bandwidth_kbps
         self.latency_ms = latency_ms
+        self.concurrent_delivery = concurrent_delivery
+        self.subscriber_queue_size = subscriber_queue_size
+        self.batch_window_ms = batch_window_ms
 
         # Subscription management
         self.subscriptions: Dict[SubscriptionID, Callable] = {}
         self.topic_subscribers: Dict[str, List[SubscriptionID]] = defaultdict(list)
         self.topic_filters: Dict[str, TopicFilter] = {}
+        self._topic_index = TopicTrie()
+        self._queues: Dict[SubscriptionID, asyncio.Queue] = {}
+        self._workers: Dict[SubscriptionID, asyncio.Task] = {}
+
+        # Micro-batching (batch_window_ms > 0)
+        self._batch: List[Tuple[SwarmMessage, asyncio.Future]] = []
+        self._batch_timer: Optional[asyncio.Task] = None
 
         # Message tracking
         self.message_sequence = 0
@@ -74,13 +142,7 @@ class SwarmMessageBus:
         self.max_stored_messages = 1000
 
         # Metrics
-        self.metrics = {
-            "published": 0,
-            "delivered": 0,
-            "failed": 0,
-            "acked": 0,
-            "lost": 0,
-        }
+        self.metrics = _empty_metrics()
 
     async def publish(
         self,
@@ -103,39 +165,13 @@ class SwarmMessageBus:
             True if published successfully, False otherwise
         """
         try:
-            # Validate topic
-            if not SwarmTopic.is_valid_topic(topic):
-                logger.error(f"Invalid topic: {topic}")
-                return False
-
-            # Serialize payload
-            if isinstance(payload, (SwarmMessage, HealthSummary)):
-                payload_bytes = self.serializer.serialize_health(
-                    payload if isinstance(payload, HealthSummary) else payload.payload,
-                    compress=False,  # Use compression when lz4 available
-                )
-            elif isinstance(payload, bytes):
-                payload_bytes = payload
-            else:
-                payload_bytes = json.dumps(payload).encode("utf-8")
-
-            # Validate payload size (10KB ISL limit)
-            if len(payload_bytes) > 10240:
-                logger.error(
-                    f"Payload {len(payload_bytes)} exceeds 10KB ISL limit"
-                )
+            message = self._build_message(topic, payload, qos, receiver)
+            if message is None:
                 return False
 
-            # Create message
-            self.message_sequence += 1
-            message = SwarmMessage(
-                topic=topic,
-                payload=payload_bytes,
-                sender=self.config.agent_id,
-                qos=qos,
-                sequence=self.message_sequence,
-                receiver=receiver,
-            )
+            # Coalesce into the current batch window
+            if self.batch_window_ms > 0 and qos in (QoSLevel.FIRE_FORGET, QoSLevel.ACK):
+                return await self._publish_coalesced(message, timeout_ms)
 
             # Handle QoS level
             if qos == QoSLevel.FIRE_FORGET:
@@ -153,6 +189,199 @@ class SwarmMessageBus:
             self.metrics["failed"] += 1
             return False
 
+    async def publish_many(
+        self,
+        messages: Iterable[Tuple[str, Any]],
+        qos: int = 0,
+        receiver: Optional[AgentID] = None,
+        timeout_ms: int = 5000,
+    ) -> List[bool]:
+        """Publish several messages as one batch.
+
+        QoS 0/1 messages are framed per receiver, compressed once and sent
+        with a single latency sleep, bypassing the batch window. QoS 2
+        messages keep their per-message retry path.
+
+        Args:
+            messages: (topic, payload) pairs, payloads as for publish()
+            qos: QoS level applied to every message
+            receiver: Optional specific receiver (None=broadcast)
+            timeout_ms: Timeout for ACK/reliable delivery
+
+        Returns:
+            Per-message success flags, in input order
+        """
+        messages = list(messages)
+        if qos == QoSLevel.RELIABLE:
+            return [
+                await self.publish(topic, payload, qos, receiver, timeout_ms)
+                for topic, payload in messages
+            ]
+
+        results = [False] * len(messages)
+        batch: List[Tuple[int, SwarmMessage]] = []
+        for index, (topic, payload) in enumerate(messages):
+            try:
+                message = self._build_message(topic, payload, qos, receiver)
+            except Exception as e:
+                logger.error(f"Error publishing to {topic}: {e}")
+                self.metrics["failed"] += 1
+                continue
+            if message is not None:
+                batch.append((index, message))
+        if not batch:
+            return results
+
+        ack_events = self._register_acks([message for _, message in batch])
+        try:
+            try:
+                await self._send_batch([message for _, message in batch])
+            except Exception as e:
+                logger.error(f"Batch publish failed: {e}")
+                self.metrics["failed"] += len(batch)
+                return results
+
+            acked = await asyncio.gather(*(
+                self._await_ack(message, ack_events.get(str(message.message_id)), timeout_ms)
+                for _, message in batch
+            ))
+            for (index, _), ok in zip(batch, acked):
+                results[index] = ok
+            return results
+        finally:
+            for key in ack_events:
+                self.pending_acks.pop(key, None)
+
+    def _build_message(
+        self, topic: str, payload: Any, qos: int, receiver: Optional[AgentID]
+    ) -> Optional[SwarmMessage]:
+        """Validate and serialize a payload; None if it cannot be sent."""
+        # Validate topic
+        if not SwarmTopic.is_valid_topic(topic):
+            logger.error(f"Invalid topic: {topic}")
+            return None
+
+        # Serialize payload
+        if isinstance(payload, (SwarmMessage, HealthSummary)):
+            payload_bytes = self.serializer.serialize_health(
+                payload if isinstance(payload, HealthSummary) else payload.payload,
+                compress=False,  # Use compression when lz4 available
+            )
+        elif isinstance(payload, bytes):
+            payload_bytes = payload
+        else:
+            payload_bytes = json.dumps(payload).encode("utf-8")
+
+        # Validate payload size (10KB ISL limit)
+        if len(payload_bytes) > 10240:
+            logger.error(
+                f"Payload {len(payload_bytes)} exceeds 10KB ISL limit"
+            )
+            return None
+
+        # Create message
+        self.message_sequence += 1
+        return SwarmMessage(
+            topic=topic,
+            payload=payload_bytes,
+            sender=self.config.agent_id,
+            qos=qos,
+            sequence=self.message_sequence,
+            receiver=receiver,
+        )
+
+    async def _publish_coalesced(self, message: SwarmMessage, timeout_ms: int) -> bool:
+        """Queue a QoS 0/1 message for the current batch window."""
+        sent = asyncio.get_running_loop().create_future()
+        ack_event = self._register_acks([message]).get(str(message.message_id))
+        try:
+            self._batch.append((message, sent))
+            if self._batch_timer is None:
+                self._batch_timer = asyncio.create_task(self._flush_after_window())
+            if not await sent:
+                return False
+            return await self._await_ack(message, ack_event, timeout_ms)
+        finally:
+            self.pending_acks.pop(str(message.message_id), None)
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(self.batch_window_ms / 1000.0)
+        self._batch_timer = None
+        await self._flush_batch()
+
+    async def _flush_batch(self) -> None:
+        """Send everything in the current batch window now."""
+        batch, self._batch = self._batch, []
+        if not batch:
+            return
+        try:
+            await self._send_batch([message for message, _ in batch])
+            ok = True
+        except Exception as e:
+            logger.error(f"Batch publish failed: {e}")
+            self.metrics["failed"] += len(batch)
+            ok = False
+        for _, sent in batch:
+            if not sent.done():
+                sent.set_result(ok)
+
+    async def _send_batch(self, messages: List[SwarmMessage]) -> None:
+        """Account frames per link, pay one latency sleep, deliver in order."""
+        by_link: Dict[Tuple[AgentID, Optional[AgentID]], List[int]] = defaultdict(list)
+        standalone = 0
+        for message in messages:
+            body = len(message.topic.encode("utf-8")) + len(message.payload)
+            standalone += MESSAGE_HEADER.size + body
+            by_link[(message.sender, message.receiver)].append(body)
+
+        framed = sum(
+            self._frame_size(bodies[start:start + MAX_FRAME_MESSAGES])
+            for bodies in by_link.values()
+            for start in range(0, len(bodies), MAX_FRAME_MESSAGES)
+        )
+
+        self.metrics["published"] += len(messages)
+        self.metrics["batches"] += 1
+        self.metrics["batched_messages"] += len(messages)
+        self.metrics["isl_bytes"] += framed
+        self.metrics["bytes_saved"] += standalone - framed
+
+        await self._simulate_latency()
+        for message in messages:
+            await self._deliver_message(message)
+            if message.qos == QoSLevel.FIRE_FORGET:
+                self.metrics["delivered"] += 1
+
+    @staticmethod
+    def _frame_size(bodies: List[int]) -> int:
+        """Bytes of one frame holding entries with these topic + payload sizes."""
+        return FRAME_HEADER.size + FRAME_ENTRY.size * len(bodies) + sum(bodies)
+
+    def _register_acks(self, messages: List[SwarmMessage]) -> Dict[str, asyncio.Event]:
+        """Create pending ACK events for the QoS 1 messages in a batch."""
+        events = {}
+        for message in messages:
+            if message.qos == QoSLevel.ACK:
+                key = str(message.message_id)
+                events[key] = self.pending_acks[key] = asyncio.Event()
+        return events
+
+    async def _await_ack(
+        self, message: SwarmMessage, ack_event: Optional[asyncio.Event], timeout_ms: int
+    ) -> bool:
+        """Wait for a batched message's ACK (QoS 1); QoS 0 succeeds at once."""
+        if ack_event is None:
+            return True
+        try:
+            await asyncio.wait_for(ack_event.wait(), timeout=timeout_ms / 1000.0)
+        except asyncio.TimeoutError:
+            logger.warning(f"ACK timeout for message {message.message_id}")
+            self.metrics["lost"] += 1
+            return False
+        self.metrics["acked"] += 1
+        self.metrics["delivered"] += 1
+        return True
+
     async def _publish_fire_forget(self, message: SwarmMessage) -> bool:
         """Publish with QoS 0 (fire-forget)."""
         try:
@@ -252,26 +481,90 @@ class SwarmMessageBus:
 
     async def _deliver_message(self, message: SwarmMessage) -> None:
         """Deliver message to subscribers."""
-        # Find matching subscribers
-        matching_subs: List[SubscriptionID] = []
-
-        for sub_id in list(self.subscriptions.keys()):
-            topic_filter = self.topic_filters.get(str(sub_id))
-            if topic_filter and topic_filter.matches(message.topic):
-                matching_subs.append(sub_id)
-
-        # Deliver to all matching subscribers
-        for sub_id in matching_subs:
-            callback = self.subscriptions.get(sub_id)
-            if callback:
-                try:
-                    result = callback(message)
-                    if asyncio.iscoroutine(result):
-                        await result
-                except Exception as e:
-                    logger.error(
-                        f"Error in subscription callback {sub_id}: {e}"
-                    )
+        matching_subs: List[SubscriptionID] = self._topic_index.match(message.topic)
+        if not matching_subs:
+            return
+
+        if self.subscriber_queue_size > 0:
+            for sub_id in matching_subs:
+                self._enqueue(sub_id, message)
+        elif self.concurrent_delivery and len(matching_subs) > 1:
+            await asyncio.gather(
+                *(self._invoke(sub_id, message) for sub_id in matching_subs)
+            )
+        else:
+            for sub_id in matching_subs:
+                await self._invoke(sub_id, message)
+
+    async def _invoke(self, sub_id: SubscriptionID, message: SwarmMessage) -> None:
+        """Run one subscription callback, logging (not raising) its errors."""
+        callback = self.subscriptions.get(sub_id)
+        if callback:
+            try:
+                result = callback(message)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.error(
+                    f"Error in subscription callback {sub_id}: {e}"
+                )
+
+    def _enqueue(self, sub_id: SubscriptionID, message: SwarmMessage) -> None:
+        """Queue message for a subscription, starting its worker on first use."""
+        queue = self._queues.get(sub_id)
+        if queue is None:
+            if sub_id not in self.subscriptions:
+                return
+            queue = self._queues[sub_id] = asyncio.Queue(maxsize=self.subscriber_queue_size)
+            self._workers[sub_id] = asyncio.create_task(self._drain_queue(sub_id, queue))
+
+        if queue.full():
+            # Keep the freshest data flowing to a subscriber that fell behind
+            queue.get_nowait()
+            queue.task_done()
+            self.metrics["dropped"] += 1
+            logger.warning(f"Subscriber {sub_id.id} queue full, dropped oldest message")
+        queue.put_nowait(message)
+
+    async def _drain_queue(self, sub_id: SubscriptionID, queue: asyncio.Queue) -> None:
+        """Per-subscription worker delivering queued messages in order."""
+        while True:
+            message = await queue.get()
+            try:
+                await self._invoke(sub_id, message)
+            finally:
+                queue.task_done()
+
+    def _stop_worker(self, sub_id: SubscriptionID) -> None:
+        worker = self._workers.pop(sub_id, None)
+        if worker is not None:
+            worker.cancel()
+        self._queues.pop(sub_id, None)
+
+    async def flush(self) -> None:
+        """Send the pending batch and wait until every queue has been delivered."""
+        self._cancel_batch_timer()
+        await self._flush_batch()
+        for queue in list(self._queues.values()):
+            await queue.join()
+
+    async def close(self) -> None:
+        """Send the pending batch, then stop per-subscription workers.
+
+        Messages still queued for a subscriber are discarded.
+        """
+        self._cancel_batch_timer()
+        await self._flush_batch()
+        workers = list(self._workers.values())
+        for sub_id in list(self._workers):
+            self._stop_worker(sub_id)
+        if workers:
+            await asyncio.gather(*workers, return_exceptions=True)
+
+    def _cancel_batch_timer(self) -> None:
+        if self._batch_timer is not None:
+            self._batch_timer.cancel()
+            self._batch_timer = None
 
     async def _simulate_latency(self) -> None:
         """Simulate ISL latency."""
@@ -307,6 +600,7 @@ class SwarmMessageBus:
             self.subscriptions[sub_id] = callback
             self.topic_filters[str(sub_id)] = filter_obj
             self.topic_subscribers[topic_filter].append(sub_id)
+            self._topic_index.add(topic_filter, sub_id)
 
             logger.debug(f"Subscription {sub_id.id} created for {topic_filter}")
             return sub_id
@@ -328,6 +622,8 @@ class SwarmMessageBus:
             self.subscriptions.pop(subscription_id)
             topic_filter_str = subscription_id.topic_filter
             self.topic_filters.pop(str(subscription_id), None)
+            self._topic_index.remove(subscription_id)
+            self._stop_worker(subscription_id)
 
             if topic_filter_str in self.topic_subscribers:
                 try:
@@ -374,6 +670,11 @@ class SwarmMessageBus:
             **self.metrics,
             "subscriptions": len(self.subscriptions),
             "pending_acks": len(self.pending_acks),
+            "queued": sum(queue.qsize() for queue in self._queues.values()),
+            "avg_batch_size": (
+                self.metrics["batched_messages"] / self.metrics["batches"]
+                if self.metrics["batches"] else 0.0
+            ),
             "deduplication_cache": len(self.received_messages),
             "message_sequence": self.message_sequence,
         }
@@ -394,13 +695,15 @@ class SwarmMessageBus:
         self.subscriptions.clear()
         self.topic_filters.clear()
         self.topic_subscribers.clear()
+        self._topic_index.clear()
+        for sub_id in list(self._workers):
+            self._stop_worker(sub_id)
+        self._cancel_batch_timer()
+        for _, sent in self._batch:
+            if not sent.done():
+                sent.set_result(False)
+        self._batch = []
         self.pending_acks.clear()
         self.received_messages.clear()
-        self.metrics = {
-            "published": 0,
-            "delivered": 0,
-            "failed": 0,
-            "acked": 0,
-            "lost": 0,
-        }
+        self.metrics = _empty_metrics()
         logger.info("Message bus cleared")
@@ -11,9 +11,11 @@ Issue #399: State compression for bandwidth-constrained ISL links
 import struct
 import logging
 import datetime
-from typing import Optional
+from typing import List, Optional, Sequence
 from dataclasses import dataclass
 
+import numpy as np
+
 from astraguard.swarm.models import HealthSummary
 
 logger = logging.getLogger(__name__)
@@ -24,6 +26,16 @@ QUANTIZATION_OFFSET = 128
 MIN_FLOAT = -1.0
 MAX_FLOAT = 1.0
 
+# Wire layout: header (version, flags, original_size), then
+# risk_score + recurrence_score as float32, then 32 signature values
+SIGNATURE_DIM = 32
+SCALAR_BYTES = 8
+HEADER = struct.Struct("<BBH")
+SCALARS = struct.Struct("<ff")
+DELTA_SIZE = SCALAR_BYTES + 4 * SIGNATURE_DIM   # Stage 1 output: float32 deltas
+QUANTIZED_SIZE = SCALAR_BYTES + SIGNATURE_DIM   # Stage 2 output: uint8 deltas
+_QUANTIZE_FACTOR = 255 / (MAX_FLOAT - MIN_FLOAT)
+
 try:
     import lz4.frame
     HAS_LZ4 = True
@@ -43,7 +55,11 @@ class CompressionStats:
 
 
 class StateCompressor:
-    """Multi-stage compression pipeline for HealthSummary anomaly vectors."""
+    """Multi-stage compression pipeline for HealthSummary anomaly vectors.
+
+    Stages work in place on buffers preallocated per compressor, using
+    NumPy views over them, so a message costs one output allocation.
+    """
 
     def __init__(self, prev_state: Optional[HealthSummary] = None):
         """Initialize compressor with optional previous state for delta encoding.
@@ -56,6 +72,18 @@ class StateCompressor:
         )
         self.stats = None
 
+        # Stage buffers, reused for every message
+        self._delta_buf = bytearray(DELTA_SIZE)
+        self._delta_values = np.frombuffer(self._delta_buf, dtype="<f4", offset=SCALAR_BYTES)
+        self._quant_buf = bytearray(HEADER.size + QUANTIZED_SIZE)
+        self._quant_view = memoryview(self._quant_buf)[HEADER.size:]
+        self._quant_values = np.frombuffer(
+            self._quant_buf, dtype=np.uint8, offset=HEADER.size + SCALAR_BYTES
+        )
+        self._dequant_buf = bytearray(DELTA_SIZE)
+        self._dequant_values = np.frombuffer(self._dequant_buf, dtype="<f4", offset=SCALAR_BYTES)
+        self._scratch = np.empty(SIGNATURE_DIM, dtype=np.float64)
+
     def compress_health(
         self, summary: HealthSummary, use_lz4: bool | None = None
     ) -> bytes:
@@ -79,23 +107,22 @@ class StateCompressor:
             # Stage 1: Delta encoding
             delta_data = self._stage1_delta_encode(summary)
 
-            # Stage 2: Quantization
+            # Stage 2: Quantization (written after the header slot of _quant_buf)
             quantized_data = self._stage2_quantize(delta_data)
 
+            # Build output: version (1 byte) + flags (1 byte) + original_size (2 bytes) + data
+            version = 1
+            flags = 0x01 if (use_lz4 and HAS_LZ4) else 0x00  # Bit 0: LZ4 enabled
+            original_size = self._calculate_original_size(summary)
+
             # Stage 3: LZ4 compression (if available and enabled)
             if use_lz4 and HAS_LZ4:
                 compressed_data = self._stage3_lz4_compress(quantized_data)
+                output = HEADER.pack(version, flags, original_size) + compressed_data
             else:
                 compressed_data = quantized_data
-
-            # Build output: version (1 byte) + flags (1 byte) + original_size (4 bytes) + data
-            version = 1
-            flags = 0x01 if (use_lz4 and HAS_LZ4) else 0x00  # Bit 0: LZ4 enabled
-            original_size = self._calculate_original_size(summary)
-
-            output = struct.pack(
-                "<BBH", version, flags, original_size
-            ) + compressed_data
+                HEADER.pack_into(self._quant_buf, 0, version, flags, original_size)
+                output = bytes(self._quant_buf)
 
             # Update statistics
             self._update_stats(
@@ -125,8 +152,8 @@ class StateCompressor:
             if len(data) < 6:
                 raise ValueError("Data too short for header")
 
-            version, flags, original_size = struct.unpack("<BBH", data[:4])
-            compressed_data = data[4:]
+            version, flags, original_size = HEADER.unpack_from(data)
+            compressed_data = memoryview(data)[HEADER.size:]
 
             if version != 1:
                 raise ValueError(f"Unsupported compression version: {version}")
@@ -152,71 +179,170 @@ class StateCompressor:
             logger.error(f"Decompression failed: {e}")
             raise ValueError(f"State decompression pipeline error: {e}")
 
+    # ===== Batch API =====
+
+    def compress_batch(
+        self,
+        summaries: Sequence[HealthSummary],
+        prev_states: Optional[Sequence[Optional[HealthSummary]]] = None,
+        use_lz4: bool | None = None,
+    ) -> List[bytes]:
+        """Compress many agents' health summaries in one vectorized pass.
+
+        Each summary is delta encoded against its own entry of prev_states
+        (None for a full signature), so payload i decompresses with
+        StateCompressor(prev_state=prev_states[i]).decompress(). The
+        compressor's own delta reference is not used or updated.
+
+        Args:
+            summaries: HealthSummary per agent
+            prev_states: Optional previous HealthSummary per agent
+            use_lz4: Enable LZ4 compression (stage 3). If None, auto-detect
+
+        Returns:
+            One compressed payload per summary, in input order
+
+        Raises:
+            ValueError: If prev_states does not match summaries or compression fails
+        """
+        if use_lz4 is None:
+            use_lz4 = HAS_LZ4
+        if prev_states is not None and len(prev_states) != len(summaries):
+            raise ValueError("prev_states must have one entry per summary")
+        n = len(summaries)
+        if n == 0:
+            return []
+
+        try:
+            signatures = np.array([s.anomaly_signature for s in summaries], dtype=np.float64)
+            if prev_states is not None:
+                signatures -= _reference_matrix(prev_states)
+
+            # Stages 1+2 for every row: float32 deltas, then uint8 codes
+            records = np.empty(n, dtype=[("scalars", "<f4", 2), ("codes", "u1", SIGNATURE_DIM)])
+            records["scalars"] = [(s.risk_score, s.recurrence_score) for s in summaries]
+            records["codes"] = _quantize(signatures.astype(np.float32).astype(np.float64))
+            payload = records.tobytes()
+
+            lz4_enabled = bool(use_lz4 and HAS_LZ4)
+            header = HEADER.pack(1, 0x01 if lz4_enabled else 0x00, self._calculate_original_size(None))
+            view = memoryview(payload)
+            outputs = []
+            for i in range(n):
+                row = view[i * QUANTIZED_SIZE:(i + 1) * QUANTIZED_SIZE]
+                outputs.append(header + (self._stage3_lz4_compress(row) if lz4_enabled else row))
+            return outputs
+
+        except Exception as e:
+            logger.error(f"Batch compression failed: {e}")
+            raise ValueError(f"State compression pipeline error: {e}")
+
+    def decompress_batch(
+        self,
+        payloads: Sequence[bytes],
+        prev_states: Optional[Sequence[Optional[HealthSummary]]] = None,
+    ) -> List[HealthSummary]:
+        """Decompress payloads produced by compress_batch() in one vectorized pass.
+
+        Args:
+            payloads: Compressed payloads
+            prev_states: The prev_states used when compressing
+
+        Returns:
+            Restored HealthSummary per payload, in input order
+
+        Raises:
+            ValueError: If any payload is invalid
+        """
+        if prev_states is not None and len(prev_states) != len(payloads):
+            raise ValueError("prev_states must have one entry per payload")
+        n = len(payloads)
+        if n == 0:
+            return []
+
+        try:
+            quantized = bytearray(n * QUANTIZED_SIZE)
+            for i, data in enumerate(payloads):
+                if len(data) < 6:
+                    raise ValueError("Data too short for header")
+                version, flags, _ = HEADER.unpack_from(data)
+                if version != 1:
+                    raise ValueError(f"Unsupported compression version: {version}")
+                body = memoryview(data)[HEADER.size:]
+                if flags & 0x01:
+                    if not HAS_LZ4:
+                        raise ValueError("LZ4 decompression not available")
+                    body = self._stage3_lz4_decompress(body)
+                if len(body) < QUANTIZED_SIZE:
+                    raise ValueError("Compressed payload too short")
+                quantized[i * QUANTIZED_SIZE:(i + 1) * QUANTIZED_SIZE] = body[:QUANTIZED_SIZE]
+
+            records = np.frombuffer(
+                quantized, dtype=[("scalars", "<f4", 2), ("codes", "u1", SIGNATURE_DIM)]
+            )
+            # Round-trip through float32 like the single-message stage buffers
+            signatures = _dequantize(records["codes"]).astype(np.float32).astype(np.float64)
+            if prev_states is not None:
+                signatures += _reference_matrix(prev_states)
+            scalars = records["scalars"].astype(np.float64).tolist()
+
+            timestamp = datetime.datetime.utcnow()
+            return [
+                HealthSummary(
+                    anomaly_signature=signature,
+                    risk_score=risk_score,
+                    recurrence_score=recurrence_score,
+                    timestamp=timestamp,
+                )
+                for signature, (risk_score, recurrence_score) in zip(signatures.tolist(), scalars)
+            ]
+
+        except Exception as e:
+            logger.error(f"Batch decompression failed: {e}")
+            raise ValueError(f"State decompression pipeline error: {e}")
+
     # ===== Stage 1: Delta Encoding =====
 
-    def _stage1_delta_encode(self, summary: HealthSummary) -> bytes:
+    def _stage1_delta_encode(self, summary: HealthSummary) -> memoryview:
         """Stage 1: Delta encode anomaly signature against previous state.
         
         Reduces 4.2KB → 1.5KB (65% reduction) by storing differences.
+        Writes float32 scalars + deltas into the preallocated delta buffer.
         """
         anomaly_sig = summary.anomaly_signature
-        
-        if self.prev_anomaly_sig is None:
-            # First message: store full signature
-            delta_values = anomaly_sig
-        else:
-            # Store deltas relative to previous signature
-            delta_values = [
-                curr - prev
-                for curr, prev in zip(anomaly_sig, self.prev_anomaly_sig)
-            ]
+        np.copyto(self._scratch, anomaly_sig)
 
-        # Encode as binary: each float32 is 4 bytes × 32 values = 128 bytes per signature
-        # Plus metadata: scalar fields (risk_score, recurrence_score)
-        output = struct.pack("<f", summary.risk_score)
-        output += struct.pack("<f", summary.recurrence_score)
-        
-        # Skip timestamp to avoid serialization issues
-        # Timestamp will be set to current time on deserialization
+        if self.prev_anomaly_sig is not None:
+            # Store deltas relative to previous signature
+            self._scratch -= self.prev_anomaly_sig
 
-        # Encode anomaly signature deltas
-        for delta_val in delta_values:
-            output += struct.pack("<f", delta_val)
+        # Encode as binary: scalar fields (risk_score, recurrence_score), then
+        # each float32 is 4 bytes × 32 values = 128 bytes per signature.
+        # Timestamp is skipped and set to current time on deserialization.
+        SCALARS.pack_into(self._delta_buf, 0, summary.risk_score, summary.recurrence_score)
+        self._delta_values[:] = self._scratch
 
         # Update state for next delta
         self.prev_anomaly_sig = anomaly_sig
 
-        return output
+        return memoryview(self._delta_buf)
 
     def _stage1_delta_decode(
         self, delta_data: bytes, original_size: int
     ) -> HealthSummary:
         """Stage 1 (reverse): Restore from delta encoding."""
-        offset = 0
-
         # Unpack scalar fields
-        risk_score = struct.unpack_from("<f", delta_data, offset)[0]
-        offset += 4
-
-        recurrence_score = struct.unpack_from("<f", delta_data, offset)[0]
-        offset += 4
+        risk_score, recurrence_score = SCALARS.unpack_from(delta_data, 0)
 
         # Timestamp skipped during encoding, use current time
         timestamp = datetime.datetime.utcnow()
 
-        # Unpack anomaly signature deltas
-        anomaly_sig = []
-        for _ in range(32):
-            delta_val = struct.unpack_from("<f", delta_data, offset)[0]
-            offset += 4
-
-            # Apply delta if we have previous signature
-            if self.prev_anomaly_sig:
-                value = self.prev_anomaly_sig[len(anomaly_sig)] + delta_val
-            else:
-                value = delta_val
-
-            anomaly_sig.append(value)
+        # Unpack anomaly signature deltas and apply previous signature if any
+        values = np.frombuffer(delta_data, dtype="<f4", count=SIGNATURE_DIM, offset=SCALAR_BYTES)
+        np.copyto(self._scratch, values)
+        if self.prev_anomaly_sig is not None and len(self.prev_anomaly_sig):
+            self._scratch += self.prev_anomaly_sig
+        anomaly_sig = self._scratch.tolist()
 
         # Update state for next delta
         self.prev_anomaly_sig = anomaly_sig
@@ -228,62 +354,37 @@ class StateCompressor:
             timestamp=timestamp,
         )
 
-        return summary
-
     # ===== Stage 2: 8-bit Quantization =====
 
-    def _stage2_quantize(self, delta_data: bytes) -> bytes:
+    def _stage2_quantize(self, delta_data: bytes) -> memoryview:
         """Stage 2: Quantize float32 to uint8 for 25% reduction.
         
         Maps [-1.0, 1.0] to [0, 255] with ±0.01 accuracy.
         Only quantizes anomaly signature, preserves scalar fields.
         """
-        offset = 0
-        output = b""
-
         # Keep scalar fields unquantized (8 bytes: risk_score (4) + recurrence_score (4))
-        # No timestamp in delta_data anymore
-        output += delta_data[:8]
-        offset = 8
-
-        # Quantize anomaly signature (32 values)
-        while offset < len(delta_data):
-            float_val = struct.unpack_from("<f", delta_data, offset)[0]
-            offset += 4
-
-            # Map to 8-bit range: [-1.0, 1.0] → [0, 255]
-            # Clamp to valid range
-            clamped = max(MIN_FLOAT, min(MAX_FLOAT, float_val))
+        self._quant_view[:SCALAR_BYTES] = delta_data[:SCALAR_BYTES]
 
-            # Normalize to [0, 1] then scale to [0, 255]
-            normalized = (clamped - MIN_FLOAT) / (MAX_FLOAT - MIN_FLOAT)
-            quantized = int(round(normalized * 255))
-
-            output += struct.pack("<B", quantized)
-
-        return output
+        # Quantize anomaly signature (32 values); stage 1 output is already a float32 view
+        if isinstance(delta_data, memoryview) and delta_data.obj is self._delta_buf:
+            values = self._delta_values
+        else:
+            values = np.frombuffer(delta_data, dtype="<f4", count=SIGNATURE_DIM, offset=SCALAR_BYTES)
+        self._quant_values[:] = _quantize(values, out=self._scratch)
+        return self._quant_view
 
-    def _stage2_dequantize(self, quantized_data: bytes) -> bytes:
+    def _stage2_dequantize(self, quantized_data: bytes) -> memoryview:
         """Stage 2 (reverse): Dequantize uint8 back to float32."""
-        offset = 0
-        output = b""
+        if len(quantized_data) < QUANTIZED_SIZE:
+            raise ValueError("Quantized payload too short")
 
         # Copy scalar fields (8 bytes)
-        output += quantized_data[:8]
-        offset = 8
+        self._dequant_buf[:SCALAR_BYTES] = quantized_data[:SCALAR_BYTES]
 
         # Dequantize anomaly signature (32 values)
-        while offset < len(quantized_data):
-            quantized = struct.unpack_from("<B", quantized_data, offset)[0]
-            offset += 1
-
-            # Map back: [0, 255] → [-1.0, 1.0]
-            normalized = quantized / 255.0
-            float_val = MIN_FLOAT + normalized * (MAX_FLOAT - MIN_FLOAT)
-
-            output += struct.pack("<f", float_val)
-
-        return output
+        codes = np.frombuffer(quantized_data, dtype=np.uint8, count=SIGNATURE_DIM, offset=SCALAR_BYTES)
+        self._dequant_values[:] = _dequantize(codes, out=self._scratch)
+        return memoryview(self._dequant_buf)
 
     # ===== Stage 3: LZ4 Compression =====
 
@@ -303,7 +404,7 @@ class StateCompressor:
 
     # ===== Utilities =====
 
-    def _calculate_original_size(self, summary: HealthSummary) -> int:
+    def _calculate_original_size(self, summary: Optional[HealthSummary]) -> int:
         """Estimate original size of HealthSummary."""
         # Approximation: 12 bytes (scalars) + 32 × 4 bytes (signature) = 140 bytes
         return 140
@@ -356,3 +457,43 @@ class StateCompressor:
             "compressed_size": compressed_size,
             "compression_ratio": f"{ratio:.1f}%",
         }
+
+
+def _quantize(values: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Map values in [-1.0, 1.0] to rounded float64 codes in [0, 255] (NaN maps to 255).
+
+    Assigning the result into a uint8 array yields the wire codes.
+    """
+    if out is None:
+        out = np.array(values, dtype=np.float64)
+    else:
+        np.copyto(out, values)
+    # fmin/fmax clamp like max(MIN, min(MAX, v)), including NaN -> MAX_FLOAT
+    np.fmin(out, MAX_FLOAT, out=out)
+    np.fmax(out, MIN_FLOAT, out=out)
+    out -= MIN_FLOAT
+    # Single multiply equals "/ (MAX - MIN) * 255" exactly since MAX - MIN is a power of two
+    out *= _QUANTIZE_FACTOR
+    np.rint(out, out=out)
+    return out
+
+
+def _dequantize(codes: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """Map uint8 codes back to float64 values in [-1.0, 1.0]."""
+    if out is None:
+        out = codes.astype(np.float64)
+    else:
+        np.copyto(out, codes)
+    out /= 255.0
+    out *= MAX_FLOAT - MIN_FLOAT
+    out += MIN_FLOAT
+    return out
+
+
+def _reference_matrix(prev_states: Sequence[Optional[HealthSummary]]) -> np.ndarray:
+    """Stack previous signatures into an (n, 32) matrix, zeros where None."""
+    reference = np.zeros((len(prev_states), SIGNATURE_DIM), dtype=np.float64)
+    for i, prev in enumerate(prev_states):
+        if prev is not None:
+            reference[i] = prev.anomaly_signature
+    return reference
@@ -5,11 +5,31 @@ Implements LZ4 compression + orjson fast serialization for <1KB HealthSummary
 payloads on ISL links with 10KB/s bandwidth limit.
 
 Issue #399 integration: Compression metrics and LZ4 optimization.
+
+HealthSummary payloads can also use a fixed-layout binary wire format
+(selected per message). Binary payloads start with a format byte that
+cannot begin a JSON document or an LZ4 frame, so deserialize_health()
+tells the formats apart without extra framing:
+
+    offset  size  field
+    0       1     format byte (BINARY_FORMAT_V1)
+    1       1     flags (bit 0: timestamp is timezone-aware UTC)
+    2       2     compressed_size (uint16)
+    4       8     timestamp, microseconds since the Unix epoch (int64)
+    12      8     risk_score (float64)
+    20      8     recurrence_score (float64)
+    28      128   anomaly_signature, 32 x float32
+
+All fields are little-endian. The signature starts 4-byte aligned, so it
+can be read in place through a memoryview (see signature_view()).
 """
 
 import json
-from typing import Any, Dict, Union
-from datetime import datetime
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Optional, Union
+from datetime import datetime, timedelta, timezone
 
 try:
     import lz4.frame
@@ -26,6 +46,23 @@ except ImportError:
 import jsonschema
 from astraguard.swarm.models import HealthSummary, SwarmConfig, AgentID
 
+# Wire formats accepted by serialize_health()
+WIRE_FORMAT_JSON = "json"
+WIRE_FORMAT_BINARY = "binary"
+WIRE_FORMATS = (WIRE_FORMAT_JSON, WIRE_FORMAT_BINARY)
+
+# Binary HealthSummary layout (version 1)
+BINARY_FORMAT_V1 = 0x01  # JSON starts with "{", LZ4 frames with 0x04
+FLAG_TZ_UTC = 0x01
+SIGNATURE_DIM = 32
+BINARY_HEADER = struct.Struct("<BBHqdd")
+BINARY_SIGNATURE = struct.Struct(f"<{SIGNATURE_DIM}f")
+BINARY_SIZE = BINARY_HEADER.size + BINARY_SIGNATURE.size  # 156 bytes
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
 
 class SwarmSerializer:
     """
@@ -37,6 +74,7 @@ class SwarmSerializer:
     - JSONSchema v1.0 validation
     - <50ms roundtrip serialization
     - <1KB compressed HealthSummary payloads
+    - Fixed-layout binary HealthSummary format (156 bytes, no JSON work)
     """
 
     # JSONSchema for validation
@@ -136,26 +174,38 @@ class SwarmSerializer:
         },
     }
 
-    def __init__(self, validate: bool = True):
+    def __init__(self, validate: bool = True, wire_format: str = WIRE_FORMAT_JSON):
         """
         Initialize serializer.
         
         Args:
             validate: Enable JSONSchema validation on serialize/deserialize
+            wire_format: Default HealthSummary format ("json" or "binary")
+            
+        Raises:
+            ValueError: If wire_format is unknown
         """
+        if wire_format not in WIRE_FORMATS:
+            raise ValueError(f"Unknown wire format: {wire_format}")
         self.validate = validate
+        self.wire_format = wire_format
         self._use_orjson = HAS_ORJSON
         self._use_lz4 = HAS_LZ4
 
     def serialize_health(
-        self, summary: HealthSummary, compress: bool = True
+        self,
+        summary: HealthSummary,
+        compress: bool = True,
+        wire_format: Optional[str] = None,
     ) -> bytes:
         """
         Serialize HealthSummary to bytes with optional LZ4 compression.
         
         Args:
             summary: HealthSummary instance
-            compress: Enable LZ4 compression (default True)
+            compress: Enable LZ4 compression (default True). Only applies to
+                JSON; binary payloads are already compact and sent as is.
+            wire_format: "json" or "binary" (default: the serializer's format)
             
         Returns:
             Serialized bytes (compressed if enabled)
@@ -163,6 +213,12 @@ class SwarmSerializer:
         Raises:
             ValueError: If validation fails or compression unavailable
         """
+        wire_format = wire_format or self.wire_format
+        if wire_format == WIRE_FORMAT_BINARY:
+            return self._encode_binary(summary)
+        if wire_format != WIRE_FORMAT_JSON:
+            raise ValueError(f"Unknown wire format: {wire_format}")
+
         data = summary.to_dict()
 
         if self.validate:
@@ -190,6 +246,9 @@ class SwarmSerializer:
         """
         Deserialize bytes to HealthSummary with optional LZ4 decompression.
         
+        Binary payloads are recognized by their format byte and decoded
+        directly; `compressed` only applies to JSON payloads.
+        
         Args:
             data: Serialized bytes
             compressed: Whether data is LZ4 compressed (default True)
@@ -200,6 +259,9 @@ class SwarmSerializer:
         Raises:
             ValueError: If validation or decompression fails
         """
+        if self.is_binary(data):
+            return self._decode_binary(data)
+
         # Decompress if needed
         if compressed:
             if not self._use_lz4:
@@ -222,6 +284,36 @@ class SwarmSerializer:
 
         return HealthSummary.from_dict(json_data)
 
+    @staticmethod
+    def is_binary(data: Union[bytes, bytearray, memoryview]) -> bool:
+        """Whether data is a binary-format HealthSummary payload."""
+        return len(data) > 0 and data[0] == BINARY_FORMAT_V1
+
+    @staticmethod
+    def signature_view(data: Union[bytes, bytearray, memoryview]) -> memoryview:
+        """
+        Read the anomaly signature of a binary payload without decoding it.
+        
+        On little-endian hosts the returned float32 view shares memory with
+        `data` (no copy); big-endian hosts get a byte-swapped copy.
+        
+        Args:
+            data: Binary HealthSummary payload
+            
+        Returns:
+            memoryview of 32 floats
+            
+        Raises:
+            ValueError: If data is not a binary HealthSummary payload
+        """
+        SwarmSerializer._check_binary(data)
+        raw = memoryview(data)[BINARY_HEADER.size:BINARY_SIZE]
+        if sys.byteorder == "little":
+            return raw.cast("f")
+        values = array("f", raw.tobytes())
+        values.byteswap()
+        return memoryview(values)
+
     def serialize_swarm_config(self, config: SwarmConfig) -> bytes:
         """
         Serialize SwarmConfig to JSON bytes.
@@ -317,3 +409,49 @@ class SwarmSerializer:
             "compression_ratio": f"{ratio:.1f}%",
             "saved_bytes": original_size - compressed_size,
         }
+
+    # Private helper methods
+
+    @staticmethod
+    def _encode_binary(summary: HealthSummary) -> bytes:
+        """Pack a HealthSummary into the fixed binary layout."""
+        timestamp = summary.timestamp
+        flags = 0
+        if timestamp.tzinfo is not None:
+            micros = (timestamp - _EPOCH_UTC) // _MICROSECOND
+            flags |= FLAG_TZ_UTC
+        else:
+            micros = (timestamp - _EPOCH) // _MICROSECOND
+        return BINARY_HEADER.pack(
+            BINARY_FORMAT_V1,
+            flags,
+            summary.compressed_size,
+            micros,
+            summary.risk_score,
+            summary.recurrence_score,
+        ) + BINARY_SIGNATURE.pack(*summary.anomaly_signature)
+
+    @staticmethod
+    def _decode_binary(data: Union[bytes, bytearray, memoryview]) -> HealthSummary:
+        """Unpack a binary payload; HealthSummary validates the field ranges."""
+        SwarmSerializer._check_binary(data)
+        _, flags, compressed_size, micros, risk_score, recurrence_score = (
+            BINARY_HEADER.unpack_from(data)
+        )
+        epoch = _EPOCH_UTC if flags & FLAG_TZ_UTC else _EPOCH
+        return HealthSummary(
+            anomaly_signature=list(BINARY_SIGNATURE.unpack_from(data, BINARY_HEADER.size)),
+            risk_score=risk_score,
+            recurrence_score=recurrence_score,
+            timestamp=epoch + timedelta(microseconds=micros),
+            compressed_size=compressed_size,
+        )
+
+    @staticmethod
+    def _check_binary(data: Union[bytes, bytearray, memoryview]) -> None:
+        if not SwarmSerializer.is_binary(data):
+            raise ValueError("Not a binary HealthSummary payload")
+        if len(data) != BINARY_SIZE:
+            raise ValueError(
+                f"Binary HealthSummary must be {BINARY_SIZE} bytes, got {len(data)}"
+            )
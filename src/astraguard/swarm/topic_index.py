@@ -0,0 +1,139 @@
+"""
+TopicTrie - Subscription index for SwarmMessageBus delivery.
+
+Resolves the subscriptions matching a topic in O(topic depth) instead of
+testing every TopicFilter. Patterns follow TopicFilter semantics:
+
+- "*"              → every topic
+- "health/*"       → every topic starting with "health/" (any depth)
+- "health/summary" → exactly that topic
+
+Topics and patterns are split on "/", so a "prefix/*" subscription sits on
+the node for "prefix" and matches any topic with at least one more segment.
+"""
+
+from typing import Dict, Hashable, List, Tuple
+
+WILDCARD = "*"
+
+
+class _TrieNode:
+    """One topic segment; holds exact and "/*" subscriptions ending here."""
+
+    __slots__ = ("children", "exact", "wildcard")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.exact: Dict[Hashable, int] = {}     # key -> subscription order
+        self.wildcard: Dict[Hashable, int] = {}
+
+
+class TopicTrie:
+    """Topic trie mapping subscription patterns to subscription keys."""
+
+    def __init__(self):
+        self._root = _TrieNode()
+        self._match_all: Dict[Hashable, int] = {}
+        self._patterns: Dict[Hashable, str] = {}
+        self._order = 0
+
+    def __len__(self) -> int:
+        return len(self._patterns)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._patterns
+
+    def add(self, pattern: str, key: Hashable) -> None:
+        """
+        Index a subscription.
+
+        Args:
+            pattern: Topic filter pattern (see module docstring)
+            key: Subscription key returned by match()
+
+        Raises:
+            ValueError: If the pattern is empty
+        """
+        if not pattern:
+            raise ValueError("Filter pattern cannot be empty")
+        if key in self._patterns:
+            self.remove(key)
+
+        self._order += 1
+        self._patterns[key] = pattern
+        bucket, _ = self._bucket(pattern, create=True)
+        bucket[key] = self._order
+
+    def remove(self, key: Hashable) -> bool:
+        """
+        Remove a subscription and prune nodes left empty.
+
+        Returns:
+            True if removed, False if the key was not indexed
+        """
+        pattern = self._patterns.pop(key, None)
+        if pattern is None:
+            return False
+
+        bucket, path = self._bucket(pattern, create=False)
+        bucket.pop(key, None)
+        # Walk back up, dropping nodes that no longer hold anything
+        for parent, segment in reversed(path):
+            node = parent.children[segment]
+            if node.children or node.exact or node.wildcard:
+                break
+            del parent.children[segment]
+        return True
+
+    def match(self, topic: str) -> List[Hashable]:
+        """
+        Return keys of subscriptions matching topic, in subscription order.
+
+        Args:
+            topic: Concrete topic string (e.g., "health/summary")
+
+        Returns:
+            Matching subscription keys
+        """
+        found: List[Tuple[int, Hashable]] = [(order, key) for key, order in self._match_all.items()]
+        node = self._root
+        segments = topic.split("/")
+        last = len(segments) - 1
+        for depth, segment in enumerate(segments):
+            node = node.children.get(segment)
+            if node is None:
+                break
+            if depth < last:
+                found.extend((order, key) for key, order in node.wildcard.items())
+            else:
+                found.extend((order, key) for key, order in node.exact.items())
+
+        if len(found) > 1:
+            found.sort(key=lambda item: item[0])
+        return [key for _, key in found]
+
+    def clear(self) -> None:
+        """Remove every subscription."""
+        self._root = _TrieNode()
+        self._match_all.clear()
+        self._patterns.clear()
+
+    # Private helper methods
+
+    def _bucket(self, pattern: str, create: bool) -> Tuple[Dict[Hashable, int], list]:
+        """Return the key dict for pattern and the (parent, segment) path to it."""
+        if pattern == WILDCARD:
+            return self._match_all, []
+
+        wildcard = pattern.endswith("/" + WILDCARD)
+        segments = (pattern[:-2] if wildcard else pattern).split("/")
+        node, path = self._root, []
+        for segment in segments:
+            child = node.children.get(segment)
+            if child is None:
+                if not create:
+                    raise KeyError(pattern)
+                child = node.children[segment] = _TrieNode()
+            path.append((node, segment))
+            node = child
+        return (node.wildcard if wildcard else node.exact), path
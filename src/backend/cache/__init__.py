@@ -4,6 +4,7 @@ Cache Abstraction Layer for AstraGuard-AI
 Provides a standardized cache interface with multiple implementations:
 - InMemoryLRUCache: Thread-safe LRU cache for local/staging
 - RedisCache: Optional Redis-backed cache for production
+- TieredCache: Local LRU near-cache in front of Redis
 
 Example usage:
     from backend.cache import InMemoryLRUCache, cached
@@ -17,6 +18,7 @@ Example usage:
 
 from backend.cache.interface import Cache, CacheStats
 from backend.cache.in_memory import InMemoryLRUCache
+from backend.cache.tiered import TieredCache, LocalInvalidationBus, RedisInvalidationBus
 from backend.cache.decorators import cached
 from backend.cache.config import get_cache_config, create_cache
 
@@ -32,6 +34,9 @@ __all__ = [
     "CacheStats",
     # Implementations
     "InMemoryLRUCache",
+    "TieredCache",
+    "LocalInvalidationBus",
+    "RedisInvalidationBus",
     # Decorators
     "cached",
     # Configuration
@@ -20,20 +20,32 @@ class CacheConfig:
     
     Environment Variables:
         CACHE_ENABLED: Enable/disable caching (default: false)
-        CACHE_BACKEND: "memory" or "redis" (default: memory)
+        CACHE_BACKEND: "memory", "redis" or "tiered" (default: memory)
         CACHE_MAXSIZE: Max entries for in-memory cache (default: 1024)
+        CACHE_MAX_BYTES: Memory budget for in-memory cache (default: unset)
+        CACHE_SHARDS: Lock shards for in-memory cache (default: by maxsize)
         CACHE_TTL_SECONDS: Default TTL in seconds (default: 60)
         CACHE_REDIS_URL: Redis URL for redis backend (default: redis://localhost:6379)
         CACHE_KEY_PREFIX: Key prefix for cache entries (default: astra:cache:)
+        CACHE_L1_MAXSIZE: Local entries in front of Redis for tiered (default: 4096)
+        CACHE_L1_TTL_SECONDS: TTL of local copies for tiered (default: 5)
+        CACHE_INVALIDATION_CHANNEL: Pub/sub channel for tiered (default: astra:cache:invalidate)
     """
     
     def __init__(self):
         self.enabled = os.getenv("CACHE_ENABLED", "false").lower() in ("true", "1", "yes")
         self.backend = os.getenv("CACHE_BACKEND", "memory").lower()
         self.maxsize = int(os.getenv("CACHE_MAXSIZE", "1024"))
+        max_bytes = os.getenv("CACHE_MAX_BYTES")
+        self.max_bytes = int(max_bytes) if max_bytes else None
+        shards = os.getenv("CACHE_SHARDS")
+        self.shards = int(shards) if shards else None
         self.ttl_seconds = int(os.getenv("CACHE_TTL_SECONDS", "60"))
         self.redis_url = os.getenv("CACHE_REDIS_URL", "redis://localhost:6379")
         self.key_prefix = os.getenv("CACHE_KEY_PREFIX", "astra:cache:")
+        self.l1_maxsize = int(os.getenv("CACHE_L1_MAXSIZE", "4096"))
+        self.l1_ttl_seconds = int(os.getenv("CACHE_L1_TTL_SECONDS", "5"))
+        self.invalidation_channel = os.getenv("CACHE_INVALIDATION_CHANNEL", "astra:cache:invalidate")
     
     def __repr__(self) -> str:
         return (
@@ -68,7 +80,7 @@ def create_cache(config: Optional[CacheConfig] = None, metrics_sink=None):
         logger.info("Caching is disabled (CACHE_ENABLED=false)")
         return None
     
-    if config.backend == "redis":
+    if config.backend in ("redis", "tiered"):
         try:
             from backend.cache.redis_cache import RedisCache
             cache = RedisCache(
@@ -77,6 +89,20 @@ def create_cache(config: Optional[CacheConfig] = None, metrics_sink=None):
                 metrics_sink=metrics_sink,
                 key_prefix=config.key_prefix,
             )
+            if config.backend == "tiered":
+                from backend.cache.in_memory import InMemoryLRUCache
+                from backend.cache.tiered import TieredCache
+                near_cache = InMemoryLRUCache(
+                    maxsize=config.l1_maxsize,
+                    default_ttl=config.l1_ttl_seconds,
+                    metrics_sink=metrics_sink,
+                )
+                logger.info(f"Created TieredCache: L1 maxsize={config.l1_maxsize}, L2 {config.redis_url}")
+                return TieredCache(
+                    near_cache, cache,
+                    l1_ttl=config.l1_ttl_seconds,
+                    channel=config.invalidation_channel,
+                )
             logger.info(f"Created RedisCache: {config.redis_url}")
             return cache
         except ImportError as e:
@@ -88,6 +114,8 @@ def create_cache(config: Optional[CacheConfig] = None, metrics_sink=None):
         maxsize=config.maxsize,
         default_ttl=config.ttl_seconds,
         metrics_sink=metrics_sink,
+        max_bytes=config.max_bytes,
+        shards=config.shards,
     )
     logger.info(f"Created InMemoryLRUCache: maxsize={config.maxsize}")
     return cache
@@ -2,273 +2,439 @@
 In-Memory LRU Cache Implementation
 
 Thread-safe LRU cache with TTL support for local and staging environments.
-Uses OrderedDict for O(1) LRU eviction and threading.Lock for safety.
+Keys are spread over independently locked shards, each an OrderedDict for
+O(1) LRU eviction, so threads touching different keys rarely contend.
+Entries are bounded by count and, optionally, by estimated memory.
 """
 
 import logging
+import math
+import random
+import sys
 import threading
 import time
 from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Any, Optional
+from typing import Any, Callable, List, Optional, Tuple
 
 from backend.cache.interface import Cache, CacheStats
 
 logger = logging.getLogger(__name__)
 
+# Hit/miss counters are emitted to the metrics sink in batches of this many
+# operations per shard; the op that flushes also records a latency sample
+METRICS_BATCH = 64
+
+# Containers are walked to this many objects when estimating size, then
+# extrapolated from the average seen
+SIZE_ESTIMATE_MAX_OBJECTS = 256
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate bytes held by a value, including nested containers."""
+    if isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return sys.getsizeof(value)
+
+    total = 0
+    seen = set()
+    pending = [value]
+    visited = 0
+    remaining = 0
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        if visited >= SIZE_ESTIMATE_MAX_OBJECTS:
+            remaining += 1 + len(pending)
+            break
+        visited += 1
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+    if remaining:
+        total += remaining * total // visited
+    return total
+
 
 @dataclass
 class CacheEntry:
     """Internal cache entry with value and expiration."""
     value: Any
     expires_at: Optional[float] = None
-    
-    def is_expired(self) -> bool:
+    size: int = 0
+    load_time: float = 0.0  # Seconds the loader took, for early refresh
+
+    def is_expired(self, now: Optional[float] = None) -> bool:
         """Check if entry has expired."""
         if self.expires_at is None:
             return False
-        return time.time() > self.expires_at
+        return (time.monotonic() if now is None else now) > self.expires_at
+
+
+class _Shard:
+    """One independently locked LRU segment."""
+
+    __slots__ = (
+        "lock", "entries", "maxsize", "max_bytes", "bytes",
+        "hits", "misses", "evictions", "unemitted_hits", "unemitted_misses",
+    )
+
+    def __init__(self, maxsize: int, max_bytes: Optional[int]):
+        self.lock = threading.Lock()
+        self.entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.unemitted_hits = 0
+        self.unemitted_misses = 0
+
+    def remove(self, key: str) -> Optional[CacheEntry]:
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.bytes -= entry.size
+        return entry
+
+    def make_room(self, size: int) -> List[str]:
+        """Evict LRU entries until one more entry of `size` bytes fits."""
+        evicted = []
+        while self.entries and (
+            len(self.entries) >= self.maxsize
+            or (self.max_bytes is not None and self.bytes + size > self.max_bytes)
+        ):
+            key, entry = self.entries.popitem(last=False)
+            self.bytes -= entry.size
+            self.evictions += 1
+            evicted.append(key)
+        return evicted
 
 
 class InMemoryLRUCache(Cache):
     """Thread-safe in-memory LRU cache with TTL support.
-    
+
     Features:
     - O(1) get/set/invalidate operations
-    - LRU eviction when maxsize is reached
+    - LRU eviction per shard when maxsize or max_bytes is reached
     - Per-entry TTL with automatic expiration
-    - Thread-safe via lock
-    - Optional metrics emission via MetricsSink
-    
+    - Thread-safe via one lock per shard
+    - Single-flight get_or_set with optional probabilistic early refresh
+    - Optional metrics emission via MetricsSink (batched counters)
+
+    Sharding makes LRU order approximate: eviction picks the least
+    recently used entry of the shard the new key hashes to. With one shard
+    (the default for small caches) it is exact.
+
     Example:
         cache = InMemoryLRUCache(maxsize=1024, default_ttl=60)
         await cache.set("key", "value")
         result = await cache.get("key")
     """
-    
+
     def __init__(
         self,
         maxsize: int = 1024,
         default_ttl: Optional[int] = None,
-        metrics_sink=None
+        metrics_sink=None,
+        max_bytes: Optional[int] = None,
+        shards: Optional[int] = None,
+        early_refresh_beta: float = 0.0,
+        sizeof: Callable[[Any], int] = estimate_size
     ):
         """Initialize LRU cache.
-        
+
         Args:
             maxsize: Maximum number of entries (default: 1024)
             default_ttl: Default TTL in seconds (None = no expiration)
             metrics_sink: Optional MetricsSink for cache metrics
+            max_bytes: Memory budget across all shards, by sizeof() of
+                keys and values (None = bounded by maxsize only)
+            shards: Number of independently locked segments (None picks
+                one per 256 entries of maxsize, up to 16)
+            early_refresh_beta: get_or_set reloads a hit early with
+                probability rising as expiry nears, scaled by how long the
+                value took to load (XFetch; 0 disables, 1 is typical)
+            sizeof: Byte estimate for values
         """
+        if shards is None:
+            shards = max(1, min(16, maxsize // 256))
+        shards = max(1, min(shards, maxsize))
+
         self._maxsize = maxsize
         self._default_ttl = default_ttl
         self._metrics_sink = metrics_sink
-        
-        self._cache: OrderedDict[str, CacheEntry] = OrderedDict()
-        self._lock = threading.Lock()
-        
-        # Statistics
-        self._hits = 0
-        self._misses = 0
-        self._evictions = 0
-        
+        self._max_bytes = max_bytes
+        self._early_refresh_beta = early_refresh_beta
+        self._sizeof = sizeof
+
+        # Spread capacity so shard limits add up to maxsize / max_bytes
+        self._shards = [
+            _Shard(
+                maxsize // shards + (i < maxsize % shards),
+                None if max_bytes is None else max_bytes // shards,
+            )
+            for i in range(shards)
+        ]
+
         logger.debug(
             f"InMemoryLRUCache initialized: maxsize={maxsize}, "
-            f"default_ttl={default_ttl}"
+            f"default_ttl={default_ttl}, shards={shards}, max_bytes={max_bytes}"
         )
-    
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
     async def get(self, key: str) -> Optional[Any]:
         """Retrieve value by key.
-        
-        Moves accessed entry to end of OrderedDict (most recently used).
+
+        Moves accessed entry to end of its shard (most recently used).
         Returns None and increments miss count if key not found or expired.
-        
+
         Args:
             key: Cache key
-            
+
         Returns:
             Cached value or None
         """
-        start_time = time.time()
-        
-        with self._lock:
-            entry = self._cache.get(key)
-            
-            if entry is None:
-                self._misses += 1
-                self._emit_miss(key, start_time)
-                return None
-            
-            if entry.is_expired():
+        shard = self._shard(key)
+        start_time = time.perf_counter() if self._metrics_sink is not None else 0.0
+
+        with shard.lock:
+            entry = shard.entries.get(key)
+
+            if entry is not None and entry.expires_at is not None and entry.is_expired():
                 # Remove expired entry
-                del self._cache[key]
-                self._misses += 1
-                self._emit_miss(key, start_time)
+                shard.remove(key)
                 logger.debug(f"Cache key expired: {key}")
-                return None
-            
-            # Move to end (most recently used)
-            self._cache.move_to_end(key)
-            self._hits += 1
-            self._emit_hit(key, start_time)
-            
-            return entry.value
-    
+                entry = None
+
+            if entry is None:
+                shard.misses += 1
+                shard.unemitted_misses += 1
+                value = None
+            else:
+                # Move to end (most recently used)
+                shard.entries.move_to_end(key)
+                shard.hits += 1
+                shard.unemitted_hits += 1
+                value = entry.value
+
+            pending = self._take_unemitted(shard)
+
+        if pending is not None:
+            self._emit_access(pending, entry is not None, start_time)
+        return value
+
     async def set(
-        self, 
-        key: str, 
-        value: Any, 
+        self,
+        key: str,
+        value: Any,
         ttl: Optional[int] = None
     ) -> bool:
         """Store value with optional TTL.
-        
-        If cache is at maxsize, evicts least recently used entry.
-        
+
+        Evicts least recently used entries of the key's shard until the
+        new entry fits its count and byte limits.
+
         Args:
             key: Cache key
             value: Value to cache
             ttl: TTL in seconds (None uses default_ttl)
-            
+
         Returns:
-            True (always succeeds for in-memory cache)
+            True, or False if the entry alone exceeds a shard's byte budget
         """
         effective_ttl = ttl if ttl is not None else self._default_ttl
         expires_at = None
         if effective_ttl is not None:
-            expires_at = time.time() + effective_ttl
-        
-        entry = CacheEntry(value=value, expires_at=expires_at)
-        
-        with self._lock:
-            # If key exists, update and move to end
-            if key in self._cache:
-                self._cache[key] = entry
-                self._cache.move_to_end(key)
-                return True
-            
-            # Evict LRU if at capacity
-            while len(self._cache) >= self._maxsize:
-                evicted_key, _ = self._cache.popitem(last=False)
-                self._evictions += 1
-                self._emit_eviction(evicted_key)
-                logger.debug(f"Cache evicted LRU key: {evicted_key}")
-            
-            self._cache[key] = entry
-        
+            expires_at = time.monotonic() + effective_ttl
+
+        size = sys.getsizeof(key) + self._sizeof(value)
+        shard = self._shard(key)
+        if shard.max_bytes is not None and size > shard.max_bytes:
+            logger.debug(f"Cache entry too large ({size} bytes): {key}")
+            return False
+
+        entry = CacheEntry(value=value, expires_at=expires_at, size=size)
+
+        with shard.lock:
+            # If key exists, replace it (and move to end)
+            shard.remove(key)
+            evicted = shard.make_room(size)
+            shard.entries[key] = entry
+            shard.bytes += size
+
+        for evicted_key in evicted:
+            self._emit_eviction(evicted_key)
+            logger.debug(f"Cache evicted LRU key: {evicted_key}")
+
         return True
-    
+
     async def invalidate(self, key: str) -> bool:
         """Invalidate a single cache entry.
-        
+
         Args:
             key: Cache key to invalidate
-            
+
         Returns:
             True if key existed and was removed
         """
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
+        shard = self._shard(key)
+        with shard.lock:
+            if shard.remove(key) is not None:
                 logger.debug(f"Cache invalidated key: {key}")
                 return True
             return False
-    
+
     async def clear(self) -> int:
         """Clear all cache entries.
-        
+
         Returns:
             Number of entries cleared
         """
-        with self._lock:
-            count = len(self._cache)
-            self._cache.clear()
-            logger.info(f"Cache cleared: {count} entries removed")
-            return count
-    
+        count = 0
+        for shard in self._shards:
+            with shard.lock:
+                count += len(shard.entries)
+                shard.entries.clear()
+                shard.bytes = 0
+        logger.info(f"Cache cleared: {count} entries removed")
+        return count
+
     def stats(self) -> CacheStats:
         """Get cache statistics.
-        
+
         Returns:
             CacheStats with current metrics
         """
-        with self._lock:
-            return CacheStats(
-                hits=self._hits,
-                misses=self._misses,
-                evictions=self._evictions,
-                size=len(self._cache),
-            )
-    
+        stats = CacheStats()
+        for shard in self._shards:
+            with shard.lock:
+                stats.hits += shard.hits
+                stats.misses += shard.misses
+                stats.evictions += shard.evictions
+                stats.size += len(shard.entries)
+                stats.size_bytes += shard.bytes
+        return stats
+
     def reset_stats(self) -> None:
         """Reset statistics counters."""
-        with self._lock:
-            self._hits = 0
-            self._misses = 0
-            self._evictions = 0
-    
+        for shard in self._shards:
+            with shard.lock:
+                shard.hits = 0
+                shard.misses = 0
+                shard.evictions = 0
+
+    def flush_metrics(self) -> None:
+        """Emit hit/miss counts still held back by batching."""
+        if self._metrics_sink is None:
+            return
+        for shard in self._shards:
+            with shard.lock:
+                pending = (shard.unemitted_hits, shard.unemitted_misses)
+                shard.unemitted_hits = shard.unemitted_misses = 0
+            self._emit_counts(*pending)
+
     async def cleanup_expired(self) -> int:
         """Remove all expired entries.
-        
+
         Call periodically to proactively clean up expired entries.
-        
+
         Returns:
             Number of entries removed
         """
         removed = 0
-        with self._lock:
-            expired_keys = [
-                key for key, entry in self._cache.items()
-                if entry.is_expired()
-            ]
-            for key in expired_keys:
-                del self._cache[key]
-                removed += 1
-        
+        now = time.monotonic()
+        for shard in self._shards:
+            with shard.lock:
+                expired_keys = [
+                    key for key, entry in shard.entries.items()
+                    if entry.is_expired(now)
+                ]
+                for key in expired_keys:
+                    shard.remove(key)
+                removed += len(expired_keys)
+
         if removed > 0:
             logger.debug(f"Cache cleanup: {removed} expired entries removed")
-        
+
         return removed
-    
+
     # -------------------------------------------------------------------------
-    # Metrics Emission Helpers
+    # Early Refresh Hooks (used by Cache.get_or_set)
     # -------------------------------------------------------------------------
-    
-    def _emit_hit(self, key: str, start_time: float) -> None:
-        """Emit cache hit metrics."""
-        if self._metrics_sink is None:
+
+    def _refresh_due(self, key: str) -> bool:
+        """XFetch: reload early with probability rising towards expiry."""
+        if self._early_refresh_beta <= 0:
+            return False
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is None or entry.expires_at is None or entry.load_time <= 0:
+                return False
+            expires_at, load_time = entry.expires_at, entry.load_time
+        # 1 - random() is in (0, 1], so the log is finite
+        head_start = -load_time * self._early_refresh_beta * math.log(1.0 - random.random())
+        return time.monotonic() + head_start >= expires_at
+
+    def _record_load_time(self, key: str, seconds: float) -> None:
+        if self._early_refresh_beta <= 0:
             return
-        
-        latency_ms = (time.time() - start_time) * 1000
-        self._metrics_sink.emit_counter(
-            "cache_hits_total",
-            tags={"cache": "memory"}
-        )
-        self._metrics_sink.emit_histogram(
-            "cache_latency_ms",
-            latency_ms,
-            tags={"cache": "memory", "result": "hit"}
-        )
-    
-    def _emit_miss(self, key: str, start_time: float) -> None:
-        """Emit cache miss metrics."""
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is not None:
+                entry.load_time = seconds
+
+    # -------------------------------------------------------------------------
+    # Metrics Emission Helpers
+    # -------------------------------------------------------------------------
+
+    def _take_unemitted(self, shard: _Shard) -> Optional[Tuple[int, int]]:
+        """Claim a full batch of hit/miss counts (call with the shard lock held)."""
         if self._metrics_sink is None:
-            return
-        
-        latency_ms = (time.time() - start_time) * 1000
-        self._metrics_sink.emit_counter(
-            "cache_misses_total",
-            tags={"cache": "memory"}
-        )
+            return None
+        if shard.unemitted_hits + shard.unemitted_misses < METRICS_BATCH:
+            return None
+        pending = (shard.unemitted_hits, shard.unemitted_misses)
+        shard.unemitted_hits = shard.unemitted_misses = 0
+        return pending
+
+    def _emit_access(self, pending: Tuple[int, int], hit: bool, start_time: float) -> None:
+        """Emit a batch of hit/miss counts plus this access's latency."""
+        self._emit_counts(*pending)
+        latency_ms = (time.perf_counter() - start_time) * 1000
         self._metrics_sink.emit_histogram(
             "cache_latency_ms",
             latency_ms,
-            tags={"cache": "memory", "result": "miss"}
+            tags={"cache": "memory", "result": "hit" if hit else "miss"}
         )
-    
+
+    def _emit_counts(self, hits: int, misses: int) -> None:
+        if hits:
+            self._metrics_sink.emit_counter(
+                "cache_hits_total",
+                value=hits,
+                tags={"cache": "memory"}
+            )
+        if misses:
+            self._metrics_sink.emit_counter(
+                "cache_misses_total",
+                value=misses,
+                tags={"cache": "memory"}
+            )
+
     def _emit_eviction(self, key: str) -> None:
         """Emit cache eviction metrics."""
         if self._metrics_sink is None:
             return
-        
+
         self._metrics_sink.emit_counter(
             "cache_evictions_total",
             tags={"cache": "memory"}
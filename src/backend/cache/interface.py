@@ -5,13 +5,20 @@ Defines the abstract Cache protocol and associated types for the caching layer.
 All cache implementations must conform to this interface.
 """
 
+import asyncio
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Guards lazy creation of per-cache single-flight state
+_inflight_init_lock = threading.Lock()
+
 
 @dataclass
 class CacheStats:
@@ -22,11 +29,17 @@ class CacheStats:
         misses: Number of cache misses (key not found or expired)
         evictions: Number of entries evicted due to size limits
         size: Current number of entries in cache
+        size_bytes: Estimated bytes held (0 if the cache does not track it)
+        mean_latency_ms: Mean lookup latency (0.0 if not measured)
+        tiers: Per-tier stats for layered caches, e.g. {"l1": ..., "l2": ...}
     """
     hits: int = 0
     misses: int = 0
     evictions: int = 0
     size: int = 0
+    size_bytes: int = 0
+    mean_latency_ms: float = 0.0
+    tiers: Dict[str, "CacheStats"] = field(default_factory=dict)
     
     def hit_rate(self) -> float:
         """Calculate cache hit rate.
@@ -41,13 +54,18 @@ class CacheStats:
     
     def to_dict(self) -> dict:
         """Convert stats to dictionary for serialization."""
-        return {
+        result = {
             "hits": self.hits,
             "misses": self.misses,
             "evictions": self.evictions,
             "size": self.size,
+            "size_bytes": self.size_bytes,
             "hit_rate": self.hit_rate(),
+            "mean_latency_ms": self.mean_latency_ms,
         }
+        if self.tiers:
+            result["tiers"] = {name: tier.to_dict() for name, tier in self.tiers.items()}
+        return result
 
 
 class Cache(ABC):
@@ -125,6 +143,34 @@ class Cache(ABC):
         """
         ...
     
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Retrieve several keys at once.
+        
+        The default issues one get per key concurrently; networked
+        implementations override it with a single round-trip.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Mapping of the keys that were found to their values
+        """
+        values = await asyncio.gather(*(self.get(key) for key in keys))
+        return {key: value for key, value in zip(keys, values) if value is not None}
+    
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Store several values with the same TTL.
+        
+        Args:
+            items: Mapping of cache keys to values
+            ttl: Time to live in seconds (None uses default)
+            
+        Returns:
+            True if every value was stored
+        """
+        results = await asyncio.gather(*(self.set(key, value, ttl) for key, value in items.items()))
+        return all(results)
+    
     async def get_or_set(
         self,
         key: str,
@@ -133,6 +179,11 @@ class Cache(ABC):
     ) -> Any:
         """Get value from cache or compute and store it.
         
+        Concurrent misses on the same key (from any coroutine or thread)
+        share one factory call: the first caller loads, the rest await its
+        result. Implementations may also report a hit as due for early
+        refresh (see _refresh_due), in which case this caller reloads it.
+        
         Args:
             key: Cache key
             factory: Async callable to compute value if not cached
@@ -142,18 +193,74 @@ class Cache(ABC):
             Cached or computed value
         """
         value = await self.get(key)
-        if value is not None:
+        if value is not None and not self._refresh_due(key):
             return value
         
-        # Compute value
-        if callable(factory):
-            import asyncio
-            if asyncio.iscoroutinefunction(factory):
-                value = await factory()
+        return await self._load_once(key, factory, ttl)
+    
+    async def _load_once(self, key: str, factory, ttl: Optional[int]) -> Any:
+        """Single-flight load: one factory call per key at a time."""
+        inflight = self._inflight_loads()
+        while True:
+            with _inflight_init_lock:
+                shared = inflight.get(key)
+                leader = shared is None or shared.cancelled()
+                if leader:
+                    # No load running, or its loader was cancelled: take over
+                    shared = inflight[key] = Future()
+            
+            if leader:
+                break
+            # concurrent.futures.Future so waiters on other loops/threads work.
+            # Shielded: cancelling one waiter must not cancel the shared load.
+            try:
+                return await asyncio.shield(asyncio.wrap_future(shared))
+            except asyncio.CancelledError:
+                if not shared.cancelled():
+                    raise
+                # The loading caller was cancelled; retry as the loader
+        
+        try:
+            start = time.perf_counter()
+            # Compute value
+            if callable(factory):
+                if asyncio.iscoroutinefunction(factory):
+                    value = await factory()
+                else:
+                    value = factory()
             else:
-                value = factory()
+                value = factory
+            
+            await self.set(key, value, ttl)
+            self._record_load_time(key, time.perf_counter() - start)
+        except asyncio.CancelledError:
+            shared.cancel()
+            raise
+        except BaseException as e:
+            if not shared.done():
+                shared.set_exception(e)
+            raise
         else:
-            value = factory
-        
-        await self.set(key, value, ttl)
-        return value
+            if not shared.done():
+                shared.set_result(value)
+            return value
+        finally:
+            with _inflight_init_lock:
+                if inflight.get(key) is shared:
+                    del inflight[key]
+    
+    def _inflight_loads(self) -> Dict[str, Future]:
+        try:
+            return self._inflight
+        except AttributeError:
+            with _inflight_init_lock:
+                if "_inflight" not in self.__dict__:
+                    self._inflight = {}
+            return self._inflight
+    
+    def _refresh_due(self, key: str) -> bool:
+        """Whether a cached key should be reloaded before it expires."""
+        return False
+    
+    def _record_load_time(self, key: str, seconds: float) -> None:
+        """Hook: how long the factory took to produce the cached value."""
@@ -8,7 +8,7 @@ Wraps existing backend.storage infrastructure for consistency.
 import json
 import logging
 import time
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 from backend.cache.interface import Cache, CacheStats
 
@@ -101,10 +101,28 @@ class RedisCache(Cache):
         """Serialize value for Redis storage."""
         return json.dumps(value)
     
-    def _deserialize(self, data: str) -> Any:
+    def _deserialize(self, data: Any) -> Any:
         """Deserialize value from Redis storage."""
         return json.loads(data)
     
+    def _decode_stored(self, data: Any) -> Any:
+        """Decode a value read through the storage, exactly once.
+        
+        Storages that already JSON-decode what they read (RedisAdapter sets
+        DECODES_VALUES) hand back our value itself; decoding it again would
+        turn the string "123" into 123, or fail on "hello".
+        """
+        if getattr(type(self._storage), "DECODES_VALUES", False) is True:
+            return data
+        return self._deserialize(data)
+    
+    def _pipeline_client(self):
+        """Raw redis client of the storage, if it supports pipelines."""
+        client = getattr(self._storage, "redis", None)
+        if client is None or not hasattr(client, "pipeline"):
+            return None
+        return client
+    
     async def get(self, key: str) -> Optional[Any]:
         """Retrieve value by key from Redis.
         
@@ -130,7 +148,7 @@ class RedisCache(Cache):
                 self._emit_miss(key, start_time)
                 return None
             
-            value = self._deserialize(data)
+            value = self._decode_stored(data)
             self._hits += 1
             self._emit_hit(key, start_time)
             return value
@@ -183,6 +201,81 @@ class RedisCache(Cache):
             logger.error(f"RedisCache set error for {key}: {e}")
             return False
     
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Retrieve several keys with one MGET round-trip.
+        
+        Falls back to per-key gets when the storage exposes no raw client.
+        
+        Args:
+            keys: Cache keys
+            
+        Returns:
+            Mapping of the keys that were found to their values
+        """
+        if not keys:
+            return {}
+        if not self._connected:
+            if not await self.connect():
+                self._misses += len(keys)
+                return {}
+        
+        client = self._pipeline_client()
+        if client is None:
+            return await super().get_many(keys)
+        
+        try:
+            raw_values = await client.mget([self._make_key(key) for key in keys])
+        except Exception as e:
+            logger.error(f"RedisCache get_many error: {e}")
+            self._misses += len(keys)
+            return {}
+        
+        found = {}
+        for key, data in zip(keys, raw_values):
+            if data is None:
+                continue
+            try:
+                found[key] = self._deserialize(data)
+            except json.JSONDecodeError as e:
+                logger.warning(f"Cache deserialization error for {key}: {e}")
+        self._hits += len(found)
+        self._misses += len(keys) - len(found)
+        return found
+    
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Store several values in one pipelined round-trip.
+        
+        Args:
+            items: Mapping of cache keys to JSON-serializable values
+            ttl: TTL in seconds (None uses default_ttl)
+            
+        Returns:
+            True if every value was stored
+        """
+        if not items:
+            return True
+        if not self._connected:
+            if not await self.connect():
+                return False
+        
+        client = self._pipeline_client()
+        if client is None:
+            return await super().set_many(items, ttl)
+        
+        effective_ttl = ttl if ttl is not None else self._default_ttl
+        try:
+            async with client.pipeline(transaction=False) as pipe:
+                for key, value in items.items():
+                    pipe.set(self._make_key(key), self._serialize(value), ex=effective_ttl)
+                results = await pipe.execute()
+            return all(results)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Cache serialization error in set_many: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"RedisCache set_many error: {e}")
+            return False
+    
     async def invalidate(self, key: str) -> bool:
         """Invalidate a single cache entry.
         
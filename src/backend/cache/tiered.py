@@ -0,0 +1,401 @@
+"""
+Tiered Cache Implementation
+
+Near-cache layout: a bounded in-process LRU (L1) in front of a shared
+Redis cache (L2). Hot keys are served from L1 without a network round-trip
+or JSON decode. Writes go to both tiers and are announced on an
+invalidation channel so other processes drop their L1 copies; an L1 TTL
+bounds staleness if an announcement is lost.
+"""
+
+import asyncio
+import json
+import logging
+import time
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from backend.cache.interface import Cache, CacheStats
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INVALIDATION_CHANNEL = "astra:cache:invalidate"
+
+InvalidationHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+
+class LocalInvalidationBus:
+    """In-process stand-in for the Redis invalidation channel.
+
+    Delivers every published message to every subscriber, so several
+    TieredCache instances in one process (or one test) behave like
+    separate nodes sharing a channel.
+    """
+
+    def __init__(self):
+        self._handlers: List[InvalidationHandler] = []
+
+    async def start(self, handler: InvalidationHandler) -> None:
+        self._handlers.append(handler)
+
+    async def stop(self, handler: InvalidationHandler) -> None:
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+
+    async def publish(self, message: Dict[str, Any]) -> None:
+        for handler in list(self._handlers):
+            await handler(message)
+
+
+class RedisInvalidationBus:
+    """Invalidation channel over Redis pub/sub.
+
+    Works with any client exposing publish() and pubsub() like
+    redis.asyncio.Redis (or fakeredis).
+    """
+
+    def __init__(self, client, channel: str = DEFAULT_INVALIDATION_CHANNEL):
+        self._client = client
+        self._channel = channel
+        self._pubsub = None
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, handler: InvalidationHandler) -> None:
+        self._pubsub = self._client.pubsub()
+        await self._pubsub.subscribe(self._channel)
+        self._task = asyncio.create_task(self._listen(handler), name="cache-invalidation")
+
+    async def stop(self, handler: InvalidationHandler) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe(self._channel)
+                close = getattr(self._pubsub, "aclose", None) or self._pubsub.close
+                await close()
+            except Exception as e:
+                logger.warning(f"Error closing invalidation subscription: {e}")
+            self._pubsub = None
+
+    async def publish(self, message: Dict[str, Any]) -> None:
+        await self._client.publish(self._channel, json.dumps(message))
+
+    async def _listen(self, handler: InvalidationHandler) -> None:
+        async for message in self._pubsub.listen():
+            if message.get("type") != "message":
+                continue
+            try:
+                await handler(json.loads(message["data"]))
+            except Exception as e:
+                logger.warning(f"Bad cache invalidation message: {e}")
+
+
+class _TierCounters:
+    """Hit/miss/latency counters for one tier, as seen by TieredCache."""
+
+    __slots__ = ("hits", "misses", "lookups", "latency_s")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.lookups = 0
+        self.latency_s = 0.0
+
+    def record(self, hits: int, misses: int, elapsed: float) -> None:
+        self.hits += hits
+        self.misses += misses
+        self.lookups += 1
+        self.latency_s += elapsed
+
+    def to_stats(self, backend: CacheStats) -> CacheStats:
+        return CacheStats(
+            hits=self.hits,
+            misses=self.misses,
+            evictions=backend.evictions,
+            size=backend.size,
+            size_bytes=backend.size_bytes,
+            mean_latency_ms=self.latency_s * 1000 / self.lookups if self.lookups else 0.0,
+        )
+
+
+class TieredCache(Cache):
+    """Two-tier cache: local L1 in front of a shared L2.
+
+    Features:
+    - L1 hits skip the network and deserialization entirely
+    - L2 hits are copied into L1 (with a short L1 TTL)
+    - set/invalidate/clear write through both tiers and publish an
+      invalidation so other nodes evict their L1 copies
+    - get_many/set_many use the L2's batched round-trips
+    - Per-tier hit ratios and latency in stats().tiers
+
+    Example:
+        l1 = InMemoryLRUCache(maxsize=4096, default_ttl=5)
+        l2 = RedisCache(redis_url="redis://localhost:6379", default_ttl=60)
+        cache = TieredCache(l1, l2)
+        await cache.start()
+    """
+
+    def __init__(
+        self,
+        l1: Cache,
+        l2: Cache,
+        bus=None,
+        l1_ttl: Optional[int] = 5,
+        channel: str = DEFAULT_INVALIDATION_CHANNEL
+    ):
+        """Initialize tiered cache.
+
+        Args:
+            l1: Local cache (normally InMemoryLRUCache)
+            l2: Shared cache (normally RedisCache)
+            bus: Invalidation channel. None creates a RedisInvalidationBus
+                on start() when the L2 storage exposes a Redis client;
+                without one, L1 staleness is bounded by l1_ttl only
+            l1_ttl: TTL in seconds for entries copied into L1
+            channel: Pub/sub channel name for the default Redis bus
+        """
+        self.l1 = l1
+        self.l2 = l2
+        self._bus = bus
+        self._l1_ttl = l1_ttl
+        self._channel = channel
+        self.node_id = uuid.uuid4().hex
+        self._started = False
+
+        # Bumped on every invalidation; an L2 read that overlaps one is not
+        # copied into L1, since it may predate the write
+        self._generation = 0
+
+        self._tiers = {"l1": _TierCounters(), "l2": _TierCounters()}
+
+    async def start(self) -> None:
+        """Connect L2 and subscribe to the invalidation channel."""
+        if self._started:
+            return
+        self._started = True
+
+        connect = getattr(self.l2, "connect", None)
+        if connect is not None:
+            await connect()
+        if self._bus is None:
+            client = getattr(getattr(self.l2, "_storage", None), "redis", None)
+            if client is not None and hasattr(client, "pubsub"):
+                self._bus = RedisInvalidationBus(client, self._channel)
+            else:
+                logger.warning(
+                    "TieredCache has no invalidation channel; "
+                    f"L1 entries may be stale for up to {self._l1_ttl}s"
+                )
+        if self._bus is not None:
+            await self._bus.start(self._on_invalidation)
+
+    async def close(self) -> None:
+        """Unsubscribe from the invalidation channel."""
+        if self._bus is not None and self._started:
+            await self._bus.stop(self._on_invalidation)
+        self._started = False
+
+    async def get(self, key: str) -> Optional[Any]:
+        """Retrieve value from L1, falling back to L2.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Cached value or None
+        """
+        if not self._started:
+            await self.start()
+
+        start = time.perf_counter()
+        value = await self.l1.get(key)
+        l1_done = time.perf_counter()
+        hit = value is not None
+        self._tiers["l1"].record(int(hit), int(not hit), l1_done - start)
+        if hit:
+            return value
+
+        generation = self._generation
+        value = await self.l2.get(key)
+        hit = value is not None
+        self._tiers["l2"].record(int(hit), int(not hit), time.perf_counter() - l1_done)
+        if hit and generation == self._generation:
+            await self.l1.set(key, value, self._l1_ttl)
+        return value
+
+    async def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Retrieve several keys: L1 first, the rest in one L2 round-trip.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Mapping of the keys that were found to their values
+        """
+        if not self._started:
+            await self.start()
+
+        start = time.perf_counter()
+        found = await self.l1.get_many(keys)
+        l1_done = time.perf_counter()
+        self._tiers["l1"].record(len(found), len(keys) - len(found), l1_done - start)
+
+        missing = [key for key in keys if key not in found]
+        if not missing:
+            return found
+
+        generation = self._generation
+        from_l2 = await self.l2.get_many(missing)
+        self._tiers["l2"].record(
+            len(from_l2), len(missing) - len(from_l2), time.perf_counter() - l1_done
+        )
+        if from_l2 and generation == self._generation:
+            await self.l1.set_many(from_l2, self._l1_ttl)
+        found.update(from_l2)
+        return found
+
+    async def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None
+    ) -> bool:
+        """Write through both tiers and invalidate other nodes' L1.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: TTL in seconds for L2 (None uses its default)
+
+        Returns:
+            True if L2 stored the value
+        """
+        if not self._started:
+            await self.start()
+
+        self._generation += 1
+        stored = await self.l2.set(key, value, ttl)
+        if stored:
+            await self.l1.set(key, value, self._l1_ttl_for(ttl))
+        else:
+            await self.l1.invalidate(key)
+        await self._publish({"keys": [key]})
+        return stored
+
+    async def set_many(self, items: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """Write several values through both tiers with one announcement.
+
+        Args:
+            items: Mapping of cache keys to values
+            ttl: TTL in seconds for L2 (None uses its default)
+
+        Returns:
+            True if L2 stored every value
+        """
+        if not self._started:
+            await self.start()
+        if not items:
+            return True
+
+        self._generation += 1
+        stored = await self.l2.set_many(items, ttl)
+        if stored:
+            await self.l1.set_many(items, self._l1_ttl_for(ttl))
+        else:
+            for key in items:
+                await self.l1.invalidate(key)
+        await self._publish({"keys": list(items)})
+        return stored
+
+    async def invalidate(self, key: str) -> bool:
+        """Invalidate a key in both tiers and on other nodes.
+
+        Args:
+            key: Cache key to invalidate
+
+        Returns:
+            True if the key existed in L2
+        """
+        if not self._started:
+            await self.start()
+
+        self._generation += 1
+        await self.l1.invalidate(key)
+        existed = await self.l2.invalidate(key)
+        await self._publish({"keys": [key]})
+        return existed
+
+    async def clear(self) -> int:
+        """Clear both tiers and every node's L1.
+
+        Returns:
+            Number of L2 entries cleared
+        """
+        if not self._started:
+            await self.start()
+
+        self._generation += 1
+        await self.l1.clear()
+        count = await self.l2.clear()
+        await self._publish({"clear": True})
+        return count
+
+    def stats(self) -> CacheStats:
+        """Get overall and per-tier statistics.
+
+        A lookup counts as a hit if either tier had the key. tiers["l1"]
+        and tiers["l2"] carry each tier's hits, misses and mean latency as
+        seen through this cache.
+
+        Returns:
+            CacheStats with tiers populated
+        """
+        l1_stats, l2_stats = self.l1.stats(), self.l2.stats()
+        l1, l2 = self._tiers["l1"], self._tiers["l2"]
+        lookups = l1.lookups
+        return CacheStats(
+            hits=l1.hits + l2.hits,
+            misses=l2.misses,
+            evictions=l1_stats.evictions,
+            size=l1_stats.size,
+            size_bytes=l1_stats.size_bytes,
+            mean_latency_ms=(l1.latency_s + l2.latency_s) * 1000 / lookups if lookups else 0.0,
+            tiers={"l1": l1.to_stats(l1_stats), "l2": l2.to_stats(l2_stats)},
+        )
+
+    def reset_stats(self) -> None:
+        """Reset statistics counters."""
+        self._tiers = {"l1": _TierCounters(), "l2": _TierCounters()}
+        for tier in (self.l1, self.l2):
+            reset = getattr(tier, "reset_stats", None)
+            if reset is not None:
+                reset()
+
+    def _l1_ttl_for(self, ttl: Optional[int]) -> Optional[int]:
+        if ttl is None:
+            return self._l1_ttl
+        if self._l1_ttl is None:
+            return ttl
+        return min(ttl, self._l1_ttl)
+
+    async def _publish(self, message: Dict[str, Any]) -> None:
+        if self._bus is None:
+            return
+        try:
+            await self._bus.publish({"origin": self.node_id, **message})
+        except Exception as e:
+            logger.warning(f"Cache invalidation publish failed: {e}")
+
+    async def _on_invalidation(self, message: Dict[str, Any]) -> None:
+        """Drop L1 entries another node changed."""
+        if message.get("origin") == self.node_id:
+            return
+        self._generation += 1
+        if message.get("clear"):
+            await self.l1.clear()
+            return
+        for key in message.get("keys", ()):
+            await self.l1.invalidate(key)
@@ -6,7 +6,7 @@ Supports dependency injection and testing with in-memory implementations.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 
 class Storage(ABC):
@@ -85,6 +85,59 @@ class Storage(ABC):
         """
         pass
 
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Retrieve several values (one get per key unless overridden).
+        
+        Args:
+            keys: Storage keys
+            
+        Returns:
+            Values in key order, None for missing keys
+        """
+        return [await self.get(key) for key in keys]
+
+    async def mset(self, items: Dict[str, Any], ttl: Optional[int] = None, expire: Optional[int] = None) -> bool:
+        """
+        Store several values with the same TTL (one set per key unless overridden).
+        
+        Args:
+            items: Mapping of keys to values
+            ttl: Time to live in seconds (None = no expiry); expire is an alias
+            
+        Returns:
+            True if all values were stored
+        """
+        expiry = expire if expire is not None else ttl
+        results = [await self.set(key, value, ttl=expiry) for key, value in items.items()]
+        return all(results)
+
+    async def delete_many(self, keys: List[str]) -> int:
+        """
+        Delete several keys (one delete per key unless overridden).
+        
+        Args:
+            keys: Storage keys
+            
+        Returns:
+            Number of keys deleted
+        """
+        return sum([await self.delete(key) for key in keys])
+
+    async def scan_iter(self, pattern: str = "*", count: int = 100) -> AsyncIterator[str]:
+        """
+        Iterate over keys matching pattern.
+        
+        Args:
+            pattern: Key pattern (supports wildcards like "prefix:*")
+            count: Page size hint
+            
+        Yields:
+            Matching keys
+        """
+        for key in await self.keys(pattern):
+            yield key
+
     @abstractmethod
     async def increment(self, key: str, amount: int = 1) -> int:
         """
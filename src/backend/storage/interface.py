@@ -5,7 +5,7 @@ Defines a minimal, well-typed Storage interface that abstracts away
 the underlying storage implementation (Redis, in-memory, etc.).
 """
 
-from typing import Protocol, Optional, Any, List
+from typing import Protocol, Optional, Any, AsyncIterator, Dict, List
 from abc import abstractmethod
 
 
@@ -78,6 +78,65 @@ class Storage(Protocol):
         """
         ...
 
+    @abstractmethod
+    def scan_iter(self, pattern: str, count: int = 100) -> AsyncIterator[str]:
+        """
+        Iterate over keys matching a pattern, one SCAN page at a time.
+        
+        Args:
+            pattern: Glob-style pattern (e.g., "prefix:*")
+            count: Keys requested per page (a hint)
+            
+        Yields:
+            Matching keys
+        """
+        ...
+
+    @abstractmethod
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """
+        Retrieve several values in one round-trip.
+        
+        Args:
+            keys: The keys to retrieve
+            
+        Returns:
+            Values in key order, None for missing keys
+        """
+        ...
+
+    @abstractmethod
+    async def mset(
+        self,
+        items: Dict[str, Any],
+        *,
+        expire: Optional[int] = None
+    ) -> bool:
+        """
+        Store several values in one round-trip.
+        
+        Args:
+            items: Mapping of keys to values (serialized to JSON)
+            expire: Optional TTL in seconds applied to every key
+            
+        Returns:
+            True if all values were stored, False otherwise
+        """
+        ...
+
+    @abstractmethod
+    async def delete_many(self, keys: List[str]) -> int:
+        """
+        Delete several keys in one round-trip.
+        
+        Args:
+            keys: The keys to delete
+            
+        Returns:
+            Number of keys that existed and were deleted
+        """
+        ...
+
     @abstractmethod
     async def expire(self, key: str, seconds: int) -> bool:
         """
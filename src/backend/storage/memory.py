@@ -7,7 +7,7 @@ Supports TTL expiration and all Storage interface operations.
 
 import asyncio
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 from collections import defaultdict
 
 from .base import Storage
@@ -75,6 +75,44 @@ class MemoryStorage(Storage):
 
             return True
 
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        """Retrieve several values under one lock acquisition."""
+        async with self._lock:
+            now = time.time()
+            values = []
+            for key in keys:
+                if key in self._ttls and now > self._ttls[key]:
+                    del self._data[key]
+                    del self._ttls[key]
+                values.append(self._data.get(key))
+            return values
+
+    async def mset(self, items: Dict[str, Any], ttl: Optional[int] = None, expire: Optional[int] = None) -> bool:
+        """Store several values with the same TTL under one lock acquisition."""
+        expiry_time = expire if expire is not None else ttl
+
+        async with self._lock:
+            self._data.update(items)
+            if expiry_time is not None:
+                expires_at = time.time() + expiry_time
+                for key in items:
+                    self._ttls[key] = expires_at
+            else:
+                for key in items:
+                    self._ttls.pop(key, None)
+            return True
+
+    async def delete_many(self, keys: List[str]) -> int:
+        """Delete several keys under one lock acquisition."""
+        async with self._lock:
+            deleted = 0
+            for key in keys:
+                if key in self._data:
+                    del self._data[key]
+                    self._ttls.pop(key, None)
+                    deleted += 1
+            return deleted
+
     async def delete(self, key: str) -> bool:
         """Delete key if it exists."""
         async with self._lock:
@@ -132,6 +170,15 @@ class MemoryStorage(Storage):
         
         return all_keys[start:end]
 
+    async def scan_iter(self, pattern: str = "*", count: int = 100) -> AsyncIterator[str]:
+        """Iterate over keys matching pattern, a page of `count` at a time."""
+        all_keys = await self.keys(pattern)
+        for start in range(0, len(all_keys), count):
+            for key in all_keys[start:start + count]:
+                yield key
+            # Let other tasks run between pages, as a real SCAN would
+            await asyncio.sleep(0)
+
     async def expire(self, key: str, ttl: int) -> bool:
         """Set or update expiry on existing key."""
         async with self._lock:
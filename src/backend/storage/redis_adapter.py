@@ -10,13 +10,17 @@ import redis.asyncio as aioredis
 import json
 import logging
 import asyncio
-from typing import Optional, Any, List, Dict
+from typing import Optional, Any, AsyncIterator, Callable, List, Dict
 from datetime import datetime
 
 from backend.storage.interface import Storage
 
 logger = logging.getLogger(__name__)
 
+# Bulk operations split into commands of at most this many keys, all
+# sent in one pipeline, so no single command blocks Redis for long
+BULK_CHUNK_SIZE = 500
+
 
 class RedisAdapter:
     """
@@ -26,6 +30,9 @@ class RedisAdapter:
     connection management, and proper error handling.
     """
 
+    # get()/mget() return values already decoded from JSON
+    DECODES_VALUES = True
+
     def __init__(
         self,
         redis_url: str = "redis://localhost:6379",
@@ -138,6 +145,28 @@ class RedisAdapter:
         
         raise last_error
 
+    async def _execute_pipeline(self, queue_commands: Callable[[Any], None]) -> List[Any]:
+        """
+        Run a batch of commands in one pipeline under one retry envelope.
+        
+        Args:
+            queue_commands: Called with a fresh pipeline to queue the batch
+                (again on each retry, so it must be idempotent)
+            
+        Returns:
+            Replies in command order
+        """
+        async def run():
+            async with self.redis.pipeline(transaction=False) as pipe:
+                queue_commands(pipe)
+                return await pipe.execute()
+
+        return await self._execute_with_retry(run)
+
+    @staticmethod
+    def _chunks(items: List[Any]) -> List[List[Any]]:
+        return [items[i:i + BULK_CHUNK_SIZE] for i in range(0, len(items), BULK_CHUNK_SIZE)]
+
     def _serialize(self, value: Any) -> str:
         """
         Serialize value to JSON string.
@@ -196,7 +225,8 @@ class RedisAdapter:
         key: str,
         value: Any,
         *,
-        expire: Optional[int] = None
+        expire: Optional[int] = None,
+        ttl: Optional[int] = None
     ) -> bool:
         """
         Store a value with optional expiration.
@@ -205,6 +235,7 @@ class RedisAdapter:
             key: The key to store under
             value: The value to store (will be serialized to JSON)
             expire: Optional TTL in seconds
+            ttl: Alias for expire (the name MemoryStorage and RedisCache use)
             
         Returns:
             True if successful, False otherwise
@@ -213,6 +244,9 @@ class RedisAdapter:
             logger.warning("Redis not connected")
             return False
 
+        if expire is None:
+            expire = ttl
+
         try:
             serialized = self._serialize(value)
             await self._execute_with_retry(
@@ -251,40 +285,163 @@ class RedisAdapter:
             logger.error(f"Failed to delete key {key}: {e}")
             return False
 
-    async def scan_keys(self, pattern: str) -> List[str]:
+    async def mget(self, keys: List[str]) -> List[Optional[Any]]:
         """
-        Scan for keys matching a pattern using non-blocking SCAN.
+        Retrieve several values in one pipelined round-trip.
         
         Args:
-            pattern: Glob-style pattern (e.g., "prefix:*")
+            keys: The keys to retrieve
             
         Returns:
-            List of matching keys
+            Values in key order (deserialized from JSON), None for missing
+            keys; all None if Redis is unavailable
         """
+        if not keys:
+            return []
         if not self.connected:
             logger.warning("Redis not connected")
-            return []
+            return [None] * len(keys)
+
+        def queue(pipe):
+            for chunk in self._chunks(keys):
+                pipe.mget(chunk)
+
+        try:
+            replies = await self._execute_pipeline(queue)
+            return [self._deserialize(value) for reply in replies for value in reply]
+        except Exception as e:
+            logger.error(f"Failed to get {len(keys)} keys: {e}")
+            return [None] * len(keys)
+
+    async def mset(
+        self,
+        items: Dict[str, Any],
+        *,
+        expire: Optional[int] = None,
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Store several values in one pipelined round-trip.
+        
+        Values are serialized once, before the retry envelope.
+        
+        Args:
+            items: Mapping of keys to values (serialized to JSON)
+            expire: Optional TTL in seconds applied to every key
+            ttl: Alias for expire
+            
+        Returns:
+            True if all values were stored, False otherwise
+        """
+        if not items:
+            return True
+        if not self.connected:
+            logger.warning("Redis not connected")
+            return False
+
+        if expire is None:
+            expire = ttl
+
+        try:
+            serialized = [(key, self._serialize(value)) for key, value in items.items()]
+        except (TypeError, ValueError) as e:
+            logger.error(f"Failed to serialize {len(items)} values: {e}")
+            return False
+
+        def queue(pipe):
+            if expire is None:
+                for chunk in self._chunks(serialized):
+                    pipe.mset(dict(chunk))
+            else:
+                # MSET has no TTL option; SET EX per key, same round-trip
+                for key, value in serialized:
+                    pipe.set(key, value, ex=expire)
 
         try:
-            keys = []
-            cursor = 0
+            replies = await self._execute_pipeline(queue)
+            logger.debug(f"Set {len(items)} keys" + (f" with TTL {expire}s" if expire else ""))
+            return all(replies)
+        except Exception as e:
+            logger.error(f"Failed to set {len(items)} keys: {e}")
+            return False
+
+    async def delete_many(self, keys: List[str]) -> int:
+        """
+        Delete several keys in one pipelined round-trip.
+        
+        Args:
+            keys: The keys to delete
             
-            while True:
+        Returns:
+            Number of keys that existed and were deleted
+        """
+        if not keys:
+            return 0
+        if not self.connected:
+            logger.warning("Redis not connected")
+            return 0
+
+        def queue(pipe):
+            for chunk in self._chunks(keys):
+                pipe.delete(*chunk)
+
+        try:
+            deleted = sum(await self._execute_pipeline(queue))
+            logger.debug(f"Deleted {deleted} of {len(keys)} keys")
+            return deleted
+        except Exception as e:
+            logger.error(f"Failed to delete {len(keys)} keys: {e}")
+            return 0
+
+    async def scan_iter(self, pattern: str, count: int = 100) -> AsyncIterator[str]:
+        """
+        Iterate over keys matching a pattern using non-blocking SCAN.
+        
+        Keys are yielded page by page, so callers can start work (or stop)
+        before the whole keyspace has been scanned. Each page has its own
+        retry envelope.
+        
+        Args:
+            pattern: Glob-style pattern (e.g., "prefix:*")
+            count: Keys requested per SCAN page (a hint)
+            
+        Yields:
+            Matching keys
+        """
+        if not self.connected:
+            logger.warning("Redis not connected")
+            return
+
+        cursor = 0
+        while True:
+            try:
                 cursor, batch_keys = await self._execute_with_retry(
                     self.redis.scan,
                     cursor=cursor,
                     match=pattern,
-                    count=100
+                    count=count
                 )
-                keys.extend(batch_keys)
-                if cursor == 0:
-                    break
+            except Exception as e:
+                logger.error(f"Failed to scan keys with pattern {pattern}: {e}")
+                return
+            for key in batch_keys:
+                yield key
+            if cursor == 0:
+                break
+
+    async def scan_keys(self, pattern: str) -> List[str]:
+        """
+        Scan for keys matching a pattern using non-blocking SCAN.
+        
+        Args:
+            pattern: Glob-style pattern (e.g., "prefix:*")
             
-            logger.debug(f"Scanned {len(keys)} keys matching {pattern}")
-            return keys
-        except Exception as e:
-            logger.error(f"Failed to scan keys with pattern {pattern}: {e}")
-            return []
+        Returns:
+            List of matching keys
+        """
+        keys = [key async for key in self.scan_iter(pattern)]
+        logger.debug(f"Scanned {len(keys)} keys matching {pattern}")
+        return keys
 
     async def expire(self, key: str, seconds: int) -> bool:
         """
@@ -1,10 +1,159 @@
-from typing import Dict
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Optional, Tuple, TYPE_CHECKING
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# Fault codes returned by classify_batch(); FAULT_TYPES[code] gives the name
+FAULT_TYPES = ("normal", "power_fault", "thermal_fault", "attitude_fault", "unknown_fault")
+FAULT_NORMAL, FAULT_POWER, FAULT_THERMAL, FAULT_ATTITUDE, FAULT_UNKNOWN = range(len(FAULT_TYPES))
+
+# Severity codes returned by classify_batch(); SEVERITY_LEVELS[code] gives the name
+SEVERITY_LEVELS = ("low", "medium", "high", "critical")
+
+# Mapping of fault types to their severity levels
+# Severity levels: critical (immediate action required), high (urgent), medium (monitor), low (normal)
+_SEVERITY_MAP = {
+    "power_fault": "critical",  # Power issues can cause immediate system shutdown
+    "thermal_fault": "high",    # Overheating can lead to component damage
+    "attitude_fault": "medium", # Orientation issues may affect mission but not immediately critical
+    "normal": "low",            # No fault detected
+    "unknown_fault": "low",     # Unknown state, assume low risk
+}
+
+# Default location of the threshold configuration (overridable via env var)
+DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "config" / "fault_classifier.yaml"
+CONFIG_PATH_ENV = "FAULT_CLASSIFIER_CONFIG"
+
+
+@dataclass(frozen=True)
+class ClassifierThresholds:
+    """Fault classification thresholds (loaded from config/fault_classifier.yaml)."""
+    voltage_min: float = 7.3        # Critical voltage threshold: below indicates battery/power failure
+    temperature_max: float = 32.0   # Temperature safety limit: above suggests cooling system issues
+    gyro_max: float = 0.05          # Gyroscopic threshold: above indicates unstable attitude
+
+
+def load_thresholds(config_path: Optional[str] = None) -> ClassifierThresholds:
+    """
+    Load classifier thresholds from a YAML/JSON configuration file.
+
+    Falls back to ClassifierThresholds defaults for a missing file or
+    missing keys so the classifier never breaks on configuration errors.
+
+    Args:
+        config_path: Path to the config file. Defaults to $FAULT_CLASSIFIER_CONFIG
+            or config/fault_classifier.yaml.
+
+    Returns:
+        ClassifierThresholds instance
+    """
+    path = config_path or os.environ.get(CONFIG_PATH_ENV) or str(DEFAULT_CONFIG_PATH)
+    if not os.path.exists(path):
+        logger.warning(f"Classifier config not found at {path}, using default thresholds")
+        return ClassifierThresholds()
+
+    try:
+        from config.config_loader import load_config_file
+
+        section = load_config_file(path).get("thresholds", {}) or {}
+        defaults = ClassifierThresholds()
+        return ClassifierThresholds(
+            voltage_min=float(section.get("voltage_min", defaults.voltage_min)),
+            temperature_max=float(section.get("temperature_max", defaults.temperature_max)),
+            gyro_max=float(section.get("gyro_max", defaults.gyro_max)),
+        )
+    except Exception as e:
+        logger.error(f"Failed to load classifier thresholds from {path}: {e}")
+        return ClassifierThresholds()
+
+
+_thresholds: Optional[ClassifierThresholds] = None
+
+
+def get_thresholds() -> ClassifierThresholds:
+    """Get the global classifier thresholds (loaded once from configuration)."""
+    global _thresholds
+    if _thresholds is None:
+        _thresholds = load_thresholds()
+    return _thresholds
+
+
+def set_thresholds(thresholds: Optional[ClassifierThresholds]) -> None:
+    """Replace the global thresholds (None forces a reload on next use)."""
+    global _thresholds
+    _thresholds = thresholds
+
+
+def classify_batch(
+    voltage: "np.ndarray",
+    temperature: Optional["np.ndarray"] = None,
+    gyro: Optional["np.ndarray"] = None,
+    thresholds: Optional[ClassifierThresholds] = None,
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Classify many telemetry rows in one vectorized pass.
+
+    Accepts either three equally sized columns, or a single structured array
+    with 'voltage', 'temperature' and 'gyro' fields as the first argument.
+    Rules and priority order are identical to classify().
+
+    Args:
+        voltage: Voltage column, or a structured array holding all three fields
+        temperature: Temperature column (omit when passing a structured array)
+        gyro: Gyroscope column (sign is ignored)
+        thresholds: Override thresholds (defaults to configured values)
+
+    Returns:
+        Tuple of (fault_codes, severity_codes) uint8 arrays; decode with
+        FAULT_TYPES[code] and SEVERITY_LEVELS[code]
+
+    Raises:
+        ValueError: If columns are missing or have mismatched lengths
+    """
+    if np is None:
+        raise ImportError("numpy is required for classify_batch")
+
+    if temperature is None and gyro is None:
+        records = np.asarray(voltage)
+        if records.dtype.names is None:
+            raise ValueError("Pass three columns or a structured array with voltage/temperature/gyro")
+        voltage, temperature, gyro = records["voltage"], records["temperature"], records["gyro"]
+    elif temperature is None or gyro is None:
+        raise ValueError("temperature and gyro columns are both required")
+
+    voltage = np.asarray(voltage, dtype=np.float64)
+    temperature = np.asarray(temperature, dtype=np.float64)
+    gyro = np.abs(np.asarray(gyro, dtype=np.float64))
+    if not (voltage.shape == temperature.shape == gyro.shape):
+        raise ValueError("voltage, temperature and gyro must have the same shape")
+
+    t = thresholds or get_thresholds()
+    fault_codes = np.select(
+        [voltage < t.voltage_min, temperature > t.temperature_max, gyro > t.gyro_max],
+        [FAULT_POWER, FAULT_THERMAL, FAULT_ATTITUDE],
+        default=FAULT_NORMAL,
+    ).astype(np.uint8)
+    return fault_codes, _FAULT_SEVERITY_CODES[fault_codes]
 
 
 def classify(data: Dict) -> str:
     """
     Classify the type of fault based on telemetry data.
     Returns: 'normal', 'power_fault', 'thermal_fault', 'attitude_fault', or 'unknown_fault'
+
+    Thin scalar wrapper over the same configured rules as classify_batch();
+    it avoids array construction so single-point calls stay cheap.
     """
     # Extract key telemetry parameters from the input data dictionary
     # Use default values if keys are missing to ensure robustness
@@ -12,20 +161,13 @@ def classify(data: Dict) -> str:
     temperature = data.get("temperature", 25.0)  # System temperature in Celsius
     gyro = abs(data.get("gyro", 0.0))  # Absolute gyroscope reading in rad/s
 
-    # Fault classification logic based on predefined thresholds
-    # Check for power-related faults first (highest priority)
-    if voltage < 7.3:
-        # Critical voltage threshold: below 7.3V indicates battery/power system failure
+    t = get_thresholds()
+    # Same priority order as classify_batch: power, thermal, attitude
+    if voltage < t.voltage_min:
         return "power_fault"
-    
-    # Check for thermal faults (overheating)
-    if temperature > 32.0:
-        # Temperature safety limit: above 32°C suggests cooling system issues
+    if temperature > t.temperature_max:
         return "thermal_fault"
-    
-    # Check for attitude/orientation faults (excessive rotation)
-    if gyro > 0.05:
-        # Gyroscopic threshold: above 0.05 rad/s indicates unstable attitude
+    if gyro > t.gyro_max:
         return "attitude_fault"
 
     # If no faults detected, system is operating normally
@@ -34,26 +176,29 @@ def classify(data: Dict) -> str:
 
 def get_fault_severity(fault_type: str) -> str:
     """Get severity level for a fault type."""
-    # Mapping of fault types to their severity levels
-    # Severity levels: critical (immediate action required), high (urgent), medium (monitor), low (normal)
-    severity_map = {
-        "power_fault": "critical",  # Power issues can cause immediate system shutdown
-        "thermal_fault": "high",    # Overheating can lead to component damage
-        "attitude_fault": "medium", # Orientation issues may affect mission but not immediately critical
-        "normal": "low",            # No fault detected
-        "unknown_fault": "low",     # Unknown state, assume low risk
-    }
-    return severity_map.get(fault_type, "low")
+    return _SEVERITY_MAP.get(fault_type, "low")
 
 
 def get_fault_description(fault_type: str) -> str:
     """Get human-readable description for a fault type."""
+    t = get_thresholds()
     # Human-readable descriptions for each fault type, including threshold values
     desc_map = {
-        "power_fault": "Voltage dropped below critical threshold (7.3V)",  # Battery low
-        "thermal_fault": "Temperature exceeded safety limit (32°C)",      # Overheating
-        "attitude_fault": "Gyroscope detected excessive rotation (>0.05 rad/s)",  # Unstable orientation
+        "power_fault": f"Voltage dropped below critical threshold ({t.voltage_min:g}V)",  # Battery low
+        "thermal_fault": f"Temperature exceeded safety limit ({t.temperature_max:g}°C)",  # Overheating
+        "attitude_fault": f"Gyroscope detected excessive rotation (>{t.gyro_max:g} rad/s)",  # Unstable orientation
         "normal": "System operating within normal parameters",            # All good
         "unknown_fault": "Unidentified anomaly detected",                 # Something unexpected
     }
     return desc_map.get(fault_type, "Unknown system state")
+
+
+# Severity code per fault code, used to map classify_batch() results in one gather
+_FAULT_SEVERITY_CODES = (
+    np.array(
+        [SEVERITY_LEVELS.index(_SEVERITY_MAP[name]) for name in FAULT_TYPES],
+        dtype=np.uint8,
+    )
+    if np is not None
+    else None
+)
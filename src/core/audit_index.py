@@ -0,0 +1,246 @@
+"""
+Sidecar indexes and integrity checkpoints for audit log segments.
+
+Every rotated audit log segment (audit.log.N) gets an audit.log.N.idx file
+holding its time range and event_type/user_id postings (byte offsets of
+matching lines), so query_audit_logs() can skip whole segments and seek
+straight to candidate lines instead of parsing everything.
+
+The integrity log is never rotated, but it is cut into segments at the same
+points: each rotation appends a checkpoint (byte range plus the chain hash
+at both ends) to audit_integrity.checkpoints. Segments can then be verified
+independently, in a process pool, and verification can resume after the
+last segment that already verified.
+"""
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+INDEX_SUFFIX = ".idx"
+INDEX_VERSION = 1
+INDEXED_FIELDS = ("event_type", "user_id")
+
+
+def index_path(log_path: Path) -> Path:
+    """Sidecar index path for an audit log segment."""
+    return log_path.with_name(log_path.name + INDEX_SUFFIX)
+
+
+def _parse_timestamp(timestamp: str) -> datetime:
+    # Entries are stamped with utcnow().isoformat() + "Z"
+    return datetime.fromisoformat(timestamp[:-1] if timestamp.endswith("Z") else timestamp)
+
+
+class SegmentIndex:
+    """Time range and postings for one audit log segment."""
+
+    def __init__(self):
+        self.start_time: Optional[str] = None
+        self.end_time: Optional[str] = None
+        self.entries = 0
+        self.postings: Dict[str, Dict[str, List[int]]] = {name: {} for name in INDEXED_FIELDS}
+
+    def add(self, entry: Dict[str, Any], offset: int) -> None:
+        """Record an entry written at a byte offset."""
+        timestamp = entry.get("timestamp")
+        if timestamp:
+            if self.start_time is None or timestamp < self.start_time:
+                self.start_time = timestamp
+            if self.end_time is None or timestamp > self.end_time:
+                self.end_time = timestamp
+        for name in INDEXED_FIELDS:
+            value = entry.get(name)
+            if value is not None:
+                self.postings[name].setdefault(str(value), []).append(offset)
+        self.entries += 1
+
+    def overlaps(self, start_time: Optional[datetime], end_time: Optional[datetime]) -> bool:
+        """Whether any entry can fall inside [start_time, end_time]."""
+        if self.entries == 0:
+            return False
+        if self.start_time is None:
+            return True
+        if start_time and _parse_timestamp(self.end_time) < start_time:
+            return False
+        if end_time and _parse_timestamp(self.start_time) > end_time:
+            return False
+        return True
+
+    def candidates(self, **filters: Optional[str]) -> Optional[List[int]]:
+        """
+        Sorted offsets of lines matching every given indexed field.
+
+        Returns:
+            Offsets to read, or None when no indexed filter was given
+            (the caller scans the whole segment)
+        """
+        selected = None
+        for name, value in filters.items():
+            if value is None:
+                continue
+            offsets = self.postings[name].get(value, [])
+            selected = set(offsets) if selected is None else selected.intersection(offsets)
+            if not selected:
+                return []
+        return None if selected is None else sorted(selected)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "version": INDEX_VERSION,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+            "entries": self.entries,
+            "postings": self.postings,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SegmentIndex":
+        index = cls()
+        index.start_time = data["start_time"]
+        index.end_time = data["end_time"]
+        index.entries = data["entries"]
+        index.postings.update(data["postings"])
+        return index
+
+    def save(self, path: Path) -> None:
+        """Write atomically so readers never see a partial index."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.to_dict(), f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["SegmentIndex"]:
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != INDEX_VERSION:
+            return None
+        return cls.from_dict(data)
+
+    @classmethod
+    def build(cls, log_path: Path) -> "SegmentIndex":
+        """Index an existing segment by scanning it (segments written before indexing)."""
+        index = cls()
+        try:
+            with open(log_path, "rb") as f:
+                offset = 0
+                for line in f:
+                    try:
+                        index.add(json.loads(line), offset)
+                    except ValueError:
+                        pass
+                    offset += len(line)
+        except FileNotFoundError:
+            pass
+        return index
+
+
+def read_lines_at(f: BinaryIO, offsets: List[int]) -> Iterator[bytes]:
+    """Lines starting at the given byte offsets of an open segment."""
+    for offset in offsets:
+        f.seek(offset)
+        yield f.readline()
+
+
+@dataclass(frozen=True)
+class Checkpoint:
+    """One sealed integrity log segment: byte range and chain hash at both ends."""
+    segment: int
+    start: int
+    end: int
+    start_hash: str
+    end_hash: str
+
+
+def load_checkpoints(path: Path) -> List[Checkpoint]:
+    checkpoints = []
+    try:
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    checkpoints.append(Checkpoint(**json.loads(line)))
+    except FileNotFoundError:
+        pass
+    return checkpoints
+
+
+def append_checkpoint(path: Path, checkpoint: Checkpoint) -> None:
+    with open(path, "a") as f:
+        f.write(json.dumps(asdict(checkpoint), sort_keys=True) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def checkpoints_are_contiguous(checkpoints: List[Checkpoint], genesis_hash: str) -> bool:
+    """Checkpoints must tile the integrity log from offset 0 and chain onto each other."""
+    offset, chain_hash = 0, genesis_hash
+    for expected_segment, checkpoint in enumerate(checkpoints):
+        if (checkpoint.segment != expected_segment or checkpoint.start != offset
+                or checkpoint.start_hash != chain_hash or checkpoint.end < checkpoint.start):
+            return False
+        offset, chain_hash = checkpoint.end, checkpoint.end_hash
+    return True
+
+
+def verify_segment(
+    path: str,
+    start: int,
+    end: Optional[int],
+    start_hash: str,
+    end_hash: Optional[str] = None,
+) -> Tuple[bool, str]:
+    """
+    Verify the hash chain over one byte range of the integrity log.
+
+    Runs in worker processes, so it only takes and returns picklable values.
+
+    Args:
+        path: Integrity log path
+        start: Offset of the segment's first line
+        end: Offset just past its last line (None reads to end of file)
+        start_hash: Chain hash before the segment
+        end_hash: Expected chain hash after the segment, if sealed
+
+    Returns:
+        (intact, chain hash after the last line)
+    """
+    expected_hash = start_hash
+    try:
+        with open(path, "rb") as f:
+            f.seek(start)
+            position = start
+            while end is None or position < end:
+                raw = f.readline()
+                if not raw:
+                    break
+                position += len(raw)
+                line = raw.decode().strip()
+                if not line:
+                    continue
+
+                parts = line.split("|", 1)
+                if len(parts) != 2:
+                    return False, expected_hash
+
+                stored_hash, payload = parts
+                calculated_hash = hashlib.sha256((expected_hash + payload).encode()).hexdigest()
+                if calculated_hash != stored_hash:
+                    return False, expected_hash
+                expected_hash = stored_hash
+
+            if end is not None and position != end:
+                return False, expected_hash
+    except (OSError, UnicodeDecodeError):
+        return False, expected_hash
+
+    if end_hash is not None and expected_hash != end_hash:
+        return False, expected_hash
+    return True, expected_hash
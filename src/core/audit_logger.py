@@ -11,19 +11,62 @@ Features:
 - Tamper-evident logging through SHA-256 hashing
 - Sensitive data sanitization
 - Integration with existing logging infrastructure
+- Background batched writer: callers only enqueue
+
+Integrity log format: one line per write batch,
+
+    <sha256(previous hash + payload)>|<payload>
+
+where payload is the batch's JSON entries joined with RECORD_SEPARATOR
+(json.dumps escapes control characters, so it never occurs inside an
+entry). A one-entry batch is exactly the original per-entry format.
+
+Rotated segments carry sidecar indexes and the integrity log is cut into
+checkpointed segments at each rotation; see core.audit_index.
 """
 
 import os
 import json
+import atexit
 import hashlib
 import logging
-import logging.handlers
+import multiprocessing
+import queue
+import threading
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 from enum import Enum
 from pathlib import Path
 import structlog
 from astraguard.logging_config import get_logger
+from core.audit_index import (
+    Checkpoint,
+    SegmentIndex,
+    append_checkpoint,
+    checkpoints_are_contiguous,
+    index_path,
+    load_checkpoints,
+    read_lines_at,
+    verify_segment,
+)
+from core.metrics import (
+    AUDIT_BATCH_SIZE,
+    AUDIT_EVENTS_WRITTEN_TOTAL,
+    AUDIT_QUEUE_DEPTH,
+    AUDIT_QUEUE_LAG,
+)
+
+logger = logging.getLogger(__name__)
+
+GENESIS_HASH = "0" * 64
+RECORD_SEPARATOR = "\x1e"
+FSYNC_POLICIES = ("batch", "interval", "never")
+# Starting spawn workers costs about a second, which buys hashing a few
+# hundred MB in-process; below this many sealed bytes verify in-process
+PARALLEL_VERIFY_MIN_BYTES = 256 * 1024 * 1024
 
 
 class AuditEventType(str, Enum):
@@ -77,7 +120,12 @@ class AuditLogger:
         log_dir: str = "logs/audit",
         max_bytes: int = 10 * 1024 * 1024,  # 10MB per file
         backup_count: int = 5,
-        service_name: str = "astra-guard"
+        service_name: str = "astra-guard",
+        async_writes: bool = True,
+        max_batch_size: int = 512,
+        fsync_policy: str = "batch",
+        fsync_interval_s: float = 1.0,
+        verify_workers: Optional[int] = None
     ):
         """
         Initialize audit logger with rotation and tamper-evident features.
@@ -87,32 +135,37 @@ class AuditLogger:
             max_bytes: Maximum bytes per log file before rotation
             backup_count: Number of backup files to keep
             service_name: Name of the service for log entries
+            async_writes: Write from a background thread (callers only
+                enqueue); False writes each event on the caller's thread
+            max_batch_size: Most events written together
+            fsync_policy: 'batch' (fsync every batch), 'interval' (at most
+                every fsync_interval_s) or 'never' (leave it to the OS)
+            fsync_interval_s: fsync period for the 'interval' policy
+            verify_workers: Processes for verifying sealed integrity
+                segments (None: one per CPU once PARALLEL_VERIFY_MIN_BYTES
+                are pending, 0: always in-process)
         """
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"fsync_policy must be one of {FSYNC_POLICIES}")
+
         self.service_name = service_name
         self.log_dir = Path(log_dir)
         self.log_dir.mkdir(parents=True, exist_ok=True)
-
-        # Main audit log file
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.max_batch_size = max_batch_size
+        self.fsync_policy = fsync_policy
+        self.fsync_interval_s = fsync_interval_s
+        self.verify_workers = verify_workers
+
+        # Main audit log file (rotated) and integrity log (append-only)
         self.audit_log_path = self.log_dir / "audit.log"
         self.integrity_log_path = self.log_dir / "audit_integrity.log"
-
-        # Setup rotating file handler for audit logs
-        self.audit_handler = logging.handlers.RotatingFileHandler(
-            self.audit_log_path,
-            maxBytes=max_bytes,
-            backupCount=backup_count
-        )
-        self.audit_handler.setFormatter(logging.Formatter('%(message)s'))
-
-        # Setup integrity log handler (append-only)
-        self.integrity_handler = logging.FileHandler(self.integrity_log_path)
-        self.integrity_handler.setFormatter(logging.Formatter('%(message)s'))
-
-        # Create audit logger
-        self.audit_logger = logging.getLogger('astra_audit')
-        self.audit_logger.setLevel(logging.INFO)
-        self.audit_logger.addHandler(self.audit_handler)
-        self.audit_logger.addHandler(self.integrity_handler)
+        self.checkpoints_path = self.log_dir / "audit_integrity.checkpoints"
+        self.verified_path = self.log_dir / "audit_integrity.verified"
+        self._audit_file = open(self.audit_log_path, 'ab')
+        self._integrity_file = open(self.integrity_log_path, 'ab')
+        self._last_fsync = time.monotonic()
 
         # Structlog logger for integration
         self.struct_logger = get_logger('audit')
@@ -120,23 +173,57 @@ class AuditLogger:
         # Track last hash for tamper-evident chain
         self._last_hash = self._load_last_hash()
 
+        # Index of the active segment (rotated ones have .idx sidecars) and
+        # the sealed integrity segments
+        self._active_index = SegmentIndex.build(self.audit_log_path)
+        self._index_cache: Dict[Path, tuple] = {}
+        self._checkpoints = load_checkpoints(self.checkpoints_path)
+
+        # Writer state: SimpleQueue put/get need no Python-level lock
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._write_lock = threading.Lock()  # guards files, hash chain and active index
+        self._stats = {"events_written": 0, "batches": 0, "max_lag_s": 0.0}
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+        if async_writes:
+            # The writer only holds a weak reference, so an unused logger
+            # can still be collected; that stops the writer too
+            self._writer = threading.Thread(
+                target=_run_writer, args=(weakref.ref(self), self._queue, self.max_batch_size),
+                name="audit-writer", daemon=True,
+            )
+            self._writer.start()
+            weakref.finalize(self, self._queue.put, None)
+            _async_loggers.add(self)
+
     def _load_last_hash(self) -> str:
         """Load the last hash from integrity log for tamper-evident chain."""
         if not self.integrity_log_path.exists():
-            return "0" * 64  # Initial hash
+            return GENESIS_HASH  # Initial hash
 
         try:
-            with open(self.integrity_log_path, 'r') as f:
-                lines = f.readlines()
-                if lines:
-                    last_line = lines[-1].strip()
-                    # Extract hash from integrity log entry
-                    if '|' in last_line:
-                        return last_line.split('|')[0]
+            # Read backwards from the end; only the last line matters
+            with open(self.integrity_log_path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                end = f.tell()
+                chunk = b""
+                pos = end
+                while pos > 0:
+                    step = min(4096, pos)
+                    pos -= step
+                    f.seek(pos)
+                    chunk = f.read(step) + chunk
+                    lines = chunk.rstrip(b"\n").split(b"\n")
+                    if len(lines) > 1 or pos == 0:
+                        last_line = lines[-1].decode().strip()
+                        # Extract hash from integrity log entry
+                        if '|' in last_line:
+                            return last_line.split('|')[0]
+                        break
         except Exception:
             pass
 
-        return "0" * 64
+        return GENESIS_HASH
 
     def _sanitize_sensitive_data(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -251,38 +338,7 @@ class AuditLogger:
             **extra
         )
 
-        # Convert to JSON
-        entry_json = json.dumps(entry, sort_keys=True, default=str)
-
-        # Create hash chain for tamper-evident logging
-        hash_input = self._last_hash + entry_json
-        current_hash = hashlib.sha256(hash_input.encode()).hexdigest()
-
-        # Create integrity entry
-        integrity_entry = f"{current_hash}|{entry_json}"
-
-        # Log to audit file (JSON only)
-        self.audit_logger.info(entry_json)
-
-        # Log to integrity file (hash + JSON)
-        self.integrity_handler.emit(
-            logging.LogRecord(
-                name='audit_integrity',
-                level=logging.INFO,
-                pathname='',
-                lineno=0,
-                msg=integrity_entry,
-                args=(),
-                exc_info=None
-            )
-        )
-
-        # Update last hash for chain
-        self._last_hash = current_hash
-
-        # Also log to structlog for integration with existing logging
-        self.struct_logger.info(
-            "audit_event",
+        struct_fields = dict(
             event_type=event_type.value,
             user_id=user_id,
             resource=resource,
@@ -291,45 +347,243 @@ class AuditLogger:
             **(details or {})
         )
 
-    def verify_integrity(self) -> bool:
+        # Encoding, hashing and I/O happen in the writer
+        item = (entry, struct_fields, time.perf_counter())
+        if self._writer is None:
+            self._write_batch([item])
+            return
+        self._queue.put(item)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
         """
-        Verify the integrity of audit logs using hash chain.
+        Wait until every event logged so far has been written.
 
         Returns:
-            True if logs are intact, False if tampering detected
+            True if the writer caught up within the timeout
         """
-        if not self.integrity_log_path.exists():
+        if self._writer is None or not self._writer.is_alive():
             return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self) -> None:
+        """Write pending events, stop the writer and close the files."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(None)
+            self._writer.join()
+        with self._write_lock:
+            self._fsync(force=True)
+            self._audit_file.close()
+            self._integrity_file.close()
+
+    def get_writer_stats(self) -> Dict[str, Any]:
+        """Writer throughput and lag counters."""
+        with self._write_lock:
+            stats = dict(self._stats)
+        batches = stats["batches"]
+        return {
+            **stats,
+            "queue_depth": self._queue.qsize(),
+            "avg_batch_size": stats["events_written"] / batches if batches else 0.0,
+            "async": self._writer is not None,
+            "fsync_policy": self.fsync_policy,
+        }
 
-        expected_hash = "0" * 64
-
-        try:
-            with open(self.integrity_log_path, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    parts = line.split('|', 1)
-                    if len(parts) != 2:
-                        return False
+    def _handle_batch(self, batch: List[Any]) -> bool:
+        """Write a batch taken from the queue; True once the close() sentinel is seen."""
+        # Markers: flush() events and the close() sentinel
+        events = [item for item in batch if isinstance(item, tuple)]
+        if events:
+            try:
+                self._write_batch(events)
+            except Exception as e:
+                logger.error(f"Audit writer failed to write {len(events)} events: {e}")
+            AUDIT_QUEUE_DEPTH.set(self._queue.qsize())
+        for item in batch:
+            if isinstance(item, threading.Event):
+                item.set()
+        return any(item is None for item in batch)
+
+    def _write_batch(self, items: List[tuple]) -> None:
+        """Encode, chain-hash and write a batch with one write per file."""
+        entry_jsons = [json.dumps(entry, sort_keys=True, default=str) for entry, _, _ in items]
+        payload = RECORD_SEPARATOR.join(entry_jsons)
+        entry_lines = [(entry_json + "\n").encode() for entry_json in entry_jsons]
+        audit_bytes = b"".join(entry_lines)
+
+        with self._write_lock:
+            # Create hash chain for tamper-evident logging (one link per batch)
+            current_hash = hashlib.sha256((self._last_hash + payload).encode()).hexdigest()
+
+            self._maybe_rotate(len(audit_bytes))
+            offset = self._audit_file.tell()
+            self._audit_file.write(audit_bytes)
+            self._integrity_file.write(f"{current_hash}|{payload}\n".encode())
+            self._audit_file.flush()
+            self._integrity_file.flush()
+            self._fsync()
+
+            # Update last hash for chain
+            self._last_hash = current_hash
+
+            for (entry, _, _), line in zip(items, entry_lines):
+                self._active_index.add(entry, offset)
+                offset += len(line)
+
+            lag = time.perf_counter() - items[0][2]
+            self._stats["events_written"] += len(items)
+            self._stats["batches"] += 1
+            self._stats["max_lag_s"] = max(self._stats["max_lag_s"], lag)
+
+        AUDIT_EVENTS_WRITTEN_TOTAL.inc(len(items))
+        AUDIT_BATCH_SIZE.observe(len(items))
+        AUDIT_QUEUE_LAG.observe(lag)
 
-                    stored_hash, entry_json = parts
+        # Also log to structlog for integration with existing logging
+        for _, struct_fields, _ in items:
+            self.struct_logger.info("audit_event", **struct_fields)
+
+    def _fsync(self, force: bool = False) -> None:
+        if self.fsync_policy == "never" and not force:
+            return
+        now = time.monotonic()
+        if force or self.fsync_policy == "batch" or now - self._last_fsync >= self.fsync_interval_s:
+            for f in (self._audit_file, self._integrity_file):
+                if not f.closed:
+                    os.fsync(f.fileno())
+            self._last_fsync = now
+
+    def _maybe_rotate(self, incoming: int) -> None:
+        """Size-based rotation of audit.log (audit.log.1 is the newest backup)."""
+        if self.max_bytes <= 0:
+            return
+        size = self._audit_file.tell()
+        if size == 0 or size + incoming <= self.max_bytes:
+            return
+        self._audit_file.close()
+        if self.backup_count > 0:
+            for i in range(self.backup_count - 1, 0, -1):
+                src = self.log_dir / f"audit.log.{i}"
+                if src.exists():
+                    dst = self.log_dir / f"audit.log.{i + 1}"
+                    os.replace(src, dst)
+                    if index_path(src).exists():
+                        os.replace(index_path(src), index_path(dst))
+            rotated = self.log_dir / "audit.log.1"
+            os.replace(self.audit_log_path, rotated)
+            self._active_index.save(index_path(rotated))
+        else:
+            self.audit_log_path.unlink()
+        self._audit_file = open(self.audit_log_path, 'ab')
+        self._active_index = SegmentIndex()
+        self._seal_integrity_segment()
+
+    def _seal_integrity_segment(self) -> None:
+        """Checkpoint the integrity log written since the previous rotation."""
+        end = self._integrity_file.tell()
+        if self._checkpoints:
+            start, start_hash = self._checkpoints[-1].end, self._checkpoints[-1].end_hash
+        else:
+            start, start_hash = 0, GENESIS_HASH
+        if end == start:
+            return
+        checkpoint = Checkpoint(
+            segment=len(self._checkpoints), start=start, end=end,
+            start_hash=start_hash, end_hash=self._last_hash,
+        )
+        append_checkpoint(self.checkpoints_path, checkpoint)
+        self._checkpoints.append(checkpoint)
 
-                    # Verify hash chain
-                    hash_input = expected_hash + entry_json
-                    calculated_hash = hashlib.sha256(hash_input.encode()).hexdigest()
+    def verify_integrity(self, resume: bool = False) -> bool:
+        """
+        Verify the integrity of audit logs using hash chain.
 
-                    if calculated_hash != stored_hash:
-                        return False
+        Each line links one write batch (see module docstring). Sealed
+        segments are verified in parallel against their checkpoints; the
+        unsealed tail is verified from the last checkpoint's hash.
 
-                    expected_hash = stored_hash
+        Args:
+            resume: Skip sealed segments that verified on an earlier call
+                (their checkpoint hashes are still checked for continuity)
 
+        Returns:
+            True if logs are intact, False if tampering detected
+        """
+        self.flush()
+        if not self.integrity_log_path.exists():
             return True
 
-        except Exception:
+        with self._write_lock:
+            checkpoints = list(self._checkpoints)
+            tail_end = self._integrity_file.tell() if not self._integrity_file.closed else None
+        if not checkpoints_are_contiguous(checkpoints, GENESIS_HASH):
+            return False
+
+        verified = self._load_verified_segment(checkpoints) if resume else -1
+        pending = checkpoints[verified + 1:]
+        results = self._verify_segments(pending)
+
+        # Record progress up to the first failure so the next resume starts there
+        for checkpoint, intact in zip(pending, results):
+            if not intact:
+                break
+            verified = checkpoint.segment
+        if resume or verified >= 0:
+            self._save_verified_segment(checkpoints, verified)
+        if not all(results):
             return False
 
+        # Unsealed tail since the last rotation
+        tail_start, tail_hash = (
+            (checkpoints[-1].end, checkpoints[-1].end_hash) if checkpoints else (0, GENESIS_HASH)
+        )
+        intact, _ = verify_segment(str(self.integrity_log_path), tail_start, tail_end, tail_hash)
+        return intact
+
+    def _verify_segments(self, checkpoints: List[Checkpoint]) -> List[bool]:
+        args = [
+            (str(self.integrity_log_path), cp.start, cp.end, cp.start_hash, cp.end_hash)
+            for cp in checkpoints
+        ]
+        pending_bytes = sum(cp.end - cp.start for cp in checkpoints)
+        if (len(args) < 2 or self.verify_workers == 0
+                or (self.verify_workers is None and pending_bytes < PARALLEL_VERIFY_MIN_BYTES)):
+            return [verify_segment(*a)[0] for a in args]
+
+        workers = min(len(args), self.verify_workers or os.cpu_count() or 1)
+        # spawn: forking would copy the writer thread's held locks
+        with ProcessPoolExecutor(workers, mp_context=multiprocessing.get_context("spawn")) as pool:
+            return [intact for intact, _ in pool.map(verify_segment, *zip(*args))]
+
+    def _load_verified_segment(self, checkpoints: List[Checkpoint]) -> int:
+        """Last segment recorded as verified, if its checkpoint is unchanged."""
+        try:
+            with open(self.verified_path) as f:
+                state = json.load(f)
+            segment = state["segment"]
+            if 0 <= segment < len(checkpoints) and checkpoints[segment].end_hash == state["end_hash"]:
+                return segment
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+        return -1
+
+    def _save_verified_segment(self, checkpoints: List[Checkpoint], segment: int) -> None:
+        state = {
+            "segment": segment,
+            "end_hash": checkpoints[segment].end_hash if segment >= 0 else GENESIS_HASH,
+        }
+        tmp_path = self.verified_path.with_name(self.verified_path.name + ".tmp")
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.verified_path)
+        except OSError as e:
+            logger.warning(f"Could not record audit verification progress: {e}")
+
     def query_audit_logs(
         self,
         start_time: Optional[datetime] = None,
@@ -355,53 +609,111 @@ class AuditLogger:
         Returns:
             List of matching audit entries
         """
+        self.flush()
         results = []
 
         # Check all audit log files (including rotated ones)
         log_files = [self.audit_log_path]
-        for i in range(1, self.audit_handler.backupCount + 1):
+        for i in range(1, self.backup_count + 1):
             backup_file = self.log_dir / f"audit.log.{i}"
             if backup_file.exists():
                 log_files.append(backup_file)
 
         for log_file in log_files:
             try:
-                with open(log_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line:
-                            continue
+                f, offsets = self._open_segment(
+                    log_file, start_time, end_time,
+                    event_type=event_type.value if event_type else None,
+                    user_id=user_id,
+                )
+            except FileNotFoundError:
+                continue
+            if f is None:
+                continue
+
+            with f:
+                # Seek straight to indexed matches, or scan the segment
+                lines = iter(f) if offsets is None else read_lines_at(f, offsets)
+                for line in lines:
+                    line = line.strip()
+                    if not line:
+                        continue
+
+                    try:
+                        entry = json.loads(line)
 
-                        try:
-                            entry = json.loads(line)
-
-                            # Apply filters
-                            if start_time and datetime.fromisoformat(entry['timestamp'][:-1]) < start_time:
-                                continue
-                            if end_time and datetime.fromisoformat(entry['timestamp'][:-1]) > end_time:
-                                continue
-                            if event_type and entry.get('event_type') != event_type.value:
-                                continue
-                            if user_id and entry.get('user_id') != user_id:
-                                continue
-                            if resource and entry.get('resource') != resource:
-                                continue
-                            if status and entry.get('status') != status:
-                                continue
-
-                            results.append(entry)
-
-                            if len(results) >= limit:
-                                return results
-
-                        except json.JSONDecodeError:
+                        # Apply filters
+                        if start_time and datetime.fromisoformat(entry['timestamp'][:-1]) < start_time:
+                            continue
+                        if end_time and datetime.fromisoformat(entry['timestamp'][:-1]) > end_time:
+                            continue
+                        if event_type and entry.get('event_type') != event_type.value:
+                            continue
+                        if user_id and entry.get('user_id') != user_id:
+                            continue
+                        if resource and entry.get('resource') != resource:
+                            continue
+                        if status and entry.get('status') != status:
                             continue
 
-            except FileNotFoundError:
-                continue
+                        results.append(entry)
+
+                        if len(results) >= limit:
+                            return results
+
+                    except json.JSONDecodeError:
+                        continue
 
         return results
 
+    def _open_segment(
+        self,
+        log_file: Path,
+        start_time: Optional[datetime],
+        end_time: Optional[datetime],
+        **filters: Optional[str]
+    ):
+        """
+        Open a segment and look up candidate line offsets in its index.
+
+        The active segment is opened under the write lock so its in-memory
+        index matches the opened file even if it rotates right after.
+        Rotated segments use their .idx sidecar, built on first use for
+        segments written before indexing.
+
+        Returns:
+            (file, offsets): file is None when the segment is outside the
+            time range; offsets is None when every line must be scanned
+        """
+        if log_file == self.audit_log_path:
+            with self._write_lock:
+                index = self._active_index
+                if not index.overlaps(start_time, end_time):
+                    return None, None
+                return open(log_file, 'rb'), index.candidates(**filters)
+
+        index = self._rotated_index(log_file)
+        if not index.overlaps(start_time, end_time):
+            return None, None
+        return open(log_file, 'rb'), index.candidates(**filters)
+
+    def _rotated_index(self, log_file: Path) -> SegmentIndex:
+        stat = log_file.stat()
+        signature = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+        cached = self._index_cache.get(log_file)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        index = SegmentIndex.load(index_path(log_file))
+        if index is None:
+            index = SegmentIndex.build(log_file)
+            try:
+                index.save(index_path(log_file))
+            except OSError as e:
+                logger.warning(f"Could not write audit index for {log_file}: {e}")
+        self._index_cache[log_file] = (signature, index)
+        return index
+
     def get_audit_stats(self) -> Dict[str, Any]:
         """
         Get audit log statistics.
@@ -409,6 +721,7 @@ class AuditLogger:
         Returns:
             Dictionary with audit statistics
         """
+        self.flush()
         total_entries = 0
         event_counts = {}
         user_counts = {}
@@ -449,12 +762,41 @@ class AuditLogger:
             "total_entries": total_entries,
             "event_type_counts": event_counts,
             "unique_users": len(user_counts),
-            "integrity_verified": self.verify_integrity(),
+            "integrity_verified": self.verify_integrity(resume=True),
             "log_file_size": self.audit_log_path.stat().st_size if self.audit_log_path.exists() else 0,
-            "recent_entries": recent_entries[-5:]  # Last 5 entries
+            "recent_entries": recent_entries[-5:],  # Last 5 entries
+            "writer": self.get_writer_stats()
         }
 
 
+def _run_writer(ref: "weakref.ref[AuditLogger]", events: "queue.SimpleQueue", max_batch_size: int) -> None:
+    """Writer thread: drain the queue in batches while the logger is alive."""
+    while True:
+        batch = [events.get()]
+        while len(batch) < max_batch_size:
+            try:
+                batch.append(events.get_nowait())
+            except queue.Empty:
+                break
+
+        audit_logger = ref()
+        if audit_logger is None:
+            return
+        if audit_logger._handle_batch(batch):
+            return
+        del audit_logger
+
+
+# Loggers with a writer thread, closed (pending events written) at exit
+_async_loggers: "weakref.WeakSet[AuditLogger]" = weakref.WeakSet()
+
+
+@atexit.register
+def _close_async_loggers() -> None:
+    for audit_logger in list(_async_loggers):
+        audit_logger.close()
+
+
 # Global audit logger instance
 _audit_logger = None
 
@@ -91,6 +91,13 @@ ANOMALY_DETECTION_LATENCY = Histogram(
     registry=REGISTRY
 )
 
+ANOMALY_DETECTION_BATCH_SIZE = Histogram(
+    'astraguard_anomaly_detection_batch_size',
+    'Number of telemetry points scored per batch detection call',
+    buckets=(1, 10, 50, 100, 250, 500, 1000, 5000),
+    registry=REGISTRY
+)
+
 ANOMALY_MODEL_LOAD_ERRORS_TOTAL = Counter(
     'astraguard_anomaly_model_load_errors_total',
     'Total model loading failures',
@@ -135,6 +142,32 @@ PREDICTIVE_MAINTENANCE_MODEL_TRAINING_DURATION = Histogram(
     registry=REGISTRY
 )
 
+PREDICTIVE_MAINTENANCE_MODEL_AGE = Gauge(
+    'astraguard_predictive_maintenance_model_age_seconds',
+    'Seconds since the active predictive maintenance models were trained',
+    registry=REGISTRY
+)
+
+PREDICTIVE_MAINTENANCE_MODEL_VERSION = Gauge(
+    'astraguard_predictive_maintenance_model_version',
+    'Version of the active predictive maintenance model set',
+    registry=REGISTRY
+)
+
+PREDICTIVE_MAINTENANCE_MODEL_SWAPS_TOTAL = Counter(
+    'astraguard_predictive_maintenance_model_swaps_total',
+    'Retrained model sets swapped in or rejected by holdout validation',
+    ['result'],  # swapped, rejected
+    registry=REGISTRY
+)
+
+PREDICTIVE_MAINTENANCE_INFERENCE_LATENCY = Histogram(
+    'astraguard_predictive_maintenance_inference_latency_seconds',
+    'Latency of one batched inference pass over all failure-type models',
+    ['batch_size'],  # power-of-two bucket: '1', '2', '4', ... '256'
+    registry=REGISTRY
+)
+
 PREDICTIVE_MAINTENANCE_DATA_POINTS_TOTAL = Gauge(
     'astraguard_predictive_maintenance_data_points_total',
     'Total data points available for training',
@@ -232,6 +265,61 @@ MTTR_SECONDS = Histogram(
     registry=REGISTRY
 )
 
+# ============================================================================
+# Telemetry Ingest Pipeline Metrics
+# ============================================================================
+
+INGEST_QUEUE_DEPTH = Gauge(
+    'astraguard_ingest_queue_depth',
+    'Items waiting in each ingest pipeline queue',
+    ['stage'],  # 'detect', 'predictive', 'persist'
+    registry=REGISTRY
+)
+
+INGEST_STAGE_LATENCY = Histogram(
+    'astraguard_ingest_stage_latency_seconds',
+    'Latency of each ingest pipeline stage per micro-batch',
+    ['stage'],  # 'queue_wait', 'detect', 'predictive', 'persist'
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+    registry=REGISTRY
+)
+
+INGEST_REJECTED_TOTAL = Counter(
+    'astraguard_ingest_rejected_total',
+    'Telemetry points rejected because the ingest queue was full',
+    registry=REGISTRY
+)
+
+# ============================================================================
+# Audit Logging Metrics
+# ============================================================================
+
+AUDIT_EVENTS_WRITTEN_TOTAL = Counter(
+    'astraguard_audit_events_written_total',
+    'Audit events written by the background audit writer',
+    registry=REGISTRY
+)
+
+AUDIT_QUEUE_DEPTH = Gauge(
+    'astraguard_audit_queue_depth',
+    'Audit events enqueued but not yet written',
+    registry=REGISTRY
+)
+
+AUDIT_QUEUE_LAG = Histogram(
+    'astraguard_audit_queue_lag_seconds',
+    'Time from log_event() to the batch containing the event being written',
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+    registry=REGISTRY
+)
+
+AUDIT_BATCH_SIZE = Histogram(
+    'astraguard_audit_batch_size',
+    'Audit events per write batch',
+    buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256, 512),
+    registry=REGISTRY
+)
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
@@ -0,0 +1,296 @@
+"""
+Columnar Persistence for the Adaptive Memory Store
+
+Append-only on-disk layout used by AdaptiveMemoryStore(persistence="columnar"):
+
+    manifest.json     committed row count, dimension and metadata log size
+    vectors.f32       normalized embeddings, row-major float32
+    norms.f32         embedding norms (vectors * norms restores the original)
+    timestamps.f64    POSIX timestamps
+    recurrence.f64    recurrence counts (rewritten in place when they change)
+    critical.u8       critical flags
+    meta_offsets.i64  byte offset of each row's latest metadata record
+    metadata.log      JSON lines: {"row", "timestamp", "metadata"}
+
+Saves append new rows and rewrite only the fixed-width cells of changed
+rows. The manifest is replaced last, so a save interrupted half-way leaves
+the previous state readable. Loads memory-map the columns copy-on-write and
+materialize MemoryEvent objects only when they are first accessed.
+"""
+
+import json
+import os
+import shutil
+import threading
+from datetime import datetime
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from memory_engine.vector_index import EmbeddingMatrix
+
+FORMAT_VERSION = 1
+MANIFEST_FILE = "manifest.json"
+METADATA_LOG = "metadata.log"
+OFFSETS_FILE = "meta_offsets.i64"
+
+# Column name -> (file name, dtype); order matches EmbeddingMatrix.from_columns()
+COLUMNS = {
+    "vectors": ("vectors.f32", np.float32),
+    "norms": ("norms.f32", np.float32),
+    "timestamps": ("timestamps.f64", np.float64),
+    "recurrence": ("recurrence.f64", np.float64),
+    "critical": ("critical.u8", np.bool_),
+}
+
+
+def _json_default(value: Any) -> Any:
+    """Encode metadata values json cannot handle natively."""
+    if isinstance(value, datetime):
+        return {"__datetime__": value.isoformat()}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def _json_object_hook(obj: dict) -> Any:
+    if len(obj) == 1 and "__datetime__" in obj:
+        return datetime.fromisoformat(obj["__datetime__"])
+    return obj
+
+
+def encode_record(row: int, timestamp: datetime, metadata: dict) -> bytes:
+    """Encode one metadata log line."""
+    record = {"row": row, "timestamp": timestamp.isoformat(), "metadata": metadata}
+    return (json.dumps(record, default=_json_default) + "\n").encode("utf-8")
+
+
+def decode_record(line: bytes) -> Tuple[datetime, dict]:
+    """Decode a metadata log line into (timestamp, metadata)."""
+    record = json.loads(line, object_hook=_json_object_hook)
+    return datetime.fromisoformat(record["timestamp"]), record["metadata"]
+
+
+class LazyEventList:
+    """
+    List-like view of persisted events that materializes each one on first access.
+
+    Supports the list operations AdaptiveMemoryStore and its callers use:
+    len(), indexing, iteration and append().
+    """
+
+    def __init__(self, size: int, loader: Callable[[int], Any]):
+        self._items: List[Optional[Any]] = [None] * size
+        self._loader = loader
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self._items)))]
+        item = self._items[index]
+        if item is None:
+            with self._lock:
+                item = self._items[index]
+                if item is None:
+                    item = self._loader(index % len(self._items))
+                    self._items[index] = item
+        return item
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self._items)):
+            yield self[i]
+
+    def append(self, item: Any) -> None:
+        self._items.append(item)
+
+    def is_loaded(self, index: int) -> bool:
+        """Whether the item at index has been materialized."""
+        return self._items[index] is not None
+
+
+class ColumnarPersistence:
+    """Reads and writes the columnar memory store layout in one directory."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._log_handle = None
+
+    def exists(self) -> bool:
+        return os.path.exists(self._path(MANIFEST_FILE))
+
+    def read_manifest(self) -> dict:
+        with open(self._path(MANIFEST_FILE), "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+        if manifest.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported memory store format version: {manifest.get('version')}")
+        return manifest
+
+    def write_full(self, matrix: EmbeddingMatrix, events: Iterable[Any]) -> None:
+        """
+        Rewrite the whole store into a fresh directory and swap it in.
+
+        Used for the first save and after pruning, which renumbers rows.
+        """
+        events = list(events)  # Materialize lazily loaded events before swapping files
+        self.close()
+
+        staging = self.directory + ".tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+
+        columns = self._columns(matrix)
+        for name, (filename, dtype) in COLUMNS.items():
+            np.ascontiguousarray(columns[name], dtype=dtype).tofile(os.path.join(staging, filename))
+
+        offsets = np.empty(len(events), dtype=np.int64)
+        log_bytes = 0
+        with open(os.path.join(staging, METADATA_LOG), "wb") as log:
+            for row, event in enumerate(events):
+                line = encode_record(row, event.timestamp, event.metadata)
+                offsets[row] = log_bytes
+                log.write(line)
+                log_bytes += len(line)
+        offsets.tofile(os.path.join(staging, OFFSETS_FILE))
+        self._write_manifest(staging, len(events), matrix.dim, log_bytes)
+
+        previous = self.directory + ".old"
+        shutil.rmtree(previous, ignore_errors=True)
+        if os.path.exists(self.directory):
+            os.rename(self.directory, previous)
+        os.rename(staging, self.directory)
+        shutil.rmtree(previous, ignore_errors=True)
+
+    def append(self, matrix: EmbeddingMatrix, events: Any, start_row: int, dirty_rows: Iterable[int]) -> None:
+        """
+        Persist rows [start_row:] and the changed cells of already persisted rows.
+
+        Args:
+            matrix: Store embedding matrix (rows aligned with events)
+            events: Store event list
+            start_row: Number of rows already on disk
+            dirty_rows: Persisted rows whose recurrence/metadata changed
+        """
+        manifest = self.read_manifest()
+        if manifest["rows"] != start_row:
+            raise ValueError("Persisted row count does not match the store; a full save is required")
+
+        size = len(matrix)
+        columns = self._columns(matrix)
+        for name, (filename, dtype) in COLUMNS.items():
+            itemsize = np.dtype(dtype).itemsize * (matrix.dim if name == "vectors" else 1)
+            new_rows = np.ascontiguousarray(columns[name][start_row:size], dtype=dtype)
+            self._append_bytes(self._path(filename), start_row * itemsize, new_rows.tobytes())
+
+        dirty = sorted(row for row in set(dirty_rows) if row < start_row)
+        log_bytes = manifest["log_bytes"]
+        lines = []
+        offsets = np.empty(size - start_row, dtype=np.int64)
+        dirty_offsets = np.empty(len(dirty), dtype=np.int64)
+        for i, row in enumerate(dirty):
+            event = events[row]
+            lines.append(encode_record(row, event.timestamp, event.metadata))
+            dirty_offsets[i] = log_bytes
+            log_bytes += len(lines[-1])
+        for row in range(start_row, size):
+            event = events[row]
+            lines.append(encode_record(row, event.timestamp, event.metadata))
+            offsets[row - start_row] = log_bytes
+            log_bytes += len(lines[-1])
+
+        self._append_bytes(self._path(METADATA_LOG), manifest["log_bytes"], b"".join(lines))
+        self._append_bytes(self._path(OFFSETS_FILE), start_row * 8, offsets.tobytes())
+
+        if dirty:
+            # Fixed-width cells of changed rows are rewritten in place
+            rows = np.asarray(dirty, dtype=np.int64)
+            recurrence = np.memmap(self._path(COLUMNS["recurrence"][0]), dtype=np.float64, mode="r+")
+            recurrence[rows] = matrix.recurrence[rows]
+            recurrence.flush()
+            del recurrence
+            meta_offsets = np.memmap(self._path(OFFSETS_FILE), dtype=np.int64, mode="r+")
+            meta_offsets[rows] = dirty_offsets
+            meta_offsets.flush()
+            del meta_offsets
+
+        self._write_manifest(self.directory, size, matrix.dim, log_bytes)
+
+    def load(self, event_factory: Callable[..., Any]) -> Tuple[EmbeddingMatrix, LazyEventList]:
+        """
+        Memory-map the columns and return a matrix plus lazily loaded events.
+
+        Args:
+            event_factory: Called as event_factory(embedding, metadata, timestamp,
+                recurrence_count) to build one event
+
+        Returns:
+            Tuple of (EmbeddingMatrix, LazyEventList)
+        """
+        self.close()
+        manifest = self.read_manifest()
+        rows, dim = manifest["rows"], manifest["dim"]
+        if rows == 0:
+            return EmbeddingMatrix(), LazyEventList(0, event_factory)
+
+        columns = {}
+        for name, (filename, dtype) in COLUMNS.items():
+            shape = (rows, dim) if name == "vectors" else (rows,)
+            columns[name] = np.memmap(self._path(filename), dtype=dtype, mode="c", shape=shape)
+        offsets = np.memmap(self._path(OFFSETS_FILE), dtype=np.int64, mode="r", shape=(rows,))
+        matrix = EmbeddingMatrix.from_columns(**columns)
+
+        log = open(self._path(METADATA_LOG), "rb")
+        self._log_handle = log
+        vectors, norms, recurrence = columns["vectors"], columns["norms"], columns["recurrence"]
+
+        def load_event(row: int) -> Any:
+            log.seek(int(offsets[row]))
+            timestamp, metadata = decode_record(log.readline())
+            embedding = np.asarray(vectors[row]) * norms[row]
+            return event_factory(embedding, metadata, timestamp, int(recurrence[row]))
+
+        return matrix, LazyEventList(rows, load_event)
+
+    def close(self) -> None:
+        """Close the metadata log handle held for lazy loading."""
+        if self._log_handle is not None:
+            self._log_handle.close()
+            self._log_handle = None
+
+    # Private helper methods
+
+    def _path(self, filename: str) -> str:
+        return os.path.join(self.directory, filename)
+
+    @staticmethod
+    def _columns(matrix: EmbeddingMatrix) -> dict:
+        vectors = matrix.vectors if matrix.dim is not None else np.empty((0, 0), dtype=np.float32)
+        return {
+            "vectors": vectors,
+            "norms": matrix.norms,
+            "timestamps": matrix.timestamps,
+            "recurrence": matrix.recurrence,
+            "critical": matrix.critical,
+        }
+
+    @staticmethod
+    def _append_bytes(path: str, committed_size: int, data: bytes) -> None:
+        """Append after the committed size, dropping bytes left by an interrupted save."""
+        with open(path, "r+b") as f:
+            f.truncate(committed_size)
+            f.seek(committed_size)
+            f.write(data)
+
+    @staticmethod
+    def _write_manifest(directory: str, rows: int, dim: Optional[int], log_bytes: int) -> None:
+        manifest = {"version": FORMAT_VERSION, "rows": rows, "dim": dim, "log_bytes": log_bytes}
+        tmp_path = os.path.join(directory, MANIFEST_FILE + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, os.path.join(directory, MANIFEST_FILE))
@@ -12,6 +12,7 @@ except ImportError:
 import math
 import threading
 import tempfile
+import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Tuple, Optional, Union, Any, TYPE_CHECKING
 import pickle
@@ -22,6 +23,10 @@ import fasteners
 if TYPE_CHECKING:
     import numpy as np
 
+if np is not None:
+    from memory_engine.columnar_persistence import ColumnarPersistence
+    from memory_engine.vector_index import EmbeddingMatrix, RandomProjectionLSH, normalize, split_norm
+
 # Import timeout and resource monitoring decorators
 from core.timeout_handler import with_timeout
 from core.resource_monitor import monitor_operation_resources
@@ -53,6 +58,17 @@ RECURRENCE_BOOST_FACTOR = 0.3
 # Numerical stability constant
 EPSILON = 1e-10
 
+# Approximate (LSH) index: below this many events an exact scan is faster
+ANN_MIN_EVENTS = 2048
+
+# Persistence formats: "pickle" dumps the event list, "columnar" appends
+# to memory-mapped column files (see columnar_persistence.py)
+PERSISTENCE_FORMATS = ("pickle", "columnar")
+DEFAULT_STORAGE_PATHS = {
+    "pickle": "memory_engine/memory_store.pkl",
+    "columnar": "memory_engine/memory_store",
+}
+
 
 class MemoryEvent:
     """Represents a stored memory event."""
@@ -79,28 +95,67 @@ class AdaptiveMemoryStore:
     - Recurrence scoring: repeated patterns reinforced
     - Safe decay: critical events never deleted
     - Clean interfaces: write, retrieve, prune, replay
+
+    Embeddings are mirrored into a contiguous float32 matrix of normalized
+    rows, so similarity search is one matrix-vector product and temporal
+    decay / recurrence boosts are computed as vectorized weights.
     """
 
-    def __init__(self, decay_lambda: float = DEFAULT_DECAY_LAMBDA, max_capacity: int = DEFAULT_MAX_CAPACITY):
+    def __init__(
+        self,
+        decay_lambda: float = DEFAULT_DECAY_LAMBDA,
+        max_capacity: int = DEFAULT_MAX_CAPACITY,
+        ann_index: bool = False,
+        persistence: str = "pickle",
+    ):
         """
         Initialize adaptive memory store.
 
         Args:
             decay_lambda: Decay rate for temporal weighting (default: 0.1)
             max_capacity: Maximum number of events to store
+            ann_index: Use an approximate random-projection LSH index for
+                similarity lookups once ANN_MIN_EVENTS events are stored
+            persistence: "pickle" (default) or "columnar" for incremental,
+                memory-mapped saves and lazy loads; storage_path is then a directory
 
         Raises:
-            ValueError: If decay_lambda is negative or max_capacity is not positive
+            ValueError: If decay_lambda is negative, max_capacity is not positive
+                or persistence is unknown
         """
         if decay_lambda < 0:
             raise ValueError("decay_lambda must be non-negative")
         if max_capacity <= 0:
             raise ValueError("max_capacity must be positive")
+        if persistence not in PERSISTENCE_FORMATS:
+            raise ValueError(f"persistence must be one of {PERSISTENCE_FORMATS}")
+        if persistence == "columnar" and np is None:
+            raise ImportError("numpy is required for columnar persistence")
         self.decay_lambda = decay_lambda
         self.max_capacity = max_capacity
-        self.memory: List[MemoryEvent] = []
-        self.storage_path = "memory_engine/memory_store.pkl"
+        self.ann_index = ann_index and np is not None
+        self.persistence = persistence
+        self.storage_path = DEFAULT_STORAGE_PATHS[persistence]
         self._lock = threading.RLock()  # Reentrant lock for thread safety
+        self._matrix: Optional["EmbeddingMatrix"] = EmbeddingMatrix() if np is not None else None
+        self._lsh: Optional["RandomProjectionLSH"] = None
+        # Columnar persistence state: rows on disk and rows changed since the last save
+        self._columnar: Optional["ColumnarPersistence"] = None
+        self._persisted_rows: Optional[int] = None
+        self._dirty_rows: set = set()
+        self.memory = []
+
+    @property
+    def memory(self) -> List[MemoryEvent]:
+        """Stored events in insertion order (do not mutate in place)."""
+        return self._events
+
+    @memory.setter
+    def memory(self, events: List[MemoryEvent]) -> None:
+        with self._lock:
+            self._events: List[MemoryEvent] = list(events)
+            self._rebuild_index()
+            self._persisted_rows = None
 
     @with_timeout(seconds=3.0, operation_name="memory_write")
     def write(
@@ -127,22 +182,60 @@ class AdaptiveMemoryStore:
         if timestamp is None:
             timestamp = datetime.now()
 
-        # Check for similar existing events (recurrence)
-        similar = self._find_similar(embedding, threshold=0.85)
-
-        if similar:
-            # Boost recurrence count for existing event
-            similar.recurrence_count += 1
-            similar.metadata["last_seen"] = timestamp
-        else:
-            # Add new event
-            event = MemoryEvent(embedding, metadata, timestamp)
-            self.memory.append(event)
+        with self._lock:
+            self._record(embedding, metadata, timestamp)
 
         # Auto-prune if capacity exceeded
         if len(self.memory) > self.max_capacity:
             self.prune(keep_critical=True)
 
+    @with_timeout(seconds=10.0, operation_name="memory_write_batch")
+    def write_batch(
+        self,
+        embeddings: Union[List[List[float]], "np.ndarray"],
+        metadatas: List[Dict],
+        timestamps: Optional[List[datetime]] = None,
+    ) -> int:
+        """
+        Store many events under a single lock acquisition.
+
+        Recurrence handling matches write(); capacity pruning runs once
+        after the whole batch instead of after every insert.
+
+        Args:
+            embeddings: Sequence (or 2-D array) of event vectors
+            metadatas: One metadata dict per embedding
+            timestamps: Optional per-event timestamps (defaults to now)
+
+        Returns:
+            Number of events written (new or recurrence-boosted)
+
+        Raises:
+            ValueError: If the input lengths do not match
+        """
+        if len(embeddings) != len(metadatas):
+            raise ValueError("embeddings and metadatas must have the same length")
+        if timestamps is not None and len(timestamps) != len(embeddings):
+            raise ValueError("timestamps must match the number of embeddings")
+        if len(embeddings) == 0:
+            return 0
+
+        now = datetime.now()
+        with self._lock:
+            for i, (embedding, metadata) in enumerate(zip(embeddings, metadatas)):
+                if embedding is None or len(embedding) == 0:
+                    raise ValueError("Embedding cannot be empty")
+                if not isinstance(metadata, dict):
+                    raise ValueError("Metadata must be a dictionary")
+                timestamp = timestamps[i] if timestamps is not None and timestamps[i] else now
+                self._record(embedding, metadata, timestamp)
+
+        # prune() runs on its own timeout thread and takes the lock itself
+        if len(self.memory) > self.max_capacity:
+            self.prune(keep_critical=True)
+
+        return len(embeddings)
+
     @with_timeout(seconds=5.0, operation_name="memory_retrieve")
     def retrieve(
         self, query_embedding: Union[List[float], "np.ndarray"], top_k: int = DEFAULT_TOP_K
@@ -168,30 +261,36 @@ class AdaptiveMemoryStore:
         with self._lock:
             if not self.memory:
                 return []
-
-            scores = []
-            for event in self.memory:
-                # Calculate similarity
-                similarity = self._cosine_similarity(query_embedding, event.embedding)
-
-                # Apply temporal weighting
-                temporal_weight = self._temporal_weight(event)
-
-                # Apply recurrence boost
-                recurrence_boost = 1 + RECURRENCE_BOOST_FACTOR * (np.log(1 + event.recurrence_count) if np is not None else math.log(1 + event.recurrence_count))
-
-                # Combined weighted score
-                weighted_score = (
-                    SIMILARITY_WEIGHT * similarity +
-                    TEMPORAL_WEIGHT * temporal_weight +
-                    RECURRENCE_WEIGHT * recurrence_boost
-                )
-
-                scores.append((weighted_score, event.metadata, event.timestamp))
-
-            # Sort by weighted score and return top_k
-            scores.sort(reverse=True, key=lambda x: x[0])
-            return scores[:top_k]
+            if self._matrix is None:
+                return self._retrieve_scan(query_embedding, top_k)
+
+            unit = normalize(query_embedding)
+            rows = self._candidate_rows(unit)
+            if rows is not None and rows.size < top_k:
+                rows = None  # Too few approximate candidates, score everything
+
+            similarity = self._matrix.similarities(unit, rows).astype(np.float64)
+            timestamps = self._matrix.timestamps if rows is None else self._matrix.timestamps[rows]
+            recurrence = self._matrix.recurrence if rows is None else self._matrix.recurrence[rows]
+
+            age_hours = (time.time() - timestamps) / 3600
+            weighted_scores = (
+                SIMILARITY_WEIGHT * similarity +
+                TEMPORAL_WEIGHT * np.exp(-self.decay_lambda * age_hours) +
+                RECURRENCE_WEIGHT * (1 + RECURRENCE_BOOST_FACTOR * np.log1p(recurrence))
+            )
+
+            # Partial selection of the top_k, then sort just those
+            k = min(top_k, weighted_scores.size)
+            top = np.argpartition(-weighted_scores, k - 1)[:k]
+            top = top[np.argsort(-weighted_scores[top], kind="stable")]
+            event_rows = top if rows is None else rows[top]
+
+            results = []
+            for score, row in zip(weighted_scores[top].tolist(), event_rows.tolist()):
+                event = self.memory[row]
+                results.append((score, event.metadata, event.timestamp))
+            return results
 
     @with_timeout(seconds=60.0)
     @monitor_operation_resources()
@@ -217,18 +316,25 @@ class AdaptiveMemoryStore:
             cutoff = datetime.now() - timedelta(hours=max_age_hours)
             initial_count = len(self.memory)
 
-            if keep_critical:
-                # Keep critical events and recent events
-                self.memory = [
+            if self._matrix is None:
+                self._events = [
                     event
-                    for event in self.memory
-                    if event.is_critical or event.timestamp > cutoff
+                    for event in self._events
+                    if (keep_critical and event.is_critical) or event.timestamp > cutoff
                 ]
-            else:
-                # Only keep recent events
-                self.memory = [event for event in self.memory if event.timestamp > cutoff]
+                return initial_count - len(self._events)
 
-            pruned_count = initial_count - len(self.memory)
+            keep = self._matrix.timestamps > cutoff.timestamp()
+            if keep_critical:
+                # Keep critical events and recent events
+                keep |= self._matrix.critical
+
+            pruned_count = initial_count - int(np.count_nonzero(keep))
+            if pruned_count:
+                self._events = [event for event, kept in zip(self._events, keep.tolist()) if kept]
+                self._matrix.filter(keep)
+                self._lsh = None
+                self._persisted_rows = None  # Rows were renumbered, next save rewrites
             return pruned_count
 
     @with_timeout(seconds=30.0)
@@ -286,8 +392,12 @@ class AdaptiveMemoryStore:
                     )
 
                 os.makedirs(os.path.dirname(resolved_path), exist_ok=True)
-                with open(resolved_path, "wb") as f:
-                    pickle.dump(self.memory, f)
+                if self.persistence == "columnar":
+                    with fasteners.InterProcessLock(resolved_path + ".lock"):
+                        self._save_columnar(resolved_path)
+                else:
+                    with open(resolved_path, "wb") as f:
+                        pickle.dump(self.memory, f)
                 logger.debug(f"Memory store saved to {resolved_path}")
             except Exception as e:
                 logger.error(f"Failed to save memory store: {e}", exc_info=True)
@@ -315,6 +425,9 @@ class AdaptiveMemoryStore:
                         f"Storage path must be within {MEMORY_STORE_BASE_DIR}, /tmp, or system temp directory"
                     )
 
+                if self.persistence == "columnar":
+                    return self._load_columnar(resolved_path)
+
                 if os.path.exists(resolved_path):
                     # Use inter-process file lock to prevent concurrent access corruption
                     lock_path = resolved_path + ".lock"
@@ -335,24 +448,162 @@ class AdaptiveMemoryStore:
 
     def get_stats(self) -> Dict:
         """Get memory statistics."""
-        if not self.memory:
+        with self._lock:
+            if not self.memory:
+                return {
+                    "total_events": 0,
+                    "critical_events": 0,
+                    "avg_age_hours": 0,
+                    "max_recurrence": 0,
+                }
+
+            if self._matrix is not None:
+                ages = (time.time() - self._matrix.timestamps) / 3600
+                return {
+                    "total_events": len(self.memory),
+                    "critical_events": int(np.count_nonzero(self._matrix.critical)),
+                    "avg_age_hours": float(ages.mean()),
+                    "max_recurrence": int(self._matrix.recurrence.max()),
+                }
+
+            ages = [event.age_seconds() / 3600 for event in self.memory]
             return {
-                "total_events": 0,
-                "critical_events": 0,
-                "avg_age_hours": 0,
-                "max_recurrence": 0,
+                "total_events": len(self.memory),
+                "critical_events": sum(1 for e in self.memory if e.is_critical),
+                "avg_age_hours": sum(ages) / len(ages),
+                "max_recurrence": max(e.recurrence_count for e in self.memory),
             }
 
-        ages = [event.age_seconds() / 3600 for event in self.memory]
+    # Private helper methods
 
-        return {
-            "total_events": len(self.memory),
-            "critical_events": sum(1 for e in self.memory if e.is_critical),
-            "avg_age_hours": np.mean(ages) if np is not None else sum(ages) / len(ages),
-            "max_recurrence": max(e.recurrence_count for e in self.memory),
-        }
+    def _record(self, embedding: Union[List[float], "np.ndarray"], metadata: Dict, timestamp: datetime) -> None:
+        """Add an event, or boost the recurrence of a similar one. Caller holds the lock."""
+        if self._matrix is None:
+            similar = self._find_similar(embedding, threshold=DEFAULT_SIMILARITY_THRESHOLD)
+            if similar:
+                similar.recurrence_count += 1
+                similar.metadata["last_seen"] = timestamp
+            else:
+                self._events.append(MemoryEvent(embedding, metadata, timestamp))
+            return
 
-    # Private helper methods
+        unit, norm = split_norm(embedding)
+        row = self._similar_row(unit, DEFAULT_SIMILARITY_THRESHOLD)
+        if row is not None:
+            # Boost recurrence count for existing event
+            similar = self._events[row]
+            similar.recurrence_count += 1
+            similar.metadata["last_seen"] = timestamp
+            self._matrix.recurrence[row] = similar.recurrence_count
+            self._dirty_rows.add(row)
+            return
+
+        event = MemoryEvent(embedding, metadata, timestamp)
+        row = self._matrix.append(
+            unit, norm, timestamp.timestamp(), event.recurrence_count, bool(event.is_critical)
+        )
+        self._events.append(event)
+        if self._lsh is not None:
+            self._lsh.add(row, unit)
+
+    def _rebuild_index(self) -> None:
+        """Rebuild the embedding matrix from the event list (LSH is rebuilt lazily)."""
+        self._lsh = None
+        self._dirty_rows.clear()
+        if self._matrix is None:
+            return
+        self._matrix.clear()
+        for event in self._events:
+            unit, norm = split_norm(event.embedding)
+            self._matrix.append(
+                unit,
+                norm,
+                event.timestamp.timestamp(),
+                event.recurrence_count,
+                bool(event.is_critical),
+            )
+
+    def _candidate_rows(self, unit: "np.ndarray") -> Optional["np.ndarray"]:
+        """Approximate candidate rows from the LSH index, or None for an exact scan."""
+        self._matrix.check_dim(unit)
+        if not self.ann_index or len(self._matrix) < ANN_MIN_EVENTS:
+            return None
+        if self._lsh is None:
+            self._lsh = RandomProjectionLSH(self._matrix.dim)
+            self._lsh.rebuild(self._matrix.vectors)
+        return self._lsh.query(unit)
+
+    def _save_columnar(self, resolved_path: str) -> None:
+        """Append new rows and changed cells, or rewrite the store when rows were renumbered."""
+        previous = self._columnar
+        if previous is None or previous.directory != resolved_path:
+            self._columnar = ColumnarPersistence(resolved_path)
+            self._persisted_rows = None
+
+        if self._persisted_rows and self._columnar.exists():
+            self._columnar.append(self._matrix, self._events, self._persisted_rows, self._dirty_rows)
+        else:
+            self._columnar.write_full(self._matrix, self._events)
+            if previous is not None and previous is not self._columnar:
+                previous.close()
+        self._persisted_rows = len(self._events)
+        self._dirty_rows.clear()
+
+    def _load_columnar(self, resolved_path: str) -> bool:
+        """Memory-map a columnar store; events are materialized on first access."""
+        persistence = ColumnarPersistence(resolved_path)
+        if not persistence.exists():
+            return False
+        with fasteners.InterProcessLock(resolved_path + ".lock"):
+            matrix, events = persistence.load(self._restore_event)
+
+        if self._columnar is not None:
+            self._columnar.close()
+        self._columnar = persistence
+        self._matrix = matrix
+        self._events = events
+        self._lsh = None
+        self._dirty_rows.clear()
+        self._persisted_rows = len(events)
+        logger.debug(f"Memory store loaded from {resolved_path} ({len(events)} events)")
+        return True
+
+    @staticmethod
+    def _restore_event(
+        embedding: "np.ndarray", metadata: Dict, timestamp: datetime, recurrence_count: int
+    ) -> MemoryEvent:
+        event = MemoryEvent(embedding, metadata, timestamp)
+        event.recurrence_count = recurrence_count
+        return event
+
+    def _similar_row(self, unit: "np.ndarray", threshold: float) -> Optional[int]:
+        """Row of the oldest event whose similarity exceeds threshold."""
+        if len(self._matrix) == 0:
+            return None
+        rows = self._candidate_rows(unit)
+        hits = np.flatnonzero(self._matrix.similarities(unit, rows) > threshold)
+        if hits.size == 0:
+            return None
+        return int(hits[0]) if rows is None else int(rows[hits[0]])
+
+    def _retrieve_scan(
+        self, query_embedding: List[float], top_k: int
+    ) -> List[Tuple[float, Dict, datetime]]:
+        """Per-event scoring used when numpy is unavailable."""
+        scores = []
+        for event in self.memory:
+            similarity = self._cosine_similarity(query_embedding, event.embedding)
+            temporal_weight = self._temporal_weight(event)
+            recurrence_boost = 1 + RECURRENCE_BOOST_FACTOR * math.log(1 + event.recurrence_count)
+            weighted_score = (
+                SIMILARITY_WEIGHT * similarity +
+                TEMPORAL_WEIGHT * temporal_weight +
+                RECURRENCE_WEIGHT * recurrence_boost
+            )
+            scores.append((weighted_score, event.metadata, event.timestamp))
+
+        scores.sort(reverse=True, key=lambda x: x[0])
+        return scores[:top_k]
 
     def _temporal_weight(self, event: MemoryEvent) -> float:
         """Calculate temporal weight using exponential decay."""
@@ -382,6 +633,9 @@ class AdaptiveMemoryStore:
         self, embedding: Union[List[float], "np.ndarray"], threshold: float = DEFAULT_SIMILARITY_THRESHOLD
     ) -> Optional[MemoryEvent]:
         """Find similar event in memory."""
+        if self._matrix is not None:
+            row = self._similar_row(normalize(embedding), threshold)
+            return None if row is None else self._events[row]
         for event in self.memory:
             if self._cosine_similarity(embedding, event.embedding) > threshold:
                 return event
@@ -0,0 +1,233 @@
+"""
+Vector Index for the Adaptive Memory Store
+
+Contiguous float32 storage of L2-normalized embeddings, so similarity
+against every stored event is a single matrix-vector product, plus an
+optional random-projection LSH index for very large stores.
+"""
+
+from collections import defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+DEFAULT_INITIAL_CAPACITY = 256
+
+# LSH defaults: 16 tables x 8 bits gives ~97% recall at cosine 0.85 while
+# scanning roughly 6% of rows for unrelated queries
+DEFAULT_LSH_BITS = 8
+DEFAULT_LSH_TABLES = 16
+
+
+def split_norm(embedding: Sequence[float]) -> Tuple[np.ndarray, float]:
+    """
+    Split an embedding into a unit-length float32 vector and its norm.
+
+    Zero vectors stay zero, so their similarity to anything is 0.0.
+    """
+    vector = np.asarray(embedding, dtype=np.float32).ravel()
+    norm = float(np.linalg.norm(vector))
+    if norm == 0.0 or not np.isfinite(norm):
+        return np.zeros_like(vector), 0.0
+    return vector / norm, norm
+
+
+def normalize(embedding: Sequence[float]) -> np.ndarray:
+    """Return the embedding as a unit-length float32 vector."""
+    return split_norm(embedding)[0]
+
+
+class EmbeddingMatrix:
+    """
+    Growable row store of normalized embeddings and per-row scoring columns.
+
+    Row i always corresponds to the i-th event of the owning store, so
+    filter() must be applied with the same mask used on the event list.
+    """
+
+    def __init__(self, initial_capacity: int = DEFAULT_INITIAL_CAPACITY):
+        self.dim: Optional[int] = None
+        self._capacity = max(1, initial_capacity)
+        self._size = 0
+        self._vectors: Optional[np.ndarray] = None
+        self._norms = np.empty(self._capacity, dtype=np.float32)
+        self._timestamps = np.empty(self._capacity, dtype=np.float64)
+        self._recurrence = np.empty(self._capacity, dtype=np.float64)
+        self._critical = np.empty(self._capacity, dtype=bool)
+
+    @classmethod
+    def from_columns(
+        cls,
+        vectors: np.ndarray,
+        norms: np.ndarray,
+        timestamps: np.ndarray,
+        recurrence: np.ndarray,
+        critical: np.ndarray,
+    ) -> "EmbeddingMatrix":
+        """
+        Wrap existing column arrays (e.g. copy-on-write memory maps) without copying.
+
+        The arrays are used at full capacity; the first append() copies them
+        into growable in-memory buffers.
+        """
+        matrix = cls(initial_capacity=len(vectors))
+        if len(vectors):
+            matrix.dim = vectors.shape[1]
+            matrix._vectors = vectors
+            matrix._norms = norms
+            matrix._timestamps = timestamps
+            matrix._recurrence = recurrence
+            matrix._critical = critical
+            matrix._size = len(vectors)
+        return matrix
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def vectors(self) -> np.ndarray:
+        """(n, dim) view of the normalized embeddings."""
+        if self._vectors is None:
+            return np.empty((0, 0), dtype=np.float32)
+        return self._vectors[: self._size]
+
+    @property
+    def norms(self) -> np.ndarray:
+        """Original embedding norms (vectors * norms restores the embeddings)."""
+        return self._norms[: self._size]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Event timestamps as POSIX seconds."""
+        return self._timestamps[: self._size]
+
+    @property
+    def recurrence(self) -> np.ndarray:
+        """Event recurrence counts."""
+        return self._recurrence[: self._size]
+
+    @property
+    def critical(self) -> np.ndarray:
+        """Critical (never pruned) flags."""
+        return self._critical[: self._size]
+
+    def check_dim(self, vector: np.ndarray) -> None:
+        """Raise ValueError if vector does not match the stored dimension."""
+        if self.dim is not None and vector.shape[0] != self.dim:
+            raise ValueError("Embeddings must have the same length for cosine similarity")
+
+    def append(
+        self, unit_vector: np.ndarray, norm: float, timestamp: float, recurrence: int, critical: bool
+    ) -> int:
+        """Append one normalized row and return its index."""
+        self.check_dim(unit_vector)
+        if self._vectors is None:
+            self.dim = unit_vector.shape[0]
+            self._vectors = np.empty((self._capacity, self.dim), dtype=np.float32)
+        if self._size == self._capacity:
+            self._grow(self._capacity * 2)
+
+        row = self._size
+        self._vectors[row] = unit_vector
+        self._norms[row] = norm
+        self._timestamps[row] = timestamp
+        self._recurrence[row] = recurrence
+        self._critical[row] = critical
+        self._size += 1
+        return row
+
+    def similarities(self, unit_query: np.ndarray, rows: Optional[np.ndarray] = None) -> np.ndarray:
+        """Cosine similarity of the query against all rows (or a subset)."""
+        if self._size == 0:
+            return np.empty(0, dtype=np.float32)
+        self.check_dim(unit_query)
+        matrix = self.vectors if rows is None else self.vectors[rows]
+        return matrix @ unit_query
+
+    def filter(self, keep: np.ndarray) -> None:
+        """Keep only rows where the boolean mask is True, preserving order."""
+        kept = int(np.count_nonzero(keep))
+        if self._vectors is not None:
+            self._vectors[:kept] = self._vectors[: self._size][keep]
+        self._norms[:kept] = self.norms[keep]
+        self._timestamps[:kept] = self.timestamps[keep]
+        self._recurrence[:kept] = self.recurrence[keep]
+        self._critical[:kept] = self.critical[keep]
+        self._size = kept
+
+    def clear(self) -> None:
+        """Drop all rows; the dimension is re-learned on the next append."""
+        self.dim = None
+        self._vectors = None
+        self._size = 0
+
+    def _grow(self, capacity: int) -> None:
+        vectors = np.empty((capacity, self.dim), dtype=np.float32)
+        vectors[: self._size] = self._vectors[: self._size]
+        self._vectors = vectors
+        for name in ("_norms", "_timestamps", "_recurrence", "_critical"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[: self._size] = old[: self._size]
+            setattr(self, name, new)
+        self._capacity = capacity
+
+
+class RandomProjectionLSH:
+    """
+    Approximate cosine index using signed random projections.
+
+    Each table hashes a vector to the sign pattern of n_bits random
+    hyperplanes; candidates are the union of the query's buckets.
+    Row ids are matrix row indices, so call rebuild() after compaction.
+    """
+
+    def __init__(
+        self,
+        dim: int,
+        n_bits: int = DEFAULT_LSH_BITS,
+        n_tables: int = DEFAULT_LSH_TABLES,
+        seed: int = 0,
+    ):
+        if n_bits <= 0 or n_bits > 62:
+            raise ValueError("n_bits must be between 1 and 62")
+        if n_tables <= 0:
+            raise ValueError("n_tables must be positive")
+        rng = np.random.default_rng(seed)
+        self.dim = dim
+        self.n_bits = n_bits
+        self.n_tables = n_tables
+        self._planes = rng.standard_normal((n_tables * n_bits, dim)).astype(np.float32)
+        self._bit_weights = np.left_shift(1, np.arange(n_bits, dtype=np.int64))
+        self._tables: List[Dict[int, List[int]]] = [defaultdict(list) for _ in range(n_tables)]
+
+    def _hash(self, vectors: np.ndarray) -> np.ndarray:
+        """Return (n_tables, m) bucket keys for an (m, dim) matrix."""
+        bits = (vectors @ self._planes.T) > 0
+        bits = bits.reshape(vectors.shape[0], self.n_tables, self.n_bits)
+        return (bits @ self._bit_weights).T
+
+    def add(self, row: int, unit_vector: np.ndarray) -> None:
+        """Index a single row."""
+        keys = self._hash(unit_vector[np.newaxis, :])[:, 0].tolist()
+        for table, key in zip(self._tables, keys):
+            table[key].append(row)
+
+    def rebuild(self, vectors: np.ndarray) -> None:
+        """Re-index every row of an (n, dim) matrix."""
+        self._tables = [defaultdict(list) for _ in range(self.n_tables)]
+        if len(vectors) == 0:
+            return
+        keys = self._hash(vectors)
+        for table, table_keys in zip(self._tables, keys):
+            for row, key in enumerate(table_keys.tolist()):
+                table[key].append(row)
+
+    def query(self, unit_vector: np.ndarray) -> np.ndarray:
+        """Return sorted candidate row ids sharing a bucket with the query."""
+        keys = self._hash(unit_vector[np.newaxis, :])[:, 0].tolist()
+        buckets = [table.get(key) for table, key in zip(self._tables, keys)]
+        buckets = [np.asarray(b, dtype=np.int64) for b in buckets if b]
+        if not buckets:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(buckets))
@@ -0,0 +1,283 @@
+"""
+Background model training for predictive maintenance.
+
+Training used to run inline in PredictiveMaintenanceEngine.train_models(),
+mutating the live models while predictions were being served. Now:
+
+- The engine packs a snapshot of its training window into a plain array
+  (TrainingDataWindow.snapshot() reuses unchanged buckets, so taking it is
+  cheap) and train_bundle() fits every failure type in a worker process.
+- The result is a ModelBundle: an immutable set of models and scalers with
+  a version number. The engine validates it against the active models on
+  the newest rows, which the active bundle was never trained on, and
+  swaps it in with a single reference assignment, so predictions always
+  see one complete bundle and never wait on training.
+- TrainingScheduler retrains periodically, or early when recent telemetry
+  drifts away from the data the active bundle was trained on.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import IsolationForest, RandomForestRegressor
+from sklearn.metrics import r2_score
+from sklearn.preprocessing import StandardScaler
+
+from security_engine.rolling_features import BASE_METRICS, ROLLING_METRICS
+
+logger = logging.getLogger(__name__)
+
+# Packed snapshot layout: timestamp (epoch seconds), base metrics, failure_occurred
+SNAPSHOT_COLUMNS = ("timestamp",) + BASE_METRICS + ("failure_occurred",)
+MIN_FEATURE_ROWS = 50  # Failure types with fewer usable rows are skipped
+HOLDOUT_FRACTION = 0.2  # Newest share of rows held out for validation
+MIN_VALIDATION_ROWS = 10  # Unseen holdout rows needed to replace an active model
+
+
+@dataclass(frozen=True)
+class ModelBundle:
+    """One trained, versioned set of models and scalers (never mutated once active)."""
+    version: int
+    models: Dict[Any, Dict[Any, Any]] = field(default_factory=dict)
+    scalers: Dict[Any, StandardScaler] = field(default_factory=dict)
+    metrics: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    trained_at: Optional[datetime] = None
+    baseline: Optional[np.ndarray] = None  # (mean, std) of ROLLING_METRICS in the training data
+    data_until: Optional[float] = None  # Newest training timestamp (epoch seconds)
+
+
+@dataclass
+class TrainedFailureModels:
+    """Worker output for one failure type, including its time-ordered holdout split."""
+    random_forest: RandomForestRegressor
+    isolation_forest: IsolationForest
+    scaler: StandardScaler
+    r2: float
+    holdout_features: np.ndarray
+    holdout_targets: np.ndarray
+    holdout_timestamps: np.ndarray  # Epoch seconds of the holdout rows
+    duration: float
+
+
+def pack_snapshot(points: Sequence) -> np.ndarray:
+    """Pack TimeSeriesData points into a float array with SNAPSHOT_COLUMNS."""
+    packed = np.empty((len(points), len(SNAPSHOT_COLUMNS)))
+    for i, p in enumerate(points):
+        packed[i] = (
+            p.timestamp.timestamp(), p.cpu_usage, p.memory_usage, p.network_latency,
+            p.disk_io, p.error_rate, p.response_time, p.active_connections,
+            p.failure_occurred,
+        )
+    return packed
+
+
+def snapshot_frame(packed: np.ndarray) -> pd.DataFrame:
+    """Training DataFrame (sorted by timestamp) from a packed snapshot."""
+    df = pd.DataFrame(packed, columns=SNAPSHOT_COLUMNS)
+    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='s')
+    df['active_connections'] = df['active_connections'].astype(int)
+    df['failure_occurred'] = df['failure_occurred'].astype(bool)
+    return df.sort_values('timestamp', kind='stable')
+
+
+def rolling_feature_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Snapshot frame plus rolling statistics, without the incomplete leading rows."""
+    df_features = df.copy()
+    for col in ROLLING_METRICS:
+        df_features[f'{col}_rolling_mean_3'] = df_features[col].rolling(window=3).mean()
+        df_features[f'{col}_rolling_std_3'] = df_features[col].rolling(window=3).std()
+        df_features[f'{col}_rolling_mean_6'] = df_features[col].rolling(window=6).mean()
+        df_features[f'{col}_rolling_std_6'] = df_features[col].rolling(window=6).std()
+
+    # Drop NaN values
+    return df_features.dropna()
+
+
+def prepare_features_and_targets(df: pd.DataFrame, target_col: str):
+    """Rolling features and targets for one target column."""
+    return _split_target(rolling_feature_frame(df), target_col)
+
+
+def _split_target(df_features: pd.DataFrame, target_col: str):
+    # Features are all columns except timestamp and target
+    feature_cols = [col for col in df_features.columns if col not in ['timestamp', target_col]]
+    return df_features[feature_cols].values, df_features[target_col].values
+
+
+def holdout_size(timestamps: np.ndarray, holdout_after: Optional[float] = None) -> int:
+    """
+    Number of newest rows to hold out from training.
+
+    At least HOLDOUT_FRACTION of the rows, extended to every row newer than
+    holdout_after (so the active models can be scored on data they never
+    saw), but never more than half of them.
+    """
+    n = len(timestamps)
+    size = int(n * HOLDOUT_FRACTION)
+    if holdout_after is not None:
+        size = max(size, int(np.count_nonzero(timestamps > holdout_after)))
+    return max(1, min(size, n // 2))
+
+
+def train_failure_models(
+    features: np.ndarray, targets: np.ndarray, timestamps: np.ndarray,
+    holdout_after: Optional[float] = None,
+) -> TrainedFailureModels:
+    """
+    Fit scaler, Random Forest and Isolation Forest for one failure type.
+
+    Rows must be in time order; the newest ones (see holdout_size()) are
+    the holdout used to validate a swap.
+    """
+    start = time.perf_counter()
+
+    # Split data in time order; the newest rows are the holdout
+    split = len(features) - holdout_size(timestamps, holdout_after)
+    X_train, X_test = features[:split], features[split:]
+    y_train, y_test = targets[:split], targets[split:]
+
+    # Scale features
+    scaler = StandardScaler().fit(X_train)
+    X_train_scaled = scaler.transform(X_train)
+
+    # Random Forest
+    rf_model = RandomForestRegressor(n_estimators=100, random_state=42)
+    rf_model.fit(X_train_scaled, y_train)
+    rf_r2 = r2_score(y_test, rf_model.predict(scaler.transform(X_test)))
+
+    # Isolation Forest for anomaly detection
+    if_model = IsolationForest(contamination=0.1, random_state=42)
+    if_model.fit(X_train_scaled)
+
+    return TrainedFailureModels(
+        random_forest=rf_model,
+        isolation_forest=if_model,
+        scaler=scaler,
+        r2=float(rf_r2),
+        holdout_features=X_test,
+        holdout_targets=y_test,
+        holdout_timestamps=timestamps[split:],
+        duration=time.perf_counter() - start,
+    )
+
+
+def train_bundle(
+    packed: np.ndarray, target_columns: Dict[str, str], holdout_after: Optional[float] = None,
+) -> Dict[str, TrainedFailureModels]:
+    """
+    Train every failure type from a packed snapshot.
+
+    Runs in a worker process, so it only takes and returns picklable values.
+
+    Args:
+        packed: Snapshot from pack_snapshot()
+        target_columns: Failure type value -> predicted column
+        holdout_after: Newest timestamp the active models were trained on;
+            every newer row goes into the holdout
+
+    Returns:
+        Failure type value -> trained models, for types with enough data
+    """
+    df_features = rolling_feature_frame(snapshot_frame(packed))
+    if len(df_features) < MIN_FEATURE_ROWS:
+        return {}
+    timestamps = packed[df_features.index.to_numpy(), 0]  # Row labels index the snapshot
+    trained = {}
+    for failure_type, target_col in target_columns.items():
+        features, targets = _split_target(df_features, target_col)
+        trained[failure_type] = train_failure_models(features, targets, timestamps, holdout_after)
+    return trained
+
+
+def drift_baseline(packed: np.ndarray) -> np.ndarray:
+    """Mean and std of ROLLING_METRICS over a packed snapshot, shape (2, n)."""
+    cols = [SNAPSHOT_COLUMNS.index(name) for name in ROLLING_METRICS]
+    values = packed[:, cols]
+    return np.stack([values.mean(axis=0), values.std(axis=0)])
+
+
+def holdout_r2(model: Any, scaler: Any, features: np.ndarray, targets: np.ndarray) -> Optional[float]:
+    """R² of an existing model on a holdout split, or None if it cannot score it."""
+    try:
+        return float(r2_score(targets, model.predict(scaler.transform(features))))
+    except Exception:
+        return None
+
+
+class TrainingScheduler:
+    """
+    Periodic and drift-triggered retraining for a PredictiveMaintenanceEngine.
+
+    Every check_interval_s the scheduler retrains when interval_s has passed
+    since the last successful training, or earlier when the engine's
+    drift_score() exceeds drift_threshold. Either trigger also needs
+    min_new_points points added since the last training.
+    """
+
+    def __init__(
+        self,
+        engine: Any,
+        interval_s: float = 3600.0,
+        drift_threshold: float = 3.0,
+        check_interval_s: float = 60.0,
+        min_new_points: int = 100,
+    ):
+        self.engine = engine
+        self.interval_s = interval_s
+        self.drift_threshold = drift_threshold
+        self.check_interval_s = check_interval_s
+        self.min_new_points = min_new_points
+        self._task: Optional[asyncio.Task] = None
+        self._last_attempt = time.monotonic()
+        self.runs: Dict[str, int] = {"periodic": 0, "drift": 0}
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._last_attempt = time.monotonic()
+            self._task = asyncio.create_task(self._run(), name="predictive-training-scheduler")
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def due(self) -> Optional[str]:
+        """Why a retrain is due ('periodic' or 'drift'), or None."""
+        if self.engine.points_since_training < self.min_new_points:
+            return None
+        if time.monotonic() - self._last_attempt >= self.interval_s:
+            return "periodic"
+        if self.engine.drift_score() >= self.drift_threshold:
+            return "drift"
+        return None
+
+    async def check(self) -> Optional[Dict[str, Any]]:
+        """Retrain now if due; returns the training result if it ran."""
+        reason = self.due()
+        if reason is None:
+            return None
+        self._last_attempt = time.monotonic()
+        self.runs[reason] += 1
+        logger.info(f"Scheduled predictive model retraining ({reason})")
+        return await self.engine.train_models()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.check_interval_s)
+            try:
+                await self.check()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Scheduled model training failed: {e}")
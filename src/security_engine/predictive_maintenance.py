@@ -7,21 +7,22 @@ and trigger preventive recovery actions before issues escalate.
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Set, Tuple, Optional, Any
 from datetime import datetime, timedelta
 import logging
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from enum import Enum
 import asyncio
-from concurrent.futures import ThreadPoolExecutor
+import json
+import multiprocessing
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 import pickle
 import os
 
 # ML imports
-from sklearn.ensemble import RandomForestRegressor, IsolationForest
 from sklearn.preprocessing import StandardScaler
-from sklearn.model_selection import train_test_split
-from sklearn.metrics import mean_squared_error, r2_score
 import torch
 import torch.nn as nn
 import torch.optim as optim
@@ -29,10 +30,33 @@ from torch.utils.data import Dataset, DataLoader
 
 # Project imports
 from memory_engine.memory_store import AdaptiveMemoryStore
+from security_engine.rolling_features import (
+    BASE_METRICS,
+    FEATURE_COLUMNS,
+    ROLLING_METRICS,
+    RollingFeatureStore,
+    TrainingDataWindow,
+)
+from security_engine.model_training import (
+    MIN_VALIDATION_ROWS,
+    ModelBundle,
+    TrainingScheduler,
+    drift_baseline,
+    holdout_r2,
+    pack_snapshot,
+    prepare_features_and_targets,
+    snapshot_frame,
+    train_bundle,
+)
 from core.metrics import (
     PREDICTIVE_MAINTENANCE_PREDICTIONS_TOTAL,
     PREDICTIVE_MAINTENANCE_ACCURACY,
     PREDICTIVE_MAINTENANCE_PREVENTIVE_ACTIONS_TOTAL,
+    PREDICTIVE_MAINTENANCE_INFERENCE_LATENCY,
+    PREDICTIVE_MAINTENANCE_MODEL_TRAINING_DURATION,
+    PREDICTIVE_MAINTENANCE_MODEL_AGE,
+    PREDICTIVE_MAINTENANCE_MODEL_VERSION,
+    PREDICTIVE_MAINTENANCE_MODEL_SWAPS_TOTAL,
 )
 from core.error_handling import PredictiveMaintenanceError
 from core.timeout_handler import async_timeout, get_timeout_config
@@ -41,6 +65,9 @@ from core.component_health import get_health_monitor
 
 logger = logging.getLogger(__name__)
 
+TRAINING_RETENTION = timedelta(days=30)
+PREDICTION_THRESHOLD = 0.3  # Minimum failure probability reported
+
 class PredictionModel(Enum):
     """Available prediction models."""
     RANDOM_FOREST = "random_forest"
@@ -130,17 +157,37 @@ class PredictiveMaintenanceEngine:
     - Model training and evaluation
     """
 
-    def __init__(self, memory_store: AdaptiveMemoryStore):
+    def __init__(
+        self,
+        memory_store: AdaptiveMemoryStore,
+        coalesce_window_ms: float = 0.0,
+        max_inference_batch: int = 256,
+        training_workers: int = 1,
+        swap_tolerance: float = 0.05,
+    ):
+        """
+        Args:
+            memory_store: Store receiving training data for persistence
+            coalesce_window_ms: If > 0, predict_failures() calls arriving
+                within this window share one batched inference pass
+            max_inference_batch: Flush a coalesced batch early at this size
+            training_workers: Processes used by train_models() (0 trains
+                in the engine's thread pool instead)
+            swap_tolerance: Largest R² drop, on rows the active models were
+                not trained on, accepted when a retrained model replaces the
+                active one
+        """
         self.memory_store = memory_store
-        self.models: Dict[FailureType, Dict[PredictionModel, Any]] = {}
-        self.scalers: Dict[FailureType, StandardScaler] = {}
+        # Active models and scalers; replaced as a whole on every swap
+        self._bundle = ModelBundle(version=0)
         self.model_dir = "security_engine/models"
-        self.training_data: List[TimeSeriesData] = []
+        self.training_data = TrainingDataWindow()
         self.prediction_history: List[PredictionResult] = []
         
         # Sliding window for rolling statistics (last 10 data points)
-        self.recent_data: List[TimeSeriesData] = []
         self.max_window_size = 10
+        self.recent_data: deque = deque(maxlen=self.max_window_size)
+        self.feature_store = RollingFeatureStore()
 
         # Create model directory if it doesn't exist
         os.makedirs(self.model_dir, exist_ok=True)
@@ -155,16 +202,58 @@ class PredictiveMaintenanceEngine:
         # Thread pool for CPU-intensive ML operations
         self.executor = ThreadPoolExecutor(max_workers=2)
 
+        # Batched inference: concurrent predict_failures() calls are merged
+        self.coalesce_window_ms = coalesce_window_ms
+        self.max_inference_batch = max_inference_batch
+        self._pending_inference: List[Tuple[Any, asyncio.Future]] = []
+        self._inference_timer: Optional[asyncio.Task] = None
+        self._inference_flushes: Set[asyncio.Task] = set()  # Early (full batch) flushes
+        self.inference_stats: Dict[str, List[float]] = {}  # batch bucket -> [count, total_s]
+
+        # Background training: snapshot -> worker process -> validate -> swap
+        self.training_workers = training_workers
+        self.swap_tolerance = swap_tolerance
+        self._training_executor: Optional[ProcessPoolExecutor] = None
+        self._training = False
+        self.points_since_training = 0
+        self.training_scheduler: Optional[TrainingScheduler] = None
+        self.training_stats: Dict[str, Any] = {
+            "runs": 0, "swaps": 0, "rejected": 0, "last_duration_s": None,
+        }
+        PREDICTIVE_MAINTENANCE_MODEL_AGE.set_function(self.model_age_seconds)
+
+    @property
+    def models(self) -> Dict[FailureType, Dict[PredictionModel, Any]]:
+        return self._bundle.models
+
+    @property
+    def scalers(self) -> Dict[FailureType, StandardScaler]:
+        return self._bundle.scalers
+
+    @property
+    def model_version(self) -> int:
+        return self._bundle.version
+
+    def model_age_seconds(self) -> float:
+        """Seconds since the active models were trained (0 if never trained)."""
+        if self._bundle.trained_at is None:
+            return 0.0
+        return (datetime.now() - self._bundle.trained_at).total_seconds()
+
     async def initialize(self) -> bool:
         """Initialize the predictive maintenance engine."""
         try:
             # Load existing models
             await self._load_models()
 
-            # Initialize models for each failure type
-            for failure_type in FailureType:
-                self.models[failure_type] = {}
-                self.scalers[failure_type] = StandardScaler()
+            # Initialize models for each failure type not loaded from disk;
+            # the active bundle is never mutated, so build a new one
+            bundle = self._bundle
+            self._bundle = replace(
+                bundle,
+                models={ft: bundle.models.get(ft, {}) for ft in FailureType},
+                scalers={ft: bundle.scalers.get(ft) or StandardScaler() for ft in FailureType},
+            )
 
             self.health_monitor.mark_healthy("predictive_maintenance", {
                 "models_loaded": len(self.models),
@@ -184,13 +273,12 @@ class PredictiveMaintenanceEngine:
         self.training_data.append(data)
 
         # Keep only recent data (last 30 days)
-        cutoff = datetime.now() - timedelta(days=30)
-        self.training_data = [d for d in self.training_data if d.timestamp > cutoff]
+        self.training_data.trim(datetime.now() - TRAINING_RETENTION)
 
         # Maintain sliding window for rolling statistics
         self.recent_data.append(data)
-        if len(self.recent_data) > self.max_window_size:
-            self.recent_data.pop(0)
+        self.feature_store.push(data)
+        self.points_since_training += 1
 
         # Store in memory for persistence
         await self._store_training_data(data)
@@ -199,85 +287,169 @@ class PredictiveMaintenanceEngine:
         """
         Train all predictive models using available data.
 
+        Training runs in a worker process on a snapshot of the training
+        window, so predictions keep using the active models meanwhile.
+        Retrained models are validated on the newest rows, which the active
+        models never saw, and swapped in as a new model version.
+
         Returns:
             Dictionary of model performance metrics
         """
         if len(self.training_data) < 100:  # Minimum data requirement
             logger.warning("Insufficient training data for model training")
             return {"error": "insufficient_data"}
+        if self._training:
+            logger.info("Model training already in progress")
+            return {"error": "training_in_progress"}
 
-        performance_metrics = {}
-
+        self._training = True
+        start = time.perf_counter()
         try:
-            # Prepare data
-            df = self._prepare_training_dataframe()
-
-            for failure_type in FailureType:
-                logger.info(f"Training models for {failure_type.value}")
+            loop = asyncio.get_running_loop()
+            packed = self.training_data.snapshot(pack_snapshot)
+            points_in_snapshot = self.points_since_training
+            target_columns = {ft.value: _target_column(ft) for ft in FailureType}
+
+            trained = await loop.run_in_executor(
+                self._get_training_executor(), train_bundle, packed, target_columns,
+                _data_until(self._bundle),
+            )
+            candidate, performance_metrics = await loop.run_in_executor(
+                self.executor, self._validate_candidate, trained, packed
+            )
 
-                # Prepare features and targets
-                features, targets = self._prepare_features_and_targets(df, failure_type)
+            self.training_stats["runs"] += 1
+            self.training_stats["last_duration_s"] = round(time.perf_counter() - start, 3)
+            self.points_since_training -= points_in_snapshot
 
-                if len(features) < 50:
-                    continue
+            if candidate is None:
+                self.training_stats["rejected"] += 1
+                PREDICTIVE_MAINTENANCE_MODEL_SWAPS_TOTAL.labels(result="rejected").inc()
+                logger.warning("Retrained models did not validate; keeping "
+                               f"model version {self.model_version}")
+                return performance_metrics
 
-                # Train different models
-                model_metrics = await self._train_models_for_failure_type(
-                    failure_type, features, targets
-                )
-
-                performance_metrics[failure_type.value] = model_metrics
+            self._swap_models(candidate)
 
             # Save trained models
             await self._save_models()
 
             self.health_monitor.mark_healthy("predictive_maintenance", {
                 "last_training": datetime.now().isoformat(),
+                "model_version": candidate.version,
                 "performance_metrics": performance_metrics
             })
 
-            logger.info("Model training completed successfully")
+            logger.info(f"Model training completed successfully (version {candidate.version})")
             return performance_metrics
 
         except Exception as e:
             logger.error(f"Model training failed: {e}")
             self.health_monitor.mark_failed("predictive_maintenance", str(e))
             return {"error": str(e)}
+        finally:
+            self._training = False
+
+    def start_training_scheduler(self, **kwargs) -> TrainingScheduler:
+        """Start periodic/drift-triggered retraining (kwargs go to TrainingScheduler)."""
+        if self.training_scheduler is None:
+            self.training_scheduler = TrainingScheduler(self, **kwargs)
+        self.training_scheduler.start()
+        return self.training_scheduler
+
+    async def close(self) -> None:
+        """Answer pending coalesced predictions, then stop training."""
+        timer, self._inference_timer = self._inference_timer, None
+        if timer is not None:
+            timer.cancel()
+            await asyncio.gather(timer, return_exceptions=True)
+        await self._flush_inference()
+        if self._inference_flushes:
+            await asyncio.gather(*self._inference_flushes, return_exceptions=True)
+        if self.training_scheduler is not None:
+            await self.training_scheduler.stop()
+        if self._training_executor is not None:
+            self._training_executor.shutdown(wait=False, cancel_futures=True)
+            self._training_executor = None
+
+    def drift_score(self) -> float:
+        """
+        Largest z-score of the recent window's mean against the training data.
+
+        Compares the mean of recent_data with the active models' training
+        distribution for each rolling metric; 0.0 before the first training.
+        """
+        baseline = self._bundle.baseline
+        if baseline is None or len(self.recent_data) < 3:
+            return 0.0
+        recent = np.array([[getattr(d, name) for name in ROLLING_METRICS] for d in self.recent_data])
+        stderr = np.maximum(baseline[1], 1e-9) / np.sqrt(len(recent))
+        return float(np.max(np.abs(recent.mean(axis=0) - baseline[0]) / stderr))
+
+    def get_training_stats(self) -> Dict[str, Any]:
+        """Model version, age, swap counts and scheduler state for monitoring."""
+        return {
+            **self.training_stats,
+            "model_version": self.model_version,
+            "model_age_s": round(self.model_age_seconds(), 3),
+            "training": self._training,
+            "points_since_training": self.points_since_training,
+            "drift_score": round(self.drift_score(), 3),
+            "scheduler": dict(self.training_scheduler.runs) if self.training_scheduler else None,
+        }
 
     @async_timeout(seconds=15.0, operation_name="predictive_failure_prediction")
     async def predict_failures(self, current_data: TimeSeriesData) -> List[PredictionResult]:
         """
         Predict potential failures based on current system state.
 
+        Every failure-type model runs once per inference batch in the
+        engine's thread pool; with coalesce_window_ms > 0, concurrent calls
+        share a batch.
+
         Returns:
             List of prediction results for potential failures
         """
-        predictions = []
-
         try:
-            for failure_type in FailureType:
-                if failure_type not in self.models or not self.models[failure_type]:
-                    continue
+            # One feature row per point, shared by every failure type. Built
+            # now so it reflects the rolling window at call time.
+            feature_row = self._feature_row(current_data)
 
-                # Get prediction from best performing model
-                prediction = await self._predict_single_failure_type(failure_type, current_data)
+            if self.coalesce_window_ms > 0:
+                candidates = await self._coalesced_inference(feature_row)
+            else:
+                candidates = (await self._run_inference([feature_row]))[0]
+            return self._finalize_predictions(candidates)
 
-                if prediction and prediction.probability > 0.3:  # High confidence threshold
-                    predictions.append(prediction)
-                    PREDICTIVE_MAINTENANCE_PREDICTIONS_TOTAL.labels(
-                        failure_type=failure_type.value, 
-                        model_type=prediction.model_used.value
-                    ).inc()
+        except Exception as e:
+            logger.error(f"Failure prediction failed: {e}")
+            return []
 
-            # Sort by probability and confidence
-            predictions.sort(key=lambda x: x.probability * x.confidence, reverse=True)
+    async def predict_failures_batch(self, points: List[TimeSeriesData]) -> List[List[PredictionResult]]:
+        """
+        Predict failures for several points in one inference pass.
 
-            logger.info(f"Generated {len(predictions)} high-confidence failure predictions")
-            return predictions[:5]  # Return top 5 predictions
+        Each point is evaluated against the current rolling window, as if
+        predict_failures() were called for each in turn.
 
-        except Exception as e:
-            logger.error(f"Failure prediction failed: {e}")
+        Returns:
+            One prediction list per point, in input order
+        """
+        if not points:
             return []
+        try:
+            rows = [self._feature_row(point) for point in points]
+            return [self._finalize_predictions(c) for c in await self._run_inference(rows)]
+        except Exception as e:
+            logger.error(f"Batch failure prediction failed: {e}")
+            return [[] for _ in points]
+
+    def get_inference_stats(self) -> Dict[str, Dict[str, float]]:
+        """Inference passes and mean latency (ms) per batch-size bucket."""
+        return {
+            bucket: {"batches": int(count), "avg_ms": round(total / count * 1000, 3)}
+            for bucket, (count, total) in sorted(self.inference_stats.items(), key=lambda kv: int(kv[0]))
+        }
 
     @async_timeout(seconds=20.0, operation_name="preventive_actions_trigger")
     async def trigger_preventive_actions(self, predictions: List[PredictionResult]) -> List[str]:
@@ -304,236 +476,278 @@ class PredictiveMaintenanceEngine:
 
         return actions_taken
 
-    async def _predict_single_failure_type(self, failure_type: FailureType, data: TimeSeriesData) -> Optional[PredictionResult]:
-        """Predict failure for a specific failure type."""
-        if failure_type not in self.models:
+    async def _predict_single_failure_type(
+        self,
+        failure_type: FailureType,
+        data: TimeSeriesData,
+        feature_row: Optional[Tuple[np.ndarray, Dict[FailureType, np.ndarray]]] = None,
+    ) -> Optional[PredictionResult]:
+        """Predict failure for a specific failure type (one row, inline)."""
+        bundle = self._bundle
+        if failure_type not in bundle.models:
             return None
 
         # Use the best performing model (Random Forest as default)
-        model = self.models[failure_type].get(PredictionModel.RANDOM_FOREST)
+        model = bundle.models[failure_type].get(PredictionModel.RANDOM_FOREST)
         if not model:
             return None
 
         try:
             # Prepare features
-            features = self._extract_features_from_data(data, failure_type)
-            features_scaled = self.scalers[failure_type].transform([features])
-
-            # Make prediction using regression model
-            model = self.models[failure_type].get(PredictionModel.RANDOM_FOREST)
-            if not model:
-                return None
-                
+            if feature_row is None:
+                feature_row = self._feature_row(data)
+            features = self._select_features(feature_row, failure_type)
+            features_scaled = bundle.scalers[failure_type].transform(features.reshape(1, -1))
             predicted_value = model.predict(features_scaled)[0]
-                
-            # Calculate failure probability based on predicted value vs threshold
-            # For each failure type, define what constitutes a "high" value indicating potential failure
-            thresholds = {
-                FailureType.CPU_SPIKE: 75.0,  # CPU usage > 75%
-                FailureType.MEMORY_LEAK: 80.0,  # Memory usage > 80%
-                FailureType.NETWORK_LATENCY: 100.0,  # Latency > 100ms
-                FailureType.DISK_IO_BURST: 200.0,  # Disk I/O > 200 ops/sec
-                FailureType.SERVICE_CRASH: 1.0,  # Error rate > 1%
-                FailureType.RESOURCE_EXHAUSTION: 1.0  # Error rate > 1%
-            }
-            
-            threshold = thresholds[failure_type]
-            
-            # Calculate probability as sigmoid of (predicted_value - threshold)
-            # This gives higher probability when predicted value is much higher than threshold
-            probability = 1 / (1 + np.exp(-(predicted_value - threshold) / 10))  # Sigmoid with scaling
-            
+            probability = _failure_probability(failure_type, predicted_value)
+
             # Only create prediction if probability is significant (> 0.3)
-            if probability < 0.3:
+            if probability < PREDICTION_THRESHOLD:
                 return None
-
-            # Estimate time to failure (simplified - higher probability = sooner failure)
-            time_to_failure_hours = max(1, int((1 - probability) * 24))
-
-            prediction = PredictionResult(
-                failure_type=failure_type,
-                probability=float(probability),
-                predicted_time=datetime.now() + timedelta(hours=time_to_failure_hours),
-                confidence=0.85,  # Simplified confidence score
-                features_used=['cpu_usage', 'memory_usage', 'network_latency', 'disk_io', 'error_rate'],
-                model_used=PredictionModel.RANDOM_FOREST,
-                preventive_actions=self._get_preventive_actions(failure_type)
-            )
-
-            return prediction
+            return self._make_prediction(failure_type, float(probability))
 
         except Exception as e:
             logger.error(f"Prediction failed for {failure_type}: {e}")
             return None
 
-    async def _train_models_for_failure_type(self, failure_type: FailureType, features: np.ndarray, targets: np.ndarray) -> Dict[str, float]:
-        """Train multiple models for a specific failure type."""
-        metrics = {}
+    def _predict_rows(self, feature_rows: List[Tuple[np.ndarray, Dict[FailureType, np.ndarray]]]) -> List[List[PredictionResult]]:
+        """
+        Run each failure type's scaler and model once over all rows.
 
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            features, targets, test_size=0.2, random_state=42
+        Called in the executor. Returns unfiltered candidates per row in
+        FailureType order, matching _predict_single_failure_type(). The
+        whole batch uses one model bundle even if a swap happens meanwhile.
+        """
+        bundle = self._bundle
+        results: List[List[PredictionResult]] = [[] for _ in feature_rows]
+        for failure_type in FailureType:
+            model = bundle.models.get(failure_type, {}).get(PredictionModel.RANDOM_FOREST)
+            if not model:
+                continue
+            try:
+                features = np.stack([self._select_features(row, failure_type) for row in feature_rows])
+                predicted = model.predict(bundle.scalers[failure_type].transform(features))
+                probabilities = _failure_probability(failure_type, predicted)
+            except Exception as e:
+                logger.error(f"Prediction failed for {failure_type}: {e}")
+                continue
+
+            for i, probability in enumerate(probabilities.tolist()):
+                if probability >= PREDICTION_THRESHOLD:
+                    results[i].append(self._make_prediction(failure_type, probability))
+        return results
+
+    async def _run_inference(self, feature_rows: list) -> List[List[PredictionResult]]:
+        """Run _predict_rows in the thread pool and record latency by batch size."""
+        if not any(models.get(PredictionModel.RANDOM_FOREST) for models in self.models.values()):
+            return [[] for _ in feature_rows]
+
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        results = await loop.run_in_executor(self.executor, self._predict_rows, feature_rows)
+        elapsed = time.perf_counter() - start
+
+        bucket = _batch_size_bucket(len(feature_rows))
+        PREDICTIVE_MAINTENANCE_INFERENCE_LATENCY.labels(batch_size=bucket).observe(elapsed)
+        stats = self.inference_stats.setdefault(bucket, [0, 0.0])
+        stats[0] += 1
+        stats[1] += elapsed
+        return results
+
+    async def _coalesced_inference(self, feature_row) -> List[PredictionResult]:
+        """Queue a row for the current coalescing window and await its candidates."""
+        future = asyncio.get_running_loop().create_future()
+        self._pending_inference.append((feature_row, future))
+        if len(self._pending_inference) >= self.max_inference_batch:
+            if self._inference_timer is not None:
+                self._inference_timer.cancel()
+                self._inference_timer = None
+            flush = asyncio.create_task(self._flush_inference())
+            self._inference_flushes.add(flush)
+            flush.add_done_callback(self._inference_flushes.discard)
+        elif self._inference_timer is None:
+            self._inference_timer = asyncio.create_task(self._flush_inference_after_window())
+        return await future
+
+    async def _flush_inference_after_window(self) -> None:
+        await asyncio.sleep(self.coalesce_window_ms / 1000.0)
+        self._inference_timer = None
+        await self._flush_inference()
+
+    async def _flush_inference(self) -> None:
+        batch, self._pending_inference = self._pending_inference, []
+        if not batch:
+            return
+        try:
+            results = await self._run_inference([row for row, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), candidates in zip(batch, results):
+            if not future.done():
+                future.set_result(candidates)
+
+    def _finalize_predictions(self, candidates: List[PredictionResult]) -> List[PredictionResult]:
+        """Filter, count, rank and cap one point's predictions."""
+        predictions = []
+        for prediction in candidates:
+            if prediction.probability > PREDICTION_THRESHOLD:  # High confidence threshold
+                predictions.append(prediction)
+                PREDICTIVE_MAINTENANCE_PREDICTIONS_TOTAL.labels(
+                    failure_type=prediction.failure_type.value,
+                    model_type=prediction.model_used.value
+                ).inc()
+
+        # Sort by probability and confidence
+        predictions.sort(key=lambda x: x.probability * x.confidence, reverse=True)
+
+        logger.info(f"Generated {len(predictions)} high-confidence failure predictions")
+        return predictions[:5]  # Return top 5 predictions
+
+    def _make_prediction(self, failure_type: FailureType, probability: float) -> PredictionResult:
+        # Estimate time to failure (simplified - higher probability = sooner failure)
+        time_to_failure_hours = max(1, int((1 - probability) * 24))
+
+        return PredictionResult(
+            failure_type=failure_type,
+            probability=probability,
+            predicted_time=datetime.now() + timedelta(hours=time_to_failure_hours),
+            confidence=0.85,  # Simplified confidence score
+            features_used=['cpu_usage', 'memory_usage', 'network_latency', 'disk_io', 'error_rate'],
+            model_used=PredictionModel.RANDOM_FOREST,
+            preventive_actions=self._get_preventive_actions(failure_type)
         )
 
-        # Scale features
-        self.scalers[failure_type].fit(X_train)
-        X_train_scaled = self.scalers[failure_type].transform(X_train)
-        X_test_scaled = self.scalers[failure_type].transform(X_test)
-
-        # Random Forest
-        rf_model = RandomForestRegressor(n_estimators=100, random_state=42)
-        rf_model.fit(X_train_scaled, y_train)
-        rf_pred = rf_model.predict(X_test_scaled)
-        rf_mse = mean_squared_error(y_test, rf_pred)
-        rf_r2 = r2_score(y_test, rf_pred)
+    def _get_training_executor(self):
+        if self.training_workers <= 0:
+            return self.executor
+        if self._training_executor is None:
+            # spawn: forking a process that holds torch/OpenMP threads can deadlock
+            self._training_executor = ProcessPoolExecutor(
+                max_workers=self.training_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._training_executor
 
-        self.models[failure_type][PredictionModel.RANDOM_FOREST] = rf_model
-        metrics['random_forest'] = rf_r2
+    def _validate_candidate(self, trained: Dict[str, Any], packed: np.ndarray) -> Tuple[Optional[ModelBundle], Dict[str, Any]]:
+        """
+        Compare retrained models with the active ones on data neither was trained on.
 
-        # Isolation Forest for anomaly detection
-        if_model = IsolationForest(contamination=0.1, random_state=42)
-        if_model.fit(X_train_scaled)
-        self.models[failure_type][PredictionModel.ISOLATION_FOREST] = if_model
+        Both are scored on the holdout rows newer than the active bundle's
+        training data. A failure type takes its retrained models unless the
+        active model scores more than swap_tolerance better (R²) there, or
+        too few such rows exist to tell them apart.
 
-        logger.info(f"Trained models for {failure_type.value}: RF R² = {rf_r2:.3f}")
-        return metrics
+        Returns:
+            (new bundle or None if nothing was accepted, performance metrics)
+        """
+        active = self._bundle
+        seen_until = _data_until(active)
+        models = dict(active.models)
+        scalers = dict(active.scalers)
+        metrics = dict(active.metrics)
+        performance_metrics: Dict[str, Any] = {}
+        accepted = 0
+
+        for failure_type in FailureType:
+            result = trained.get(failure_type.value)
+            if result is None:
+                continue
+            PREDICTIVE_MAINTENANCE_MODEL_TRAINING_DURATION.labels(
+                failure_type=failure_type.value, model_type=PredictionModel.RANDOM_FOREST.value
+            ).observe(result.duration)
+            performance_metrics[failure_type.value] = {'random_forest': result.r2}
+
+            current = active.models.get(failure_type, {}).get(PredictionModel.RANDOM_FOREST)
+            if current is not None and failure_type in active.scalers:
+                unseen = (result.holdout_timestamps > seen_until
+                          if seen_until is not None else slice(None))
+                features = result.holdout_features[unseen]
+                targets = result.holdout_targets[unseen]
+                if len(targets) < MIN_VALIDATION_ROWS:
+                    logger.info(f"Keeping active {failure_type.value} model: only "
+                                f"{len(targets)} holdout rows newer than its training data")
+                    continue
+                current_r2 = holdout_r2(current, active.scalers[failure_type], features, targets)
+                candidate_r2 = holdout_r2(result.random_forest, result.scaler, features, targets)
+                if current_r2 is not None and candidate_r2 is not None:
+                    performance_metrics[failure_type.value].update(
+                        active_random_forest=current_r2, candidate_random_forest=candidate_r2,
+                    )
+                    if candidate_r2 < current_r2 - self.swap_tolerance:
+                        logger.info(f"Keeping active {failure_type.value} model: R² on unseen "
+                                    f"data {current_r2:.3f} vs retrained {candidate_r2:.3f}")
+                        continue
+
+            models[failure_type] = {
+                PredictionModel.RANDOM_FOREST: result.random_forest,
+                PredictionModel.ISOLATION_FOREST: result.isolation_forest,
+            }
+            scalers[failure_type] = result.scaler
+            metrics[failure_type.value] = {'random_forest': result.r2}
+            accepted += 1
+            logger.info(f"Trained models for {failure_type.value}: RF R² = {result.r2:.3f}")
+
+        if not accepted:
+            return None, performance_metrics
+        bundle = ModelBundle(
+            version=active.version + 1,
+            models=models,
+            scalers=scalers,
+            metrics=metrics,
+            trained_at=datetime.now(),
+            baseline=drift_baseline(packed),
+            data_until=float(packed[:, 0].max()),
+        )
+        return bundle, performance_metrics
+
+    def _swap_models(self, bundle: ModelBundle) -> None:
+        """Make bundle the active model set (one reference assignment)."""
+        self._bundle = bundle
+        self.training_stats["swaps"] += 1
+        PREDICTIVE_MAINTENANCE_MODEL_SWAPS_TOTAL.labels(result="swapped").inc()
+        PREDICTIVE_MAINTENANCE_MODEL_VERSION.set(bundle.version)
+        for failure_type, scores in bundle.metrics.items():
+            PREDICTIVE_MAINTENANCE_ACCURACY.labels(
+                failure_type=failure_type, model_type=PredictionModel.RANDOM_FOREST.value
+            ).set(scores['random_forest'])
 
     def _prepare_training_dataframe(self) -> pd.DataFrame:
         """Convert training data to pandas DataFrame."""
-        data = []
-        for item in self.training_data:
-            data.append({
-                'timestamp': item.timestamp,
-                'cpu_usage': item.cpu_usage,
-                'memory_usage': item.memory_usage,
-                'network_latency': item.network_latency,
-                'disk_io': item.disk_io,
-                'error_rate': item.error_rate,
-                'response_time': item.response_time,
-                'active_connections': item.active_connections,
-                'failure_occurred': item.failure_occurred
-            })
-
-        df = pd.DataFrame(data)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df.sort_values('timestamp')
-        return df
+        return snapshot_frame(self.training_data.snapshot(pack_snapshot))
 
     def _prepare_features_and_targets(self, df: pd.DataFrame, failure_type: FailureType) -> Tuple[np.ndarray, np.ndarray]:
         """Prepare features and targets for a specific failure type."""
-        # Create target based on failure type
-        if failure_type == FailureType.CPU_SPIKE:
-            target_col = 'cpu_usage'
-        elif failure_type == FailureType.MEMORY_LEAK:
-            target_col = 'memory_usage'
-        elif failure_type == FailureType.NETWORK_LATENCY:
-            target_col = 'network_latency'
-        elif failure_type == FailureType.DISK_IO_BURST:
-            target_col = 'disk_io'
-        else:
-            target_col = 'error_rate'
-
-        # Create rolling features
-        df_features = df.copy()
-        for col in ['cpu_usage', 'memory_usage', 'network_latency', 'disk_io', 'error_rate']:
-            df_features[f'{col}_rolling_mean_3'] = df_features[col].rolling(window=3).mean()
-            df_features[f'{col}_rolling_std_3'] = df_features[col].rolling(window=3).std()
-            df_features[f'{col}_rolling_mean_6'] = df_features[col].rolling(window=6).mean()
-            df_features[f'{col}_rolling_std_6'] = df_features[col].rolling(window=6).std()
-
-        # Drop NaN values
-        df_features = df_features.dropna()
-
-        # Features are all columns except timestamp and target
-        feature_cols = [col for col in df_features.columns if col not in ['timestamp', target_col]]
-        features = df_features[feature_cols].values
-        targets = df_features[target_col].values
-
-        logger.debug(f"Training features for {failure_type}: {len(feature_cols)} columns - {feature_cols}")
-
-        return features, targets
+        return prepare_features_and_targets(df, _target_column(failure_type))
 
     def _extract_features_from_data(self, data: TimeSeriesData, failure_type: FailureType) -> List[float]:
         """Extract features from current data for prediction."""
+        return self._select_features(self._feature_row(data), failure_type).tolist()
+
+    def _feature_row(self, data: TimeSeriesData) -> Tuple[np.ndarray, Dict[FailureType, np.ndarray]]:
+        """
+        Full feature row (rolling_features.FEATURE_COLUMNS) for data, plus the
+        per-failure-type column selection to apply to it.
+
+        Rolling statistics cover the recent window plus data itself and come
+        from the incremental feature store, so this is O(1) per point.
+        """
         # If we don't have enough recent data, use current values as approximations
-        if len(self.recent_data) < 3:
-            # Fallback: use current values for all features
-            base_features = [
-                data.cpu_usage, data.memory_usage, data.network_latency, 
-                data.disk_io, data.error_rate, data.response_time, data.active_connections
-            ]
-            # Approximate rolling stats
-            features = base_features.copy()
-            for _ in range(5):  # 5 metrics × 4 rolling stats
-                features.extend([0.0, 0.0, 0.0, 0.0])
-            return features
-        
-        # Create DataFrame from recent data + current data
-        recent_with_current = self.recent_data + [data]
-        df_recent = pd.DataFrame([{
-            'cpu_usage': d.cpu_usage,
-            'memory_usage': d.memory_usage,
-            'network_latency': d.network_latency,
-            'disk_io': d.disk_io,
-            'error_rate': d.error_rate,
-            'response_time': d.response_time,
-            'active_connections': d.active_connections
-        } for d in recent_with_current])
-        
-        # Compute rolling statistics for the last row (current data)
-        for col in ['cpu_usage', 'memory_usage', 'network_latency', 'disk_io', 'error_rate']:
-            df_recent[f'{col}_rolling_mean_3'] = df_recent[col].rolling(window=min(3, len(df_recent))).mean()
-            df_recent[f'{col}_rolling_std_3'] = df_recent[col].rolling(window=min(3, len(df_recent))).std()
-            df_recent[f'{col}_rolling_mean_6'] = df_recent[col].rolling(window=min(6, len(df_recent))).mean()
-            df_recent[f'{col}_rolling_std_6'] = df_recent[col].rolling(window=min(6, len(df_recent))).std()
-        
-        # Get features for the last row (current prediction)
-        last_row = df_recent.iloc[-1]
-        
-        # Base features (all except timestamp and target, including failure_occurred = False for prediction)
-        if failure_type == FailureType.CPU_SPIKE:
-            base_features = [
-                last_row['memory_usage'], last_row['network_latency'], last_row['disk_io'], 
-                last_row['error_rate'], last_row['response_time'], last_row['active_connections'], 0.0  # failure_occurred = False
-            ]
-        elif failure_type == FailureType.MEMORY_LEAK:
-            base_features = [
-                last_row['cpu_usage'], last_row['network_latency'], last_row['disk_io'], 
-                last_row['error_rate'], last_row['response_time'], last_row['active_connections'], 0.0
-            ]
-        elif failure_type == FailureType.NETWORK_LATENCY:
-            base_features = [
-                last_row['cpu_usage'], last_row['memory_usage'], last_row['disk_io'], 
-                last_row['error_rate'], last_row['response_time'], last_row['active_connections'], 0.0
-            ]
-        elif failure_type == FailureType.DISK_IO_BURST:
-            base_features = [
-                last_row['cpu_usage'], last_row['memory_usage'], last_row['network_latency'], 
-                last_row['error_rate'], last_row['response_time'], last_row['active_connections'], 0.0
-            ]
-        else:  # SERVICE_CRASH or RESOURCE_EXHAUSTION
-            base_features = [
-                last_row['cpu_usage'], last_row['memory_usage'], last_row['network_latency'], 
-                last_row['disk_io'], last_row['response_time'], last_row['active_connections'], 0.0
-            ]
-        
-        # Rolling features for all metrics (20 features)
-        rolling_features = []
-        for col in ['cpu_usage', 'memory_usage', 'network_latency', 'disk_io', 'error_rate']:
-            rolling_features.extend([
-                last_row[f'{col}_rolling_mean_3'],
-                last_row[f'{col}_rolling_std_3'], 
-                last_row[f'{col}_rolling_mean_6'],
-                last_row[f'{col}_rolling_std_6']
-            ])
-        
-        # Combine base and rolling features
-        features = base_features + rolling_features
-        
-        # Fill any NaN values with 0
-        features = [0.0 if pd.isna(x) else x for x in features]
-        
-        return features
+        if len(self.feature_store) < 3:
+            row = np.zeros(len(FEATURE_COLUMNS))
+            row[:len(BASE_METRICS)] = [getattr(data, name) for name in BASE_METRICS]
+            return row, _FALLBACK_INDEX
+        return self.feature_store.feature_row(data), _FEATURE_INDEX
+
+    @staticmethod
+    def _select_features(
+        feature_row: Tuple[np.ndarray, Dict[FailureType, np.ndarray]], failure_type: FailureType
+    ) -> np.ndarray:
+        """Pick the model input columns for failure_type out of a full feature row."""
+        row, index = feature_row
+        return row[index[failure_type]]
 
     def _get_preventive_actions(self, failure_type: FailureType) -> List[str]:
         """Get preventive actions for a failure type."""
@@ -589,19 +803,10 @@ class PredictiveMaintenanceEngine:
     async def _load_models(self) -> None:
         """Load trained models from disk."""
         try:
-            for failure_type in FailureType:
-                model_path = os.path.join(self.model_dir, f"{failure_type.value}_models.pkl")
-                scaler_path = os.path.join(self.model_dir, f"{failure_type.value}_scaler.pkl")
-
-                if os.path.exists(model_path):
-                    with open(model_path, 'rb') as f:
-                        self.models[failure_type] = pickle.load(f)
-
-                if os.path.exists(scaler_path):
-                    with open(scaler_path, 'rb') as f:
-                        self.scalers[failure_type] = pickle.load(f)
-
-            logger.info("Models loaded successfully")
+            bundle = await asyncio.to_thread(self._read_models)
+            self._bundle = bundle
+            PREDICTIVE_MAINTENANCE_MODEL_VERSION.set(bundle.version)
+            logger.info(f"Models loaded successfully (version {bundle.version})")
 
         except Exception as e:
             logger.error(f"Failed to load models: {e}")
@@ -609,22 +814,55 @@ class PredictiveMaintenanceEngine:
     async def _save_models(self) -> None:
         """Save trained models to disk."""
         try:
-            for failure_type in FailureType:
-                if failure_type in self.models:
-                    model_path = os.path.join(self.model_dir, f"{failure_type.value}_models.pkl")
-                    scaler_path = os.path.join(self.model_dir, f"{failure_type.value}_scaler.pkl")
-
-                    with open(model_path, 'wb') as f:
-                        pickle.dump(self.models[failure_type], f)
-
-                    with open(scaler_path, 'wb') as f:
-                        pickle.dump(self.scalers[failure_type], f)
-
+            await asyncio.to_thread(self._write_models, self._bundle)
             logger.info("Models saved successfully")
 
         except Exception as e:
             logger.error(f"Failed to save models: {e}")
 
+    def _read_models(self) -> ModelBundle:
+        models, scalers = {}, {}
+        for failure_type in FailureType:
+            model_path = os.path.join(self.model_dir, f"{failure_type.value}_models.pkl")
+            scaler_path = os.path.join(self.model_dir, f"{failure_type.value}_scaler.pkl")
+
+            if os.path.exists(model_path):
+                with open(model_path, 'rb') as f:
+                    models[failure_type] = pickle.load(f)
+
+            if os.path.exists(scaler_path):
+                with open(scaler_path, 'rb') as f:
+                    scalers[failure_type] = pickle.load(f)
+
+        version, trained_at, data_until = 0, None, None
+        meta_path = os.path.join(self.model_dir, "model_version.json")
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+            version = meta.get("version", 0)
+            trained_at = datetime.fromisoformat(meta["trained_at"]) if meta.get("trained_at") else None
+            data_until = meta.get("data_until")
+        return ModelBundle(version=version, models=models, scalers=scalers,
+                           trained_at=trained_at, data_until=data_until)
+
+    def _write_models(self, bundle: ModelBundle) -> None:
+        # Write to temporary files and rename, so a crash never leaves a torn model set
+        for failure_type in FailureType:
+            if failure_type in bundle.models:
+                model_path = os.path.join(self.model_dir, f"{failure_type.value}_models.pkl")
+                scaler_path = os.path.join(self.model_dir, f"{failure_type.value}_scaler.pkl")
+                _atomic_pickle(bundle.models[failure_type], model_path)
+                _atomic_pickle(bundle.scalers[failure_type], scaler_path)
+
+        meta_path = os.path.join(self.model_dir, "model_version.json")
+        with open(meta_path + ".tmp", 'w') as f:
+            json.dump({
+                "version": bundle.version,
+                "trained_at": bundle.trained_at.isoformat() if bundle.trained_at else None,
+                "data_until": bundle.data_until,
+            }, f)
+        os.replace(meta_path + ".tmp", meta_path)
+
     async def _store_training_data(self, data: TimeSeriesData) -> None:
         """Store training data in memory store for persistence."""
         # Convert to embedding (simplified)
@@ -646,6 +884,73 @@ class PredictiveMaintenanceEngine:
 
         self.memory_store.write(embedding, metadata, data.timestamp)
 
+# Predicted value above which each failure type is considered likely
+FAILURE_THRESHOLDS = {
+    FailureType.CPU_SPIKE: 75.0,  # CPU usage > 75%
+    FailureType.MEMORY_LEAK: 80.0,  # Memory usage > 80%
+    FailureType.NETWORK_LATENCY: 100.0,  # Latency > 100ms
+    FailureType.DISK_IO_BURST: 200.0,  # Disk I/O > 200 ops/sec
+    FailureType.SERVICE_CRASH: 1.0,  # Error rate > 1%
+    FailureType.RESOURCE_EXHAUSTION: 1.0  # Error rate > 1%
+}
+
+
+def _failure_probability(failure_type: FailureType, predicted):
+    """
+    Sigmoid of (predicted value - threshold); scalar or array.
+
+    Gives higher probability when the predicted value is well above the
+    failure type's threshold.
+    """
+    return 1 / (1 + np.exp(-(predicted - FAILURE_THRESHOLDS[failure_type]) / 10))
+
+
+def _data_until(bundle: ModelBundle) -> Optional[float]:
+    """Newest timestamp a bundle's models may have been trained on (epoch seconds)."""
+    if bundle.data_until is not None:
+        return bundle.data_until
+    return bundle.trained_at.timestamp() if bundle.trained_at else None
+
+
+def _atomic_pickle(obj: Any, path: str) -> None:
+    with open(path + ".tmp", 'wb') as f:
+        pickle.dump(obj, f)
+    os.replace(path + ".tmp", path)
+
+
+def _batch_size_bucket(size: int) -> str:
+    """Power-of-two label for inference latency metrics (capped at 256)."""
+    bucket = 1
+    while bucket < size and bucket < 256:
+        bucket *= 2
+    return str(bucket)
+
+
+def _target_column(failure_type: FailureType) -> str:
+    """Column predicted for a failure type (see _prepare_features_and_targets)."""
+    return {
+        FailureType.CPU_SPIKE: 'cpu_usage',
+        FailureType.MEMORY_LEAK: 'memory_usage',
+        FailureType.NETWORK_LATENCY: 'network_latency',
+        FailureType.DISK_IO_BURST: 'disk_io',
+    }.get(failure_type, 'error_rate')
+
+
+# Model input columns per failure type: every feature except the target
+_FEATURE_INDEX: Dict[FailureType, np.ndarray] = {
+    failure_type: np.array([
+        i for i, col in enumerate(FEATURE_COLUMNS) if col != _target_column(failure_type)
+    ])
+    for failure_type in FailureType
+}
+
+# Without enough history every type sees the raw metrics (target included)
+# followed by zeroed rolling statistics
+_FALLBACK_INDEX: Dict[FailureType, np.ndarray] = dict.fromkeys(
+    FailureType,
+    np.array([i for i, col in enumerate(FEATURE_COLUMNS) if col != 'failure_occurred']),
+)
+
 # Global instance
 _predictive_engine: Optional[PredictiveMaintenanceEngine] = None
 
@@ -0,0 +1,286 @@
+"""
+Incremental feature store for predictive maintenance.
+
+Replaces the per-prediction pandas rebuild of rolling statistics:
+
+- RollingFeatureStore keeps the last few points in fixed-size NumPy ring
+  buffers and maintains sliding-window mean/variance with Welford-style
+  add/remove updates, so a feature row costs O(1) regardless of history.
+- TrainingDataWindow keeps training data in hourly buckets, so retention
+  trimming drops whole buckets and is amortized O(1) per append, and a
+  training snapshot only repacks the buckets changed since the last one.
+
+Feature rows match the training layout built by
+PredictiveMaintenanceEngine._prepare_features_and_targets():
+
+    cpu_usage, memory_usage, network_latency, disk_io, error_rate,
+    response_time, active_connections, failure_occurred,
+    then mean/std over the last 3 and 6 samples for each ROLLING_METRICS column
+
+minus the target column of the failure type.
+"""
+
+import bisect
+from collections import deque
+from datetime import datetime
+from typing import Callable, Deque, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+BASE_METRICS = (
+    "cpu_usage", "memory_usage", "network_latency", "disk_io",
+    "error_rate", "response_time", "active_connections",
+)
+ROLLING_METRICS = ("cpu_usage", "memory_usage", "network_latency", "disk_io", "error_rate")
+ROLLING_WINDOWS = (3, 6)
+
+# Full row: base metrics, failure_occurred, then rolling stats (28 columns)
+FEATURE_COLUMNS = list(BASE_METRICS) + ["failure_occurred"] + [
+    f"{col}_rolling_{stat}_{window}"
+    for col in ROLLING_METRICS
+    for window, stat in ((3, "mean"), (3, "std"), (6, "mean"), (6, "std"))
+]
+
+# Rolling windows include the point being predicted, so the store only
+# needs window - 1 previous points per window.
+_HISTORY = max(ROLLING_WINDOWS) - 1
+_REANCHOR_EVERY = 1024  # exact recompute interval, bounds floating-point drift
+
+
+class _SlidingMoments:
+    """Mean and M2 (sum of squared deviations) over the last `size` pushes."""
+
+    __slots__ = ("size", "n", "mean", "m2")
+
+    def __init__(self, size: int, dims: int):
+        self.size = size
+        self.n = 0
+        self.mean = np.zeros(dims)
+        self.m2 = np.zeros(dims)
+
+    def add(self, x: np.ndarray) -> None:
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def remove(self, x: np.ndarray) -> None:
+        if self.n == 1:
+            self.n = 0
+            self.mean[:] = 0.0
+            self.m2[:] = 0.0
+            return
+        self.n -= 1
+        delta = x - self.mean
+        self.mean -= delta / self.n
+        self.m2 -= delta * (x - self.mean)
+
+    def reset(self, values: np.ndarray) -> None:
+        self.n = len(values)
+        if self.n:
+            self.mean = values.mean(axis=0)
+            self.m2 = ((values - self.mean) ** 2).sum(axis=0)
+        else:
+            self.mean[:] = 0.0
+            self.m2[:] = 0.0
+
+    def with_point(self, x: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Mean and sample std (ddof=1) if x were added, without adding it."""
+        n = self.n + 1
+        delta = x - self.mean
+        mean = self.mean + delta / n
+        if n < 2:
+            return mean, np.full_like(mean, np.nan)
+        m2 = np.maximum(self.m2 + delta * (x - mean), 0.0)
+        return mean, np.sqrt(m2 / (n - 1))
+
+
+class RollingFeatureStore:
+    """
+    O(1) rolling feature rows for the most recent telemetry point.
+
+    push() records a point; feature_row() builds the full FEATURE_COLUMNS
+    row for a point evaluated on top of the recorded history, equivalent to
+    pandas rolling(min(window, n)).mean()/.std() over history + [point].
+    """
+
+    def __init__(self):
+        dims = len(ROLLING_METRICS)
+        self._ring = np.zeros((_HISTORY, dims))
+        self._head = 0  # next write position
+        self._count = 0  # points in the ring (<= _HISTORY)
+        self._total = 0  # points ever pushed
+        self._moments: Dict[int, _SlidingMoments] = {
+            window: _SlidingMoments(window - 1, dims) for window in ROLLING_WINDOWS
+        }
+
+    def __len__(self) -> int:
+        return self._total
+
+    def push(self, data) -> None:
+        """Record a TimeSeriesData point."""
+        x = self._rolling_values(data)
+        for moments in self._moments.values():
+            if moments.n == moments.size:
+                moments.remove(self._ring[(self._head - moments.size) % _HISTORY])
+            moments.add(x)
+        self._ring[self._head] = x
+        self._head = (self._head + 1) % _HISTORY
+        self._count = min(self._count + 1, _HISTORY)
+        self._total += 1
+        if self._total % _REANCHOR_EVERY == 0:
+            self._reanchor()
+
+    def feature_row(self, data) -> np.ndarray:
+        """
+        Full FEATURE_COLUMNS row for data, with failure_occurred = 0.
+
+        NaN statistics (a single-sample window) are reported as 0.0.
+        """
+        x = self._rolling_values(data)
+        row = np.empty(len(FEATURE_COLUMNS))
+        row[:len(BASE_METRICS)] = [getattr(data, name) for name in BASE_METRICS]
+        row[len(BASE_METRICS)] = 0.0
+
+        stats = np.empty((len(ROLLING_METRICS), 2 * len(ROLLING_WINDOWS)))
+        for i, window in enumerate(ROLLING_WINDOWS):
+            mean, std = self._moments[window].with_point(x)
+            stats[:, 2 * i] = mean
+            stats[:, 2 * i + 1] = std
+        row[len(BASE_METRICS) + 1:] = stats.ravel()
+        return np.nan_to_num(row, nan=0.0)
+
+    def clear(self) -> None:
+        self.__init__()
+
+    # Private helper methods
+
+    @staticmethod
+    def _rolling_values(data) -> np.ndarray:
+        return np.array([getattr(data, name) for name in ROLLING_METRICS], dtype=np.float64)
+
+    def _reanchor(self) -> None:
+        """Recompute every window exactly from the ring buffer."""
+        for moments in self._moments.values():
+            count = min(moments.n, self._count)
+            idx = [(self._head - k) % _HISTORY for k in range(count, 0, -1)]
+            moments.reset(self._ring[idx])
+
+
+class TrainingDataWindow:
+    """
+    Append-mostly training data store with time-bucketed retention.
+
+    Points are grouped into fixed-width buckets by timestamp; trim() drops
+    whole buckets older than the cutoff and only inspects the boundary
+    bucket, so retention costs amortized O(1) per append. Iteration yields
+    points bucket by bucket (in timestamp order for in-order appends).
+
+    snapshot() is copy-on-write per bucket: packed arrays are cached and
+    only buckets touched since the previous snapshot are repacked.
+    """
+
+    def __init__(self, bucket_seconds: int = 3600):
+        self.bucket_seconds = bucket_seconds
+        self._keys: List[int] = []  # sorted bucket keys
+        self._buckets: Dict[int, Deque] = {}
+        self._unsorted: set = set()  # buckets that received out-of-order points
+        self._packed: Dict[int, np.ndarray] = {}  # snapshot cache of unchanged buckets
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator:
+        for key in self._keys:
+            yield from self._buckets[key]
+
+    def __getitem__(self, index):
+        return list(self)[index]
+
+    def append(self, data) -> None:
+        key = int(data.timestamp.timestamp()) // self.bucket_seconds
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = deque()
+            if not self._keys or key > self._keys[-1]:
+                self._keys.append(key)
+            else:
+                bisect.insort(self._keys, key)
+        elif bucket and data.timestamp < bucket[-1].timestamp:
+            self._unsorted.add(key)
+        bucket.append(data)
+        self._packed.pop(key, None)
+        self._size += 1
+
+    def extend(self, items: Sequence) -> None:
+        for item in items:
+            self.append(item)
+
+    def trim(self, cutoff: datetime) -> int:
+        """
+        Drop points with timestamp <= cutoff.
+
+        Returns:
+            Number of points removed
+        """
+        removed = 0
+        cutoff_ts = cutoff.timestamp()
+        while self._keys:
+            key = self._keys[0]
+            bucket = self._buckets[key]
+            if (key + 1) * self.bucket_seconds <= cutoff_ts:
+                # Whole bucket is older than the cutoff
+                removed += len(bucket)
+                del self._buckets[key]
+                self._packed.pop(key, None)
+                self._unsorted.discard(key)
+                self._keys.pop(0)
+                continue
+            if key * self.bucket_seconds <= cutoff_ts:
+                before = removed
+                if key in self._unsorted:
+                    # Sort once; afterwards the bucket trims from the left
+                    kept = sorted((d for d in bucket if d.timestamp > cutoff), key=lambda d: d.timestamp)
+                    removed += len(bucket) - len(kept)
+                    self._buckets[key] = bucket = deque(kept)
+                    self._unsorted.discard(key)
+                else:
+                    while bucket and bucket[0].timestamp <= cutoff:
+                        bucket.popleft()
+                        removed += 1
+                if removed != before:
+                    self._packed.pop(key, None)
+                if not bucket:
+                    del self._buckets[key]
+                    self._keys.pop(0)
+            break
+        self._size -= removed
+        return removed
+
+    def snapshot(self, pack: Callable[[Sequence], np.ndarray]) -> np.ndarray:
+        """
+        Pack every point into one array, reusing cached unchanged buckets.
+
+        Args:
+            pack: Turns a sequence of points into a 2-D array (one row each)
+
+        Returns:
+            Independent copy; later appends and trims do not affect it
+        """
+        parts = []
+        for key in self._keys:
+            packed = self._packed.get(key)
+            if packed is None:
+                packed = self._packed[key] = pack(self._buckets[key])
+            parts.append(packed)
+        if not parts:
+            return pack([])
+        return np.concatenate(parts)
+
+    def clear(self) -> None:
+        self._keys.clear()
+        self._buckets.clear()
+        self._unsorted.clear()
+        self._packed.clear()
+        self._size = 0
@@ -10,10 +10,14 @@ The policy engine implements a decision tree:
 3. Evaluate allowed vs. forbidden actions
 4. Determine escalation level (e.g., to SAFE_MODE)
 5. Return structured decision with reasoning
+
+The decision only depends on a small discrete space (phase x severity level
+x in-threshold x recurrent), so the tree is compiled once per policy load
+into a table of validated decision templates; evaluate() is a lookup.
 """
 
 import logging
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, NamedTuple, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
 from state_machine.state_engine import MissionPhase
@@ -26,6 +30,8 @@ from core.input_validation import PolicyDecision as CorePolicyDecision, Validati
 
 logger = logging.getLogger(__name__)
 
+_VALID_ANOMALY_TYPES = CorePolicyDecision.VALID_ANOMALY_TYPES
+
 
 class SeverityLevel(Enum):
     """Severity levels for anomalies."""
@@ -76,6 +82,28 @@ class PolicyDecision:
     reasoning: str
 
 
+class _DecisionTemplate(NamedTuple):
+    """Precomputed, validated decision for one table cell."""
+
+    severity: str
+    is_allowed: bool
+    allowed_actions: Tuple[str, ...]
+    recommended_action: str
+    escalation_level: str
+    confidence: float
+    reasoning_tail: str  # reasoning after "Anomaly type: <type> | "
+
+
+# (phase, severity level, severity within phase thresholds) ->
+#   (template, template when recurrence_count >= 3 or None if the same)
+_DecisionTable = Dict[Tuple[str, SeverityLevel, bool], Tuple[_DecisionTemplate, Optional[_DecisionTemplate]]]
+
+
+class _CompiledPolicy(NamedTuple):
+    config: Dict[str, Any]
+    table: _DecisionTable
+
+
 class MissionPhasePolicyEngine:
     """
     Evaluates anomalies against mission-phase-specific policies.
@@ -103,8 +131,7 @@ class MissionPhasePolicyEngine:
         health_monitor.register_component("policy_engine")
 
         try:
-            self.policy_config = policy_config
-            self._validate_config()
+            self._policy = self._compile(policy_config)
             health_monitor.mark_healthy(
                 "policy_engine", {"phases_loaded": len(policy_config.get("phases", {}))}
             )
@@ -118,21 +145,111 @@ class MissionPhasePolicyEngine:
                 context={"error": str(e)},
             )
 
-    def _validate_config(self):
+    @property
+    def policy_config(self) -> Dict[str, Any]:
+        return self._policy.config
+
+    def reload(self, policy_config: Dict[str, Any]) -> None:
+        """
+        Compile a new policy and swap it in atomically.
+
+        Raises:
+            PolicyEvaluationError: If the new config is invalid; the current
+                policy stays active
+        """
+        self._policy = self._compile(policy_config)
+        logger.info(
+            f"Policy engine reloaded with {len(policy_config.get('phases', {}))} phases"
+        )
+
+    def _compile(self, policy_config: Dict[str, Any]) -> _CompiledPolicy:
+        """Validate a policy config and build its decision table."""
+        self._validate_config(policy_config)
+        table: _DecisionTable = {}
+        for phase in MissionPhase:
+            phase_config = policy_config["phases"].get(phase.value)
+            if not phase_config:
+                continue
+            for severity_level in SeverityLevel:
+                for in_range in (True, False):
+                    base = self._compile_template(phase, phase_config, severity_level, in_range, 0)
+                    recurrent = self._compile_template(phase, phase_config, severity_level, in_range, 3)
+                    table[(phase.value, severity_level, in_range)] = (
+                        base, None if recurrent == base else recurrent
+                    )
+        return _CompiledPolicy(policy_config, table)
+
+    def _compile_template(
+        self,
+        mission_phase: MissionPhase,
+        phase_config: Dict,
+        severity_level: SeverityLevel,
+        in_range: bool,
+        recurrence_count: int,
+    ) -> _DecisionTemplate:
+        """Run the decision tree for one table cell and validate the result."""
+        allowed_actions = phase_config.get("allowed_actions", [])
+        forbidden_actions = phase_config.get("forbidden_actions", [])
+        attributes = {"recurrence_count": recurrence_count}
+
+        # Thresholds are applied through in_range, so skip them here
+        is_allowed = in_range and self._is_response_allowed(
+            mission_phase, phase_config, severity_level, attributes, severity_score=None
+        )
+        escalation_level = self._determine_escalation(
+            mission_phase, phase_config, severity_level, None, is_allowed, attributes
+        )
+        recommended_action = self._select_action(
+            phase_config, escalation_level, allowed_actions, forbidden_actions, None
+        )
+        reasoning = self._build_reasoning(
+            mission_phase, "", severity_level, is_allowed, escalation_level, allowed_actions
+        )
+        template = _DecisionTemplate(
+            severity=severity_level.value,
+            is_allowed=is_allowed,
+            allowed_actions=tuple(allowed_actions),
+            recommended_action=recommended_action,
+            escalation_level=escalation_level.value,
+            # Confidence in decision (higher if phase has specific rules)
+            confidence=0.9 if allowed_actions else 0.7,
+            reasoning_tail=reasoning.split(" | ", 1)[1],
+        )
+
+        # Validate the template fields once; anomaly_type is checked per call.
+        # As before, an invalid decision is logged and still used.
+        try:
+            CorePolicyDecision.validate({
+                'mission_phase': mission_phase.value,
+                'anomaly_type': next(iter(CorePolicyDecision.VALID_ANOMALY_TYPES)),
+                'severity': template.severity,
+                'recommended_action': template.recommended_action,
+                'detection_confidence': template.confidence,
+                'timestamp': '',
+                'reasoning': reasoning,
+            })
+        except ValidationError as e:
+            logger.warning(
+                f"Policy decision validation failed for phase {mission_phase.value}, "
+                f"severity {severity_level.value}: {e}"
+            )
+        return template
+
+    def _validate_config(self, policy_config: Dict[str, Any]):
         """Validate that the policy config has required structure."""
-        if not isinstance(self.policy_config, dict):
+        if not isinstance(policy_config, dict):
             raise PolicyEvaluationError(
                 "Policy config must be a dictionary",
                 component="policy_engine",
-                context={"config_type": str(type(self.policy_config))},
+                context={"config_type": str(type(policy_config))},
             )
 
-        if "phases" not in self.policy_config:
+        if "phases" not in policy_config:
             raise PolicyEvaluationError(
                 "Policy config must have 'phases' key", component="policy_engine"
             )
 
-        phases = self.policy_config["phases"]
+        phases = policy_config["phases"]
         if not isinstance(phases, dict):
             raise PolicyEvaluationError(
                 "Phases must be a dictionary",
@@ -170,94 +287,49 @@ class MissionPhasePolicyEngine:
         if anomaly_attributes is None:
             anomaly_attributes = {}
 
-        # Get phase configuration
-        phase_config = self._get_phase_config(mission_phase)
+        # One snapshot of the compiled policy for the whole evaluation
+        policy = self._policy
+        phase_config = policy.config.get("phases", {}).get(mission_phase.value)
         if not phase_config:
             # No specific config for this phase - use conservative defaults
             return self._make_default_decision(
                 mission_phase, anomaly_type, severity_score
             )
 
-        # Classify severity
+        # Classify severity and check it against phase-specific thresholds
         severity_level = self._classify_severity(severity_score)
+        in_range = True
+        if severity_score is not None:
+            severity_thresholds = phase_config.get("severity_thresholds", {})
+            min_threshold = severity_thresholds.get("min_threshold", 0.0)
+            max_threshold = severity_thresholds.get("max_threshold", 1.0)
+            in_range = min_threshold <= severity_score <= max_threshold
 
-        # Determine allowed actions for this phase
-        allowed_actions = phase_config.get("allowed_actions", [])
-        forbidden_actions = phase_config.get("forbidden_actions", [])
-
-        # Evaluate against severity thresholds
-        severity_thresholds = phase_config.get("severity_thresholds", {})
-
-        # Determine if response is appropriate for this phase
-        is_allowed = self._is_response_allowed(
-            mission_phase,
-            phase_config,
-            severity_level,
-            anomaly_attributes,
-            severity_thresholds,
-            severity_score,
-        )
-
-        # Determine escalation
-        escalation_level = self._determine_escalation(
-            mission_phase,
-            phase_config,
-            severity_level,
-            severity_score,
-            is_allowed,
-            anomaly_attributes,
-        )
-
-        # Select recommended action
-        recommended_action = self._select_action(
-            phase_config, escalation_level, allowed_actions, forbidden_actions, anomaly_type
-        )
-
-        # Build reasoning
-        reasoning = self._build_reasoning(
-            mission_phase,
-            anomaly_type,
-            severity_level,
-            is_allowed,
-            escalation_level,
-            allowed_actions,
-        )
+        template, recurrent = policy.table[(mission_phase.value, severity_level, in_range)]
+        # Recurrent fault escalates (only looked at where it changes the outcome)
+        if recurrent is not None and anomaly_attributes.get("recurrence_count", 0) >= 3:
+            template = recurrent
 
-        # Confidence in decision (higher if phase has specific rules)
-        confidence = 0.9 if allowed_actions else 0.7
+        if anomaly_type not in _VALID_ANOMALY_TYPES:
+            logger.warning(
+                f"Policy decision validation failed: anomaly_type '{anomaly_type}' "
+                f"not in {_VALID_ANOMALY_TYPES}"
+            )
+            # Continue with the decision but log the issue
 
-        decision = PolicyDecision(
+        return PolicyDecision(
             mission_phase=mission_phase.value,
             anomaly_type=anomaly_type,
-            severity=severity_level.value,
+            severity=template.severity,
             severity_score=severity_score,
-            is_allowed=is_allowed,
-            allowed_actions=allowed_actions,
-            recommended_action=recommended_action,
-            escalation_level=escalation_level.value,
-            confidence=confidence,
-            reasoning=reasoning,
+            is_allowed=template.is_allowed,
+            allowed_actions=list(template.allowed_actions),
+            recommended_action=template.recommended_action,
+            escalation_level=template.escalation_level,
+            confidence=template.confidence,
+            reasoning=f"Anomaly type: {anomaly_type} | {template.reasoning_tail}",
         )
 
-        # Validate the decision using core input validation
-        try:
-            # Map local fields to core PolicyDecision fields
-            core_decision_dict = {
-                'mission_phase': decision.mission_phase,
-                'anomaly_type': decision.anomaly_type,
-                'severity': decision.severity,
-                'recommended_action': decision.recommended_action,
-                'detection_confidence': decision.confidence,  # Map confidence to detection_confidence
-                'timestamp': '',  # Add empty timestamp as it's not available
-                'reasoning': decision.reasoning,
-            }
-            CorePolicyDecision.validate(core_decision_dict)
-        except ValidationError as e:
-            logger.warning(f"Policy decision validation failed: {e}")
-            # Continue with the decision but log the issue
-
-        return decision
-
     def _get_phase_config(self, mission_phase: MissionPhase) -> Optional[Dict]:
         """Get configuration for a specific mission phase."""
         phases = self.policy_config.get("phases", {})
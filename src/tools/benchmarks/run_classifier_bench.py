@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Fault Classifier Microbenchmark
+
+Compares the scalar classify() loop against the vectorized classify_batch()
+at increasing row counts and optionally exports the results as JSON.
+
+Usage:
+    python tools/benchmarks/run_classifier_bench.py
+    python tools/benchmarks/run_classifier_bench.py --rows 10000 100000
+    python tools/benchmarks/run_classifier_bench.py --output classifier_bench.json
+"""
+
+import argparse
+import json
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+
+from classifier.fault_classifier import FAULT_TYPES, classify, classify_batch
+
+DEFAULT_ROWS = [10_000, 100_000, 1_000_000]
+
+
+def generate_telemetry(rows: int, seed: int = 42) -> np.ndarray:
+    """Generate a structured telemetry array with a mix of fault conditions."""
+    rng = np.random.default_rng(seed)
+    records = np.empty(rows, dtype=[("voltage", "f8"), ("temperature", "f8"), ("gyro", "f8")])
+    records["voltage"] = rng.normal(8.0, 0.4, rows)
+    records["temperature"] = rng.normal(26.0, 4.0, rows)
+    records["gyro"] = rng.normal(0.0, 0.03, rows)
+    return records
+
+
+def bench_scalar(records: np.ndarray) -> tuple:
+    """Time classify() over one dict per row."""
+    rows = [
+        {"voltage": v, "temperature": t, "gyro": g}
+        for v, t, g in zip(
+            records["voltage"].tolist(), records["temperature"].tolist(), records["gyro"].tolist()
+        )
+    ]
+    start = time.perf_counter()
+    results = [classify(row) for row in rows]
+    return time.perf_counter() - start, results
+
+
+def bench_batch(records: np.ndarray) -> tuple:
+    """Time classify_batch() over the structured array."""
+    start = time.perf_counter()
+    codes, _ = classify_batch(records)
+    return time.perf_counter() - start, codes
+
+
+def run(rows_list: list) -> list:
+    """Run both variants for each row count and verify identical output."""
+    results = []
+    print(f"{'Rows':>12} {'scalar (s)':>12} {'batch (s)':>12} {'rows/s batch':>15} {'speedup':>9}")
+    print("-" * 64)
+    for rows in rows_list:
+        records = generate_telemetry(rows)
+        scalar_s, scalar_results = bench_scalar(records)
+        batch_s, batch_codes = bench_batch(records)
+
+        names = np.array(FAULT_TYPES, dtype=object)[batch_codes]
+        if names.tolist() != scalar_results:
+            print(f"ERROR: classify_batch disagrees with classify at {rows} rows")
+            sys.exit(1)
+
+        speedup = scalar_s / batch_s if batch_s > 0 else float("inf")
+        print(f"{rows:>12,} {scalar_s:>12.4f} {batch_s:>12.4f} {rows / batch_s:>15,.0f} {speedup:>8.1f}x")
+        results.append({
+            "rows": rows,
+            "scalar_seconds": scalar_s,
+            "batch_seconds": batch_s,
+            "speedup": speedup,
+        })
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark classify() vs classify_batch()")
+    parser.add_argument(
+        "--rows", "-n",
+        type=int,
+        nargs="+",
+        default=DEFAULT_ROWS,
+        help="Row counts to benchmark (default: 10k 100k 1M)"
+    )
+    parser.add_argument(
+        "--output", "-o",
+        default=None,
+        help="Optional JSON file to write results to"
+    )
+    args = parser.parse_args()
+
+    print("=" * 64)
+    print("FAULT CLASSIFIER BENCHMARK")
+    print("=" * 64)
+    results = run(args.rows)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"created": datetime.now().isoformat(), "results": results}, f, indent=2)
+        print(f"\nResults saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
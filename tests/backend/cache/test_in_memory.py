@@ -451,3 +451,253 @@ async def test_get_or_set_sync_factory():
     result = await cache.get_or_set("key", factory)
     
     assert result == "sync_computed"
+
+
+# ============================================================================
+# SHARDING AND MEMORY BUDGET TESTS
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_sharded_cache_respects_maxsize():
+    """Test shard limits add up to maxsize."""
+    cache = InMemoryLRUCache(maxsize=64, shards=8)
+    
+    for i in range(500):
+        await cache.set(f"key{i}", i)
+    
+    stats = cache.stats()
+    assert stats.size <= 64
+    assert stats.evictions == 500 - stats.size
+    assert await cache.get("key499") == 499
+
+
+@pytest.mark.asyncio
+async def test_byte_budget_evicts_lru():
+    """Test eviction by estimated memory once max_bytes is reached."""
+    cache = InMemoryLRUCache(maxsize=1000, max_bytes=4000, shards=1)
+    
+    for i in range(20):
+        await cache.set(f"key{i}", "x" * 400)
+    
+    stats = cache.stats()
+    assert stats.size_bytes <= 4000
+    assert stats.size < 20
+    assert await cache.get("key0") is None
+    assert await cache.get("key19") == "x" * 400
+
+
+@pytest.mark.asyncio
+async def test_entry_larger_than_budget_is_rejected():
+    """Test set returns False for an entry that can never fit."""
+    cache = InMemoryLRUCache(maxsize=10, max_bytes=1000, shards=1)
+    
+    assert await cache.set("big", "x" * 5000) is False
+    assert await cache.get("big") is None
+
+
+@pytest.mark.asyncio
+async def test_size_bytes_tracks_replace_and_invalidate():
+    """Test byte accounting on overwrite, invalidate and clear."""
+    cache = InMemoryLRUCache(maxsize=10)
+    
+    await cache.set("key", "x" * 100)
+    small = cache.stats().size_bytes
+    await cache.set("key", "x" * 1000)
+    assert cache.stats().size_bytes == small + 900
+    
+    await cache.invalidate("key")
+    assert cache.stats().size_bytes == 0
+    
+    await cache.set("a", [1, 2, 3])
+    await cache.clear()
+    assert cache.stats().size_bytes == 0
+
+
+# ============================================================================
+# SINGLE-FLIGHT AND EARLY REFRESH TESTS
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_coalesces_concurrent_misses():
+    """Test concurrent misses on one key call the factory once."""
+    cache = InMemoryLRUCache(maxsize=10)
+    call_count = 0
+    
+    async def factory():
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(0.05)
+        return "computed"
+    
+    results = await asyncio.gather(*[cache.get_or_set("key", factory) for _ in range(20)])
+    
+    assert results == ["computed"] * 20
+    assert call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_shares_factory_errors():
+    """Test waiters see the loader's exception and the next call retries."""
+    cache = InMemoryLRUCache(maxsize=10)
+    call_count = 0
+    
+    async def failing():
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(0.02)
+        raise ValueError("backend down")
+    
+    results = await asyncio.gather(
+        *[cache.get_or_set("key", failing) for _ in range(5)],
+        return_exceptions=True,
+    )
+    
+    assert call_count == 1
+    assert all(isinstance(r, ValueError) for r in results)
+    assert await cache.get_or_set("key", lambda: "recovered") == "recovered"
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_survives_cancelled_waiter():
+    """Test cancelling one waiter leaves the shared load and other waiters intact."""
+    cache = InMemoryLRUCache(maxsize=10)
+    call_count = 0
+    release = asyncio.Event()
+    
+    async def factory():
+        nonlocal call_count
+        call_count += 1
+        await release.wait()
+        return "computed"
+    
+    leader = asyncio.create_task(cache.get_or_set("key", factory))
+    await asyncio.sleep(0.01)
+    cancelled = asyncio.create_task(cache.get_or_set("key", factory))
+    waiter = asyncio.create_task(cache.get_or_set("key", factory))
+    await asyncio.sleep(0.01)
+    
+    cancelled.cancel()
+    await asyncio.sleep(0.01)
+    release.set()
+    
+    assert await leader == "computed"
+    assert await waiter == "computed"
+    assert cancelled.cancelled()
+    assert call_count == 1
+    assert cache._inflight_loads() == {}
+
+
+@pytest.mark.asyncio
+async def test_get_or_set_waiter_takes_over_cancelled_load():
+    """Test a waiter reloads when the loading caller is cancelled."""
+    cache = InMemoryLRUCache(maxsize=10)
+    calls = []
+    
+    async def factory():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "computed"
+    
+    leader = asyncio.create_task(cache.get_or_set("key", factory))
+    await asyncio.sleep(0.01)
+    waiters = [asyncio.create_task(cache.get_or_set("key", factory)) for _ in range(2)]
+    await asyncio.sleep(0.01)
+    leader.cancel()
+    
+    assert await asyncio.gather(*waiters) == ["computed", "computed"]
+    assert len(calls) == 2
+    assert cache._inflight_loads() == {}
+
+
+def test_get_or_set_coalesces_across_threads():
+    """Test callers on different threads and event loops share one load."""
+    cache = InMemoryLRUCache(maxsize=10)
+    call_count = 0
+    count_lock = threading.Lock()
+    
+    def factory():
+        nonlocal call_count
+        with count_lock:
+            call_count += 1
+        time.sleep(0.1)
+        return "computed"
+    
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(asyncio.run, cache.get_or_set("key", factory))
+            for _ in range(8)
+        ]
+        results = [f.result() for f in futures]
+    
+    assert results == ["computed"] * 8
+    assert call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_early_refresh_reloads_before_expiry(monkeypatch):
+    """Test XFetch reloads a hit close to expiry and not a fresh one."""
+    import backend.cache.in_memory as in_memory
+    
+    # Fix the draw: head start = load time * beta * ln(2) ~= 0.2s
+    monkeypatch.setattr(in_memory.random, "random", lambda: 0.5)
+    cache = InMemoryLRUCache(maxsize=10, default_ttl=1, early_refresh_beta=1.0)
+    call_count = 0
+    
+    async def slow_factory():
+        nonlocal call_count
+        call_count += 1
+        await asyncio.sleep(0.3)
+        return call_count
+    
+    assert await cache.get_or_set("key", slow_factory) == 1
+    assert await cache.get_or_set("key", slow_factory) == 1  # Fresh hit
+    
+    await asyncio.sleep(0.85)
+    assert await cache.get("key") == 1  # Not expired yet
+    assert await cache.get_or_set("key", slow_factory) == 2
+
+
+@pytest.mark.asyncio
+async def test_early_refresh_disabled_by_default():
+    """Test hits are never reloaded early without early_refresh_beta."""
+    cache = InMemoryLRUCache(maxsize=10, default_ttl=60)
+    await cache.set("key", "value")
+    
+    assert not any(cache._refresh_due("key") for _ in range(100))
+
+
+# ============================================================================
+# METRICS BATCHING TESTS
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_metrics_counters_are_batched():
+    """Test hit/miss counters reach the sink in batches with exact totals."""
+    from backend.cache.in_memory import METRICS_BATCH
+    
+    class RecordingSink:
+        def __init__(self):
+            self.counters = {}
+            self.histograms = 0
+        
+        def emit_counter(self, name, value=1.0, tags=None):
+            self.counters[name] = self.counters.get(name, 0) + value
+        
+        def emit_histogram(self, name, value, tags=None):
+            self.histograms += 1
+    
+    sink = RecordingSink()
+    cache = InMemoryLRUCache(maxsize=10, metrics_sink=sink, shards=1)
+    await cache.set("key", "value")
+    
+    for _ in range(150):
+        await cache.get("key")
+    for _ in range(50):
+        await cache.get("missing")
+    
+    assert sink.histograms == 200 // METRICS_BATCH
+    cache.flush_metrics()
+    assert sink.counters == {"cache_hits_total": 150, "cache_misses_total": 50}
@@ -331,3 +331,46 @@ async def test_metrics_emission_on_miss(mock_storage):
         "cache_misses" in str(call) 
         for call in mock_sink.emit_counter.call_args_list
     )
+
+
+# ============================================================================
+# REDIS ADAPTER ROUND-TRIP TESTS
+# ============================================================================
+
+
+class StubRedisClient:
+    """get/set stand-in for the raw client (no pipeline support)."""
+    
+    def __init__(self):
+        self.data = {}
+    
+    async def get(self, key):
+        return self.data.get(key)
+    
+    async def set(self, key, value, ex=None):
+        self.data[key] = value
+        return True
+
+
+@pytest.fixture
+def adapter_cache():
+    """RedisCache over a RedisAdapter with a stub client."""
+    from backend.storage.redis_adapter import RedisAdapter
+    
+    adapter = RedisAdapter(max_retries=1, retry_delay=0)
+    adapter.redis = StubRedisClient()
+    adapter.connected = True
+    return RedisCache(storage=adapter, default_ttl=60)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("value", [
+    "hello", "123", "true", "null", "", {"data": "value"}, [1, "2"], 42, 1.5, False,
+])
+async def test_round_trip_over_redis_adapter(adapter_cache, value):
+    """Test values are decoded exactly once when the adapter decodes JSON."""
+    assert await adapter_cache.set("key", value)
+    
+    assert await adapter_cache.get("key") == value
+    assert await adapter_cache.get_many(["key", "missing"]) == {"key": value}
+    assert adapter_cache.stats().misses == 1
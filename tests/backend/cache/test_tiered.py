@@ -0,0 +1,308 @@
+"""
+Tests for TieredCache (local L1 in front of a shared L2).
+
+L2 is a RedisCache over MemoryStorage and invalidations go through
+LocalInvalidationBus, or RedisInvalidationBus with a local pub/sub
+stand-in, so no Redis server is needed.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from backend.cache.in_memory import InMemoryLRUCache
+from backend.cache.redis_cache import RedisCache
+from backend.cache.tiered import LocalInvalidationBus, RedisInvalidationBus, TieredCache
+from backend.storage.memory import MemoryStorage
+
+
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+
+class CountingStorage(MemoryStorage):
+    """MemoryStorage that counts reads (stands in for Redis round-trips)."""
+    
+    def __init__(self):
+        super().__init__()
+        self.gets = 0
+    
+    async def get(self, key):
+        self.gets += 1
+        return await super().get(key)
+
+
+class FakePubSub:
+    """Minimal redis.asyncio PubSub stand-in."""
+    
+    def __init__(self, broker):
+        self._broker = broker
+        self._queue = asyncio.Queue()
+    
+    async def subscribe(self, channel):
+        self._broker.setdefault(channel, []).append(self._queue)
+        await self._queue.put({"type": "subscribe", "data": 1})
+    
+    async def unsubscribe(self, channel):
+        self._broker[channel].remove(self._queue)
+    
+    async def aclose(self):
+        pass
+    
+    async def listen(self):
+        while True:
+            yield await self._queue.get()
+
+
+class FakeRedis:
+    """publish()/pubsub() stand-in sharing one in-process broker."""
+    
+    def __init__(self, broker):
+        self._broker = broker
+    
+    def pubsub(self):
+        return FakePubSub(self._broker)
+    
+    async def publish(self, channel, data):
+        for queue in self._broker.get(channel, []):
+            await queue.put({"type": "message", "data": data})
+        return len(self._broker.get(channel, []))
+
+
+def make_node(storage, bus, l1_ttl=5):
+    l1 = InMemoryLRUCache(maxsize=100)
+    l2 = RedisCache(storage=storage, default_ttl=60)
+    return TieredCache(l1, l2, bus=bus, l1_ttl=l1_ttl)
+
+
+@pytest.fixture
+def storage():
+    return CountingStorage()
+
+
+# ============================================================================
+# READ PATH TESTS
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_hot_reads_are_served_from_l1(storage):
+    """Test repeated reads hit L1 and skip L2."""
+    cache = make_node(storage, LocalInvalidationBus())
+    await cache.set("key", {"data": "value"})
+    
+    for _ in range(10):
+        assert await cache.get("key") == {"data": "value"}
+    
+    assert storage.gets == 0
+    stats = cache.stats()
+    assert stats.tiers["l1"].hits == 10
+    assert stats.tiers["l2"].hits == 0
+
+
+@pytest.mark.asyncio
+async def test_l2_hit_populates_l1(storage):
+    """Test a value written by another node is read from L2 once."""
+    bus = LocalInvalidationBus()
+    writer, reader = make_node(storage, bus), make_node(storage, bus)
+    await writer.set("key", "value")
+    
+    assert await reader.get("key") == "value"
+    assert await reader.get("key") == "value"
+    
+    assert storage.gets == 1
+    stats = reader.stats()
+    assert stats.tiers["l1"].hits == 1 and stats.tiers["l1"].misses == 1
+    assert stats.tiers["l2"].hits == 1
+    assert stats.hits == 2 and stats.misses == 0
+    assert stats.tiers["l2"].mean_latency_ms > 0
+
+
+@pytest.mark.asyncio
+async def test_miss_in_both_tiers(storage):
+    """Test a key missing everywhere counts as one miss."""
+    cache = make_node(storage, LocalInvalidationBus())
+    
+    assert await cache.get("missing") is None
+    
+    stats = cache.stats()
+    assert stats.misses == 1
+    assert stats.hit_rate() == 0.0
+
+
+# ============================================================================
+# INVALIDATION TESTS
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_set_invalidates_other_nodes_l1(storage):
+    """Test a write on one node evicts the stale L1 copy on another."""
+    bus = LocalInvalidationBus()
+    node_a, node_b = make_node(storage, bus), make_node(storage, bus)
+    await node_a.set("key", "v1")
+    assert await node_b.get("key") == "v1"
+    
+    await node_a.set("key", "v2")
+    
+    assert await node_b.get("key") == "v2"
+
+
+@pytest.mark.asyncio
+async def test_invalidate_and_clear_propagate(storage):
+    """Test invalidate and clear reach every node's L1."""
+    bus = LocalInvalidationBus()
+    node_a, node_b = make_node(storage, bus), make_node(storage, bus)
+    await node_a.set_many({"k1": 1, "k2": 2})
+    assert await node_b.get_many(["k1", "k2"]) == {"k1": 1, "k2": 2}
+    
+    await node_a.invalidate("k1")
+    assert await node_b.get("k1") is None
+    
+    await node_a.clear()
+    assert await node_b.l1.get("k2") is None
+    assert await node_b.get("k2") is None
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_l2_read_skips_l1_fill(storage):
+    """Test an L2 read overlapping an invalidation is not cached in L1."""
+    bus = LocalInvalidationBus()
+    node_a, node_b = make_node(storage, bus), make_node(storage, bus)
+    await node_a.set("key", "old")
+    
+    original_get = node_b.l2.get
+    
+    async def racing_get(key):
+        value = await original_get(key)
+        await node_a.set("key", "new")  # Lands while the old value is in flight
+        return value
+    
+    node_b.l2.get = racing_get
+    assert await node_b.get("key") == "old"
+    node_b.l2.get = original_get
+    
+    assert await node_b.l1.get("key") is None
+    assert await node_b.get("key") == "new"
+
+
+@pytest.mark.asyncio
+async def test_l1_ttl_bounds_staleness_without_bus(storage):
+    """Test L1 copies expire on their own when no channel is available."""
+    node_a = make_node(storage, bus=None, l1_ttl=1)
+    node_b = make_node(storage, bus=None, l1_ttl=1)
+    await node_a.set("key", "v1")
+    assert await node_b.get("key") == "v1"
+    
+    await node_a.set("key", "v2")
+    assert await node_b.get("key") == "v1"  # Stale until L1 TTL
+    
+    await asyncio.sleep(1.1)
+    assert await node_b.get("key") == "v2"
+
+
+@pytest.mark.asyncio
+async def test_redis_pubsub_bus(storage):
+    """Test invalidations over the Redis pub/sub bus."""
+    broker = {}
+    node_a = make_node(storage, RedisInvalidationBus(FakeRedis(broker)))
+    node_b = make_node(storage, RedisInvalidationBus(FakeRedis(broker)))
+    await node_a.start()
+    await node_b.start()
+    
+    await node_a.set("key", "v1")
+    assert await node_b.get("key") == "v1"
+    await node_a.set("key", "v2")
+    
+    for _ in range(100):
+        if await node_b.l1.get("key") is None:
+            break
+        await asyncio.sleep(0.01)
+    assert await node_b.get("key") == "v2"
+    
+    await node_a.close()
+    await node_b.close()
+    assert broker["astra:cache:invalidate"] == []
+
+
+# ============================================================================
+# BATCH OPERATION TESTS
+# ============================================================================
+
+
+class FakePipeline:
+    def __init__(self, data):
+        self._data = data
+        self._ops = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc):
+        return False
+    
+    def set(self, key, value, ex=None):
+        self._ops.append((key, value, ex))
+    
+    async def execute(self):
+        for key, value, _ in self._ops:
+            self._data[key] = value
+        return [True] * len(self._ops)
+
+
+class FakeRedisClient:
+    """mget()/pipeline() stand-in recording round-trips."""
+    
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+    
+    async def mget(self, keys):
+        self.round_trips += 1
+        return [self.data.get(key) for key in keys]
+    
+    def pipeline(self, transaction=True):
+        self.round_trips += 1
+        return FakePipeline(self.data)
+
+
+@pytest.mark.asyncio
+async def test_redis_cache_batches_round_trips():
+    """Test RedisCache get_many/set_many use one round-trip each."""
+    client = FakeRedisClient()
+    storage = MemoryStorage()
+    storage.redis = client
+    cache = RedisCache(storage=storage, default_ttl=60)
+    
+    assert await cache.set_many({f"k{i}": {"i": i} for i in range(50)})
+    found = await cache.get_many([f"k{i}" for i in range(60)])
+    
+    assert client.round_trips == 2
+    assert len(found) == 50
+    assert found["k7"] == {"i": 7}
+    assert json.loads(client.data["astra:cache:k7"]) == {"i": 7}
+    assert cache.stats().misses == 10
+
+
+@pytest.mark.asyncio
+async def test_tiered_get_many_only_asks_l2_for_l1_misses():
+    """Test get_many serves L1 hits locally and batches the rest."""
+    client = FakeRedisClient()
+    storage = MemoryStorage()
+    storage.redis = client
+    l2 = RedisCache(storage=storage, default_ttl=60)
+    cache = TieredCache(InMemoryLRUCache(maxsize=100), l2, bus=LocalInvalidationBus())
+    
+    await l2.set_many({f"k{i}": i for i in range(10)})
+    await cache.get_many(["k0", "k1"])
+    client.round_trips = 0
+    
+    found = await cache.get_many([f"k{i}" for i in range(10)])
+    
+    assert found == {f"k{i}": i for i in range(10)}
+    assert client.round_trips == 1
+    stats = cache.stats()
+    assert stats.tiers["l1"].hits == 2
+    assert stats.tiers["l2"].hits == 10
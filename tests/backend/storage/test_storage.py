@@ -8,6 +8,7 @@ unless explicitly enabled with REDIS_TEST_URL environment variable.
 
 import pytest
 import asyncio
+import json
 import time
 import os
 from typing import Type
@@ -232,6 +233,38 @@ class TestMemoryStorage:
         keys = await storage.scan_keys("concurrent:*")
         assert len(keys) == 10
 
+    @pytest.mark.asyncio
+    async def test_bulk_operations(self, storage):
+        """Test mget/mset/delete_many round-trip values in key order."""
+        result = await storage.mset({"bulk:1": "a", "bulk:2": {"n": 2}, "bulk:3": [3]})
+        assert result is True
+
+        values = await storage.mget(["bulk:2", "missing", "bulk:1", "bulk:3"])
+        assert values == [{"n": 2}, None, "a", [3]]
+
+        deleted = await storage.delete_many(["bulk:1", "bulk:2", "missing"])
+        assert deleted == 2
+        assert await storage.mget(["bulk:1", "bulk:3"]) == [None, [3]]
+
+    @pytest.mark.asyncio
+    async def test_mset_with_expiry(self, storage):
+        """Test mset applies one TTL to every key."""
+        await storage.mset({"temp:1": 1, "temp:2": 2}, expire=1)
+        assert await storage.mget(["temp:1", "temp:2"]) == [1, 2]
+
+        await asyncio.sleep(1.1)
+
+        assert await storage.mget(["temp:1", "temp:2"]) == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_scan_iter(self, storage):
+        """Test scan_iter yields every matching key across pages."""
+        await storage.mset({f"user:{i}": i for i in range(25)})
+        await storage.set("product:1", "widget")
+
+        keys = [key async for key in storage.scan_iter("user:*", count=10)]
+        assert sorted(keys) == sorted(f"user:{i}" for i in range(25))
+
 
 class TestRedisAdapter:
     """Test suite for Redis adapter (interface tests only)."""
@@ -310,6 +343,154 @@ class TestRedisAdapter:
         assert value is None
 
 
+class FakePipeline:
+    """Pipeline stand-in: queues commands, replays them on execute()."""
+
+    def __init__(self, client):
+        self._client = client
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+        return queue
+
+    async def execute(self):
+        self._client.round_trips += 1
+        if self._client.fail_next:
+            self._client.fail_next -= 1
+            raise ConnectionError("connection reset")
+        return [getattr(self._client, "_" + name)(*args, **kwargs)
+                for name, args, kwargs in self._commands]
+
+
+class FakeRedis:
+    """Local stand-in for redis.asyncio.Redis counting round-trips."""
+
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+        self.fail_next = 0
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+    async def get(self, key):
+        self.round_trips += 1
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.round_trips += 1
+        return self._set(key, value, ex)
+
+    async def scan(self, cursor=0, match="*", count=10):
+        self.round_trips += 1
+        prefix = match.rstrip("*")
+        keys = sorted(k for k in self.data if k.startswith(prefix))
+        page = keys[cursor:cursor + count]
+        next_cursor = cursor + count if cursor + count < len(keys) else 0
+        return next_cursor, page
+
+    def _mget(self, keys):
+        return [self.data.get(k) for k in keys]
+
+    def _mset(self, mapping):
+        self.data.update(mapping)
+        return True
+
+    def _set(self, key, value, ex=None):
+        self.data[key] = value
+        return True
+
+    def _delete(self, *keys):
+        return sum(self.data.pop(k, None) is not None for k in keys)
+
+
+class TestRedisAdapterBulkOperations:
+    """Bulk operations against a local Redis stand-in (no server needed)."""
+
+    @pytest.fixture
+    def fake_redis(self):
+        return FakeRedis()
+
+    @pytest.fixture
+    def adapter(self, fake_redis):
+        adapter = RedisAdapter(max_retries=2, retry_delay=0)
+        adapter.redis = fake_redis
+        adapter.connected = True
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_mset_and_mget_use_one_round_trip_each(self, adapter, fake_redis):
+        """Test bulk set/get are one pipeline each."""
+        items = {f"health:{i}": {"status": "ok", "i": i} for i in range(1200)}
+
+        assert await adapter.mset(items) is True
+        assert fake_redis.round_trips == 1
+
+        values = await adapter.mget(list(items) + ["missing"])
+        assert fake_redis.round_trips == 2
+        assert values[:-1] == list(items.values())
+        assert values[-1] is None
+
+    @pytest.mark.asyncio
+    async def test_mset_with_expiry_and_serializes_once(self, adapter, fake_redis, monkeypatch):
+        """Test values are serialized once even when the pipeline is retried."""
+        calls = []
+        original = adapter._serialize
+        monkeypatch.setattr(adapter, "_serialize", lambda v: calls.append(v) or original(v))
+        fake_redis.fail_next = 1
+
+        assert await adapter.mset({"vote:a": {"v": 1}, "vote:b": {"v": 2}}, expire=30) is True
+
+        assert len(calls) == 2
+        assert fake_redis.round_trips == 2  # One failed attempt, one retry
+        assert json.loads(fake_redis.data["vote:a"]) == {"v": 1}
+
+    @pytest.mark.asyncio
+    async def test_delete_many(self, adapter, fake_redis):
+        """Test delete_many counts deleted keys in one round-trip."""
+        await adapter.mset({"vote:a": 1, "vote:b": 2})
+        fake_redis.round_trips = 0
+
+        assert await adapter.delete_many(["vote:a", "vote:b", "vote:c"]) == 2
+        assert fake_redis.round_trips == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_failure_returns_defaults(self, adapter, fake_redis):
+        """Test exhausted retries degrade like the single-key operations."""
+        fake_redis.fail_next = 2
+
+        assert await adapter.mget(["a", "b"]) == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_scan_iter_yields_pages(self, adapter, fake_redis):
+        """Test scan_iter streams keys page by page and can stop early."""
+        await adapter.mset({f"health:{i:03}": i for i in range(250)})
+        fake_redis.round_trips = 0
+
+        first = []
+        async for key in adapter.scan_iter("health:*", count=100):
+            first.append(key)
+            if len(first) == 10:
+                break
+        assert fake_redis.round_trips == 1
+
+        assert len(await adapter.scan_keys("health:*")) == 250
+
+    @pytest.mark.asyncio
+    async def test_set_accepts_ttl_alias(self, adapter, fake_redis):
+        """Test set(ttl=...) as used by RedisCache."""
+        assert await adapter.set("cache:key", "value", ttl=60) is True
+        assert fake_redis.data["cache:key"] == "value"
+
+
 class TestCompatibilityShim:
     """Test backward compatibility imports."""
 
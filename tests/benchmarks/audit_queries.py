@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Audit Query and Verification Benchmarks
+
+Compares query_audit_logs against a full scan of every segment (the
+previous behaviour), and integrity verification in-process against the
+process pool over checkpointed segments, including a resumed run.
+Run with: python benchmarks/audit_queries.py
+"""
+
+import json
+import os
+import tempfile
+import time
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import structlog
+
+from core.audit_logger import AuditEventType, AuditLogger
+
+EVENTS = 100_000
+USERS = 500
+SEGMENT_BYTES = 2 * 1024 * 1024
+
+
+def full_scan(logger: AuditLogger, user_id: str) -> list:
+    """Previous behaviour: parse every line of every segment."""
+    results = []
+    log_files = [logger.audit_log_path] + [
+        p for p in logger.log_dir.glob("audit.log.*") if p.suffix.lstrip(".").isdigit()
+    ]
+    for log_file in log_files:
+        with open(log_file) as f:
+            for line in f:
+                entry = json.loads(line)
+                if entry.get("user_id") == user_id:
+                    results.append(entry)
+    return results
+
+
+def timed(fn, *args, **kwargs):
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return time.perf_counter() - start, result
+
+
+def print_results():
+    # Keep console output out of the measurement
+    structlog.configure(logger_factory=structlog.ReturnLoggerFactory())
+
+    print("=" * 72)
+    print("AUDIT QUERY AND VERIFICATION BENCHMARK")
+    print("=" * 72)
+    print()
+
+    with tempfile.TemporaryDirectory() as log_dir:
+        logger = AuditLogger(
+            log_dir=log_dir, max_bytes=SEGMENT_BYTES, backup_count=1000,
+            fsync_policy="never",
+        )
+        for i in range(EVENTS):
+            logger.log_event(
+                AuditEventType.DATA_ACCESS, user_id=f"user-{i % USERS}",
+                resource=f"telemetry/{i % 97}", action="read",
+            )
+        logger.flush(timeout=None)
+        segments = len(logger._checkpoints) + 1
+        print(f"{EVENTS:,} events, {segments} segments, {USERS} users")
+        print()
+
+        scan_s, scanned = timed(full_scan, logger, "user-7")
+        logger.query_audit_logs(user_id="user-7", limit=EVENTS)  # load sidecars
+        index_s, indexed = timed(logger.query_audit_logs, user_id="user-7", limit=EVENTS)
+        assert len(scanned) == len(indexed)
+        print("| Query (one user)       | Time (ms) |")
+        print("|------------------------|-----------|")
+        print(f"| Full scan              | {scan_s * 1e3:9.1f} |")
+        print(f"| Sidecar index          | {index_s * 1e3:9.1f} |")
+        print()
+
+        logger.verify_workers = 0
+        serial_s, ok_serial = timed(logger.verify_integrity)
+        logger.verify_workers = os.cpu_count()
+        parallel_s, ok_parallel = timed(logger.verify_integrity)
+        logger.verify_integrity(resume=True)
+        resume_s, ok_resume = timed(logger.verify_integrity, resume=True)
+        assert ok_serial and ok_parallel and ok_resume
+        print("| Verification           | Time (ms) |")
+        print("|------------------------|-----------|")
+        print(f"| In-process             | {serial_s * 1e3:9.1f} |")
+        print(f"| Process pool           | {parallel_s * 1e3:9.1f} |")
+        print(f"| Resumed                | {resume_s * 1e3:9.1f} |")
+        print("(The default only uses the pool past PARALLEL_VERIFY_MIN_BYTES.)")
+        logger.close()
+
+    print()
+    print("=" * 72)
+    print("BENCHMARK COMPLETE")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    print_results()
@@ -9,6 +9,7 @@ Output is formatted for inclusion in pull requests.
 """
 
 import asyncio
+import threading
 import time
 import statistics
 from typing import List, Tuple
@@ -19,6 +20,10 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from backend.cache.in_memory import InMemoryLRUCache
+from backend.cache.redis_cache import RedisCache
+from backend.cache.tiered import LocalInvalidationBus, TieredCache
+from backend.health.sinks import NoOpMetricsSink
+from backend.storage.memory import MemoryStorage
 
 
 def format_duration(ms: float) -> str:
@@ -188,6 +193,89 @@ async def benchmark_eviction_pressure() -> dict:
     }
 
 
+def benchmark_thread_contention(shards: int, threads: int, ops_per_thread: int = 20000) -> float:
+    """Mixed get/set ops per second from many threads (90% reads)."""
+    cache = InMemoryLRUCache(maxsize=10000, shards=shards, metrics_sink=NoOpMetricsSink())
+    for i in range(5000):
+        asyncio.run(cache.set(f"key_{i}", {"value": i}))
+    barrier = threading.Barrier(threads + 1)
+
+    def worker(seed: int):
+        # Drive the coroutines directly: no I/O inside, so one send() completes them
+        def run(coro):
+            try:
+                coro.send(None)
+            except StopIteration:
+                pass
+        barrier.wait()
+        for i in range(ops_per_thread):
+            key = f"key_{(seed * 7919 + i * 31) % 5000}"
+            if i % 10 == 0:
+                run(cache.set(key, {"value": i}))
+            else:
+                run(cache.get(key))
+
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    return threads * ops_per_thread / (time.perf_counter() - start)
+
+
+async def benchmark_stampede(coalesce: bool, callers: int = 1000, keys: int = 10) -> Tuple[int, float]:
+    """Concurrent misses on a few hot keys: loader calls and wall time."""
+    cache = InMemoryLRUCache(maxsize=1000)
+    loads = 0
+
+    async def load():
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.01)  # 10ms simulated backend call
+        return {"loaded": loads}
+
+    async def naive(key: str):
+        value = await cache.get(key)
+        if value is None:
+            value = await load()
+            await cache.set(key, value)
+        return value
+
+    start = time.perf_counter()
+    await asyncio.gather(*[
+        cache.get_or_set(f"hot_{i % keys}", load) if coalesce else naive(f"hot_{i % keys}")
+        for i in range(callers)
+    ])
+    return loads, (time.perf_counter() - start) * 1000
+
+
+class RemoteStorage(MemoryStorage):
+    """MemoryStorage with a simulated network round-trip per read."""
+
+    async def get(self, key):
+        await asyncio.sleep(0.0005)
+        return await super().get(key)
+
+
+async def benchmark_tiered_hot_reads(reads: int = 2000, keys: int = 100) -> Tuple[float, float, float]:
+    """Mean hot-read latency: RedisCache alone vs TieredCache; L1 hit ratio."""
+    storage = RemoteStorage()
+    l2 = RedisCache(storage=storage, default_ttl=60)
+    tiered = TieredCache(InMemoryLRUCache(maxsize=1000), l2, bus=LocalInvalidationBus())
+    for i in range(keys):
+        await l2.set(f"hot_{i}", {"id": i, "payload": "x" * 200})
+
+    timings = {}
+    for name, cache in (("redis", l2), ("tiered", tiered)):
+        start = time.perf_counter()
+        for i in range(reads):
+            await cache.get(f"hot_{i % keys}")
+        timings[name] = (time.perf_counter() - start) * 1000 / reads
+    return timings["redis"], timings["tiered"], tiered.stats().tiers["l1"].hit_rate()
+
+
 def print_results():
     """Run all benchmarks and print results."""
     print("=" * 60)
@@ -241,6 +329,33 @@ def print_results():
     print(f"- P99 SET (with eviction): {format_duration(eviction['set_with_eviction_p99_ms'])}")
     print()
     
+    # Contention
+    print("## Thread Contention (get/set ops/second, 90% reads, NoOp sink)\n")
+    print("| Threads | 1 shard     | 16 shards   |")
+    print("|---------|-------------|-------------|")
+    for threads in (1, 4, 16):
+        single = benchmark_thread_contention(1, threads)
+        sharded = benchmark_thread_contention(16, threads)
+        print(f"| {threads:7} | {single:11,.0f} | {sharded:11,.0f} |")
+    print()
+
+    print("## Miss Stampede (1000 coroutines, 10 keys, 10ms loader)\n")
+    print("| Strategy          | Loader calls | Wall time |")
+    print("|-------------------|--------------|-----------|")
+    for name, coalesce in (("get, load, set", False), ("get_or_set", True)):
+        loads, wall_ms = asyncio.run(benchmark_stampede(coalesce))
+        print(f"| {name:17} | {loads:12} | {format_duration(wall_ms):9} |")
+    print()
+
+    print("## Tiered Near-Cache (0.5ms simulated Redis read, 100 hot keys)\n")
+    redis_ms, tiered_ms, l1_hit_rate = asyncio.run(benchmark_tiered_hot_reads())
+    print("| Cache              | Mean read |")
+    print("|--------------------|-----------|")
+    print(f"| RedisCache         | {format_duration(redis_ms):9} |")
+    print(f"| TieredCache        | {format_duration(tiered_ms):9} |")
+    print(f"\nL1 hit rate: {l1_hit_rate:.1%}")
+    print()
+
     print("=" * 60)
     print("BENCHMARK COMPLETE")
     print("=" * 60)
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""
+StateCompressor Throughput Benchmarks
+
+Compares summaries/sec and transient memory per message of the legacy
+byte-concatenation stages, the buffer-based compress_health() and the
+vectorized compress_batch().
+Run with: python benchmarks/compressor_throughput.py
+"""
+
+import struct
+import time
+import tracemalloc
+from datetime import datetime
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.swarm.compressor import StateCompressor
+from astraguard.swarm.models import HealthSummary
+
+AGENT_COUNTS = [10, 100, 1000]
+ROUNDS = 20
+
+
+def make_summaries(count: int, round_index: int = 0) -> list:
+    return [
+        HealthSummary(
+            anomaly_signature=[((i + j + round_index) % 50) / 50 - 0.5 for j in range(32)],
+            risk_score=(i % 10) / 10,
+            recurrence_score=(i % 20) / 2,
+            timestamp=datetime.utcnow(),
+        )
+        for i in range(count)
+    ]
+
+
+def legacy_compress(summary: HealthSummary, prev: HealthSummary) -> bytes:
+    """Stages 1+2 as previously implemented (one struct.pack per float)."""
+    deltas = [c - p for c, p in zip(summary.anomaly_signature, prev.anomaly_signature)]
+    delta = struct.pack("<f", summary.risk_score)
+    delta += struct.pack("<f", summary.recurrence_score)
+    for value in deltas:
+        delta += struct.pack("<f", value)
+
+    output = delta[:8]
+    offset = 8
+    while offset < len(delta):
+        value = struct.unpack_from("<f", delta, offset)[0]
+        offset += 4
+        clamped = max(-1.0, min(1.0, value))
+        output += struct.pack("<B", int(round((clamped + 1.0) / 2.0 * 255)))
+    return struct.pack("<BBH", 1, 0, 140) + output
+
+
+def run_legacy(summaries, prevs):
+    return [legacy_compress(s, p) for s, p in zip(summaries, prevs)]
+
+
+def run_single(summaries, prevs):
+    compressors = [StateCompressor(prev_state=p) for p in prevs]
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for compressor, summary, prev in zip(compressors, summaries, prevs):
+            compressor.prev_anomaly_sig = prev.anomaly_signature
+            compressor.compress_health(summary, use_lz4=False)
+    return time.perf_counter() - start
+
+
+def run_batch(summaries, prevs):
+    compressor = StateCompressor()
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        compressor.compress_batch(summaries, prevs, use_lz4=False)
+    return time.perf_counter() - start
+
+
+def time_legacy(summaries, prevs):
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        run_legacy(summaries, prevs)
+    return time.perf_counter() - start
+
+
+def peak_bytes_per_message(fn) -> float:
+    """Peak transient traced memory of one message, output excluded."""
+    fn()  # Warm up caches and lazily created buffers
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    base, _ = tracemalloc.get_traced_memory()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak - base
+
+
+def print_results():
+    print("=" * 72)
+    print("STATE COMPRESSOR THROUGHPUT BENCHMARK (LZ4 disabled)")
+    print("=" * 72)
+    print()
+    print("| Agents | Legacy (msg/s) | Buffered (msg/s) | Batch (msg/s) | Batch speedup |")
+    print("|--------|----------------|------------------|---------------|---------------|")
+
+    for count in AGENT_COUNTS:
+        prevs = make_summaries(count, 0)
+        summaries = make_summaries(count, 1)
+        messages = count * ROUNDS
+        legacy_s = time_legacy(summaries, prevs)
+        single_s = run_single(summaries, prevs)
+        batch_s = run_batch(summaries, prevs)
+        print(
+            f"| {count:6} | {messages / legacy_s:14,.0f} | {messages / single_s:16,.0f} "
+            f"| {messages / batch_s:13,.0f} | {legacy_s / batch_s:12.1f}x |"
+        )
+
+    summary, prev = make_summaries(1, 1)[0], make_summaries(1, 0)[0]
+    compressor = StateCompressor(prev_state=prev)
+
+    def stages():
+        compressor.prev_anomaly_sig = prev.anomaly_signature
+        compressor._stage2_quantize(compressor._stage1_delta_encode(summary))
+
+    print()
+    print("| Stages 1+2 | Peak transient bytes/msg |")
+    print("|------------|--------------------------|")
+    print(f"| Legacy     | {peak_bytes_per_message(lambda: legacy_compress(summary, prev)):24,.0f} |")
+    print(f"| Buffered   | {peak_bytes_per_message(stages):24,.0f} |")
+
+    print()
+    print("=" * 72)
+    print("BENCHMARK COMPLETE")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    print_results()
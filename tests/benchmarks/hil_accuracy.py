@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+HIL Accuracy Collector Benchmarks
+
+Times AccuracyCollector.get_summary() (confusion matrix + per-fault stats)
+against the original O(classifications x ground-truth) linear scan, for one
+classification per satellite per tick and a fault event every 10 ticks on
+a tenth of the constellation.
+Run with: python benchmarks/hil_accuracy.py
+"""
+
+import time
+
+import numpy as np
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.hil.metrics.accuracy import AccuracyCollector
+
+FAULTS = ["power_brownout", "thermal_runaway", "comms_dropout"]
+SIZES = [(20, 100), (100, 300), (1000, 600)]  # (satellites, ticks)
+LINEAR_SCAN_LIMIT = 50_000  # classifications; beyond this the scan takes minutes
+
+
+def build(satellites: int, ticks: int) -> AccuracyCollector:
+    rng = np.random.default_rng(0)
+    collector = AccuracyCollector()
+    for t in range(ticks):
+        if t % 10 == 0:
+            for s in rng.choice(satellites, max(1, satellites // 10), replace=False):
+                collector.record_ground_truth(f"SAT-{s:04d}", float(t), FAULTS[t % 3])
+        for s in range(satellites):
+            correct = bool(rng.random() > 0.1)
+            predicted = None if correct else FAULTS[int(rng.integers(3))]
+            collector.record_agent_classification(
+                f"SAT-{s:04d}", float(t), predicted, 0.9 if correct else 0.5, correct
+            )
+    return collector
+
+
+def linear_scan(collector: AccuracyCollector) -> None:
+    """The original get_confusion_matrix + false-negative scans."""
+    classifications = collector.agent_classifications
+    events = collector.ground_truth_events
+    for c in classifications:
+        for e in events:
+            if e.satellite_id == c.satellite_id and abs(e.timestamp_s - c.timestamp_s) < 1.0:
+                break
+    for fault_type in FAULTS:
+        sum(
+            1 for c in classifications
+            if c.predicted_fault != fault_type and c.is_correct is False
+            and any(
+                e.expected_fault_type == fault_type for e in events
+                if e.satellite_id == c.satellite_id
+                and abs(e.timestamp_s - c.timestamp_s) < 1.0
+            )
+        )
+
+
+def print_results():
+    print("=" * 72)
+    print("HIL ACCURACY COLLECTOR BENCHMARK")
+    print("=" * 72)
+    print()
+    print("| Classifications | Ground truth | Linear scan (s) | Indexed (s) | Speedup |")
+    print("|-----------------|--------------|-----------------|-------------|---------|")
+    for satellites, ticks in SIZES:
+        collector = build(satellites, ticks)
+        n_class = len(collector)
+        n_truth = collector.get_summary()["total_events"]
+
+        start = time.perf_counter()
+        collector.get_summary()
+        indexed = time.perf_counter() - start
+
+        if n_class <= LINEAR_SCAN_LIMIT:
+            start = time.perf_counter()
+            linear_scan(collector)
+            scan = time.perf_counter() - start
+            scan_text, speedup = f"{scan:15.2f}", f"{scan / indexed:6.0f}x"
+        else:
+            scan_text, speedup = f"{'skipped':>15s}", f"{'-':>7s}"
+        print(f"| {n_class:15,d} | {n_truth:12,d} | {scan_text} | {indexed:11.3f} | {speedup} |")
+
+    print()
+    print("=" * 72)
+    print("BENCHMARK COMPLETE")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    print_results()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+HIL Campaign Throughput Benchmarks
+
+Runs the same campaign (copies of the sample scenarios, on a virtual clock)
+in-process one scenario after another, then sharded across process pools of
+increasing size with ScenarioOrchestrator.run_process_campaign().
+Reports scenarios and satellite-ticks per second.
+Run with: python benchmarks/hil_campaign.py
+"""
+
+import asyncio
+import os
+import shutil
+import tempfile
+import time
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.hil import scenarios
+from astraguard.hil.scenarios import ScenarioOrchestrator, execute_scenario_file
+
+COPIES = 8
+SAMPLES = Path(scenarios.__file__).parent / "sample_scenarios"
+
+
+def make_campaign(root: Path) -> list:
+    paths = []
+    for i in range(COPIES):
+        for sample in sorted(SAMPLES.glob("*.yaml")):
+            path = root / f"{sample.stem}_{i:02d}.yaml"
+            shutil.copy(sample, path)
+            paths.append(str(path))
+    return paths
+
+
+def bench_serial(paths: list) -> float:
+    async def run():
+        for i, path in enumerate(paths):
+            await execute_scenario_file(path, verbose=False, virtual_time=True, seed=i)
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    return len(paths) / (time.perf_counter() - start)
+
+
+def bench_pool(paths: list, processes: int, results_dir: Path) -> float:
+    orchestrator = ScenarioOrchestrator(str(results_dir.parent), str(results_dir))
+    summary = asyncio.run(orchestrator.run_process_campaign(
+        paths, processes=processes, seed=0, verbose=False
+    ))
+    return summary["throughput"]["scenarios_per_s"]
+
+
+def print_results():
+    print("=" * 72)
+    print("HIL CAMPAIGN THROUGHPUT BENCHMARK")
+    print("=" * 72)
+    print()
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        paths = make_campaign(root)
+        print(f"{len(paths)} scenarios, {os.cpu_count()} CPUs")
+        print()
+        print("| Mode                    | Scenarios/sec | Speedup |")
+        print("|-------------------------|---------------|---------|")
+        serial = bench_serial(paths)
+        print(f"| {'In-process, serial':23s} | {serial:13.2f} | {1.0:6.1f}x |")
+        for processes in sorted({1, 2, 4, os.cpu_count() or 1}):
+            rate = bench_pool(paths, processes, root / f"results_{processes}")
+            mode = f"Process pool ({processes})"
+            print(f"| {mode:23s} | {rate:13.2f} | {rate / serial:6.1f}x |")
+
+    print()
+    print("=" * 72)
+    print("BENCHMARK COMPLETE")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    print_results()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+HIL Constellation Physics Benchmarks
+
+Compares per-satellite StubSatelliteSimulator.generate_telemetry() (scalar
+subsystems + a Pydantic packet every tick) against ConstellationEngine.step()
+for the whole constellation, with and without materializing every packet.
+Reports satellite-ticks per second.
+Run with: python benchmarks/hil_constellation.py
+"""
+
+import asyncio
+import time
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.hil.simulator import ConstellationEngine, StubSatelliteSimulator
+
+SIZES = [500, 5000]
+STUB_TICKS = 5
+ENGINE_TICKS = 200
+
+
+def bench_stub(size: int) -> float:
+    sims = [StubSatelliteSimulator(f"SAT-{i:05d}") for i in range(size)]
+
+    async def run():
+        for _ in range(STUB_TICKS):
+            for sim in sims:
+                await sim.generate_telemetry()
+
+    start = time.perf_counter()
+    asyncio.run(run())
+    return size * STUB_TICKS / (time.perf_counter() - start)
+
+
+def bench_engine(size: int, materialize: bool = False) -> float:
+    engine = ConstellationEngine([f"SAT-{i:05d}" for i in range(size)])
+    # A few faulted satellites, as in a typical scenario
+    engine.inject_fault("SAT-00000", "power_brownout", severity=0.8)
+    engine.inject_fault("SAT-00001", "attitude_desync")
+    engine.inject_fault("SAT-00002", "thermal_runaway", severity=0.5)
+    ticks = STUB_TICKS if materialize else ENGINE_TICKS
+
+    start = time.perf_counter()
+    for _ in range(ticks):
+        engine.step(dt=1.0)
+        if materialize:
+            engine.packets()
+    return size * ticks / (time.perf_counter() - start)
+
+
+def print_results():
+    print("=" * 72)
+    print("HIL CONSTELLATION PHYSICS BENCHMARK")
+    print("=" * 72)
+    print()
+    print("| Satellites | Mode                         | Sat-ticks/sec | Speedup |")
+    print("|------------|------------------------------|---------------|---------|")
+    for size in SIZES:
+        stub = bench_stub(size)
+        engine_packets = bench_engine(size, materialize=True)
+        engine = bench_engine(size)
+        for mode, rate in [
+            ("Stub simulators", stub),
+            ("Engine + packets every tick", engine_packets),
+            ("Engine, packets on demand", engine),
+        ]:
+            print(f"| {size:10d} | {mode:28s} | {rate:13,.0f} | {rate / stub:6.1f}x |")
+
+    print()
+    print("=" * 72)
+    print("BENCHMARK COMPLETE")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    print_results()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+HIL Latency Collector Benchmarks
+
+Records one fault-detection latency per satellite per tick and compares the
+previous list-of-dataclasses collector (sorted per call) with the column
+array (exact) and sketch-backed (streaming) LatencyCollector modes.
+Reports record time, get_summary() time and retained memory.
+Run with: python benchmarks/hil_latency.py
+"""
+
+import time
+import tracemalloc
+from collections import defaultdict
+
+import numpy as np
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from astraguard.hil.metrics.latency import LatencyCollector, LatencyMeasurement
+
+SATELLITES = 1000
+TICKS = [100, 1000]
+
+
+class ListCollector:
+    """Previous storage model: one dataclass per measurement."""
+
+    def __init__(self):
+        self.measurements = []
+
+    def record_fault_detection(self, sat_id, scenario_time_s, duration_ms):
+        self.measurements.append(LatencyMeasurement(
+            time.time(), "fault_detection", sat_id, duration_ms, scenario_time_s
+        ))
+
+    def get_summary(self):
+        by_satellite = defaultdict(lambda: defaultdict(list))
+        for m in self.measurements:
+            by_satellite[m.satellite_id][m.metric_type].append(m.duration_ms)
+        for metrics in by_satellite.values():
+            for latencies in metrics.values():
+                sorted(latencies)
+
+
+def bench(mode: str, ticks: int):
+    sat_ids = [f"SAT-{i:04d}" for i in range(SATELLITES)]
+    rng = np.random.default_rng(0)
+    tracemalloc.start()
+    start = time.perf_counter()
+    if mode == "list":
+        collector = ListCollector()
+        for t in range(ticks):
+            for sat_id, d in zip(sat_ids, np.abs(rng.normal(75, 25, SATELLITES)).tolist()):
+                collector.record_fault_detection(sat_id, float(t), d)
+    else:
+        collector = LatencyCollector(streaming=(mode == "streaming"))
+        for t in range(ticks):
+            collector.record_batch(
+                "fault_detection", sat_ids, float(t), np.abs(rng.normal(75, 25, SATELLITES))
+            )
+    record_s = time.perf_counter() - start
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    collector.get_summary()
+    summary_s = time.perf_counter() - start
+    return record_s, summary_s, retained / 1e6
+
+
+def print_results():
+    print("=" * 72)
+    print("HIL LATENCY COLLECTOR BENCHMARK")
+    print("=" * 72)
+    print()
+    print("| Measurements | Mode                | Record (s) | Summary (s) | Memory (MB) |")
+    print("|--------------|---------------------|------------|-------------|-------------|")
+    for ticks in TICKS:
+        for mode, label in [
+            ("list", "Dataclass list"),
+            ("raw", "Column arrays"),
+            ("streaming", "Streaming sketches"),
+        ]:
+            record_s, summary_s, mb = bench(mode, ticks)
+            print(f"| {SATELLITES * ticks:12,d} | {label:19s} | {record_s:10.2f} | "
+                  f"{summary_s:11.3f} | {mb:11.1f} |")
+
+    print()
+    print("=" * 72)
+    print("BENCHMARK COMPLETE")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    print_results()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Memory Store Persistence Benchmarks
+
+Compares pickle and columnar persistence of AdaptiveMemoryStore: full
+save, incremental save after a handful of new events, and cold-start load.
+Run with: python benchmarks/memory_persistence.py
+"""
+
+import shutil
+import tempfile
+import time
+from datetime import datetime
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+
+from memory_engine.memory_store import AdaptiveMemoryStore, MemoryEvent
+
+STORE_SIZES = [10_000, 100_000, 500_000]
+DIM = 64
+NEW_EVENTS = 100
+
+
+def make_store(persistence: str, path: str, size: int = 0) -> AdaptiveMemoryStore:
+    store = AdaptiveMemoryStore(max_capacity=size * 2 or 1, persistence=persistence)
+    store.storage_path = path
+    if size:
+        rng = np.random.default_rng(42)
+        now = datetime.now()
+        store.memory = [
+            MemoryEvent(embedding, {"severity": 0.5, "id": i}, now)
+            for i, embedding in enumerate(rng.normal(size=(size, DIM)))
+        ]
+    return store
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def bench(persistence: str, size: int, directory: str) -> tuple:
+    """Return (full save, incremental save, load) seconds."""
+    path = f"{directory}/store_{persistence}"
+    store = make_store(persistence, path, size)
+    full_s = timed(store.save)
+
+    rng = np.random.default_rng(7)
+    store.write_batch(rng.normal(size=(NEW_EVENTS, DIM)), [{"new": True}] * NEW_EVENTS)
+    incremental_s = timed(store.save)
+
+    cold = make_store(persistence, path)
+    load_s = timed(cold.load)
+    assert len(cold.memory) == size + NEW_EVENTS
+    return full_s, incremental_s, load_s
+
+
+def print_results():
+    print("=" * 72)
+    print("MEMORY STORE PERSISTENCE BENCHMARK")
+    print("=" * 72)
+    print()
+    print("| Events  | Format   | Full save (s) | +100 save (s) | Load (ms) |")
+    print("|---------|----------|---------------|---------------|-----------|")
+
+    directory = tempfile.mkdtemp()
+    try:
+        for size in STORE_SIZES:
+            for persistence in ("pickle", "columnar"):
+                full_s, incremental_s, load_s = bench(persistence, size, directory)
+                print(f"| {size:7,} | {persistence:8} | {full_s:13.3f} | {incremental_s:13.4f} | {load_s * 1000:9.1f} |")
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print()
+    print("=" * 72)
+    print("BENCHMARK COMPLETE")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    print_results()
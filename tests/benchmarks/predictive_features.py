@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Predictive Maintenance Feature Extraction Benchmarks
+
+Compares feature extraction for all failure types per telemetry point via
+the per-prediction pandas DataFrame rebuild with the incremental
+RollingFeatureStore, and training-data retention via a full list
+comprehension per append with the time-bucketed TrainingDataWindow.
+Run with: python benchmarks/predictive_features.py
+"""
+
+import random
+import time
+from datetime import datetime, timedelta
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pandas as pd
+
+from security_engine.predictive_maintenance import FailureType, TimeSeriesData
+from security_engine.rolling_features import RollingFeatureStore, TrainingDataWindow
+
+POINTS = 2000
+RETENTION_SIZES = [1_000, 10_000, 50_000]
+ROLLING = ['cpu_usage', 'memory_usage', 'network_latency', 'disk_io', 'error_rate']
+BASE = ROLLING + ['response_time', 'active_connections']
+
+
+def make_point(rng: random.Random, timestamp: datetime) -> TimeSeriesData:
+    return TimeSeriesData(
+        timestamp=timestamp,
+        cpu_usage=rng.gauss(45, 10),
+        memory_usage=rng.gauss(60, 15),
+        network_latency=rng.gauss(50, 20),
+        disk_io=rng.gauss(100, 30),
+        error_rate=rng.gauss(0.1, 0.05),
+        response_time=rng.gauss(200, 50),
+        active_connections=rng.randint(10, 50),
+    )
+
+
+def pandas_features(recent: list, data: TimeSeriesData) -> None:
+    """Previous behaviour: one DataFrame rebuild per failure type."""
+    for _ in FailureType:
+        df = pd.DataFrame([{c: getattr(d, c) for c in BASE} for d in recent + [data]])
+        for col in ROLLING:
+            df[f'{col}_rolling_mean_3'] = df[col].rolling(window=3).mean()
+            df[f'{col}_rolling_std_3'] = df[col].rolling(window=3).std()
+            df[f'{col}_rolling_mean_6'] = df[col].rolling(window=min(6, len(df))).mean()
+            df[f'{col}_rolling_std_6'] = df[col].rolling(window=min(6, len(df))).std()
+        df.iloc[-1]
+
+
+def time_features(points: list) -> tuple:
+    recent = []
+    start = time.perf_counter()
+    for point in points:
+        if len(recent) >= 3:
+            pandas_features(recent, point)
+        recent = (recent + [point])[-10:]
+    pandas_s = time.perf_counter() - start
+
+    store = RollingFeatureStore()
+    start = time.perf_counter()
+    for point in points:
+        if len(store) >= 3:
+            store.feature_row(point)
+        store.push(point)
+    store_s = time.perf_counter() - start
+    return len(points) / pandas_s, len(points) / store_s
+
+
+def time_retention(points: list, appends: int = 500) -> tuple:
+    cutoff_base = points[0].timestamp
+    data = list(points)
+    start = time.perf_counter()
+    for i in range(appends):
+        data.append(points[i])
+        cutoff = cutoff_base + timedelta(minutes=i)
+        data = [d for d in data if d.timestamp > cutoff]
+    list_s = (time.perf_counter() - start) / appends
+
+    window = TrainingDataWindow()
+    window.extend(points)
+    start = time.perf_counter()
+    for i in range(appends):
+        window.append(points[i])
+        window.trim(cutoff_base + timedelta(minutes=i))
+    window_s = (time.perf_counter() - start) / appends
+    return list_s, window_s
+
+
+def print_results():
+    rng = random.Random(42)
+    base = datetime.now() - timedelta(days=7)
+
+    print("=" * 72)
+    print("PREDICTIVE MAINTENANCE FEATURE BENCHMARK")
+    print("=" * 72)
+    print()
+
+    points = [make_point(rng, base + timedelta(seconds=i)) for i in range(POINTS)]
+    pandas_rate, store_rate = time_features(points)
+    print(f"Feature rows for {len(FailureType)} failure types, {POINTS} points")
+    print("| Method                 | Points/sec |")
+    print("|------------------------|------------|")
+    print(f"| pandas per type        | {pandas_rate:10,.0f} |")
+    print(f"| RollingFeatureStore    | {store_rate:10,.0f} |")
+    print(f"Speedup: {store_rate / pandas_rate:.0f}x")
+    print()
+
+    print("| Retained points | List rebuild (us/append) | Buckets (us/append) |")
+    print("|-----------------|--------------------------|---------------------|")
+    for size in RETENTION_SIZES:
+        retained = [make_point(rng, base + timedelta(seconds=10 * i)) for i in range(size)]
+        list_s, window_s = time_retention(retained)
+        print(f"| {size:15,} | {list_s * 1e6:24.1f} | {window_s * 1e6:19.2f} |")
+
+    print()
+    print("=" * 72)
+    print("BENCHMARK COMPLETE")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    print_results()
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Predictive Maintenance Inference Benchmarks
+
+Compares failure prediction one model call per failure type per point (the
+previous predict_failures loop) with one batched pass per failure type over
+a whole batch of points, and reports latency per batch size.
+Run with: python benchmarks/predictive_inference.py
+"""
+
+import asyncio
+import os
+import random
+import tempfile
+import time
+from datetime import datetime
+from unittest.mock import MagicMock
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.preprocessing import StandardScaler
+
+from security_engine.predictive_maintenance import (
+    FAILURE_THRESHOLDS,
+    FailureType,
+    PredictionModel,
+    PredictiveMaintenanceEngine,
+    TimeSeriesData,
+)
+from security_engine.rolling_features import FEATURE_COLUMNS
+
+BATCH_SIZES = [1, 8, 32, 128]
+ROUNDS = 5
+
+
+def make_point(rng: random.Random) -> TimeSeriesData:
+    return TimeSeriesData(
+        timestamp=datetime.now(),
+        cpu_usage=rng.gauss(70, 20),
+        memory_usage=rng.gauss(75, 15),
+        network_latency=rng.gauss(90, 30),
+        disk_io=rng.gauss(180, 40),
+        error_rate=rng.gauss(1.0, 0.5),
+        response_time=rng.gauss(200, 50),
+        active_connections=rng.randint(10, 50),
+    )
+
+
+def make_engine() -> PredictiveMaintenanceEngine:
+    os.chdir(tempfile.mkdtemp())  # engine creates its model directory in cwd
+    engine = PredictiveMaintenanceEngine(MagicMock())
+    rng = np.random.default_rng(0)
+    width = len(FEATURE_COLUMNS) - 1
+    for failure_type in FailureType:
+        features = rng.normal(size=(1000, width))
+        targets = FAILURE_THRESHOLDS[failure_type] + 20 * features[:, 0]
+        scaler = StandardScaler().fit(features)
+        model = RandomForestRegressor(n_estimators=100, max_depth=10, random_state=0)
+        engine.scalers[failure_type] = scaler
+        engine.models[failure_type] = {
+            PredictionModel.RANDOM_FOREST: model.fit(scaler.transform(features), targets)
+        }
+    return engine
+
+
+async def per_type(engine, points) -> None:
+    """Previous behaviour: one model call per failure type per point."""
+    for point in points:
+        feature_row = engine._feature_row(point)
+        for failure_type in FailureType:
+            await engine._predict_single_failure_type(failure_type, point, feature_row)
+
+
+async def time_batch(engine, points) -> tuple:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await per_type(engine, points)
+    per_type_s = (time.perf_counter() - start) / ROUNDS
+
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        await engine.predict_failures_batch(points)
+    batched_s = (time.perf_counter() - start) / ROUNDS
+    return per_type_s, batched_s
+
+
+async def run():
+    rng = random.Random(42)
+    engine = make_engine()
+    for _ in range(10):
+        await engine.add_training_data(make_point(rng))
+
+    print(f"Inference for {len(FailureType)} failure types (RF, 100 trees)")
+    print("| Batch size | Per type (ms) | Batched (ms) | Batched (ms/point) | Speedup |")
+    print("|------------|---------------|--------------|--------------------|---------|")
+    for size in BATCH_SIZES:
+        points = [make_point(rng) for _ in range(size)]
+        per_type_s, batched_s = await time_batch(engine, points)
+        print(f"| {size:10} | {per_type_s * 1000:13.1f} | {batched_s * 1000:12.1f} "
+              f"| {batched_s * 1000 / size:18.3f} | {per_type_s / batched_s:6.1f}x |")
+    engine.executor.shutdown()
+
+
+def print_results():
+    print("=" * 72)
+    print("PREDICTIVE MAINTENANCE INFERENCE BENCHMARK")
+    print("=" * 72)
+    print()
+    asyncio.run(run())
+    print()
+    print("=" * 72)
+    print("BENCHMARK COMPLETE")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    print_results()
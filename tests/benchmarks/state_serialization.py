@@ -96,6 +96,46 @@ def benchmark_lz4_compression() -> Dict[str, Any]:
     }
 
 
+def benchmark_binary_serialization() -> Dict[str, Any]:
+    """Benchmark the fixed-layout binary HealthSummary format."""
+    serializer = SwarmSerializer(validate=False, wire_format="binary")
+    summary = HealthSummary(
+        anomaly_signature=[0.1 * i for i in range(32)],
+        risk_score=0.75,
+        recurrence_score=5.2,
+        timestamp=datetime.utcnow(),
+    )
+    json_size = len(serializer.serialize_health(summary, compress=False, wire_format="json"))
+    
+    # Serialize
+    start = time.perf_counter()
+    for _ in range(1000):
+        serialized = serializer.serialize_health(summary)
+    serialize_time = (time.perf_counter() - start) / 1000 * 1000  # ms
+    
+    # Deserialize
+    start = time.perf_counter()
+    for _ in range(1000):
+        restored = serializer.deserialize_health(serialized)
+    deserialize_time = (time.perf_counter() - start) / 1000 * 1000  # ms
+    
+    # Zero-copy signature access
+    start = time.perf_counter()
+    for _ in range(1000):
+        signature = SwarmSerializer.signature_view(serialized)
+    view_time = (time.perf_counter() - start) / 1000 * 1000  # ms
+    
+    return {
+        "test": "Binary Serialization",
+        "payload_size_bytes": len(serialized),
+        "json_size_bytes": json_size,
+        "serialize_time_ms": f"{serialize_time:.4f}",
+        "deserialize_time_ms": f"{deserialize_time:.4f}",
+        "signature_view_time_ms": f"{view_time:.4f}",
+        "roundtrip_time_ms": f"{serialize_time + deserialize_time:.4f}",
+    }
+
+
 def benchmark_swarm_config_serialization() -> Dict[str, Any]:
     """Benchmark SwarmConfig serialization."""
     serializer = SwarmSerializer(validate=False)
@@ -177,6 +217,7 @@ def run_all_benchmarks() -> List[Dict[str, Any]]:
     return [
         benchmark_json_serialization(),
         benchmark_lz4_compression(),
+        benchmark_binary_serialization(),
         benchmark_swarm_config_serialization(),
         benchmark_large_constellation(),
     ]
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Storage Bulk Operation Benchmarks
+
+Compares one monitoring tick (health and vote keys for every agent)
+written and read with single-key RedisAdapter calls against the pipelined
+mset/mget/delete_many calls. Uses a local Redis stand-in that charges a
+fixed network delay per round-trip, so no server is needed.
+Run with: python benchmarks/storage_bulk.py
+"""
+
+import asyncio
+import time
+
+# Add project root to path for imports
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.storage.redis_adapter import RedisAdapter
+
+AGENTS = 100
+TICKS = 5
+ROUND_TRIP_S = 0.0005
+
+
+class _Pipeline:
+    def __init__(self, server):
+        self._server = server
+        self._commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __getattr__(self, name):
+        def queue(*args, **kwargs):
+            self._commands.append((name, args, kwargs))
+        return queue
+
+    async def execute(self):
+        await self._server.round_trip()
+        return [getattr(self._server, "_" + name)(*args, **kwargs)
+                for name, args, kwargs in self._commands]
+
+
+class LatencyRedis:
+    """Redis stand-in with a fixed delay per round-trip."""
+
+    def __init__(self):
+        self.data = {}
+        self.round_trips = 0
+
+    async def round_trip(self):
+        self.round_trips += 1
+        await asyncio.sleep(ROUND_TRIP_S)
+
+    def pipeline(self, transaction=True):
+        return _Pipeline(self)
+
+    async def get(self, key):
+        await self.round_trip()
+        return self.data.get(key)
+
+    async def set(self, key, value, ex=None):
+        await self.round_trip()
+        return self._set(key, value, ex)
+
+    async def delete(self, *keys):
+        await self.round_trip()
+        return self._delete(*keys)
+
+    def _mget(self, keys):
+        return [self.data.get(k) for k in keys]
+
+    def _mset(self, mapping):
+        self.data.update(mapping)
+        return True
+
+    def _set(self, key, value, ex=None):
+        self.data[key] = value
+        return True
+
+    def _delete(self, *keys):
+        return sum(self.data.pop(k, None) is not None for k in keys)
+
+
+def tick_items(tick: int) -> dict:
+    items = {}
+    for agent in range(AGENTS):
+        items[f"health:agent-{agent}"] = {"status": "ok", "cpu": 0.4, "tick": tick}
+        items[f"vote:agent-{agent}"] = {"action": "hold", "confidence": 0.9, "tick": tick}
+    return items
+
+
+async def single_key_tick(adapter: RedisAdapter, items: dict) -> None:
+    for key, value in items.items():
+        await adapter.set(key, value, expire=30)
+    for key in items:
+        await adapter.get(key)
+    for key in items:
+        await adapter.delete(key)
+
+
+async def bulk_tick(adapter: RedisAdapter, items: dict) -> None:
+    await adapter.mset(items, expire=30)
+    await adapter.mget(list(items))
+    await adapter.delete_many(list(items))
+
+
+async def run(tick_fn) -> tuple:
+    server = LatencyRedis()
+    adapter = RedisAdapter()
+    adapter.redis = server
+    adapter.connected = True
+
+    start = time.perf_counter()
+    for tick in range(TICKS):
+        await tick_fn(adapter, tick_items(tick))
+    elapsed = time.perf_counter() - start
+    return elapsed / TICKS, server.round_trips // TICKS
+
+
+def print_results():
+    print("=" * 72)
+    print("STORAGE BULK OPERATION BENCHMARK")
+    print("=" * 72)
+    print()
+    print(f"{AGENTS * 2} keys per tick (set, get, delete), "
+          f"{ROUND_TRIP_S * 1e3:.1f} ms per round-trip")
+    print()
+
+    single_s, single_trips = asyncio.run(run(single_key_tick))
+    bulk_s, bulk_trips = asyncio.run(run(bulk_tick))
+
+    print("| Mode           | Round-trips/tick | Time/tick (ms) |")
+    print("|----------------|------------------|----------------|")
+    print(f"| Single-key     | {single_trips:16d} | {single_s * 1e3:14.1f} |")
+    print(f"| Pipelined bulk | {bulk_trips:16d} | {bulk_s * 1e3:14.1f} |")
+    print()
+    print(f"Speedup: {single_s / bulk_s:.1f}x")
+
+    print()
+    print("=" * 72)
+    print("BENCHMARK COMPLETE")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    print_results()
@@ -149,6 +149,31 @@ class TestAgentClassification:
 
         assert len(collector) == 2  # 2 agent classifications (ground truth tracked separately)
 
+    def test_classification_batch_matches_single_records(self):
+        """A batch records the same rows as one call per satellite."""
+        sat_ids = ["SAT-001", "SAT-002", "SAT-003"]
+        predicted = [None, "comms_dropout", "thermal_runaway"]
+        confidences = [0.95, 0.9, 0.45]
+        is_correct = [True, True, False]
+
+        single = AccuracyCollector()
+        for row in zip(sat_ids, predicted, confidences, is_correct):
+            sat_id, fault, confidence, correct = row
+            single.record_agent_classification(sat_id, 7.0, fault, confidence, correct)
+        batch = AccuracyCollector()
+        batch.record_classification_batch(
+            sat_ids, 7.0, np.array(predicted, dtype=object), np.array(confidences),
+            np.array(is_correct),
+        )
+
+        assert batch.agent_classifications == single.agent_classifications
+
+    def test_classification_batch_rejects_misaligned_columns(self):
+        """Column lengths must match the satellite count."""
+        collector = AccuracyCollector()
+        with pytest.raises(ValueError):
+            collector.record_classification_batch(["SAT-001"], 1.0, [None, None], [0.9], [True])
+
 
 class TestAccuracyCalculation:
     """Test accuracy metrics calculation."""
@@ -694,5 +719,106 @@ class TestDataConsistency:
         assert abs(stats["overall_accuracy"] - expected_accuracy) < 0.001
 
 
+def _linear_scan_confusion(collector):
+    """Reference O(C x G) confusion matrix: first matching event wins."""
+    confusion = {}
+    for c in collector.agent_classifications:
+        actual = None
+        for e in collector.ground_truth_events:
+            if e.satellite_id == c.satellite_id and abs(e.timestamp_s - c.timestamp_s) < 1.0:
+                actual = e.expected_fault_type
+                break
+        row = confusion.setdefault(c.predicted_fault or "nominal", {})
+        row[actual or "nominal"] = row.get(actual or "nominal", 0) + 1
+    return confusion
+
+
+def _linear_scan_false_negatives(collector, fault_type):
+    """Reference O(C x G) false-negative count for one fault type."""
+    return sum(
+        1
+        for c in collector.agent_classifications
+        if c.predicted_fault != fault_type
+        and c.is_correct is False
+        and any(
+            e.expected_fault_type == fault_type
+            for e in collector.ground_truth_events
+            if e.satellite_id == c.satellite_id
+            and abs(e.timestamp_s - c.timestamp_s) < 1.0
+        )
+    )
+
+
+class TestIndexedGroundTruthJoin:
+    """The indexed join reproduces the original linear-scan matching."""
+
+    FAULTS = [None, "power_brownout", "thermal_runaway", "comms_dropout"]
+
+    def _random_collector(self, seed):
+        rng = np.random.default_rng(seed)
+        collector = AccuracyCollector()
+        # Half-second grid puts many events exactly on the 1.0s boundary
+        for _ in range(300):
+            collector.record_ground_truth(
+                f"SAT-{rng.integers(5)}", float(rng.integers(40)) * 0.5,
+                self.FAULTS[rng.integers(4)],
+            )
+        for _ in range(500):
+            collector.record_agent_classification(
+                f"SAT-{rng.integers(6)}", float(rng.integers(40)) * 0.5 + rng.choice([0.0, 0.3]),
+                self.FAULTS[rng.integers(4)], float(rng.random()), bool(rng.random() > 0.4),
+            )
+        return collector
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_confusion_matrix_matches_linear_scan(self, seed):
+        """Confusion matrix equals the first-match linear scan."""
+        collector = self._random_collector(seed)
+        assert collector.get_confusion_matrix() == _linear_scan_confusion(collector)
+
+    @pytest.mark.parametrize("seed", [0, 1, 2])
+    def test_per_fault_stats_match_linear_scan(self, seed):
+        """Per-fault counts equal the list-comprehension definitions."""
+        collector = self._random_collector(seed)
+        classifications = collector.agent_classifications
+        by_fault = collector.get_accuracy_stats()["by_fault_type"]
+
+        assert sorted(by_fault) == ["comms_dropout", "power_brownout", "thermal_runaway"]
+        for fault_type, stats in by_fault.items():
+            predictions = [c for c in classifications if c.predicted_fault == fault_type]
+            assert stats["true_positives"] == sum(c.is_correct for c in predictions)
+            assert stats["false_positives"] == sum(not c.is_correct for c in predictions)
+            assert stats["false_negatives"] == _linear_scan_false_negatives(collector, fault_type)
+            assert stats["avg_confidence"] == pytest.approx(
+                np.mean([c.confidence for c in predictions])
+            )
+
+    def test_earliest_recorded_event_wins(self):
+        """With several events in the window, the first recorded one is used."""
+        collector = AccuracyCollector()
+        collector.record_ground_truth("SAT-001", 10.5, "thermal_runaway")
+        collector.record_ground_truth("SAT-001", 10.0, "power_brownout")
+        collector.record_ground_truth("SAT-001", 11.0, None)  # exactly 1.0s away
+        collector.record_agent_classification("SAT-001", 10.0, "power_brownout", 0.9, False)
+
+        assert collector.get_confusion_matrix() == {"power_brownout": {"thermal_runaway": 1}}
+        by_fault = collector.get_accuracy_stats()["by_fault_type"]
+        assert by_fault["thermal_runaway"]["false_negatives"] == 1
+        assert by_fault["power_brownout"]["false_negatives"] == 0
+
+    def test_recorded_data_round_trips(self):
+        """Columnar storage still exposes the recorded dataclasses."""
+        collector = AccuracyCollector()
+        collector.record_ground_truth("SAT-001", 5.0, "comms_dropout")
+        collector.record_agent_classification("SAT-002", 6.0, None, 0.95, True)
+
+        assert collector.ground_truth_events == [
+            GroundTruthEvent(5.0, "SAT-001", "comms_dropout", 1.0)
+        ]
+        assert collector.agent_classifications == [
+            AgentClassification(6.0, "SAT-002", None, 0.95, True)
+        ]
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v", "-s"])
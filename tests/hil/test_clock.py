@@ -0,0 +1,73 @@
+"""Tests for injectable HIL clocks."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from astraguard.hil.clock import VirtualClock, WALL_CLOCK
+from astraguard.hil.metrics.latency import LatencyCollector
+from astraguard.hil.simulator.base import StubSatelliteSimulator
+from astraguard.hil.simulator.faults.power_brownout import PowerBrownoutFault
+
+
+class TestVirtualClock:
+    """Test simulated time source."""
+
+    def test_advances_only_when_told(self):
+        """Test now() and time() move together with advance()."""
+        clock = VirtualClock(epoch=datetime(2026, 3, 1))
+        assert clock.now() == datetime(2026, 3, 1)
+
+        clock.advance(90.0)
+        assert clock.now() == datetime(2026, 3, 1) + timedelta(seconds=90)
+        assert clock.time() == datetime(2026, 3, 1).timestamp() + 90
+
+        clock.advance_to(120.0)
+        assert clock.elapsed_s == 120.0
+
+    def test_rejects_moving_backwards(self):
+        """Test the clock is monotonic."""
+        clock = VirtualClock()
+        clock.advance(10.0)
+        with pytest.raises(ValueError):
+            clock.advance_to(5.0)
+
+    def test_wall_clock_is_real_time(self):
+        """Test the default clock tracks datetime.now()."""
+        assert abs((WALL_CLOCK.now() - datetime.now()).total_seconds()) < 1.0
+
+
+class TestClockInjection:
+    """Test components read time from the injected clock."""
+
+    def test_fault_phases_follow_virtual_time(self):
+        """Test brownout phases advance with simulated, not wall, time."""
+        clock = VirtualClock()
+        fault = PowerBrownoutFault("SAT1", severity=0.5, duration=300.0, clock=clock)
+        fault.inject()
+        assert fault.get_fault_state()["phase"] == "panel_damage"
+
+        clock.advance(120.0)
+        assert fault.get_fault_state()["phase"] == "battery_stress"
+
+        clock.advance(200.0)
+        assert fault.is_expired()
+
+    @pytest.mark.asyncio
+    async def test_stub_simulator_packets_use_clock(self):
+        """Test packet timestamps come from the injected clock."""
+        clock = VirtualClock()
+        sim = StubSatelliteSimulator("SAT1", clock=clock)
+        clock.advance(42.0)
+
+        packet = await sim.generate_telemetry()
+        assert packet.timestamp == clock.epoch + timedelta(seconds=42)
+
+    def test_latency_collector_uses_clock(self):
+        """Test measurement timestamps come from the injected clock."""
+        clock = VirtualClock()
+        collector = LatencyCollector(clock=clock)
+        clock.advance(5.0)
+        collector.record_fault_detection("SAT1", 5.0, 80.0)
+
+        assert collector.measurements[0].timestamp == clock.epoch.timestamp() + 5.0
@@ -0,0 +1,140 @@
+"""Tests for the vectorized constellation physics engine."""
+
+import numpy as np
+import pytest
+
+from astraguard.hil.simulator import (
+    ConstellationEngine,
+    ConstellationSatellite,
+    StubSatelliteSimulator,
+    TelemetryPacket,
+)
+
+
+class TestScalarParity:
+    """The engine reproduces StubSatelliteSimulator physics."""
+
+    @pytest.mark.asyncio
+    async def test_nominal_state_matches_stub(self):
+        """Test a full orbit of nominal physics matches the scalar model."""
+        engine = ConstellationEngine(["SAT-A", "SAT-B"])
+        stub = StubSatelliteSimulator("SAT-A")
+
+        for _ in range(6000):
+            engine.step(dt=1.0)
+            await stub.generate_telemetry()
+
+        i = engine.index_of("SAT-A")
+        assert engine.true_anomaly_deg[i] == pytest.approx(stub.orbit_sim._true_anomaly_deg)
+        assert engine.altitude_m[i] == pytest.approx(stub.orbit_sim.altitude_m)
+        assert engine.battery_soc[i] == pytest.approx(stub.power_sim.battery_soc)
+        assert engine.battery_temp[i] == pytest.approx(stub.thermal_sim.battery_temp)
+        assert engine.eps_temp[i] == pytest.approx(stub.thermal_sim.eps_temp)
+        np.testing.assert_allclose(engine.quaternion[i], stub.attitude_sim._quaternion)
+
+        packet = engine.packet("SAT-A")
+        expected = stub.get_telemetry_history()[-1]
+        assert packet.power == expected.power
+        assert packet.thermal == expected.thermal
+        assert packet.attitude == expected.attitude
+
+    def test_tumbling_quaternion_integration_matches_scalar(self):
+        """Test vectorized quaternion integration on spinning satellites."""
+        from astraguard.hil.simulator.attitude import AttitudeSimulator
+
+        engine = ConstellationEngine(["SAT-A"])
+        scalar = AttitudeSimulator("SAT-A")
+        omega = np.array([0.1, -0.2, 0.05])
+        engine.angular_velocity[0] = omega
+        scalar._angular_velocity = omega.copy()
+
+        for _ in range(50):
+            engine._step_attitude(1.0)
+            scalar.update(1.0)
+
+        np.testing.assert_allclose(engine.quaternion[0], scalar._quaternion)
+        assert engine.nadir_error_deg[0] == pytest.approx(
+            scalar.get_attitude_data().nadir_pointing_error_deg
+        )
+
+
+class TestFaults:
+    """Sparse fault handling on top of the array state."""
+
+    def test_attitude_desync_tumbles_only_faulted_satellite(self):
+        """Test tumble starts on the next step for the faulted row only."""
+        engine = ConstellationEngine(["SAT-A", "SAT-B"])
+        engine.inject_fault("SAT-A", "attitude_desync")
+
+        for _ in range(30):
+            engine.step()
+
+        assert engine.tumbling.tolist() == [True, False]
+        assert engine.nadir_error_deg[0] > engine.nadir_error_deg[1]
+
+    def test_brownout_reduces_solar_current(self):
+        """Test power_brownout degrades the faulted satellite's panels."""
+        engine = ConstellationEngine(["SAT-A", "SAT-B"])
+        engine.inject_fault("SAT-A", "power_brownout", severity=0.8)
+        engine.step()
+
+        faulted = engine.packet("SAT-A").power
+        nominal = engine.packet("SAT-B").power
+        assert faulted.solar_current < nominal.solar_current
+
+    def test_thermal_runaway_heats_faulted_satellite(self):
+        """Test thermal_runaway degrades cooling and spreads to neighbors."""
+        engine = ConstellationEngine(["SAT-A", "SAT-B"])
+        engine.add_nearby_sat("SAT-A", "SAT-B", 0.5)
+        engine.inject_fault("SAT-A", "thermal_runaway", severity=1.0)
+
+        for _ in range(30):
+            engine.step()
+
+        assert engine.battery_temp[0] > engine.battery_temp[1]
+        assert engine.thermal_status.tolist() == [2, 0]
+        assert engine._thermal_faults[0].infected_neighbors == ["SAT-B"]
+
+
+class TestPacketsAndViews:
+    """On-demand packets and per-satellite compatibility views."""
+
+    def test_packets_are_materialized_on_demand(self):
+        """Test packets() builds validated packets for the requested satellites."""
+        engine = ConstellationEngine([f"SAT-{i:03d}" for i in range(10)])
+        engine.step()
+
+        packets = engine.packets(["SAT-001", "SAT-007"])
+        assert set(packets) == {"SAT-001", "SAT-007"}
+        assert all(isinstance(p, TelemetryPacket) for p in packets.values())
+        assert len(engine.packets()) == 10
+
+    @pytest.mark.asyncio
+    async def test_satellite_view_is_a_simulator(self):
+        """Test ConstellationSatellite exposes the SatelliteSimulator interface."""
+        engine = ConstellationEngine(["SAT-A", "SAT-B"])
+        sat = engine.satellite("SAT-A")
+        assert isinstance(sat, ConstellationSatellite)
+        assert engine.satellite("SAT-A") is sat
+
+        sat.add_nearby_sat("SAT-B", 1.2)
+        assert [n.sat_id for n in sat.thermal_sim.nearby_sats] == ["SAT-B"]
+
+        engine.step()
+        packet = await sat.generate_telemetry()
+        assert packet.satellite_id == "SAT-A"
+        assert packet.orbit == sat.orbit_sim.get_orbit_data().model_copy(
+            update={"ground_speed_ms": packet.orbit.ground_speed_ms}
+        )
+        assert len(sat.get_telemetry_history()) == 1
+
+        await sat.inject_fault("comms_dropout", severity=0.5)
+        assert sat.fault_type == "comms_dropout"
+        assert sat.comms_sim.get_comms_stats()["state"] in {"nominal", "degraded", "dropout"}
+
+    def test_rejects_invalid_ids(self):
+        """Test long and duplicate satellite ids are rejected."""
+        with pytest.raises(ValueError):
+            ConstellationEngine(["X" * 17])
+        with pytest.raises(ValueError):
+            ConstellationEngine(["SAT-A", "SAT-A"])
@@ -6,7 +6,10 @@ import csv
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+
 from astraguard.hil.metrics.latency import LatencyCollector, LatencyMeasurement
+from astraguard.hil.metrics.sketch import QuantileSketch
 from astraguard.hil.metrics.storage import MetricsStorage
 
 
@@ -161,6 +164,139 @@ class TestLatencyCollector:
         assert collector.get_stats() == {}
 
 
+class TestQuantileSketch:
+    """Test the mergeable quantile sketch."""
+
+    def test_quantiles_within_relative_accuracy(self):
+        """Test sketched percentiles stay within the error bound."""
+        values = np.random.default_rng(0).lognormal(4.0, 1.0, 50_000)
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        sketch.add_many(values)
+
+        exact = np.sort(values)
+        for q in (0.01, 0.5, 0.95, 0.99):
+            expected = exact[int(len(exact) * q)]
+            assert sketch.quantile(q) == pytest.approx(expected, rel=0.01)
+        assert sketch.count == len(values)
+        assert sketch.min == exact[0]
+        assert sketch.max == exact[-1]
+        assert sketch.mean == pytest.approx(values.mean())
+
+    def test_merge_equals_single_sketch(self):
+        """Test merged partial sketches match one sketch over all values."""
+        values = np.random.default_rng(1).normal(100.0, 30.0, 10_000)
+        whole = QuantileSketch()
+        whole.add_many(values)
+
+        merged = QuantileSketch()
+        for part in np.array_split(values, 4):
+            partial = QuantileSketch()
+            for value in part:
+                partial.add(float(value))
+            merged.merge(QuantileSketch.from_dict(json.loads(json.dumps(partial.to_dict()))))
+
+        assert merged.count == whole.count
+        for q in (0.5, 0.95, 0.99):
+            assert merged.quantile(q) == whole.quantile(q)
+
+    def test_merge_rejects_different_accuracy(self):
+        """Test sketches with different error bounds do not merge."""
+        with pytest.raises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+    def test_non_positive_values(self):
+        """Test zero and negative values are counted without a log bucket."""
+        sketch = QuantileSketch()
+        sketch.add_many([0.0, 0.0, 10.0])
+        assert sketch.quantile(0.0) == 0.0
+        assert sketch.quantile(0.99) == pytest.approx(10.0, rel=0.01)
+
+
+class TestStreamingLatency:
+    """Test streaming (sketch-backed) latency collection."""
+
+    def _fill(self, collector, n=2000, seed=0):
+        rng = np.random.default_rng(seed)
+        sat_ids = ["SAT1", "SAT2", "SAT3"]
+        for t in range(n):
+            collector.record_batch("fault_detection", sat_ids, float(t), np.abs(rng.normal(75, 25, 3)))
+            collector.record_agent_decision("SAT1", float(t), abs(rng.normal(120, 40)))
+
+    def test_streaming_stats_match_exact(self):
+        """Test streaming stats approximate the exact ones."""
+        exact = LatencyCollector()
+        streaming = LatencyCollector(streaming=True)
+        self._fill(exact)
+        self._fill(streaming)
+
+        assert len(streaming) == len(exact) == 8000
+        assert streaming.measurements == []
+        exact_stats, stream_stats = exact.get_stats(), streaming.get_stats()
+        assert set(stream_stats) == set(exact_stats)
+        for metric_type, stats in exact_stats.items():
+            for key, value in stats.items():
+                assert stream_stats[metric_type][key] == pytest.approx(value, rel=0.01)
+
+        by_sat = streaming.get_stats_by_satellite()
+        assert by_sat["SAT2"]["fault_detection"]["count"] == 2000
+        assert by_sat["SAT1"]["agent_decision"]["p95_ms"] == pytest.approx(
+            exact.get_stats_by_satellite()["SAT1"]["agent_decision"]["p95_ms"], rel=0.01
+        )
+
+    def test_record_batch_matches_individual_records(self):
+        """Test record_batch stores the same measurements as record_*."""
+        batch = LatencyCollector()
+        single = LatencyCollector()
+        batch.record_batch("fault_detection", ["SAT1", "SAT2"], 5.0, [50.0, 60.0])
+        single.record_fault_detection("SAT1", 5.0, 50.0)
+        single.record_fault_detection("SAT2", 5.0, 60.0)
+
+        strip = lambda ms: [(m.metric_type, m.satellite_id, m.duration_ms) for m in ms]
+        assert strip(batch.measurements) == strip(single.measurements)
+        assert batch.get_stats() == single.get_stats()
+
+        with pytest.raises(ValueError):
+            batch.record_batch("fault_detection", ["SAT1"], 5.0, [1.0, 2.0])
+
+    def test_merge_across_collectors(self):
+        """Test sketches exported from separate runs merge into one view."""
+        runs = [LatencyCollector() for _ in range(3)]
+        for seed, run in enumerate(runs):
+            self._fill(run, n=500, seed=seed)
+
+        campaign = LatencyCollector(streaming=True)
+        for run in runs:
+            exported = json.loads(json.dumps(run.export_sketches()))
+            campaign.merge(LatencyCollector.from_sketches(exported))
+
+        combined = LatencyCollector()
+        for run in runs:
+            combined.merge(run)
+
+        assert len(campaign) == len(combined) == 6000
+        assert campaign.get_summary()["measurement_types"] == {
+            "fault_detection": 4500, "agent_decision": 1500
+        }
+        exact_p95 = combined.get_stats()["fault_detection"]["p95_ms"]
+        assert campaign.get_stats()["fault_detection"]["p95_ms"] == pytest.approx(exact_p95, rel=0.01)
+
+        with pytest.raises(ValueError):
+            combined.merge(campaign)
+
+    def test_streaming_collector_has_no_raw_export(self, tmp_path):
+        """Test CSV export is refused and storage skips the raw file."""
+        collector = LatencyCollector(streaming=True)
+        collector.record_fault_detection("SAT1", 1.0, 80.0)
+
+        with pytest.raises(ValueError):
+            collector.export_csv(str(tmp_path / "raw.csv"))
+
+        paths = MetricsStorage("streaming", str(tmp_path)).save_latency_stats(collector)
+        assert paths["raw"] is None
+        summary = json.loads(Path(paths["summary"]).read_text())
+        assert summary["total_measurements"] == 1
+
+
 class TestMetricsStorage:
     """Test MetricsStorage functionality."""
 
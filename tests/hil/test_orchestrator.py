@@ -10,6 +10,7 @@ from astraguard.hil.scenarios.orchestrator import (
     ScenarioOrchestrator,
     execute_campaign,
     execute_all_scenarios,
+    scenario_seed,
 )
 from astraguard.hil.scenarios.schema import Scenario, SatelliteConfig, SuccessCriteria
 
@@ -360,3 +361,123 @@ class TestHighLevelAPIs:
         assert isinstance(summary, dict)
         assert "campaign_id" in summary
         assert "pass_rate" in summary
+
+
+@pytest.fixture
+def campaign_dirs(tmp_path):
+    """Copy the sample scenarios into a scratch scenario/results layout."""
+    import shutil
+    from astraguard.hil import scenarios
+
+    scenario_dir = tmp_path / "scenarios"
+    shutil.copytree(Path(scenarios.__file__).parent / "sample_scenarios", scenario_dir)
+    return scenario_dir, tmp_path / "results"
+
+
+class TestProcessCampaign:
+    """Test the process-pool campaign runner."""
+
+    @pytest.mark.asyncio
+    async def test_stream_campaign_yields_and_saves_each_result(self, campaign_dirs):
+        """Test results stream back one at a time and are persisted."""
+        scenario_dir, results_dir = campaign_dirs
+        orchestrator = ScenarioOrchestrator(str(scenario_dir), str(results_dir))
+        paths = sorted(str(p) for p in scenario_dir.glob("*.yaml"))
+
+        streamed = []
+        async for name, result in orchestrator.stream_campaign(paths, processes=2, seed=7):
+            streamed.append(name)
+            assert ResultStorage(str(results_dir)).has_result(Path(name).stem)
+            assert "final_telemetry" not in result
+            assert result["seed"] == scenario_seed(7, name)
+
+        assert sorted(streamed) == ["cascade_fail.yaml", "nominal.yaml"]
+
+    @pytest.mark.asyncio
+    async def test_closing_stream_early_drops_queued_scenarios(self, campaign_dirs, monkeypatch):
+        """Test aclose() shuts the pool down without running the rest."""
+        import shutil
+        from concurrent.futures import ProcessPoolExecutor
+        import astraguard.hil.scenarios.orchestrator as orchestrator_module
+
+        shutdowns = []
+
+        class RecordingPool(ProcessPoolExecutor):
+            def shutdown(self, wait=True, *, cancel_futures=False):
+                shutdowns.append((wait, cancel_futures))
+                super().shutdown(wait=wait, cancel_futures=cancel_futures)
+
+        monkeypatch.setattr(orchestrator_module, "ProcessPoolExecutor", RecordingPool)
+        scenario_dir, results_dir = campaign_dirs
+        paths = []
+        for i in range(6):
+            path = scenario_dir / f"nominal_{i}.yaml"
+            shutil.copy(scenario_dir / "nominal.yaml", path)
+            paths.append(str(path))
+        orchestrator = ScenarioOrchestrator(str(scenario_dir), str(results_dir))
+
+        stream = orchestrator.stream_campaign(paths, processes=1, seed=5)
+        name, _ = await stream.__anext__()
+        await stream.aclose()
+
+        assert shutdowns == [(False, True)]
+        assert [p.name for p in results_dir.glob("nominal_*.json")] == [
+            p.name for p in results_dir.glob(f"{Path(name).stem}_*.json")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_seeded_campaign_is_reproducible(self, campaign_dirs):
+        """Test the same campaign seed gives the same scenario outcomes."""
+        scenario_dir, results_dir = campaign_dirs
+        path = str(scenario_dir / "cascade_fail.yaml")
+
+        runs = []
+        for run in range(2):
+            orchestrator = ScenarioOrchestrator(str(scenario_dir), str(results_dir / str(run)))
+            summary = await orchestrator.run_process_campaign(
+                [path], processes=1, seed=42, verbose=False
+            )
+            runs.append(summary["results"]["cascade_fail.yaml"])
+
+        assert runs[0]["accuracy_stats"] == runs[1]["accuracy_stats"]
+        assert runs[0]["latency_stats"] == runs[1]["latency_stats"]
+        assert runs[0]["success"] == runs[1]["success"]
+
+    @pytest.mark.asyncio
+    async def test_resume_skips_saved_scenarios(self, campaign_dirs):
+        """Test resume=True only runs scenarios without a saved result."""
+        scenario_dir, results_dir = campaign_dirs
+        orchestrator = ScenarioOrchestrator(str(scenario_dir), str(results_dir))
+        ResultStorage(str(results_dir)).save_scenario_result("nominal", {"success": True})
+        # A longer name sharing the prefix does not count as "cascade_fail"
+        ResultStorage(str(results_dir)).save_scenario_result("cascade_fail_v2", {"success": True})
+        paths = sorted(str(p) for p in scenario_dir.glob("*.yaml"))
+
+        summary = await orchestrator.run_process_campaign(
+            paths, processes=2, seed=1, resume=True, verbose=False
+        )
+
+        assert list(summary["results"]) == ["cascade_fail.yaml"]
+        assert summary["skipped_scenarios"] == 1
+        throughput = summary["throughput"]
+        assert throughput["scenarios_per_s"] > 0
+        assert throughput["sat_ticks_per_s"] > throughput["simulated_s_per_s"]
+        # Latency sketches from every scenario merge into campaign-wide stats
+        assert summary["latency_stats"]["fault_detection"]["count"] == 1200 * 3
+        assert list(results_dir.glob("campaign_*.json"))
+
+    @pytest.mark.asyncio
+    async def test_worker_errors_are_reported(self, tmp_path):
+        """Test a broken scenario becomes a failed result, not a crash."""
+        broken = tmp_path / "broken.yaml"
+        broken.write_text("this: is: invalid: yaml: syntax:")
+        orchestrator = ScenarioOrchestrator(str(tmp_path), str(tmp_path / "results"))
+
+        summary = await orchestrator.run_process_campaign(
+            [str(broken)], processes=1, seed=3, verbose=False
+        )
+
+        result = summary["results"]["broken.yaml"]
+        assert result["success"] is False
+        assert "error" in result
+        assert summary["failed"] == 1
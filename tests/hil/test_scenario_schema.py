@@ -189,10 +189,19 @@ class TestScenarioCreation:
                 name="test",
                 description="Test",
                 satellites=[
-                    SatelliteConfig(id=f"SAT-{i:03d}") for i in range(15)
+                    SatelliteConfig(id=f"SAT-{i:04d}") for i in range(5001)
                 ]
             )
 
+    def test_scenario_large_constellation(self):
+        """Constellations beyond a handful of satellites validate."""
+        scenario = Scenario(
+            name="test",
+            description="Test",
+            satellites=[SatelliteConfig(id=f"SAT-{i:04d}") for i in range(2000)]
+        )
+        assert len(scenario.satellites) == 2000
+
     def test_scenario_duration_bounds(self):
         """Test duration validation."""
         with pytest.raises(ValueError):
@@ -27,6 +27,7 @@ from astraguard.swarm.types import (
     SubscriptionID,
     MessageAck,
 )
+from astraguard.swarm import bus as bus_module
 from astraguard.swarm.bus import SwarmMessageBus
 
 
@@ -415,6 +416,330 @@ class TestSwarmMessageBus:
         bus.unsubscribe(sub_id)
 
 
+class TestBusFanout:
+    """Test suite for trie-based subscriber resolution and fan-out modes."""
+
+    @staticmethod
+    def create_bus(**kwargs) -> SwarmMessageBus:
+        agent = AgentID.create("astra-v3.0", "SAT-001-A")
+        config = SwarmConfig(
+            agent_id=agent,
+            role=SatelliteRole.PRIMARY,
+            constellation_id="astra-v3.0",
+        )
+        return SwarmMessageBus(config, SwarmSerializer(validate=False), latency_ms=0, **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_removes_from_index(self):
+        """Test unsubscribed callbacks no longer receive messages."""
+        bus = self.create_bus()
+        received = []
+        sub_id = bus.subscribe("health/*", received.append)
+        bus.subscribe("*", lambda msg: None)
+
+        await bus.publish("health/summary", b"one", qos=0)
+        bus.unsubscribe(sub_id)
+        await bus.publish("health/summary", b"two", qos=0)
+
+        assert [msg.payload for msg in received] == [b"one"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_delivery(self):
+        """Test callbacks run concurrently with concurrent_delivery."""
+        bus = self.create_bus(concurrent_delivery=True)
+        started = []
+
+        async def slow(msg: SwarmMessage):
+            started.append("slow")
+            await asyncio.sleep(0.2)
+
+        async def fast(msg: SwarmMessage):
+            started.append("fast")
+
+        bus.subscribe("health/*", slow)
+        bus.subscribe("health/*", fast)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(
+            bus.publish("health/summary", b"a", qos=0),
+            bus.publish("health/summary", b"b", qos=0),
+        )
+        assert loop.time() - start < 0.35
+        assert started.count("fast") == 2
+
+    @pytest.mark.asyncio
+    async def test_queued_delivery_isolates_slow_subscriber(self):
+        """Test a slow subscriber does not delay others or the publisher."""
+        bus = self.create_bus(subscriber_queue_size=10)
+        release = asyncio.Event()
+        slow_received, fast_received = [], []
+
+        async def slow(msg: SwarmMessage):
+            await release.wait()
+            slow_received.append(msg.payload)
+
+        bus.subscribe("health/*", slow)
+        bus.subscribe("health/*", lambda msg: fast_received.append(msg.payload))
+
+        for i in range(3):
+            assert await bus.publish("health/summary", bytes([i]), qos=0)
+        await asyncio.sleep(0.01)
+
+        assert fast_received == [b"\x00", b"\x01", b"\x02"]
+        assert slow_received == []
+
+        release.set()
+        await bus.flush()
+        assert slow_received == fast_received
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_queued_delivery_drops_oldest_when_full(self):
+        """Test a full subscriber queue drops its oldest message."""
+        bus = self.create_bus(subscriber_queue_size=2)
+        release = asyncio.Event()
+        received = []
+
+        async def blocked(msg: SwarmMessage):
+            await release.wait()
+            received.append(msg.payload)
+
+        bus.subscribe("health/*", blocked)
+        for i in range(5):
+            await bus.publish("health/summary", bytes([i]), qos=0)
+            await asyncio.sleep(0)
+
+        # Message 0 is being handled, 1 and 2 were dropped for 3 and 4
+        assert bus.get_metrics()["dropped"] == 2
+        release.set()
+        await bus.flush()
+        assert received == [b"\x00", b"\x03", b"\x04"]
+        await bus.close()
+
+    @pytest.mark.asyncio
+    async def test_queued_ack_delivery(self):
+        """Test QoS 1 works when ACKs come from queued callbacks."""
+        bus = self.create_bus(subscriber_queue_size=4)
+
+        async def ack_subscriber(msg: SwarmMessage):
+            await bus.acknowledge(msg)
+
+        bus.subscribe("health/summary", ack_subscriber)
+        assert await bus.publish("health/summary", b"ping", qos=QoSLevel.ACK, timeout_ms=1000)
+        assert bus.metrics["acked"] == 1
+        await bus.close()
+
+    def test_negative_queue_size_rejected(self):
+        with pytest.raises(ValueError):
+            self.create_bus(subscriber_queue_size=-1)
+
+
+class TestBusBatching:
+    """Test suite for coalesced (micro-batched) publishing."""
+
+    @staticmethod
+    def create_bus(**kwargs) -> SwarmMessageBus:
+        agent = AgentID.create("astra-v3.0", "SAT-001-A")
+        config = SwarmConfig(
+            agent_id=agent,
+            role=SatelliteRole.PRIMARY,
+            constellation_id="astra-v3.0",
+        )
+        kwargs.setdefault("latency_ms", 0)
+        return SwarmMessageBus(config, SwarmSerializer(validate=False), **kwargs)
+
+    @pytest.mark.asyncio
+    async def test_publish_many_single_latency_sleep(self):
+        """Test a batch pays one latency sleep and delivers in order."""
+        bus = self.create_bus(latency_ms=50)
+        received = []
+        bus.subscribe("*", lambda msg: received.append(msg.topic))
+
+        topics = [f"health/agent_{i}" for i in range(10)]
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await bus.publish_many([(t, {"risk": 0.1}) for t in topics], qos=0)
+
+        assert loop.time() - start < 0.2
+        assert results == [True] * 10
+        assert received == topics
+        metrics = bus.get_metrics()
+        assert metrics["batches"] == 1
+        assert metrics["avg_batch_size"] == 10
+        assert metrics["published"] == metrics["delivered"] == 10
+
+    @pytest.mark.asyncio
+    async def test_publish_many_reports_bytes_saved(self):
+        """Test framing saves ISL bytes against standalone messages."""
+        bus = self.create_bus()
+        payload = {"risk_score": 0.25, "recurrence_score": 1.0, "mode": "nominal"}
+        await bus.publish_many([("health/summary", payload)] * 20, qos=0)
+
+        metrics = bus.get_metrics()
+        assert metrics["isl_bytes"] > 0
+        assert metrics["bytes_saved"] > 0
+
+    @pytest.mark.asyncio
+    async def test_publish_many_skips_invalid_messages(self):
+        """Test invalid entries fail individually without sinking the batch."""
+        bus = self.create_bus()
+        results = await bus.publish_many(
+            [("health/a", b"x"), ("invalid/topic", b"x"), ("health/b", b"x")], qos=0
+        )
+        assert results == [True, False, True]
+        assert bus.metrics["batched_messages"] == 2
+
+    @pytest.mark.asyncio
+    async def test_publish_many_one_frame_per_receiver(self):
+        """Test messages are framed per receiver."""
+        bus = self.create_bus()
+        frames = []
+        frame_size = bus._frame_size
+        bus._frame_size = lambda bodies: frames.append(len(bodies)) or frame_size(bodies)
+
+        await bus.publish_many([("health/a", b"1"), ("health/b", b"2")], qos=0)
+        other = AgentID.create("astra-v3.0", "SAT-002-A")
+        await bus.publish_many([("coord/x", b"3")], qos=0, receiver=other)
+
+        assert frames == [2, 1]
+
+    @pytest.mark.asyncio
+    async def test_batch_one_frame_per_sender(self):
+        """Test a batch mixing senders frames each sender's messages apart."""
+        bus = self.create_bus()
+        frames = []
+        frame_size = bus._frame_size
+        bus._frame_size = lambda bodies: frames.append(len(bodies)) or frame_size(bodies)
+        relayed = SwarmMessage(
+            topic="health/relay",
+            payload=b"4",
+            sender=AgentID.create("astra-v3.0", "SAT-003-A"),
+        )
+        local = [bus._build_message(t, b"x", 0, None) for t in ("health/a", "health/b")]
+
+        await bus._send_batch([local[0], relayed, local[1]])
+
+        assert sorted(frames) == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_publish_many_byte_accounting(self):
+        """Test ISL bytes follow the frame layout, uncompressed."""
+        bus = self.create_bus()
+        await bus.publish_many([("health/a", b"12"), ("health/bb", b"3")], qos=0)
+
+        bodies = len("health/a") + 2 + len("health/bb") + 1
+        framed = bus_module.FRAME_HEADER.size + 2 * bus_module.FRAME_ENTRY.size + bodies
+        standalone = 2 * bus_module.MESSAGE_HEADER.size + bodies
+        assert bus.metrics["isl_bytes"] == framed
+        assert bus.metrics["bytes_saved"] == standalone - framed
+
+    @pytest.mark.asyncio
+    async def test_publish_many_splits_oversized_frames(self, monkeypatch):
+        """Test a receiver's messages are split so frame counts fit the header."""
+        monkeypatch.setattr(bus_module, "MAX_FRAME_MESSAGES", 3)
+        bus = self.create_bus()
+        frames = []
+        frame_size = bus._frame_size
+        bus._frame_size = lambda bodies: frames.append(len(bodies)) or frame_size(bodies)
+
+        results = await bus.publish_many([("health/a", bytes([i])) for i in range(7)], qos=0)
+
+        assert results == [True] * 7
+        assert frames == [3, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_publish_many_ack_timeouts_run_concurrently(self):
+        """Test several missing ACKs in one batch time out together."""
+        bus = self.create_bus()
+
+        async def ack_even(msg: SwarmMessage):
+            if msg.payload[0] % 2 == 0:
+                await bus.acknowledge(msg)
+
+        bus.subscribe("health/*", ack_even)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        results = await bus.publish_many(
+            [("health/summary", bytes([i])) for i in range(6)],
+            qos=QoSLevel.ACK, timeout_ms=200,
+        )
+
+        assert loop.time() - start < 0.5  # one timeout, not three in a row
+        assert results == [True, False, True, False, True, False]
+        assert bus.metrics["acked"] == 3
+        assert bus.metrics["lost"] == 3
+        assert bus.pending_acks == {}
+
+    @pytest.mark.asyncio
+    async def test_batch_window_coalesces_publishes(self):
+        """Test concurrent publishes within the window form one batch."""
+        bus = self.create_bus(latency_ms=50, batch_window_ms=5)
+        received = []
+        bus.subscribe("health/*", lambda msg: received.append(msg.payload))
+
+        results = await asyncio.gather(
+            *(bus.publish("health/summary", bytes([i]), qos=0) for i in range(8))
+        )
+
+        assert all(results)
+        assert received == [bytes([i]) for i in range(8)]
+        assert bus.metrics["batches"] == 1
+        assert bus.metrics["batched_messages"] == 8
+
+    @pytest.mark.asyncio
+    async def test_batch_window_with_ack(self):
+        """Test QoS 1 publishes are acknowledged through the batch path."""
+        bus = self.create_bus(batch_window_ms=5)
+
+        async def ack_subscriber(msg: SwarmMessage):
+            await bus.acknowledge(msg)
+
+        bus.subscribe("health/summary", ack_subscriber)
+        results = await asyncio.gather(
+            *(bus.publish("health/summary", b"ping", qos=QoSLevel.ACK, timeout_ms=1000)
+              for _ in range(3))
+        )
+
+        assert results == [True, True, True]
+        assert bus.metrics["acked"] == 3
+        assert bus.metrics["batches"] == 1
+        assert bus.pending_acks == {}
+
+    @pytest.mark.asyncio
+    async def test_batch_window_ack_timeout(self):
+        """Test a batched QoS 1 message without an ACK is reported lost."""
+        bus = self.create_bus(batch_window_ms=5)
+        bus.subscribe("health/*", lambda msg: None)
+        assert not await bus.publish("health/summary", b"x", qos=QoSLevel.ACK, timeout_ms=50)
+        assert bus.metrics["lost"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reliable_bypasses_batch_window(self):
+        """Test QoS 2 keeps its per-message path."""
+        bus = self.create_bus(batch_window_ms=5)
+        assert await bus.publish("health/summary", b"x", qos=QoSLevel.RELIABLE)
+        assert bus.metrics["batches"] == 0
+
+    @pytest.mark.asyncio
+    async def test_flush_sends_pending_batch(self):
+        """Test flush() sends the open batch without waiting for the window."""
+        bus = self.create_bus(batch_window_ms=10_000)
+        received = []
+        bus.subscribe("health/*", received.append)
+
+        task = asyncio.create_task(bus.publish("health/summary", b"x", qos=0))
+        await asyncio.sleep(0)
+        await bus.flush()
+
+        assert await task
+        assert len(received) == 1
+
+    def test_negative_batch_window_rejected(self):
+        with pytest.raises(ValueError):
+            self.create_bus(batch_window_ms=-1)
+
+
 class TestQoSLevels:
     """Test suite for QoS level validation."""
 
@@ -339,3 +339,64 @@ class TestCompressionPipeline:
         # Should achieve decent compression
         avg_ratio = 100.0 * (1.0 - total_compressed / total_original)
         assert avg_ratio > 50  # At least 50% compression on batch
+
+
+class TestBatchCompression:
+    """Tests for the vectorized compress_batch()/decompress_batch() API."""
+
+    @staticmethod
+    def create_summaries(count: int, offset: float = 0.0) -> list:
+        return [
+            HealthSummary(
+                anomaly_signature=[((i * 7 + j) % 40) / 40 - 0.5 + offset for j in range(32)],
+                risk_score=(i % 10) / 10,
+                recurrence_score=(i % 20) / 2,
+                timestamp=datetime.utcnow(),
+            )
+            for i in range(count)
+        ]
+
+    @pytest.mark.parametrize("use_lz4", [True, False])
+    def test_batch_matches_single_message(self, use_lz4):
+        """Payload i equals compress_health() with the same delta reference."""
+        summaries = self.create_summaries(20, offset=0.1)
+        prev_states = [None if i % 3 == 0 else p for i, p in enumerate(self.create_summaries(20))]
+
+        payloads = StateCompressor().compress_batch(summaries, prev_states, use_lz4=use_lz4)
+
+        assert len(payloads) == 20
+        for payload, summary, prev in zip(payloads, summaries, prev_states):
+            assert payload == StateCompressor(prev_state=prev).compress_health(summary, use_lz4=use_lz4)
+
+    def test_batch_roundtrip(self):
+        """decompress_batch() restores every summary within quantization error."""
+        summaries = self.create_summaries(50, offset=0.05)
+        prev_states = self.create_summaries(50)
+        compressor = StateCompressor()
+
+        restored = compressor.decompress_batch(
+            compressor.compress_batch(summaries, prev_states), prev_states
+        )
+
+        for original, result in zip(summaries, restored):
+            assert abs(result.risk_score - original.risk_score) < 1e-6
+            for a, b in zip(original.anomaly_signature, result.anomaly_signature):
+                assert abs(a - b) < 0.01
+
+    def test_batch_does_not_touch_delta_state(self):
+        """The compressor's own delta reference is not used by the batch API."""
+        compressor = StateCompressor()
+        compressor.compress_batch(self.create_summaries(3))
+        assert compressor.prev_anomaly_sig is None
+
+    def test_batch_empty_and_mismatched(self):
+        compressor = StateCompressor()
+        assert compressor.compress_batch([]) == []
+        assert compressor.decompress_batch([]) == []
+        with pytest.raises(ValueError):
+            compressor.compress_batch(self.create_summaries(2), prev_states=[None])
+
+    def test_batch_invalid_payload(self):
+        with pytest.raises(ValueError):
+            StateCompressor().decompress_batch([b"\x01\x00"])
+
@@ -428,6 +428,106 @@ class TestSwarmSerializer:
         with pytest.raises(Exception):  # jsonschema.ValidationError
             serializer.validate_schema(data, "HealthSummary")
 
+    def test_serializer_binary_roundtrip(self):
+        """Test binary wire format roundtrip and size."""
+        serializer = SwarmSerializer(validate=True)
+        original = HealthSummary(
+            anomaly_signature=[0.25 * (i - 16) for i in range(32)],
+            risk_score=0.75,
+            recurrence_score=5.2,
+            timestamp=datetime.utcnow(),
+            compressed_size=140,
+        )
+
+        serialized = serializer.serialize_health(original, wire_format="binary")
+        assert len(serialized) == 156
+        assert len(serialized) < len(serializer.serialize_health(original, compress=False))
+
+        restored = serializer.deserialize_health(serialized)
+        assert restored.anomaly_signature == original.anomaly_signature
+        assert restored.risk_score == original.risk_score
+        assert restored.recurrence_score == original.recurrence_score
+        assert restored.timestamp == original.timestamp
+        assert restored.compressed_size == original.compressed_size
+
+    def test_serializer_binary_aware_timestamp(self):
+        """Test timezone-aware timestamps come back as UTC."""
+        from datetime import timedelta, timezone
+
+        serializer = SwarmSerializer(wire_format="binary")
+        local = datetime(2026, 3, 1, 12, 30, 15, 123456, tzinfo=timezone(timedelta(hours=2)))
+        summary = HealthSummary(
+            anomaly_signature=[0.0] * 32,
+            risk_score=0.1,
+            recurrence_score=0.0,
+            timestamp=local,
+        )
+
+        restored = serializer.deserialize_health(serializer.serialize_health(summary))
+        assert restored.timestamp == local
+        assert restored.timestamp.tzinfo == timezone.utc
+
+    def test_serializer_format_selected_per_message(self):
+        """Test one serializer decodes JSON and binary payloads side by side."""
+        serializer = SwarmSerializer(validate=True, wire_format="binary")
+        summary = HealthSummary(
+            anomaly_signature=[0.5] * 32,
+            risk_score=0.5,
+            recurrence_score=1.0,
+            timestamp=datetime.utcnow(),
+        )
+
+        binary = serializer.serialize_health(summary)
+        as_json = serializer.serialize_health(summary, compress=False, wire_format="json")
+        assert serializer.is_binary(binary)
+        assert not serializer.is_binary(as_json)
+        assert serializer.deserialize_health(as_json, compressed=False).anomaly_signature == [0.5] * 32
+        assert serializer.deserialize_health(binary).anomaly_signature == [0.5] * 32
+
+        if serializer._use_lz4:
+            lz4_json = serializer.serialize_health(summary, wire_format="json")
+            assert not serializer.is_binary(lz4_json)
+            assert serializer.deserialize_health(lz4_json).risk_score == 0.5
+
+    def test_serializer_signature_view_is_zero_copy(self):
+        """Test signature_view reads the payload buffer in place."""
+        import sys
+
+        serializer = SwarmSerializer(wire_format="binary")
+        summary = HealthSummary(
+            anomaly_signature=[0.5 * i for i in range(32)],
+            risk_score=0.5,
+            recurrence_score=1.0,
+            timestamp=datetime.utcnow(),
+        )
+        payload = bytearray(serializer.serialize_health(summary))
+
+        view = SwarmSerializer.signature_view(payload)
+        assert view.tolist() == summary.anomaly_signature
+        if sys.byteorder == "little":
+            payload[28:32] = b"\x00\x00\x80\x3f"  # 1.0 as float32
+            assert view[0] == 1.0
+
+    def test_serializer_binary_invalid_payloads(self):
+        """Test malformed binary payloads and unknown formats are rejected."""
+        serializer = SwarmSerializer(wire_format="binary")
+        summary = HealthSummary(
+            anomaly_signature=[0.0] * 32,
+            risk_score=0.5,
+            recurrence_score=1.0,
+            timestamp=datetime.utcnow(),
+        )
+        payload = serializer.serialize_health(summary)
+
+        with pytest.raises(ValueError):
+            serializer.deserialize_health(payload[:-4])
+        with pytest.raises(ValueError):
+            SwarmSerializer.signature_view(b'{"risk_score": 0.5}')
+        with pytest.raises(ValueError):
+            SwarmSerializer(wire_format="protobuf")
+        with pytest.raises(ValueError):
+            serializer.serialize_health(summary, wire_format="xml")
+
     def test_serializer_compression_stats(self):
         """Test compression statistics calculation."""
         stats = SwarmSerializer.get_compression_stats(4200, 800)
@@ -0,0 +1,84 @@
+"""
+Tests for the TopicTrie subscription index used by SwarmMessageBus.
+"""
+
+import random
+
+import pytest
+
+from astraguard.swarm.topic_index import TopicTrie
+from astraguard.swarm.types import TopicFilter
+
+
+class TestTopicTrie:
+    """Test suite for TopicTrie."""
+
+    def test_exact_and_wildcard_match(self):
+        trie = TopicTrie()
+        trie.add("health/summary", "exact")
+        trie.add("health/*", "health")
+        trie.add("intent/*", "intent")
+        trie.add("*", "all")
+
+        assert trie.match("health/summary") == ["exact", "health", "all"]
+        assert trie.match("health/status/detail") == ["health", "all"]
+        assert trie.match("intent/plan") == ["intent", "all"]
+        assert trie.match("coord/sync") == ["all"]
+
+    def test_wildcard_requires_a_child_segment(self):
+        trie = TopicTrie()
+        trie.add("health/*", "health")
+        assert trie.match("health") == []
+        assert trie.match("health/") == ["health"]
+        assert trie.match("healthy/summary") == []
+
+    def test_results_keep_subscription_order(self):
+        trie = TopicTrie()
+        trie.add("*", "first")
+        trie.add("health/summary", "second")
+        trie.add("health/*", "third")
+        assert trie.match("health/summary") == ["first", "second", "third"]
+
+    def test_remove_prunes_empty_nodes(self):
+        trie = TopicTrie()
+        trie.add("health/summary/detail", "a")
+        trie.add("health/*", "b")
+
+        assert trie.remove("a") is True
+        assert trie.remove("a") is False
+        assert "summary" not in trie._root.children["health"].children
+        assert trie.remove("b") is True
+        assert trie._root.children == {}
+        assert len(trie) == 0
+
+    def test_re_adding_key_replaces_pattern(self):
+        trie = TopicTrie()
+        trie.add("health/*", "sub")
+        trie.add("intent/*", "sub")
+        assert trie.match("health/summary") == []
+        assert trie.match("intent/plan") == ["sub"]
+        assert len(trie) == 1
+
+    def test_empty_pattern_rejected(self):
+        with pytest.raises(ValueError):
+            TopicTrie().add("", "sub")
+
+    def test_matches_topic_filter_semantics(self):
+        """Randomized comparison against TopicFilter.matches."""
+        rng = random.Random(398)
+        segments = ["health", "intent", "summary", "plan", "*", ""]
+
+        def random_path():
+            return "/".join(rng.choice(segments) for _ in range(rng.randint(1, 4)))
+
+        patterns = ["*"] + [random_path() for _ in range(60)]
+        patterns += [random_path() + "/*" for _ in range(60)]
+        patterns = [p for p in patterns if p]
+        trie = TopicTrie()
+        for i, pattern in enumerate(patterns):
+            trie.add(pattern, i)
+
+        for _ in range(500):
+            topic = random_path()
+            expected = [i for i, p in enumerate(patterns) if TopicFilter(p).matches(topic)]
+            assert trie.match(topic) == expected, topic
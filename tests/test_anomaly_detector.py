@@ -202,4 +202,60 @@ class TestAnomalyDetector:
         # Should fall back to heuristic despite validation error
         is_anomalous, score = await detect_anomaly(data)
         assert isinstance(is_anomalous, bool)
-        assert isinstance(score, float)
\ No newline at end of file
+        assert isinstance(score, float)
+
+class TestBatchAnomalyDetection:
+    """Tests for the vectorized batch detection path."""
+
+    def test_heuristic_batch_matches_scalar_thresholds(self):
+        """Vectorized heuristic flags the same rows as the scalar heuristic."""
+        np = pytest.importorskip("numpy")
+        from anomaly.anomaly_detector import _detect_anomaly_heuristic_batch
+
+        features = np.array([
+            [8.0, 25.0, 0.0],    # normal
+            [6.5, 50.0, 0.2],    # all three thresholds
+            [9.5, 45.0, 0.0],    # voltage + temperature
+            [np.nan, 25.0, 0.0], # invalid row
+        ])
+        is_anomalous, scores = _detect_anomaly_heuristic_batch(features)
+
+        # Invalid rows are penalised (0.5 + noise), like the scalar heuristic
+        assert is_anomalous[:3].tolist() == [False, True, True]
+        assert np.all((scores >= 0.0) & (scores <= 1.0))
+        assert 0.5 <= scores[3] <= 0.6
+
+    @pytest.mark.asyncio
+    async def test_detect_anomaly_batch_with_model_single_call(self):
+        """Model is invoked once for the whole matrix."""
+        np = pytest.importorskip("numpy")
+        from anomaly.anomaly_detector import detect_anomaly_batch
+
+        mock_model = MagicMock()
+        mock_model.predict.side_effect = lambda X: np.array([1, 0, 1])
+        mock_model.score_samples.side_effect = lambda X: np.array([0.8, 0.1, 1.7])
+
+        with patch('anomaly.anomaly_detector._MODEL', mock_model), \
+             patch('anomaly.anomaly_detector._MODEL_LOADED', True), \
+             patch('anomaly.anomaly_detector._USING_HEURISTIC_MODE', False), \
+             patch('anomaly.anomaly_detector.get_resource_monitor') as mock_rm:
+            mock_rm.return_value.check_resource_health.return_value = {'overall': 'healthy'}
+            features = np.array([[8.0, 25.0, -0.2], [8.0, 25.0, 0.0], [6.0, 50.0, 0.0]])
+            is_anomalous, scores = await detect_anomaly_batch(features)
+
+        assert mock_model.predict.call_count == 1
+        model_input = mock_model.predict.call_args[0][0]
+        assert model_input.shape == (3, 3)
+        assert model_input[0, 2] == pytest.approx(0.2)
+        assert is_anomalous.tolist() == [True, False, True]
+        assert scores.tolist() == [0.8, 0.1, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_detect_anomaly_batch_empty(self):
+        """Empty batches return empty arrays."""
+        np = pytest.importorskip("numpy")
+        from anomaly.anomaly_detector import detect_anomaly_batch
+
+        is_anomalous, scores = await detect_anomaly_batch(np.zeros((0, 5)))
+        assert len(is_anomalous) == 0
+        assert len(scores) == 0
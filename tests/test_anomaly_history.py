@@ -0,0 +1,124 @@
+"""Tests for the time-indexed anomaly history ring buffer."""
+
+import pytest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+pytest.importorskip("numpy")
+
+from api.anomaly_history import AnomalyHistory
+
+BASE = datetime(2026, 1, 1, 12, 0, 0)
+
+
+def _anomaly(minute, severity=0.5, name=None):
+    return SimpleNamespace(
+        timestamp=BASE + timedelta(minutes=minute),
+        severity_score=severity,
+        name=name if name is not None else minute,
+    )
+
+
+def _names(items):
+    return [a.name for a in items]
+
+
+def _reference(items, start_time=None, end_time=None, severity_min=None, limit=None):
+    """The list-comprehension filtering the service used before."""
+    filtered = list(items)
+    if start_time:
+        filtered = [a for a in filtered if a.timestamp >= start_time]
+    if end_time:
+        filtered = [a for a in filtered if a.timestamp <= end_time]
+    if severity_min is not None:
+        filtered = [a for a in filtered if a.severity_score >= severity_min]
+    return filtered[-limit:] if limit and len(filtered) > limit else filtered
+
+
+def test_deque_compatibility():
+    history = AnomalyHistory(maxlen=3)
+    history.extend([_anomaly(i) for i in range(5)])
+    assert len(history) == 3
+    assert _names(history) == [2, 3, 4]
+
+    history.clear()
+    assert len(history) == 0
+    assert list(history) == []
+
+
+def test_invalid_maxlen():
+    with pytest.raises(ValueError):
+        AnomalyHistory(maxlen=0)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {},
+    {"limit": 5},
+    {"start_time": BASE + timedelta(minutes=10)},
+    {"end_time": BASE + timedelta(minutes=20), "limit": 3},
+    {"start_time": BASE + timedelta(minutes=5), "end_time": BASE + timedelta(minutes=25)},
+    {"severity_min": 0.6, "limit": 4},
+    {"start_time": BASE + timedelta(minutes=30), "end_time": BASE + timedelta(minutes=10)},
+])
+def test_query_matches_reference_after_wraparound(kwargs):
+    history = AnomalyHistory(maxlen=25)
+    items = [_anomaly(i, severity=(i % 10) / 10) for i in range(40)]
+    history.extend(items)
+
+    result, _ = history.query(**kwargs)
+    assert _names(result) == _names(_reference(items[-25:], **kwargs))
+
+
+def test_out_of_order_timestamps_fall_back_to_mask():
+    history = AnomalyHistory(maxlen=10)
+    items = [_anomaly(m) for m in (0, 5, 3, 8, 1, 9)]
+    history.extend(items)
+
+    start, end = BASE + timedelta(minutes=2), BASE + timedelta(minutes=8)
+    result, _ = history.query(start_time=start, end_time=end)
+    assert _names(result) == [5, 3, 8]
+
+
+def test_order_break_expires_with_eviction():
+    history = AnomalyHistory(maxlen=3)
+    history.extend([_anomaly(5), _anomaly(1), _anomaly(2), _anomaly(3)])
+    # Entry 5 (the one out of order) has been evicted, so bisection is safe again
+    assert history._in_time_order()
+    result, _ = history.query(start_time=BASE + timedelta(minutes=2))
+    assert _names(result) == [2, 3]
+
+
+def test_since_cursor_returns_only_new_entries():
+    history = AnomalyHistory(maxlen=100)
+    history.extend([_anomaly(i) for i in range(3)])
+    first, cursor = history.query()
+    assert _names(first) == [0, 1, 2]
+
+    none_new, same_cursor = history.query(since=cursor)
+    assert none_new == [] and same_cursor == cursor
+
+    history.extend([_anomaly(i) for i in range(3, 6)])
+    new, cursor = history.query(since=cursor)
+    assert _names(new) == [3, 4, 5]
+    assert cursor == history.next_cursor
+
+
+def test_since_cursor_pages_forward():
+    history = AnomalyHistory(maxlen=100)
+    history.extend([_anomaly(i, severity=0.9 if i % 2 else 0.1) for i in range(10)])
+
+    pages, cursor = [], 0
+    while True:
+        page, cursor = history.query(since=cursor, limit=2, severity_min=0.5)
+        if not page:
+            break
+        pages.append(_names(page))
+    assert pages == [[1, 3], [5, 7], [9]]
+
+
+def test_since_cursor_after_eviction_starts_at_oldest():
+    history = AnomalyHistory(maxlen=3)
+    history.extend([_anomaly(i) for i in range(6)])
+    result, cursor = history.query(since=0)
+    assert _names(result) == [3, 4, 5]
+    assert cursor == 6
@@ -0,0 +1,235 @@
+"""Tests for the batched, hash-chained and indexed audit logger."""
+
+import gc
+import json
+import weakref
+from datetime import datetime, timedelta
+
+import pytest
+
+import core.audit_logger as audit_logger_module
+from core.audit_index import SegmentIndex, index_path, load_checkpoints
+from core.audit_logger import AuditEventType, AuditLogger, GENESIS_HASH, RECORD_SEPARATOR
+
+
+@pytest.fixture
+def audit(tmp_path):
+    logger = AuditLogger(log_dir=str(tmp_path), fsync_policy="never")
+    yield logger
+    logger.close()
+
+
+def integrity_lines(logger):
+    # str.splitlines() would also split on RECORD_SEPARATOR
+    return logger.integrity_log_path.read_text().rstrip("\n").split("\n")
+
+
+def test_async_events_are_written_and_chain_verifies(audit):
+    for i in range(200):
+        audit.log_event(AuditEventType.DATA_ACCESS, user_id=f"user-{i % 3}", resource="telemetry")
+
+    assert audit.flush()
+    entries = [json.loads(line) for line in audit.audit_log_path.read_text().splitlines()]
+    assert len(entries) == 200
+    assert audit.verify_integrity()
+
+    stats = audit.get_writer_stats()
+    assert stats["events_written"] == 200
+    assert stats["batches"] <= 200
+    assert stats["queue_depth"] == 0
+
+
+def test_writer_does_not_keep_logger_alive(tmp_path):
+    logger = AuditLogger(log_dir=str(tmp_path), fsync_policy="never")
+    logger.log_event(AuditEventType.DATA_ACCESS, user_id="alice")
+    assert logger.flush()
+    writer, ref = logger._writer, weakref.ref(logger)
+
+    del logger
+    gc.collect()
+    assert ref() is None
+    writer.join(timeout=5.0)
+    assert not writer.is_alive()
+
+
+def test_exit_hook_writes_pending_events(tmp_path, monkeypatch):
+    monkeypatch.setattr(audit_logger_module, "_async_loggers", weakref.WeakSet())
+    logger = AuditLogger(log_dir=str(tmp_path), fsync_policy="never")
+    for i in range(50):
+        logger.log_event(AuditEventType.DATA_ACCESS, user_id=f"user-{i}")
+
+    audit_logger_module._close_async_loggers()
+    assert not logger._writer.is_alive()
+    assert len(logger.audit_log_path.read_text().splitlines()) == 50
+    assert logger.get_writer_stats()["events_written"] == 50
+
+
+def test_batch_is_one_integrity_link(tmp_path):
+    logger = AuditLogger(log_dir=str(tmp_path), async_writes=False, fsync_policy="never")
+    logger.log_event(AuditEventType.AUTHENTICATION_SUCCESS, user_id="alice")
+    items = [
+        (logger._create_audit_entry(AuditEventType.DATA_ACCESS, user_id=f"u{i}"), {}, 0.0)
+        for i in range(3)
+    ]
+    logger._write_batch(items)
+    logger.close()
+
+    lines = integrity_lines(logger)
+    assert len(lines) == 2
+    assert RECORD_SEPARATOR not in lines[0]
+    assert lines[1].split("|", 1)[1].count(RECORD_SEPARATOR) == 2
+    assert len(logger.audit_log_path.read_text().splitlines()) == 4
+    assert logger.verify_integrity()
+
+
+def test_tampering_is_detected(audit):
+    for user in ("alice", "bob", "carol"):
+        audit.log_event(AuditEventType.AUTHENTICATION_SUCCESS, user_id=user)
+    audit.flush()
+
+    path = audit.integrity_log_path
+    path.write_text(path.read_text().replace("bob", "mallory"))
+    assert not audit.verify_integrity()
+
+
+def test_chain_resumes_across_instances(tmp_path):
+    first = AuditLogger(log_dir=str(tmp_path), fsync_policy="never")
+    first.log_event(AuditEventType.AUTHENTICATION_SUCCESS, user_id="alice")
+    first.close()
+    assert first._last_hash != GENESIS_HASH
+
+    second = AuditLogger(log_dir=str(tmp_path), fsync_policy="never")
+    assert second._last_hash == first._last_hash
+    second.log_event(AuditEventType.DATA_ACCESS, user_id="alice")
+    assert second.verify_integrity()
+    second.close()
+
+
+def test_rotation_keeps_queryable_backups(tmp_path):
+    logger = AuditLogger(
+        log_dir=str(tmp_path), max_bytes=2000, backup_count=2,
+        async_writes=False, fsync_policy="never",
+    )
+    for i in range(60):
+        logger.log_event(AuditEventType.DATA_ACCESS, user_id="alice", resource=f"r{i}")
+
+    assert (tmp_path / "audit.log.1").exists()
+    assert (tmp_path / "audit.log.2").exists()
+    assert not (tmp_path / "audit.log.3").exists()
+    assert logger.audit_log_path.stat().st_size <= 2000
+    results = logger.query_audit_logs(user_id="alice", limit=1000)
+    assert 0 < len(results) < 60
+    # The integrity log is never rotated
+    assert len(integrity_lines(logger)) == 60
+    assert logger.verify_integrity()
+    logger.close()
+
+
+def test_invalid_fsync_policy(tmp_path):
+    with pytest.raises(ValueError):
+        AuditLogger(log_dir=str(tmp_path), fsync_policy="always")
+
+
+def rotating_logger(tmp_path, **options):
+    options = {"max_bytes": 2000, "backup_count": 10, "async_writes": False,
+               "fsync_policy": "never", **options}
+    return AuditLogger(log_dir=str(tmp_path), **options)
+
+
+def test_rotated_segments_get_sidecar_indexes(tmp_path):
+    logger = rotating_logger(tmp_path)
+    for i in range(30):
+        logger.log_event(
+            AuditEventType.DATA_ACCESS if i % 2 else AuditEventType.AUTHENTICATION_SUCCESS,
+            user_id=f"user-{i % 3}", resource=f"r{i}",
+        )
+
+    assert index_path(tmp_path / "audit.log.1").exists()
+    index = SegmentIndex.load(index_path(tmp_path / "audit.log.1"))
+    with open(tmp_path / "audit.log.1", "rb") as f:
+        for offset in index.postings["user_id"]["user-1"]:
+            f.seek(offset)
+            assert json.loads(f.readline())["user_id"] == "user-1"
+
+    results = logger.query_audit_logs(
+        event_type=AuditEventType.DATA_ACCESS, user_id="user-1", limit=1000
+    )
+    expected = {f"r{i}" for i in range(30) if i % 2 and i % 3 == 1}
+    assert {entry["resource"] for entry in results} == expected
+    assert logger.query_audit_logs(user_id="nobody") == []
+    logger.close()
+
+
+def test_legacy_segment_index_is_built_on_query(tmp_path):
+    logger = rotating_logger(tmp_path)
+    for i in range(20):
+        logger.log_event(AuditEventType.DATA_ACCESS, user_id="alice", resource=f"r{i}")
+    index_path(tmp_path / "audit.log.1").unlink()
+
+    assert len(logger.query_audit_logs(user_id="alice", limit=1000)) == 20
+    assert index_path(tmp_path / "audit.log.1").exists()
+    logger.close()
+
+
+def test_time_range_skips_segments(tmp_path):
+    logger = rotating_logger(tmp_path)
+    for i in range(20):
+        logger.log_event(AuditEventType.DATA_ACCESS, user_id="alice", resource=f"r{i}")
+
+    future = datetime.utcnow() + timedelta(hours=1)
+    assert logger.query_audit_logs(start_time=future) == []
+    assert len(logger.query_audit_logs(end_time=future, limit=1000)) == 20
+    logger.close()
+
+
+def test_integrity_segments_are_checkpointed(tmp_path):
+    logger = rotating_logger(tmp_path, verify_workers=2)
+    for i in range(30):
+        logger.log_event(AuditEventType.DATA_ACCESS, user_id="alice", resource=f"r{i}")
+
+    checkpoints = load_checkpoints(logger.checkpoints_path)
+    assert len(checkpoints) >= 2
+    assert checkpoints[0].start == 0 and checkpoints[0].start_hash == GENESIS_HASH
+    for previous, current in zip(checkpoints, checkpoints[1:]):
+        assert current.start == previous.end
+        assert current.start_hash == previous.end_hash
+    assert logger.verify_integrity()
+    logger.close()
+
+
+def test_tampering_in_sealed_segment_is_detected(tmp_path):
+    logger = rotating_logger(tmp_path, verify_workers=0)
+    for i in range(30):
+        logger.log_event(AuditEventType.DATA_ACCESS, user_id="alice", resource=f"r{i}")
+    logger.flush()
+
+    path = logger.integrity_log_path
+    path.write_text(path.read_text().replace('"r1"', '"rX"', 1))
+    assert not logger.verify_integrity()
+    logger.close()
+
+
+def test_resume_skips_verified_segments(tmp_path, monkeypatch):
+    logger = rotating_logger(tmp_path, verify_workers=0)
+    for i in range(30):
+        logger.log_event(AuditEventType.DATA_ACCESS, user_id="alice", resource=f"r{i}")
+    sealed = len(logger._checkpoints)
+    assert logger.verify_integrity(resume=True)
+
+    verified = []
+    original = audit_logger_module.verify_segment
+
+    def tracking_verify(path, start, end, start_hash, end_hash=None):
+        verified.append(start)
+        return original(path, start, end, start_hash, end_hash)
+
+    monkeypatch.setattr(audit_logger_module, "verify_segment", tracking_verify)
+    for i in range(30):
+        logger.log_event(AuditEventType.DATA_ACCESS, user_id="bob", resource=f"s{i}")
+    assert logger.verify_integrity(resume=True)
+
+    # Only segments sealed since the last call, plus the unsealed tail
+    new_segments = len(logger._checkpoints) - sealed
+    assert len(verified) == new_segments + 1
+    assert min(verified) == logger._checkpoints[sealed].start
+    logger.close()
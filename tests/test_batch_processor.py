@@ -0,0 +1,124 @@
+"""Tests for the vectorized telemetry batch processor."""
+
+import pytest
+from collections import deque
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+np = pytest.importorskip("numpy")
+
+from api.models import TelemetryInput
+from api.batch_processor import (
+    classify_features,
+    pack_telemetry,
+    process_telemetry_batch,
+)
+from classifier.fault_classifier import classify
+from state_machine.state_engine import MissionPhase
+
+
+def _decision(anomaly_type, severity_score, escalate=False):
+    return {
+        'anomaly_type': anomaly_type,
+        'severity_score': severity_score,
+        'detection_confidence': 0.85,
+        'mission_phase': 'NOMINAL_OPS',
+        'policy_decision': {
+            'severity': 'HIGH',
+            'escalation_level': 'ESCALATE_SAFE_MODE' if escalate else 'CONTROLLED_ACTION',
+            'is_allowed': True,
+            'allowed_actions': ['LOG'],
+        },
+        'recommended_action': 'LOG',
+        'should_escalate_to_safe_mode': escalate,
+        'reasoning': 'test',
+        'recurrence_info': {'count': 1},
+    }
+
+
+@pytest.fixture
+def telemetry():
+    return [
+        TelemetryInput(voltage=8.0, temperature=25.0, gyro=0.01),
+        TelemetryInput(voltage=6.5, temperature=25.0, gyro=0.0, current=1.5),
+        TelemetryInput(voltage=8.0, temperature=45.0, gyro=-0.2),
+        TelemetryInput(voltage=8.1, temperature=20.0, gyro=0.0, wheel_speed=3000),
+    ]
+
+
+def test_pack_telemetry_layout(telemetry):
+    features = pack_telemetry(telemetry)
+    assert features.shape == (4, 5)
+    assert features[2, 2] == pytest.approx(0.2)  # |gyro|
+    assert features[1, 3] == pytest.approx(1.5)
+    assert features[0, 3] == 0.0  # missing current defaults to 0.0
+    assert features[3, 4] == 3000
+
+
+def test_classify_features_matches_scalar_classify(telemetry):
+    features = pack_telemetry(telemetry)
+    expected = [
+        classify({"voltage": t.voltage, "temperature": t.temperature, "gyro": t.gyro})
+        for t in telemetry
+    ]
+    assert classify_features(features).tolist() == expected
+
+
+@pytest.mark.asyncio
+async def test_process_batch_bulk_writes_anomalies(telemetry):
+    state_machine = MagicMock()
+    state_machine.get_current_phase.return_value = MissionPhase.NOMINAL_OPS
+    handler = MagicMock()
+    handler.handle_anomaly.side_effect = lambda **kw: _decision(kw['anomaly_type'], kw['severity_score'])
+    memory_store = MagicMock()
+    history = deque(maxlen=100)
+
+    flags = np.array([False, True, True, False])
+    scores = np.array([0.1, 0.9, 0.7, 0.2])
+
+    async def fake_detect(features):
+        return flags, scores
+
+    with patch('api.batch_processor.detect_anomaly_batch', fake_detect):
+        results = await process_telemetry_batch(
+            telemetry,
+            state_machine=state_machine,
+            phase_aware_handler=handler,
+            memory_store=memory_store,
+            history=history,
+        )
+
+    assert [r.is_anomaly for r in results] == flags.tolist()
+    assert [r.anomaly_type for r in results] == ["normal", "power_fault", "thermal_fault", "normal"]
+    assert handler.handle_anomaly.call_count == 2
+    assert len(history) == 2
+    memory_store.write_batch.assert_called_once()
+    kwargs = memory_store.write_batch.call_args.kwargs
+    assert kwargs['embeddings'].shape == (2, 5)
+    assert [m['anomaly_type'] for m in kwargs['metadatas']] == ["power_fault", "thermal_fault"]
+
+
+@pytest.mark.asyncio
+async def test_process_batch_refreshes_phase_after_escalation(telemetry):
+    state_machine = MagicMock()
+    state_machine.get_current_phase.side_effect = [MissionPhase.NOMINAL_OPS, MissionPhase.SAFE_MODE]
+    handler = MagicMock()
+    handler.handle_anomaly.side_effect = lambda **kw: _decision(kw['anomaly_type'], kw['severity_score'], escalate=True)
+
+    async def fake_detect(features):
+        return np.array([False, True, False, False]), np.array([0.1, 0.9, 0.2, 0.2])
+
+    with patch('api.batch_processor.detect_anomaly_batch', fake_detect):
+        results = await process_telemetry_batch(
+            telemetry, state_machine=state_machine, phase_aware_handler=handler
+        )
+
+    assert results[0].mission_phase == "NOMINAL_OPS"
+    assert results[2].mission_phase == "SAFE_MODE"
+    assert results[3].mission_phase == "SAFE_MODE"
+
+
+@pytest.mark.asyncio
+async def test_process_batch_empty():
+    results = await process_telemetry_batch([], state_machine=MagicMock(), phase_aware_handler=MagicMock())
+    assert results == []
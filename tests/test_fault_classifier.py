@@ -0,0 +1,92 @@
+"""Tests for the fault classifier (scalar and vectorized paths)."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from classifier.fault_classifier import (
+    FAULT_TYPES,
+    SEVERITY_LEVELS,
+    ClassifierThresholds,
+    classify,
+    classify_batch,
+    get_fault_description,
+    get_fault_severity,
+    load_thresholds,
+    set_thresholds,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_thresholds():
+    set_thresholds(None)
+    yield
+    set_thresholds(None)
+
+
+class TestClassify:
+
+    def test_priority_order(self):
+        assert classify({"voltage": 7.0, "temperature": 40.0, "gyro": 0.1}) == "power_fault"
+        assert classify({"voltage": 8.0, "temperature": 40.0, "gyro": 0.1}) == "thermal_fault"
+        assert classify({"voltage": 8.0, "temperature": 25.0, "gyro": -0.1}) == "attitude_fault"
+        assert classify({}) == "normal"
+
+    def test_default_descriptions_unchanged(self):
+        assert get_fault_description("power_fault") == "Voltage dropped below critical threshold (7.3V)"
+        assert get_fault_description("attitude_fault") == "Gyroscope detected excessive rotation (>0.05 rad/s)"
+        assert get_fault_severity("power_fault") == "critical"
+
+
+class TestClassifyBatch:
+
+    def test_matches_scalar_classify(self):
+        rng = np.random.default_rng(0)
+        voltage = rng.normal(7.8, 0.5, 2000)
+        temperature = rng.normal(28.0, 5.0, 2000)
+        gyro = rng.normal(0.0, 0.05, 2000)
+
+        codes, severities = classify_batch(voltage, temperature, gyro)
+        expected = [
+            classify({"voltage": v, "temperature": t, "gyro": g})
+            for v, t, g in zip(voltage, temperature, gyro)
+        ]
+        assert [FAULT_TYPES[c] for c in codes] == expected
+        assert [SEVERITY_LEVELS[s] for s in severities] == [get_fault_severity(e) for e in expected]
+
+    def test_structured_array_input(self):
+        records = np.array(
+            [(8.0, 25.0, 0.0), (7.0, 25.0, 0.0), (8.0, 35.0, 0.0), (8.0, 25.0, -0.2)],
+            dtype=[("voltage", "f8"), ("temperature", "f8"), ("gyro", "f8")],
+        )
+        codes, _ = classify_batch(records)
+        assert [FAULT_TYPES[c] for c in codes] == ["normal", "power_fault", "thermal_fault", "attitude_fault"]
+
+    def test_rejects_mismatched_columns(self):
+        with pytest.raises(ValueError):
+            classify_batch(np.zeros(3), np.zeros(2), np.zeros(3))
+        with pytest.raises(ValueError):
+            classify_batch(np.zeros(3))
+
+    def test_custom_thresholds(self):
+        thresholds = ClassifierThresholds(voltage_min=6.0, temperature_max=50.0, gyro_max=1.0)
+        codes, _ = classify_batch(np.array([7.0]), np.array([40.0]), np.array([0.5]), thresholds=thresholds)
+        assert FAULT_TYPES[codes[0]] == "normal"
+
+
+class TestThresholdConfig:
+
+    def test_load_from_yaml(self, tmp_path):
+        config = tmp_path / "classifier.yaml"
+        config.write_text("thresholds:\n  voltage_min: 6.5\n  temperature_max: 45.0\n")
+        thresholds = load_thresholds(str(config))
+        assert thresholds.voltage_min == 6.5
+        assert thresholds.temperature_max == 45.0
+        assert thresholds.gyro_max == ClassifierThresholds().gyro_max
+
+    def test_missing_file_uses_defaults(self, tmp_path):
+        assert load_thresholds(str(tmp_path / "missing.yaml")) == ClassifierThresholds()
+
+    def test_scalar_uses_configured_thresholds(self):
+        set_thresholds(ClassifierThresholds(voltage_min=6.0))
+        assert classify({"voltage": 7.0}) == "normal"
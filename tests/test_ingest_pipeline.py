@@ -0,0 +1,177 @@
+"""Tests for the staged telemetry ingest pipeline."""
+
+import asyncio
+from collections import deque
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from api.models import TelemetryInput
+from api.ingest_pipeline import IngestBackpressureError, IngestStoppedError, TelemetryIngestPipeline
+from state_machine.state_engine import MissionPhase
+
+
+def _decision(anomaly_type, severity_score):
+    return {
+        'anomaly_type': anomaly_type,
+        'severity_score': severity_score,
+        'detection_confidence': 0.85,
+        'mission_phase': 'NOMINAL_OPS',
+        'policy_decision': {
+            'severity': 'HIGH',
+            'escalation_level': 'CONTROLLED_ACTION',
+            'is_allowed': True,
+            'allowed_actions': ['LOG'],
+        },
+        'recommended_action': 'LOG',
+        'should_escalate_to_safe_mode': False,
+        'reasoning': 'test',
+        'recurrence_info': {'count': 1},
+    }
+
+
+async def _heuristic_detect(features):
+    # Low voltage is anomalous, everything else normal
+    flags = features[:, 0] < 7.0
+    return flags, np.where(flags, 0.9, 0.1)
+
+
+@pytest.fixture
+def components():
+    state_machine = MagicMock()
+    state_machine.get_current_phase.return_value = MissionPhase.NOMINAL_OPS
+    handler = MagicMock()
+    handler.handle_anomaly.side_effect = lambda **kw: _decision(kw['anomaly_type'], kw['severity_score'])
+    return state_machine, handler
+
+
+@pytest.fixture
+def detect():
+    with patch('api.ingest_pipeline.detect_anomaly_batch', _heuristic_detect) as fake:
+        yield fake
+
+
+NORMAL = TelemetryInput(voltage=8.0, temperature=25.0, gyro=0.01)
+LOW_VOLTAGE = TelemetryInput(voltage=6.5, temperature=25.0, gyro=0.0)
+
+
+@pytest.mark.asyncio
+async def test_sync_submit_returns_response(components, detect):
+    state_machine, handler = components
+    history = deque(maxlen=100)
+    memory_store = MagicMock()
+    pipeline = TelemetryIngestPipeline(state_machine, handler, memory_store=memory_store, history=history)
+    await pipeline.start()
+
+    normal, anomaly = await asyncio.gather(pipeline.submit(NORMAL), pipeline.submit(LOW_VOLTAGE))
+    await pipeline.stop()
+
+    assert not normal.is_anomaly
+    assert anomaly.is_anomaly and anomaly.anomaly_type == "power_fault"
+    assert len(history) == 1
+    memory_store.write_batch.assert_called_once()
+    stats = pipeline.get_stats()
+    assert stats["processed"] == 2
+    assert stats["batches"] == 1  # both points scored in one micro-batch
+    assert {"queue_wait", "detect", "persist"} <= set(stats["latency"])
+
+
+@pytest.mark.asyncio
+async def test_async_submit_returns_immediately(components, detect):
+    state_machine, handler = components
+    history = deque(maxlen=100)
+    pipeline = TelemetryIngestPipeline(state_machine, handler, history=history)
+    await pipeline.start()
+
+    assert await pipeline.submit(LOW_VOLTAGE, wait=False) is None
+    assert len(history) == 0
+    await pipeline.stop()  # drains
+    assert len(history) == 1
+
+
+@pytest.mark.asyncio
+async def test_backpressure_when_queue_full(components, detect):
+    state_machine, handler = components
+    pipeline = TelemetryIngestPipeline(state_machine, handler, queue_size=2)
+    await pipeline.start()
+
+    # The detect worker has not run yet, so the third point overflows
+    await pipeline.submit(NORMAL, wait=False)
+    await pipeline.submit(NORMAL, wait=False)
+    with pytest.raises(IngestBackpressureError):
+        await pipeline.submit(NORMAL, wait=False)
+
+    assert pipeline.get_stats()["rejected"] == 1
+    await pipeline.stop()
+
+
+@pytest.mark.asyncio
+async def test_slow_predictive_stage_does_not_delay_responses(components, detect):
+    state_machine, handler = components
+    release = asyncio.Event()
+    engine = MagicMock()
+
+    async def slow_add(data):
+        await release.wait()
+
+    engine.add_training_data = slow_add
+    engine.predict_failures = AsyncMock(return_value=[])
+    pipeline = TelemetryIngestPipeline(state_machine, handler, predictive_engine=engine)
+    await pipeline.start()
+
+    response = await asyncio.wait_for(pipeline.submit(NORMAL), timeout=1.0)
+    assert not response.is_anomaly
+    assert pipeline.queue_depths()["predictive"] <= 1
+
+    release.set()
+    await pipeline.stop()
+    engine.predict_failures.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_detect_failure_propagates_to_submitter(components):
+    state_machine, handler = components
+
+    async def broken(features):
+        raise RuntimeError("model exploded")
+
+    with patch('api.ingest_pipeline.detect_anomaly_batch', broken):
+        pipeline = TelemetryIngestPipeline(state_machine, handler)
+        await pipeline.start()
+        with pytest.raises(RuntimeError, match="model exploded"):
+            await pipeline.submit(NORMAL)
+        await pipeline.stop()
+
+    assert pipeline.get_stats()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_submit_requires_running_pipeline(components):
+    pipeline = TelemetryIngestPipeline(*components)
+    with pytest.raises(RuntimeError):
+        await pipeline.submit(NORMAL)
+
+
+@pytest.mark.asyncio
+async def test_stop_without_drain_fails_pending_submitters(components):
+    state_machine, handler = components
+    release = asyncio.Event()
+
+    async def slow_detect(features):
+        await release.wait()
+        return await _heuristic_detect(features)
+
+    with patch('api.ingest_pipeline.detect_anomaly_batch', slow_detect):
+        pipeline = TelemetryIngestPipeline(state_machine, handler, max_batch_size=1)
+        await pipeline.start()
+        pending = [asyncio.create_task(pipeline.submit(NORMAL)) for _ in range(3)]
+        await asyncio.sleep(0.01)  # first point is in detection, the rest queued
+        await pipeline.stop(drain=False)
+
+    for task in pending:
+        with pytest.raises(IngestStoppedError):
+            await task
+    with pytest.raises(IngestStoppedError):
+        await pipeline.submit(NORMAL)
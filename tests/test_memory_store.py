@@ -191,5 +191,181 @@ class TestAdaptiveMemoryStore:
             os.unlink(corrupted_path)
 
 
+class TestMemoryStoreVectorIndex:
+    """Tests for the matrix-backed similarity search"""
+
+    def test_retrieve_matches_reference_scoring(self):
+        """Vectorized retrieve returns the same ranking as the per-event formula"""
+        store = AdaptiveMemoryStore(decay_lambda=0.1, max_capacity=1000)
+        rng = np.random.default_rng(0)
+        now = datetime.now()
+        for i in range(50):
+            store.write(rng.normal(size=16), {'severity': 0.5, 'id': i},
+                        timestamp=now - timedelta(hours=i % 7))
+
+        query = rng.normal(size=16)
+        results = store.retrieve(query, top_k=5)
+
+        expected = sorted(
+            (
+                0.5 * store._cosine_similarity(query, e.embedding)
+                + 0.3 * store._temporal_weight(e)
+                + 0.2 * (1 + 0.3 * np.log(1 + e.recurrence_count)),
+                e.metadata['id'],
+            )
+            for e in store.memory
+        )[::-1][:5]
+        assert [r[1]['id'] for r in results] == [eid for _, eid in expected]
+        for (score, _, _), (ref, _) in zip(results, expected):
+            assert score == pytest.approx(ref, abs=1e-4)
+
+    def test_recurrence_updates_index(self):
+        """Recurrence boosts are reflected in vectorized scores and stats"""
+        store = AdaptiveMemoryStore()
+        embedding = np.ones(8)
+        for _ in range(4):
+            store.write(embedding, {'severity': 0.5})
+        store.write(-embedding, {'severity': 0.5})
+
+        assert len(store.memory) == 2
+        assert store.get_stats()['max_recurrence'] == 4
+        top_score = store.retrieve(embedding, top_k=1)[0][0]
+        assert top_score == pytest.approx(0.5 + 0.3 + 0.2 * (1 + 0.3 * np.log(5)), abs=1e-3)
+
+    def test_prune_keeps_index_aligned(self):
+        """Pruned rows are removed from the matrix in the same order as events"""
+        store = AdaptiveMemoryStore()
+        old = datetime.now() - timedelta(hours=48)
+        store.write(np.array([1.0, 0.0, 0.0]), {'type': 'old'}, timestamp=old)
+        store.write(np.array([0.0, 1.0, 0.0]), {'type': 'old_critical', 'critical': True}, timestamp=old)
+        store.write(np.array([0.0, 0.0, 1.0]), {'type': 'new'})
+
+        assert store.prune(max_age_hours=24, keep_critical=True) == 1
+        results = store.retrieve(np.array([0.0, 0.0, 1.0]), top_k=1)
+        assert results[0][1]['type'] == 'new'
+        assert [e.metadata['type'] for e in store.memory] == ['old_critical', 'new']
+
+    def test_memory_reassignment_rebuilds_index(self):
+        """Assigning the event list (e.g. after load) rebuilds the matrix"""
+        store = AdaptiveMemoryStore()
+        store.write(np.array([1.0, 0.0]), {'type': 'a'})
+        store.memory = []
+        assert store.retrieve(np.array([1.0, 0.0])) == []
+
+        store.write(np.array([1.0, 0.0, 0.0]), {'type': 'b'})
+        assert store.retrieve(np.array([1.0, 0.0, 0.0]), top_k=1)[0][1]['type'] == 'b'
+
+    def test_mismatched_dimension_rejected(self):
+        """Embeddings of a different length raise ValueError"""
+        store = AdaptiveMemoryStore()
+        store.write(np.ones(4), {'severity': 0.5})
+        with pytest.raises(ValueError):
+            store.retrieve(np.ones(5))
+
+    def test_ann_index_finds_recurrence(self):
+        """The LSH index still detects near-duplicates in a large store"""
+        store = AdaptiveMemoryStore(max_capacity=10000, ann_index=True)
+        rng = np.random.default_rng(1)
+        embeddings = rng.normal(size=(3000, 32))
+        store.write_batch(embeddings, [{'id': i} for i in range(3000)])
+        assert len(store.memory) == 3000
+
+        target = embeddings[1234] + rng.normal(scale=0.01, size=32)
+        store.write(target, {'id': 'dup'})
+        assert len(store.memory) == 3000
+        assert store.memory[1234].recurrence_count == 2
+
+        results = store.retrieve(embeddings[42], top_k=3)
+        assert results[0][1]['id'] == 42
+
+
+class TestColumnarPersistence:
+    """Tests for persistence='columnar'"""
+
+    def make_store(self, tmp_path):
+        store = AdaptiveMemoryStore(persistence='columnar')
+        store.storage_path = str(tmp_path / 'store')
+        return store
+
+    def test_round_trip(self, tmp_path):
+        """Saved events load back with metadata, timestamps and embeddings"""
+        store = self.make_store(tmp_path)
+        timestamp = datetime.now() - timedelta(hours=2)
+        store.write(np.array([3.0, 4.0, 0.0]), {'type': 'power_fault', 'critical': True}, timestamp=timestamp)
+        store.write(np.array([0.0, 0.0, 2.0]), {'type': 'thermal_fault', 'severity': np.float64(0.7)})
+        store.save()
+
+        loaded = self.make_store(tmp_path)
+        assert loaded.load() is True
+        assert len(loaded.memory) == 2
+        event = loaded.memory[0]
+        assert event.metadata == {'type': 'power_fault', 'critical': True}
+        assert event.timestamp == timestamp
+        assert event.is_critical
+        np.testing.assert_allclose(event.embedding, [3.0, 4.0, 0.0], rtol=1e-6)
+        assert loaded.memory[1].base_importance == pytest.approx(0.7)
+        assert loaded.retrieve(np.array([0.0, 0.0, 1.0]), top_k=1)[0][1]['type'] == 'thermal_fault'
+
+    def test_load_is_lazy(self, tmp_path):
+        """Events are only materialized when accessed"""
+        store = self.make_store(tmp_path)
+        for i in range(5):
+            store.write(np.eye(5)[i], {'id': i})
+        store.save()
+
+        loaded = self.make_store(tmp_path)
+        loaded.load()
+        assert not any(loaded.memory.is_loaded(i) for i in range(5))
+        assert loaded.memory[3].metadata['id'] == 3
+        assert loaded.memory.is_loaded(3) and not loaded.memory.is_loaded(2)
+
+    def test_incremental_save_appends(self, tmp_path):
+        """Later saves append new rows and persist recurrence changes"""
+        store = self.make_store(tmp_path)
+        store.write(np.array([1.0, 0.0]), {'id': 'a'})
+        store.save()
+        log_path = tmp_path / 'store' / 'metadata.log'
+        first_log = log_path.read_bytes()
+
+        store.write(np.array([1.0, 0.0]), {'id': 'a'})  # recurrence of row 0
+        store.write(np.array([0.0, 1.0]), {'id': 'b'})
+        store.save()
+        assert log_path.read_bytes().startswith(first_log)
+
+        loaded = self.make_store(tmp_path)
+        loaded.load()
+        assert [e.metadata['id'] for e in loaded.memory] == ['a', 'b']
+        assert loaded.memory[0].recurrence_count == 2
+        assert 'last_seen' in loaded.memory[0].metadata
+        assert loaded.get_stats()['max_recurrence'] == 2
+
+    def test_save_after_prune_rewrites(self, tmp_path):
+        """Pruning renumbers rows, so the next save rewrites the store"""
+        store = self.make_store(tmp_path)
+        store.write(np.array([1.0, 0.0]), {'id': 'old'}, timestamp=datetime.now() - timedelta(hours=48))
+        store.write(np.array([0.0, 1.0]), {'id': 'new'})
+        store.save()
+        assert store.prune(max_age_hours=24, keep_critical=False) == 1
+        store.save()
+
+        loaded = self.make_store(tmp_path)
+        loaded.load()
+        assert [e.metadata['id'] for e in loaded.memory] == ['new']
+
+    def test_corrupted_manifest_clears_memory(self, tmp_path):
+        """A manifest that cannot be read fails the load"""
+        store = self.make_store(tmp_path)
+        store.write(np.array([1.0, 0.0]), {'id': 'a'})
+        store.save()
+        (tmp_path / 'store' / 'manifest.json').write_text('not json')
+
+        assert store.load() is False
+        assert len(store.memory) == 0
+
+    def test_unknown_persistence_rejected(self):
+        with pytest.raises(ValueError):
+            AdaptiveMemoryStore(persistence='parquet')
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -5,6 +5,7 @@ Tests the policy evaluation logic across different mission phases
 and anomaly scenarios.
 """
 
+import pickle
 import pytest
 from datetime import datetime
 from state_machine.state_engine import MissionPhase
@@ -334,3 +335,78 @@ class TestPhaseConstraints:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+def _reference_decision(engine, phase, anomaly_type, score, attributes):
+    """The uncompiled decision tree, evaluated per call."""
+    phase_config = engine._get_phase_config(phase)
+    severity_level = engine._classify_severity(score)
+    allowed = phase_config.get("allowed_actions", [])
+    forbidden = phase_config.get("forbidden_actions", [])
+    is_allowed = engine._is_response_allowed(
+        phase, phase_config, severity_level, attributes,
+        phase_config.get("severity_thresholds", {}), score,
+    )
+    escalation = engine._determine_escalation(
+        phase, phase_config, severity_level, score, is_allowed, attributes
+    )
+    return PolicyDecision(
+        mission_phase=phase.value,
+        anomaly_type=anomaly_type,
+        severity=severity_level.value,
+        severity_score=score,
+        is_allowed=is_allowed,
+        allowed_actions=allowed,
+        recommended_action=engine._select_action(
+            phase_config, escalation, allowed, forbidden, anomaly_type
+        ),
+        escalation_level=escalation.value,
+        confidence=0.9 if allowed else 0.7,
+        reasoning=engine._build_reasoning(
+            phase, anomaly_type, severity_level, is_allowed, escalation, allowed
+        ),
+    )
+
+
+class TestCompiledDecisionTable:
+    """The compiled table must reproduce the decision tree exactly."""
+
+    def test_matches_decision_tree(self):
+        policy = MissionPhasePolicyLoader().get_policy()
+        # Narrow one phase's thresholds so out-of-range cells are exercised
+        policy["phases"]["NOMINAL_OPS"]["severity_thresholds"] = {
+            "min_threshold": 0.3, "max_threshold": 0.85,
+        }
+        engine = MissionPhasePolicyEngine(policy)
+
+        for phase in MissionPhase:
+            for anomaly_type in ("power_fault", "thermal_fault", "comm_fault"):
+                for score in (0.0, 0.2, 0.35, 0.5, 0.7, 0.8, 0.9, 0.95, 1.0):
+                    for recurrence in (0, 2, 3, 7):
+                        attributes = {"recurrence_count": recurrence}
+                        actual = engine.evaluate(phase, anomaly_type, score, attributes)
+                        expected = _reference_decision(engine, phase, anomaly_type, score, attributes)
+                        assert actual == expected, (phase, anomaly_type, score, recurrence)
+
+    def test_decision_is_plain_data(self, policy_engine):
+        decision = policy_engine.evaluate(MissionPhase.NOMINAL_OPS, "power_fault", 0.5)
+        assert vars(decision)["reasoning"].startswith("Anomaly type: power_fault | Severity: MEDIUM")
+        assert pickle.loads(pickle.dumps(decision)) == decision
+
+    def test_reload_swaps_table(self, policy_engine):
+        policy = MissionPhasePolicyLoader().get_policy()
+        policy["phases"]["NOMINAL_OPS"]["allowed_actions"] = ["REBOOT_SUBSYSTEM"]
+        policy["phases"]["NOMINAL_OPS"]["forbidden_actions"] = []
+
+        policy_engine.reload(policy)
+        after = policy_engine.evaluate(MissionPhase.NOMINAL_OPS, "power_fault", 0.5)
+        assert after.recommended_action == "REBOOT_SUBSYSTEM"
+        assert after.allowed_actions == ["REBOOT_SUBSYSTEM"]
+
+    def test_invalid_reload_keeps_current_policy(self, policy_engine):
+        from core.error_handling import PolicyEvaluationError
+
+        config = policy_engine.policy_config
+        with pytest.raises(PolicyEvaluationError):
+            policy_engine.reload({"invalid": "config"})
+        assert policy_engine.policy_config is config
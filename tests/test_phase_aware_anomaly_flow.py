@@ -196,6 +196,55 @@ class TestRecurrenceTracking:
         # Second occurrence should consider recurrence in decision
         assert decision2['recurrence_info']['total_in_window'] >= 2
 
+    def test_window_counts_expire(self, phase_aware_handler, monkeypatch):
+        """Window counts and history drop occurrences as they age out."""
+        clock = {'now': datetime(2026, 1, 1, 12, 0, 0)}
+
+        class FakeDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return clock['now']
+
+        monkeypatch.setattr('anomaly_agent.phase_aware_handler.datetime', FakeDatetime)
+        handler = phase_aware_handler
+
+        for minutes in (0, 0.5, 3, 30):
+            clock['now'] = datetime(2026, 1, 1, 12, 0, 0) + timedelta(minutes=minutes)
+            info = handler._update_recurrence_tracking('thermal_fault')
+        assert info == {
+            'count': 4,
+            'total_in_window': 4,
+            'last_occurrence': datetime(2026, 1, 1, 12, 3, 0).isoformat(),
+            'time_since_last_seconds': 27 * 60.0,
+        }
+        windows = handler.get_recurrence_stats('thermal_fault')['thermal_fault']['windows']
+        assert windows == {'1m': 1, '5m': 1, '1h': 4}
+
+        clock['now'] = datetime(2026, 1, 1, 13, 2, 0)
+        info = handler._update_recurrence_tracking('thermal_fault')
+        assert info['count'] == 5
+        assert info['total_in_window'] == 3  # 12:03, 12:30 and 13:02
+
+        clock['now'] = datetime(2026, 1, 2, 13, 15, 0)
+        handler._update_recurrence_tracking('power_fault')
+        assert handler.get_anomaly_history() == [('power_fault', clock['now'])]
+        assert handler.get_recurrence_stats()['thermal_fault']['windows']['1h'] == 0
+
+    def test_custom_windows_and_disabled_tracking(self, state_machine, policy_loader):
+        """Windows are configurable; disabled tracking records nothing."""
+        handler = PhaseAwareAnomalyHandler(
+            state_machine, policy_loader, recurrence_windows={'10s': timedelta(seconds=10)}
+        )
+        handler._update_recurrence_tracking('power_fault')
+        assert handler.get_recurrence_stats()['power_fault']['windows'] == {'10s': 1}
+
+        disabled = PhaseAwareAnomalyHandler(
+            state_machine, policy_loader, enable_recurrence_tracking=False
+        )
+        info = disabled._update_recurrence_tracking('power_fault')
+        assert info['count'] == 0 and info['total_in_window'] == 0
+        assert disabled.get_anomaly_history() == []
+
 
 class TestEndToEndDecisionFlow:
     """Test complete end-to-end decision flows."""
@@ -0,0 +1,126 @@
+"""Tests for the incremental predictive-maintenance feature store."""
+
+import random
+from datetime import datetime, timedelta
+from unittest.mock import MagicMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pd = pytest.importorskip("pandas")
+pytest.importorskip("sklearn")
+pytest.importorskip("torch")
+
+from security_engine.predictive_maintenance import (
+    FailureType,
+    PredictiveMaintenanceEngine,
+    TimeSeriesData,
+)
+from security_engine.rolling_features import (
+    FEATURE_COLUMNS,
+    RollingFeatureStore,
+    TrainingDataWindow,
+)
+
+ROLLING = ['cpu_usage', 'memory_usage', 'network_latency', 'disk_io', 'error_rate']
+TARGETS = {
+    FailureType.CPU_SPIKE: 'cpu_usage',
+    FailureType.MEMORY_LEAK: 'memory_usage',
+    FailureType.NETWORK_LATENCY: 'network_latency',
+    FailureType.DISK_IO_BURST: 'disk_io',
+}
+
+
+def _point(rng, timestamp=None):
+    return TimeSeriesData(
+        timestamp=timestamp or datetime.now(),
+        cpu_usage=rng.gauss(45, 10),
+        memory_usage=rng.gauss(60, 15),
+        network_latency=rng.gauss(50, 20),
+        disk_io=rng.gauss(100, 30),
+        error_rate=rng.gauss(0.1, 0.05),
+        response_time=rng.gauss(200, 50),
+        active_connections=rng.randint(10, 50),
+    )
+
+
+def _pandas_features(recent, data, failure_type):
+    """The DataFrame-based extraction the feature store replaces."""
+    cols = ['cpu_usage', 'memory_usage', 'network_latency', 'disk_io', 'error_rate',
+            'response_time', 'active_connections']
+    if len(recent) < 3:
+        return [getattr(data, c) for c in cols] + [0.0] * 20
+    df = pd.DataFrame([{c: getattr(d, c) for c in cols} for d in list(recent) + [data]])
+    for col in ROLLING:
+        for window in (3, 6):
+            w = min(window, len(df))
+            df[f'{col}_rolling_mean_{window}'] = df[col].rolling(window=w).mean()
+            df[f'{col}_rolling_std_{window}'] = df[col].rolling(window=w).std()
+    last = df.iloc[-1]
+    target = TARGETS.get(failure_type, 'error_rate')
+    base = [last[c] for c in cols if c != target] + [0.0]
+    rolling = [last[f'{col}_rolling_{stat}_{w}'] for col in ROLLING
+               for w, stat in ((3, 'mean'), (3, 'std'), (6, 'mean'), (6, 'std'))]
+    return [0.0 if pd.isna(x) else x for x in base + rolling]
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # engine creates its model directory in cwd
+    return PredictiveMaintenanceEngine(MagicMock())
+
+
+@pytest.mark.asyncio
+async def test_features_match_pandas_reference(engine):
+    rng = random.Random(11)
+    for step in range(40):
+        current = _point(rng)
+        for failure_type in FailureType:
+            expected = _pandas_features(engine.recent_data, current, failure_type)
+            actual = engine._extract_features_from_data(current, failure_type)
+            assert actual == pytest.approx(expected, rel=1e-9, abs=1e-9), (step, failure_type)
+        await engine.add_training_data(current)
+
+
+def test_feature_store_stays_exact_across_reanchor():
+    rng = random.Random(3)
+    store = RollingFeatureStore()
+    recent = []
+    for _ in range(2100):
+        point = _point(rng)
+        store.push(point)
+        recent = (recent + [point])[-10:]
+    current = _point(rng)
+    expected = _pandas_features(recent, current, FailureType.SERVICE_CRASH)
+    row = store.feature_row(current)
+    assert len(row) == len(FEATURE_COLUMNS)
+    # error_rate is the SERVICE_CRASH target, so drop it from the full row
+    selected = np.delete(row, FEATURE_COLUMNS.index('error_rate'))
+    assert selected.tolist() == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+
+def test_training_window_trim_matches_filter():
+    rng = random.Random(5)
+    base = datetime(2026, 1, 1)
+    points = [_point(rng, base + timedelta(minutes=17 * i)) for i in range(500)]
+    points[100], points[101] = points[101], points[100]  # out-of-order append
+
+    window = TrainingDataWindow(bucket_seconds=3600)
+    for point in points:
+        window.append(point)
+    assert len(window) == 500
+
+    for hours in (5, 40, 41, 100):
+        cutoff = base + timedelta(hours=hours, minutes=3)
+        window.trim(cutoff)
+        points = [p for p in points if p.timestamp > cutoff]
+        assert len(window) == len(points)
+        assert sorted(id(p) for p in window) == sorted(id(p) for p in points)
+
+
+@pytest.mark.asyncio
+async def test_add_training_data_applies_retention(engine):
+    rng = random.Random(9)
+    await engine.add_training_data(_point(rng, datetime.now() - timedelta(days=31)))
+    await engine.add_training_data(_point(rng))
+    assert len(engine.training_data) == 1
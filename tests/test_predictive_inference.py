@@ -0,0 +1,148 @@
+"""Tests for batched multi-model inference in the predictive maintenance engine."""
+
+import asyncio
+import random
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+pytest.importorskip("torch")
+
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.preprocessing import StandardScaler
+
+from security_engine.predictive_maintenance import (
+    FAILURE_THRESHOLDS,
+    FailureType,
+    PredictionModel,
+    PredictiveMaintenanceEngine,
+    TimeSeriesData,
+)
+from security_engine.rolling_features import FEATURE_COLUMNS
+
+
+def _point(rng):
+    return TimeSeriesData(
+        timestamp=datetime.now(),
+        cpu_usage=rng.gauss(70, 20),
+        memory_usage=rng.gauss(75, 15),
+        network_latency=rng.gauss(90, 30),
+        disk_io=rng.gauss(180, 40),
+        error_rate=rng.gauss(1.0, 0.5),
+        response_time=rng.gauss(200, 50),
+        active_connections=rng.randint(10, 50),
+    )
+
+
+def _fit_models(engine, seed=0):
+    """Small RF per failure type, targets straddling each threshold."""
+    rng = np.random.default_rng(seed)
+    width = len(FEATURE_COLUMNS) - 1
+    for failure_type in FailureType:
+        features = rng.normal(size=(200, width))
+        threshold = FAILURE_THRESHOLDS[failure_type]
+        targets = threshold + 20 * features[:, 0] + rng.normal(size=200)
+        scaler = StandardScaler().fit(features)
+        model = RandomForestRegressor(n_estimators=5, random_state=seed)
+        model.fit(scaler.transform(features), targets)
+        engine.scalers[failure_type] = scaler
+        engine.models[failure_type] = {PredictionModel.RANDOM_FOREST: model}
+
+
+async def _sequential_reference(engine, point):
+    """The previous per-type loop, one model call per failure type."""
+    feature_row = engine._feature_row(point)
+    predictions = []
+    for failure_type in FailureType:
+        prediction = await engine._predict_single_failure_type(failure_type, point, feature_row)
+        if prediction and prediction.probability > 0.3:
+            predictions.append(prediction)
+    predictions.sort(key=lambda x: x.probability * x.confidence, reverse=True)
+    return predictions[:5]
+
+
+def _summary(predictions):
+    return [(p.failure_type, p.probability, p.confidence, p.model_used, p.features_used,
+             p.preventive_actions) for p in predictions]
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # engine creates its model directory in cwd
+    engine = PredictiveMaintenanceEngine(MagicMock())
+    _fit_models(engine)
+    return engine
+
+
+@pytest.mark.asyncio
+async def test_batched_predictions_match_per_type_path(engine):
+    rng = random.Random(1)
+    for _ in range(8):
+        await engine.add_training_data(_point(rng))
+
+    points = [_point(rng) for _ in range(20)]
+    expected = [_summary(await _sequential_reference(engine, p)) for p in points]
+    assert any(expected), "fixture should produce some predictions"
+
+    single = [_summary(await engine.predict_failures(p)) for p in points]
+    batched = [_summary(r) for r in await engine.predict_failures_batch(points)]
+    assert single == expected
+    assert batched == expected
+    assert engine.get_inference_stats()["32"]["batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_coalescing_window_merges_concurrent_calls(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    engine = PredictiveMaintenanceEngine(MagicMock(), coalesce_window_ms=20)
+    _fit_models(engine)
+    rng = random.Random(2)
+    points = [_point(rng) for _ in range(10)]
+    expected = [_summary(await _sequential_reference(engine, p)) for p in points]
+
+    results = await asyncio.gather(*(engine.predict_failures(p) for p in points))
+    assert [_summary(r) for r in results] == expected
+    assert engine.get_inference_stats() == {"16": engine.get_inference_stats()["16"]}
+    assert engine.get_inference_stats()["16"]["batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_max_inference_batch_flushes_early(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    engine = PredictiveMaintenanceEngine(MagicMock(), coalesce_window_ms=10_000, max_inference_batch=4)
+    _fit_models(engine)
+    rng = random.Random(3)
+    results = await asyncio.wait_for(
+        asyncio.gather(*(engine.predict_failures(_point(rng)) for _ in range(4))), timeout=5.0
+    )
+    assert len(results) == 4
+    assert engine.get_inference_stats()["4"]["batches"] == 1
+    assert not engine._inference_flushes
+
+
+@pytest.mark.asyncio
+async def test_close_answers_pending_coalesced_calls(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    engine = PredictiveMaintenanceEngine(MagicMock(), coalesce_window_ms=10_000)
+    _fit_models(engine)
+    rng = random.Random(5)
+    calls = [asyncio.create_task(engine.predict_failures(_point(rng))) for _ in range(2)]
+    while len(engine._pending_inference) < 2:
+        await asyncio.sleep(0.01)
+
+    await asyncio.wait_for(engine.close(), timeout=5.0)
+    assert len(await asyncio.wait_for(asyncio.gather(*calls), timeout=1.0)) == 2
+    assert engine._inference_timer is None
+    assert engine.get_inference_stats()["2"]["batches"] == 1
+
+
+@pytest.mark.asyncio
+async def test_untrained_engine_predicts_nothing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    engine = PredictiveMaintenanceEngine(MagicMock())
+    rng = random.Random(4)
+    assert await engine.predict_failures(_point(rng)) == []
+    assert await engine.predict_failures_batch([_point(rng), _point(rng)]) == [[], []]
@@ -0,0 +1,207 @@
+"""Tests for background training and model hot swap in predictive maintenance."""
+
+import asyncio
+import random
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("sklearn")
+pytest.importorskip("torch")
+
+from security_engine.model_training import SNAPSHOT_COLUMNS, TrainingScheduler, pack_snapshot
+from security_engine.predictive_maintenance import (
+    FailureType,
+    PredictionModel,
+    PredictiveMaintenanceEngine,
+    TimeSeriesData,
+)
+from security_engine.rolling_features import TrainingDataWindow
+
+
+def _point(rng, timestamp, shift=0.0):
+    return TimeSeriesData(
+        timestamp=timestamp,
+        cpu_usage=rng.gauss(45 + shift, 10),
+        memory_usage=rng.gauss(60, 15),
+        network_latency=rng.gauss(50, 20),
+        disk_io=rng.gauss(100, 30),
+        error_rate=rng.gauss(0.1, 0.05),
+        response_time=rng.gauss(200, 50),
+        active_connections=rng.randint(10, 50),
+    )
+
+
+async def _fill(engine, count=120, seed=0):
+    rng = random.Random(seed)
+    base = datetime.now() - timedelta(hours=count)
+    for i in range(count):
+        await engine.add_training_data(_point(rng, base + timedelta(hours=1, minutes=i)))
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)  # engine creates its model directory in cwd
+    return PredictiveMaintenanceEngine(MagicMock(), training_workers=0)
+
+
+@pytest.mark.asyncio
+async def test_training_swaps_in_new_version(engine, tmp_path):
+    await _fill(engine)
+    assert engine.model_version == 0
+
+    metrics = await engine.train_models()
+    assert "error" not in metrics
+    assert engine.model_version == 1
+    assert engine.points_since_training == 0
+    assert engine.models[FailureType.CPU_SPIKE][PredictionModel.RANDOM_FOREST] is not None
+    stats = engine.get_training_stats()
+    assert stats["swaps"] == 1 and stats["runs"] == 1
+
+    # Persisted with its version
+    reloaded = PredictiveMaintenanceEngine(MagicMock(), training_workers=0)
+    await reloaded.initialize()
+    assert reloaded.model_version == 1
+    assert PredictionModel.RANDOM_FOREST in reloaded.models[FailureType.CPU_SPIKE]
+
+
+async def _fill_newer(engine, count=100, seed=5):
+    rng = random.Random(seed)
+    base = datetime.now()
+    for i in range(count):
+        await engine.add_training_data(_point(rng, base + timedelta(minutes=i)))
+
+
+@pytest.mark.asyncio
+async def test_holdout_validation_keeps_better_active_models(engine):
+    await _fill(engine)
+    await engine.train_models()
+    active = engine.models
+    await _fill_newer(engine)
+
+    engine.swap_tolerance = -1e9  # retrained models can never win
+    metrics = await engine.train_models()
+    assert engine.model_version == 1
+    assert engine.models is active
+    assert engine.get_training_stats()["rejected"] == 1
+    assert "active_random_forest" in metrics[FailureType.CPU_SPIKE.value]
+
+
+@pytest.mark.asyncio
+async def test_retrain_is_validated_on_data_the_active_models_never_saw(engine):
+    await _fill(engine, count=300)
+    await engine.train_models()
+    assert engine.model_version == 1
+
+    # Nothing new: the active models' own training rows cannot judge them
+    await engine.train_models()
+    assert engine.model_version == 1
+
+    await _fill_newer(engine)
+    metrics = await engine.train_models()
+    assert engine.model_version == 2
+    assert engine.get_training_stats()["swaps"] == 2
+    cpu = metrics[FailureType.CPU_SPIKE.value]
+    assert cpu["candidate_random_forest"] >= cpu["active_random_forest"] - engine.swap_tolerance
+
+
+@pytest.mark.asyncio
+async def test_initialize_does_not_mutate_active_bundle(engine):
+    await _fill(engine)
+    await engine.train_models()
+    bundle = engine._bundle
+    models, scalers = dict(bundle.models), dict(bundle.scalers)
+
+    await engine.initialize()
+    assert bundle.models == models and bundle.scalers == scalers
+    assert set(engine.models) == set(FailureType)
+    assert engine.model_version == bundle.version
+
+
+@pytest.mark.asyncio
+async def test_prediction_does_not_wait_for_training(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    engine = PredictiveMaintenanceEngine(MagicMock(), training_workers=1)
+    try:
+        await _fill(engine)
+        training = asyncio.create_task(engine.train_models())
+        await asyncio.sleep(0)
+        assert engine.get_training_stats()["training"]
+
+        rng = random.Random(1)
+        latest = _point(rng, datetime.now())
+        await asyncio.wait_for(engine.predict_failures(latest), timeout=1.0)
+        assert not training.done()
+        assert await engine.train_models() == {"error": "training_in_progress"}
+
+        await training
+        assert engine.model_version == 1
+    finally:
+        await engine.close()
+
+
+@pytest.mark.asyncio
+async def test_drift_score_tracks_shifted_telemetry(engine):
+    await _fill(engine)
+    await engine.train_models()
+    rng = random.Random(2)
+    for _ in range(10):
+        await engine.add_training_data(_point(rng, datetime.now()))
+    calm = engine.drift_score()
+    for _ in range(10):
+        await engine.add_training_data(_point(rng, datetime.now(), shift=40.0))
+    assert engine.drift_score() > max(calm, 3.0)
+
+
+@pytest.mark.asyncio
+async def test_scheduler_triggers():
+    engine = SimpleNamespace(points_since_training=0, drift=0.0)
+    engine.drift_score = lambda: engine.drift
+    calls = []
+
+    async def train_models():
+        calls.append(1)
+        return {}
+
+    engine.train_models = train_models
+    scheduler = TrainingScheduler(engine, interval_s=3600, drift_threshold=3.0, min_new_points=10)
+
+    engine.drift = 5.0
+    assert await scheduler.check() is None  # not enough new points
+    engine.points_since_training = 10
+    assert scheduler.due() == "drift"
+    await scheduler.check()
+    engine.drift = 0.0
+    assert scheduler.due() is None
+    scheduler.interval_s = 0
+    assert scheduler.due() == "periodic"
+    assert len(calls) == 1 and scheduler.runs["drift"] == 1
+
+
+def test_window_snapshot_repacks_only_changed_buckets():
+    rng = random.Random(4)
+    base = datetime(2026, 1, 1)
+    window = TrainingDataWindow(bucket_seconds=3600)
+    points = [_point(rng, base + timedelta(minutes=10 * i)) for i in range(60)]  # 10 buckets
+    window.extend(points)
+
+    packed_sizes = []
+
+    def pack(items):
+        packed_sizes.append(len(items))
+        return pack_snapshot(items)
+
+    first = window.snapshot(pack)
+    assert first.shape == (60, len(SNAPSHOT_COLUMNS))
+    assert len(packed_sizes) == 10
+
+    packed_sizes.clear()
+    window.append(_point(rng, base + timedelta(minutes=595)))
+    window.trim(base + timedelta(minutes=25))
+    second = window.snapshot(pack)
+    assert packed_sizes == [3, 7]  # trimmed first bucket and appended last bucket
+    assert second.shape == (len(window), len(SNAPSHOT_COLUMNS))
+    assert first.shape == (60, len(SNAPSHOT_COLUMNS))  # earlier snapshot unaffected